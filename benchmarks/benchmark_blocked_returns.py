@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark peak memory of blocked returns preparation against a full run.
+
+The script writes synthetic price files with staggered listings and gaps and
+prepares returns twice, tracing Python allocations with ``tracemalloc``:
+
+- ``full``: ``ReturnCalculator.load_and_prepare``, which holds the whole
+  price and returns matrices in memory.
+- ``blocked``: ``ReturnCalculator.load_and_prepare_blocks`` for each block
+  size, which keeps one block of assets in memory and writes the returns to
+  a ``ReturnsStore``.
+
+The stored returns are checked against the full run.
+
+Usage:
+    python benchmarks/benchmark_blocked_returns.py
+    python benchmarks/benchmark_blocked_returns.py --assets 2000 --block-sizes 100 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns import (
+    PriceLoader,
+    ReturnCalculator,
+    ReturnConfig,
+)
+from portfolio_management.assets.selection import SelectedAsset
+
+TEMPLATE = SelectedAsset(
+    symbol="",
+    isin="",
+    name="",
+    market="US",
+    region="North America",
+    currency="USD",
+    category="stock",
+    price_start="",
+    price_end="",
+    price_rows=0,
+    data_status="ok",
+    data_flags="",
+    stooq_path="",
+    resolved_currency="USD",
+    currency_status="matched",
+)
+
+
+def write_prices(root: Path, n_assets: int, n_days: int) -> list[SelectedAsset]:
+    """Write price files with late listings and gaps and return their assets."""
+    rng = np.random.default_rng(42)
+    calendar = pd.bdate_range("2000-01-03", periods=n_days)
+    assets = []
+    for index in range(n_assets):
+        stem = f"a{index:05d}.us"
+        start = int(rng.integers(0, n_days // 2))
+        dates = calendar[start:]
+        keep = rng.random(dates.size) > 0.03
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, dates.size)))
+        pd.DataFrame({"date": dates[keep], "close": close[keep].round(4)}).to_csv(
+            root / f"{stem}.csv",
+            index=False,
+        )
+        assets.append(replace(TEMPLATE, symbol=stem.upper(), stooq_path=f"{stem}.txt"))
+    return assets
+
+
+def traced(function, *args, **kwargs) -> tuple[object, float, float]:
+    """Return the result, seconds and peak traced MiB of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    seconds = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak / 2**20
+
+
+def main() -> None:
+    """Run the blocked returns benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=1_000,
+        help="Number of price files (default: 1000)",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=5_000,
+        help="Business days in the calendar (default: 5000)",
+    )
+    parser.add_argument(
+        "--block-sizes",
+        type=int,
+        nargs="+",
+        default=[100, 250],
+        help="Block sizes to run (default: 100 250)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    config = ReturnConfig(min_coverage=0.3)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        prices_dir = root / "prices"
+        prices_dir.mkdir()
+        print(f"Writing {args.assets} price files over {args.days} days...")
+        assets = write_prices(prices_dir, args.assets, args.days)
+
+        calculator = ReturnCalculator(PriceLoader(cache_size=0))
+        expected, seconds, peak = traced(
+            calculator.load_and_prepare,
+            assets,
+            prices_dir,
+            config,
+        )
+        print(f"{'run':<14}{'seconds':>10}{'peak (MiB)':>12}")
+        print(f"{'full':<14}{seconds:>10.2f}{peak:>12.1f}")
+
+        for block_size in args.block_sizes:
+            store, seconds, peak = traced(
+                calculator.load_and_prepare_blocks,
+                assets,
+                prices_dir,
+                config,
+                root / f"returns_{block_size}",
+                block_size=block_size,
+            )
+            pd.testing.assert_frame_equal(store.load(), expected, check_freq=False)
+            print(f"{f'blocked {block_size}':<14}{seconds:>10.2f}{peak:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
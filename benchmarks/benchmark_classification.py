@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Benchmark keyword scanning of AssetClassifier on a large match report.
+
+The script builds synthetic instruments named like a Stooq match report
+(stocks, UCITS ETFs, bonds and trusts) and times the keyword stage of
+classification:
+
+- ``per-rule``: one ``Series.str.contains`` pass over the lower-cased names
+  for every asset class, geography and sub-class keyword rule.
+- ``automaton``: ``AssetClassifier._scan_column``, which scans all names once
+  with the compiled keyword pattern and labels every name with the rules it
+  matches.
+
+The labels are checked against the per-rule masks. The times of
+``classify_universe`` and of ``classify_asset`` over all instruments are
+printed for scale.
+
+Usage:
+    python benchmarks/benchmark_classification.py
+    python benchmarks/benchmark_classification.py --assets 60000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import re
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.assets.classification import AssetClass, AssetClassifier
+from portfolio_management.assets.selection import SelectedAsset
+
+SYLLABLES = [
+    "ka",
+    "ro",
+    "lin",
+    "tek",
+    "mar",
+    "vo",
+    "sa",
+    "den",
+    "ix",
+    "ol",
+    "us",
+    "fra",
+]
+SUFFIXES = ["Inc", "Corp", "plc", "SA", "AG", "Holdings", "Group", "SE", "NV"]
+PROVIDERS = ["iShares", "Vanguard", "Xtrackers", "Amundi", "SPDR", "Invesco"]
+INDICES = ["MSCI World", "S&P 500", "FTSE 100", "Core Euro", "Nasdaq 100", "Asia"]
+STYLES = [
+    "",
+    "Value",
+    "Growth",
+    "Dividend",
+    "Small Cap",
+    "Large Cap",
+    "Government Bond",
+    "Corporate Bond",
+    "High Yield Bond",
+    "Gold",
+    "Real Estate",
+    "Treasury",
+]
+TEMPLATE = SelectedAsset(
+    symbol="",
+    isin="",
+    name="",
+    market="",
+    region="",
+    currency="",
+    category="",
+    price_start="",
+    price_end="",
+    price_rows=0,
+    data_status="ok",
+    data_flags="",
+    stooq_path="",
+    resolved_currency="",
+    currency_status="matched",
+)
+
+
+def make_assets(n_assets: int) -> list[SelectedAsset]:
+    """Build instruments with report-like names, categories and regions."""
+    rng = np.random.default_rng(42)
+    assets = []
+    for index in range(n_assets):
+        issuer = "".join(rng.choice(SYLLABLES, size=rng.integers(2, 4))).title()
+        kind = rng.random()
+        if kind < 0.7:
+            name, category = f"{issuer} {rng.choice(SUFFIXES)}", "stock"
+        elif kind < 0.9:
+            name = (
+                f"{rng.choice(PROVIDERS)} {rng.choice(INDICES)} {rng.choice(STYLES)} "
+                f"UCITS ETF {rng.choice(['USD', 'EUR', 'GBP'])} (Acc)"
+            )
+            category = "etf"
+        else:
+            name = f"{issuer} {rng.choice(['Bond', 'Gilt', 'Trust', 'REIT'])} 2030"
+            category = "bond"
+        region, currency = [
+            ("North America", "USD"),
+            ("Europe", "EUR"),
+            ("UK", "GBP"),
+            ("Asia", "JPY"),
+        ][rng.integers(0, 4)]
+        assets.append(
+            replace(
+                TEMPLATE,
+                symbol=f"S{index:06d}",
+                isin=f"XX{index:010d}",
+                name=" ".join(name.split()),
+                region=region,
+                currency=currency,
+                category=category,
+            ),
+        )
+    return assets
+
+
+def rules(classifier: AssetClassifier) -> dict[tuple, set[str]]:
+    """Return the keyword rules of the classifier that are matched on names."""
+    name_rules = {
+        ("name", AssetClass.EQUITY): classifier.EQUITY_KEYWORDS,
+        ("name", AssetClass.FIXED_INCOME): classifier.BOND_KEYWORDS,
+        ("name", AssetClass.COMMODITY): classifier.COMMODITY_KEYWORDS,
+        ("name", AssetClass.REAL_ESTATE): classifier.REAL_ESTATE_KEYWORDS,
+    }
+    for geography, patterns in classifier.GEOGRAPHY_PATTERNS.items():
+        name_rules["geography", geography] = set(patterns)
+    for asset_class, sub_classes in classifier.SUB_CLASS_KEYWORDS.items():
+        for sub_class, keywords in sub_classes.items():
+            name_rules[asset_class, sub_class] = keywords
+    return name_rules
+
+
+def main() -> None:
+    """Run the classification benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=60_000,
+        help="Number of instruments (default: 60000)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"Building {args.assets} instruments...")
+    assets = make_assets(args.assets)
+    names = pd.Series([asset.name for asset in assets]).str.lower()
+    classifier = AssetClassifier()
+    name_rules = rules(classifier)
+
+    start = time.perf_counter()
+    masks = {
+        label: names.str.contains(
+            "|".join(re.escape(keyword) for keyword in keywords),
+        )
+        for label, keywords in name_rules.items()
+    }
+    per_rule_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    labels = classifier._scan_column(names)  # noqa: SLF001
+    automaton_seconds = time.perf_counter() - start
+
+    for label, mask in masks.items():
+        assert mask.tolist() == [label in found for found in labels], label
+    print(f"{'stage':<22}{'seconds':>10}")
+    print(f"{f'per-rule ({len(masks)} passes)':<22}{per_rule_seconds:>10.3f}")
+    print(f"{'automaton (1 pass)':<22}{automaton_seconds:>10.3f}")
+    print(f"speedup: {per_rule_seconds / automaton_seconds:.1f}x")
+
+    start = time.perf_counter()
+    classifier.classify_universe(assets)
+    print(f"classify_universe: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    for asset in assets:
+        classifier.classify_asset(asset)
+    print(f"classify_asset loop: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark AssetClassifier with a persistent ClassificationCache.
+
+The script reuses the report-like instruments of
+``benchmark_classification.py`` and times ``classify_universe``:
+
+- ``uncached``: every asset is classified.
+- ``cold``: an empty cache; every asset is classified and stored.
+- ``warm``: a second run over the same assets, merged from the cache.
+- ``changed``: a run where a share of the names changed and new assets were
+  added, so only those are classified.
+
+Every result is checked against an uncached run.
+
+Usage:
+    python benchmarks/benchmark_classification_cache.py
+    python benchmarks/benchmark_classification_cache.py --assets 60000 --changed 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from benchmark_classification import make_assets
+
+from portfolio_management.assets.classification import (
+    AssetClassifier,
+    ClassificationCache,
+)
+
+
+def main() -> None:
+    """Run the classification cache benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=60_000,
+        help="Number of instruments (default: 60000)",
+    )
+    parser.add_argument(
+        "--changed",
+        type=float,
+        default=0.01,
+        help="Share of assets renamed or added in the last run (default: 0.01)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"Building {args.assets} instruments...")
+    assets = make_assets(args.assets)
+    step = max(int(1 / args.changed), 1) if args.changed > 0 else len(assets) + 1
+    changed = [
+        replace(asset, name=f"{asset.name} Dividend") if index % step == 0 else asset
+        for index, asset in enumerate(assets)
+    ]
+    changed += [
+        replace(asset, symbol=f"{asset.symbol}.NEW", isin=f"{asset.isin}N")
+        for asset in assets[: len(assets) // step]
+    ]
+
+    start = time.perf_counter()
+    expected = AssetClassifier().classify_universe(assets)
+    uncached_seconds = time.perf_counter() - start
+    expected_changed = AssetClassifier().classify_universe(changed)
+
+    print(f"{'run':<10}{'seconds':>10}{'classified':>12}{'reused':>10}")
+    print(f"{'uncached':<10}{uncached_seconds:>10.3f}{len(assets):>12}{0:>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for run, batch, reference in (
+            ("cold", assets, expected),
+            ("warm", assets, expected),
+            ("changed", changed, expected_changed),
+        ):
+            cache = ClassificationCache(Path(tmp) / "classification_cache")
+            start = time.perf_counter()
+            result = AssetClassifier(cache=cache).classify_universe(batch)
+            seconds = time.perf_counter() - start
+            pd.testing.assert_frame_equal(result, reference)
+            stats = cache.stats()
+            print(
+                f"{run:<10}{seconds:>10.3f}{stats['classified_assets']:>12}"
+                f"{stats['reused_assets']:>10}",
+            )
+
+
+if __name__ == "__main__":
+    main()
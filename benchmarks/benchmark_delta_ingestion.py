@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark full rebuilds against append-only updates after a new trading day.
+
+The script writes synthetic Stooq files, exports them and builds a price
+panel, then appends ``--new-rows`` days to every file and times each stage of
+the refresh both ways:
+
+- ``export``: `_copy_price_file` of every file versus `_append_price_rows`
+  from the checkpoint recorded after the first export.
+- ``panel``: `build_price_panel` versus `update_price_panel`.
+- ``returns``: `ReturnCalculator.load_and_prepare` over the full history
+  versus `ReturnCalculator.extend_returns` (prices already in memory).
+
+Usage:
+    python benchmarks/benchmark_delta_ingestion.py
+    python benchmarks/benchmark_delta_ingestion.py --files 5000 --rows 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns import ReturnCalculator, ReturnConfig
+from portfolio_management.analytics.returns.loaders import (
+    build_price_panel,
+    update_price_panel,
+)
+from portfolio_management.data.io.io import (
+    _append_price_rows,
+    _copy_price_file,
+    _price_file_checkpoint,
+)
+
+STOOQ_HEADER = (
+    "<TICKER>,<PER>,<DATE>,<TIME>,<OPEN>,<HIGH>,<LOW>,<CLOSE>,<VOL>,<OPENINT>"
+)
+
+
+def stooq_rows(ticker: str, dates: pd.DatetimeIndex, close: np.ndarray) -> str:
+    """Format Stooq price rows."""
+    return "".join(
+        f"{ticker},D,{stamp},000000,{c:.4f},{c:.4f},{c:.4f},{c:.4f},1000,0\n"
+        for stamp, c in zip(dates.strftime("%Y%m%d"), close, strict=True)
+    )
+
+
+def timed(func: Callable[[], object]) -> float:
+    """Return the wall time of one call."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+class _FrameLoader:
+    """Price loader stub serving an in-memory frame."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.frame = frame
+
+    def load_multiple_prices(self, *_args) -> pd.DataFrame:
+        return self.frame
+
+
+def main() -> None:
+    """Run the delta ingestion benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=1_000,
+        help="Number of price files (default: 1000)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=2_500,
+        help="Rows of history per file (default: 2500)",
+    )
+    parser.add_argument(
+        "--new-rows",
+        type=int,
+        default=1,
+        help="Trading days appended before the refresh (default: 1)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    rng = np.random.default_rng(42)
+    dates = pd.bdate_range("2010-01-01", periods=args.rows + args.new_rows)
+    closes = 100 * np.exp(
+        np.cumsum(rng.normal(0, 0.01, (dates.size, args.files)), axis=0),
+    )
+    tickers = [f"T{index:05d}.US" for index in range(args.files)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        stooq_dir, export_dir = root / "stooq", root / "exports"
+        stooq_dir.mkdir()
+        print(f"Generating {args.files} files with {args.rows} rows each...")
+        for column, ticker in enumerate(tickers):
+            (stooq_dir / f"{ticker.lower()}.txt").write_text(
+                STOOQ_HEADER
+                + "\n"
+                + stooq_rows(ticker, dates[: args.rows], closes[: args.rows, column]),
+            )
+        sources = sorted(stooq_dir.glob("*.txt"))
+        targets = [export_dir / f"{path.stem}.csv" for path in sources]
+        for source, target in zip(sources, targets, strict=True):
+            _copy_price_file(source, target)
+        checkpoints = [_price_file_checkpoint(source) for source in sources]
+        build_price_panel(export_dir, root / "panel")
+
+        for column, (ticker, source) in enumerate(zip(tickers, sources, strict=True)):
+            with source.open("a") as handle:
+                handle.write(
+                    stooq_rows(
+                        ticker,
+                        dates[args.rows :],
+                        closes[args.rows :, column],
+                    ),
+                )
+
+        results: list[tuple[str, float, float]] = []
+        full_export = timed(
+            lambda: [
+                _copy_price_file(source, root / "full" / target.name)
+                for source, target in zip(sources, targets, strict=True)
+            ],
+        )
+        delta_export = timed(
+            lambda: [
+                _append_price_rows(source, target, checkpoint)
+                for source, target, checkpoint in zip(
+                    sources,
+                    targets,
+                    checkpoints,
+                    strict=True,
+                )
+            ],
+        )
+        results.append(("export", full_export, delta_export))
+
+        full_panel = timed(lambda: build_price_panel(export_dir, root / "rebuilt"))
+        delta_panel = timed(lambda: update_price_panel(export_dir, root / "panel"))
+        results.append(("panel", full_panel, delta_panel))
+
+        prices = pd.DataFrame(closes, index=dates, columns=tickers)
+        config = ReturnConfig(min_coverage=0.5)
+        calculator = ReturnCalculator(price_loader=_FrameLoader(prices))
+        assets = [object()] * args.files
+        full_returns = timed(
+            lambda: calculator.load_and_prepare(assets, root, config),
+        )
+        calculator.price_loader = _FrameLoader(prices.iloc[: args.rows])
+        previous = calculator.load_and_prepare(assets, root, config)
+        delta_returns = timed(
+            lambda: calculator.extend_returns(previous, prices, config),
+        )
+        results.append(("returns", full_returns, delta_returns))
+
+    print(f"{'stage':<10}{'full s':>10}{'delta s':>10}{'speedup':>9}")
+    for stage, full, delta in results:
+        print(f"{stage:<10}{full:>10.3f}{delta:>10.3f}{full / delta:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
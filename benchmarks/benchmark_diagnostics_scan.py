@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark the vectorized diagnostics scanner against the pandas reader.
+
+For each file length the script writes a synthetic Stooq file and times
+`_stream_stooq_file_for_diagnostics` (chunked ``pandas.read_csv``) and
+`_scan_stooq_file_for_diagnostics` (memory-mapped NumPy scan), checking that
+both produce the same diagnostics.
+
+Usage:
+    python benchmarks/benchmark_diagnostics_scan.py
+    python benchmarks/benchmark_diagnostics_scan.py --rows 500 5000 50000 --repeats 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.data.analysis.analysis import (
+    _scan_stooq_file_for_diagnostics,
+    _stream_stooq_file_for_diagnostics,
+)
+
+STOOQ_HEADER = (
+    "<TICKER>,<PER>,<DATE>,<TIME>,<OPEN>,<HIGH>,<LOW>,<CLOSE>,<VOL>,<OPENINT>"
+)
+
+
+def write_file(path: Path, rows: int) -> None:
+    """Write a synthetic Stooq file with ``rows`` business days."""
+    dates = pd.bdate_range("1990-01-01", periods=rows).strftime("%Y%m%d")
+    body = "".join(
+        f"AAA.US,D,{date},000000,1.5,1.6,1.4,{1.5 + index * 0.001:.4f},"
+        f"{index % 7},0\r\n"
+        for index, date in enumerate(dates)
+    )
+    path.write_text(f"{STOOQ_HEADER}\r\n{body}", newline="")
+
+
+def best_time(func, path: Path, repeats: int) -> float:
+    """Return the best of ``repeats`` timings in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(path)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    """Run the diagnostics scanner benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[250, 2500, 10000],
+        help="Rows per file (default: 250 2500 10000)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=10,
+        help="Timing repeats; the best time is reported (default: 10)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}{'pandas ms':>12}{'scan ms':>10}{'speedup':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = Path(tmp) / f"aaa_{rows}.txt"
+            write_file(path, rows)
+            scanned = _scan_stooq_file_for_diagnostics(path)
+            if scanned != _stream_stooq_file_for_diagnostics(path):
+                print(f"{rows:>8}  diagnostics differ")
+                continue
+            pandas_ms = best_time(
+                _stream_stooq_file_for_diagnostics,
+                path,
+                args.repeats,
+            )
+            scan_ms = best_time(_scan_stooq_file_for_diagnostics, path, args.repeats)
+            print(
+                f"{rows:>8}{pandas_ms:>12.2f}{scan_ms:>10.2f}"
+                f"{pandas_ms / scan_ms:>8.1f}x",
+            )
+
+
+if __name__ == "__main__":
+    main()
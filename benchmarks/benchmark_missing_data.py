@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark missing-data handling of ReturnCalculator on a wide price panel.
+
+The script builds a synthetic panel with staggered listings and scattered
+gaps and, for the ``forward_fill`` and ``interpolate`` strategies, times:
+
+- ``pandas``: ``DataFrame.ffill(limit=...)`` or
+  ``DataFrame.interpolate(method="linear", limit=..., limit_direction="both")``
+  with the filled cells per asset counted from ``isna``.
+- ``calculator``: ``ReturnCalculator.handle_missing_data``, which keeps
+  pandas ``ffill`` for forward fills, interpolates the whole panel with a
+  vectorized NumPy kernel, and counts the filled cells per asset.
+
+The time of ``calculate_returns`` on the filled panel is printed for scale.
+
+Usage:
+    python benchmarks/benchmark_missing_data.py
+    python benchmarks/benchmark_missing_data.py --assets 5000 --days 7500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns import ReturnCalculator, ReturnConfig
+
+
+def make_prices(n_assets: int, n_days: int) -> pd.DataFrame:
+    """Build a price panel with late listings and scattered gaps."""
+    rng = np.random.default_rng(42)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_days, n_assets)), axis=0))
+    values[rng.random(values.shape) < 0.03] = np.nan
+    starts = rng.integers(0, n_days // 2, n_assets)
+    values[np.arange(n_days)[:, np.newaxis] < starts] = np.nan
+    return pd.DataFrame(
+        values,
+        index=pd.bdate_range("2000-01-03", periods=n_days),
+        columns=[f"A{index:05d}" for index in range(n_assets)],
+    )
+
+
+def pandas_fill(
+    prices: pd.DataFrame,
+    fill: Callable[[pd.DataFrame], pd.DataFrame],
+) -> tuple[pd.DataFrame, pd.Series]:
+    """Fill with pandas and count the filled cells per asset."""
+    filled = fill(prices)
+    counts = prices.isna().sum() - filled.isna().sum()
+    return filled.dropna(how="all"), counts
+
+
+def main() -> None:
+    """Run the missing-data benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=2_000,
+        help="Number of assets in the panel (default: 2000)",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=5_000,
+        help="Business days in the panel (default: 5000)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"Building a {args.days} x {args.assets} price panel...")
+    prices = make_prices(args.assets, args.days)
+    calculator = ReturnCalculator()
+
+    print(f"{'strategy':<14}{'pandas (s)':>12}{'calculator (s)':>16}{'speedup':>9}")
+    for strategy, reference in (
+        ("forward_fill", lambda frame: frame.ffill(limit=5)),
+        (
+            "interpolate",
+            lambda frame: frame.interpolate(
+                method="linear",
+                limit=5,
+                limit_direction="both",
+            ),
+        ),
+    ):
+        config = ReturnConfig(handle_missing=strategy, max_forward_fill_days=5)
+        start = time.perf_counter()
+        expected, counts = pandas_fill(prices, reference)
+        pandas_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        filled = calculator.handle_missing_data(prices, config)
+        calculator_seconds = time.perf_counter() - start
+        pd.testing.assert_frame_equal(filled, expected)
+        pd.testing.assert_series_equal(calculator.latest_fill_counts, counts)
+        print(
+            f"{strategy:<14}{pandas_seconds:>12.3f}{calculator_seconds:>16.3f}"
+            f"{pandas_seconds / calculator_seconds:>8.1f}x",
+        )
+
+    start = time.perf_counter()
+    calculator.calculate_returns(filled, config)
+    print(f"calculate_returns on the filled panel: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
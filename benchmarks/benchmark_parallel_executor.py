@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark thread versus process pools for CPU-bound pipeline stages.
+
+Two stages are timed on a synthetic set of price files:
+
+- ``diagnostics``: `summarize_price_file` over Stooq ``.txt`` files, the
+  streaming diagnostics step of ``prepare_tradeable_data.py``.
+- ``loader``: `PriceLoader` reading exported ``date,close`` CSVs, the first
+  step of ``calculate_returns.py``.
+
+Both parse text under the GIL, so thread pools stop scaling after a few
+workers; the process pool (chunked submissions, see `_run_in_parallel`) keeps
+scaling with the number of cores.
+
+Usage:
+    python benchmarks/benchmark_parallel_executor.py
+    python benchmarks/benchmark_parallel_executor.py --files 10000 --workers 1 4 8 16
+    python benchmarks/benchmark_parallel_executor.py --stage loader --rows 2500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns.loaders import PriceLoader
+from portfolio_management.core.utils import _run_in_parallel
+from portfolio_management.data.analysis import summarize_price_file
+from portfolio_management.data.models import StooqFile
+
+STOOQ_HEADER = (
+    "<TICKER>,<PER>,<DATE>,<TIME>,<OPEN>,<HIGH>,<LOW>,<CLOSE>,<VOL>,<OPENINT>"
+)
+
+
+def generate_files(root: Path, n_files: int, rows: int) -> tuple[list, list]:
+    """Write matching Stooq and exported CSV files; return their handles."""
+    rng = np.random.default_rng(42)
+    dates = pd.bdate_range("2010-01-01", periods=rows)
+    stamps = dates.strftime("%Y%m%d")
+    iso_dates = dates.strftime("%Y-%m-%d")
+    stooq_dir = root / "stooq"
+    csv_dir = root / "csv"
+    stooq_dir.mkdir()
+    csv_dir.mkdir()
+
+    stooq_files: list[StooqFile] = []
+    csv_paths: list[Path] = []
+    for index in range(n_files):
+        ticker = f"T{index:05d}.US"
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+        volume = rng.integers(1_000, 100_000, rows)
+        lines = [STOOQ_HEADER]
+        lines.extend(
+            f"{ticker},D,{stamp},000000,{c:.4f},{c * 1.01:.4f},{c * 0.99:.4f},"
+            f"{c:.4f},{v},0"
+            for stamp, c, v in zip(stamps, close, volume, strict=True)
+        )
+        rel_path = f"{ticker.lower()}.txt"
+        (stooq_dir / rel_path).write_text("\n".join(lines) + "\n")
+        stooq_files.append(StooqFile(ticker=ticker, stem=ticker, rel_path=rel_path))
+
+        csv_path = csv_dir / f"{ticker.lower()}.csv"
+        csv_path.write_text(
+            "date,close\n"
+            + "\n".join(f"{d},{c:.4f}" for d, c in zip(iso_dates, close, strict=True))
+            + "\n",
+        )
+        csv_paths.append(csv_path)
+    return [(stooq_dir, stooq_file) for stooq_file in stooq_files], csv_paths
+
+
+def time_diagnostics(tasks: list, workers: int, executor: str) -> float:
+    """Time summarize_price_file over all files."""
+    start = time.perf_counter()
+    _run_in_parallel(
+        summarize_price_file,
+        tasks,
+        workers,
+        preserve_order=False,
+        executor=executor,
+    )
+    return time.perf_counter() - start
+
+
+def time_loader(paths: list[Path], workers: int, executor: str) -> float:
+    """Time PriceLoader over all files with caching disabled."""
+    loader = PriceLoader(max_workers=workers, cache_size=0, executor=executor)
+    start = time.perf_counter()
+    loader._submit_load_tasks(paths)  # noqa: SLF001
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the executor scaling benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=10_000,
+        help="Number of price files (default: 10000)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=500,
+        help="Rows per price file (default: 500)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Worker counts to benchmark (default: 1 2 4 8)",
+    )
+    parser.add_argument(
+        "--stage",
+        choices=["diagnostics", "loader", "both"],
+        default="both",
+        help="Pipeline stage to benchmark (default: both)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    stages = ["diagnostics", "loader"] if args.stage == "both" else [args.stage]
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Generating {args.files} files with {args.rows} rows each...")
+        diagnostics_tasks, csv_paths = generate_files(Path(tmp), args.files, args.rows)
+
+        print(
+            f"{'stage':<12}{'workers':>8}{'thread s':>10}{'process s':>11}{'ratio':>8}",
+        )
+        for stage in stages:
+            for workers in args.workers:
+                timings = {}
+                for executor in ("thread", "process"):
+                    if stage == "diagnostics":
+                        timings[executor] = time_diagnostics(
+                            diagnostics_tasks,
+                            workers,
+                            executor,
+                        )
+                    else:
+                        timings[executor] = time_loader(csv_paths, workers, executor)
+                ratio = timings["thread"] / timings["process"]
+                print(
+                    f"{stage:<12}{workers:>8}{timings['thread']:>10.2f}"
+                    f"{timings['process']:>11.2f}{ratio:>7.2f}x",
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark price-matrix assembly from many loaded series.
+
+`PriceLoader.load_multiple_prices` ends by aligning every loaded close series
+on the union of their dates. The script builds synthetic series with
+staggered listing and delisting dates (some with gaps) and times:
+
+- ``pandas``: ``pd.DataFrame(prices).sort_index()``, which unions the
+  DatetimeIndexes and reindexes each series.
+- ``scatter``: `assemble_price_frame`, which computes the union calendar
+  once from int64 dates and scatters each series into a preallocated matrix.
+
+Usage:
+    python benchmarks/benchmark_price_assembly.py
+    python benchmarks/benchmark_price_assembly.py --assets 5000 --days 7500
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns.loaders import assemble_price_frame
+
+
+def make_prices(n_assets: int, n_days: int) -> dict[str, pd.Series]:
+    """Build close series covering random runs of a business-day calendar."""
+    rng = np.random.default_rng(42)
+    calendar = pd.bdate_range("2000-01-03", periods=n_days)
+    prices = {}
+    for index in range(n_assets):
+        start = int(rng.integers(0, n_days // 2))
+        stop = int(rng.integers(2 * n_days // 3, n_days))
+        dates = calendar[start:stop]
+        if index % 7 == 0:
+            dates = dates[rng.random(len(dates)) > 0.05]
+        prices[f"A{index:05d}"] = pd.Series(
+            rng.random(len(dates)),
+            index=pd.DatetimeIndex(dates.to_numpy(), name="date"),
+            name="close",
+        )
+    return prices
+
+
+def main() -> None:
+    """Run the price assembly benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=3_000,
+        help="Number of price series (default: 3000)",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=6_000,
+        help="Business days in the calendar (default: 6000)",
+    )
+    args = parser.parse_args()
+
+    print(f"Building {args.assets} series over {args.days} days...")
+    prices = make_prices(args.assets, args.days)
+
+    start = time.perf_counter()
+    expected = pd.DataFrame(prices).sort_index()
+    pandas_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    assembled = assemble_price_frame(prices)
+    scatter_seconds = time.perf_counter() - start
+    pd.testing.assert_frame_equal(assembled, expected, check_freq=False)
+
+    print(f"{'method':<10}{'seconds':>10}{'speedup':>9}")
+    for name, seconds in (("pandas", pandas_seconds), ("scatter", scatter_seconds)):
+        print(f"{name:<10}{seconds:>10.3f}{pandas_seconds / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
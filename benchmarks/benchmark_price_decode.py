@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark the single-pass price decode of PriceLoader against a full read.
+
+The script writes synthetic exports in the normalized Stooq layout
+(``ticker,per,date,...,close,...`` with ``YYYYMMDD`` dates) and, for every
+available IO backend, times:
+
+- ``general``: the whole file read into a DataFrame and normalized by
+  ``PriceLoader._standardize_price_dataframe`` with string date parsing.
+- ``fast``: ``PriceLoader.load_price_file``, which decodes only the date and
+  close columns with explicit types and converts dates arithmetically.
+
+Usage:
+    python benchmarks/benchmark_price_decode.py
+    python benchmarks/benchmark_price_decode.py --files 200 --rows 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns import PriceLoader
+from portfolio_management.data.io.fast_io import get_available_backends, read_csv_fast
+
+
+def write_exports(root: Path, n_files: int, rows: int) -> list[Path]:
+    """Write exported price files and return their paths."""
+    rng = np.random.default_rng(42)
+    dates = pd.bdate_range("1990-01-01", periods=rows).strftime("%Y%m%d")
+    paths = []
+    for index in range(n_files):
+        close = (100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))).round(4)
+        path = root / f"t{index:05d}.us.csv"
+        pd.DataFrame(
+            {
+                "ticker": f"T{index:05d}.US",
+                "per": "D",
+                "date": dates,
+                "time": "000000",
+                "open": close,
+                "high": close,
+                "low": close,
+                "close": close,
+                "volume": 1000,
+                "openint": 0,
+            },
+        ).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def load_general(path: Path, backend: str) -> pd.Series:
+    """Read the full file and normalize it the way the general path does."""
+    raw_kwargs = {"header": 0} if backend == "pandas" else {}
+    raw = read_csv_fast(path, backend=backend, **raw_kwargs)
+    frame = PriceLoader._standardize_price_dataframe(raw, path)  # noqa: SLF001
+    return frame["close"].sort_index().astype(float)
+
+
+def main() -> None:
+    """Run the price decode benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=100,
+        help="Number of exported price files (default: 100)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=5_000,
+        help="Rows per price file (default: 5000)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Generating {args.files} files with {args.rows} rows each...")
+        paths = write_exports(Path(tmp), args.files, args.rows)
+
+        print(f"{'backend':<10}{'general (s)':>13}{'fast (s)':>10}{'speedup':>9}")
+        for backend in get_available_backends():
+            loader = PriceLoader(io_backend=backend, cache_size=0)
+            start = time.perf_counter()
+            general = [load_general(path, backend) for path in paths]
+            general_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            fast = [loader.load_price_file(path) for path in paths]
+            fast_seconds = time.perf_counter() - start
+            for expected, actual in zip(general, fast, strict=True):
+                pd.testing.assert_series_equal(actual, expected, check_names=False)
+            print(
+                f"{backend:<10}{general_seconds:>13.3f}{fast_seconds:>10.3f}"
+                f"{general_seconds / fast_seconds:>8.1f}x",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark kernel-level copies against line streaming for price exports.
+
+The script writes synthetic Stooq files (CRLF line endings, ``<TICKER>``
+header) and exports each of them twice: once through `_stream_price_file`,
+which rewrites every line in Python, and once through `_copy_price_file`,
+which rewrites only the header and leaves the rows to
+``copy_file_range``/``sendfile``.
+
+Usage:
+    python benchmarks/benchmark_price_export.py
+    python benchmarks/benchmark_price_export.py --files 2000 --rows 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.data.io.io import _copy_price_file, _stream_price_file
+
+STOOQ_HEADER = (
+    "<TICKER>,<PER>,<DATE>,<TIME>,<OPEN>,<HIGH>,<LOW>,<CLOSE>,<VOL>,<OPENINT>"
+)
+
+
+def generate_files(root: Path, n_files: int, rows: int) -> list[Path]:
+    """Write synthetic Stooq price files and return their paths."""
+    root.mkdir()
+    paths = []
+    for index in range(n_files):
+        ticker = f"T{index:05d}.US"
+        body = "".join(
+            f"{ticker},D,{20000101 + row},000000,1.5,1.6,1.4,1.55,{row},0\r\n"
+            for row in range(rows)
+        )
+        path = root / f"{ticker.lower()}.txt"
+        path.write_text(f"{STOOQ_HEADER}\r\n{body}", newline="")
+        paths.append(path)
+    return paths
+
+
+def time_export(export, paths: list[Path], dest: Path) -> float:
+    """Export every file with ``export`` and return the elapsed seconds."""
+    start = time.perf_counter()
+    for path in paths:
+        export(path, dest / f"{path.stem}.csv")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the price export benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=500,
+        help="Number of price files (default: 500)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=5000,
+        help="Rows per price file (default: 5000)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        paths = generate_files(tmp_path / "stooq", args.files, args.rows)
+        total_mb = sum(path.stat().st_size for path in paths) / 1e6
+        streamed = time_export(_stream_price_file, paths, tmp_path / "streamed")
+        copied = time_export(_copy_price_file, paths, tmp_path / "copied")
+
+    print(f"{args.files} files, {total_mb:.1f} MB")
+    print(f"streaming (_stream_price_file): {streamed:8.3f}s")
+    print(f"kernel copy (_copy_price_file): {copied:8.3f}s")
+    print(f"speedup: {streamed / copied:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
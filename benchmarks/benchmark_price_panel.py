@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark PriceLoader reads from per-asset CSVs versus the price panel.
+
+The script writes synthetic ``date,close`` exports, builds a panel from them
+with `build_price_panel`, then times `PriceLoader.load_multiple_prices` for
+random subsets of the universe:
+
+- ``files``: one CSV read per asset (caching disabled).
+- ``panel``: column gathers from the memory-mapped ``close.npy`` matrix.
+
+Usage:
+    python benchmarks/benchmark_price_panel.py
+    python benchmarks/benchmark_price_panel.py --files 5000 --subset 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns.loaders import (
+    PriceLoader,
+    build_price_panel,
+)
+from portfolio_management.assets.selection import SelectedAsset
+
+
+def generate_exports(root: Path, n_files: int, rows: int) -> list[SelectedAsset]:
+    """Write exported price CSVs and return matching selected assets."""
+    rng = np.random.default_rng(42)
+    iso_dates = pd.bdate_range("2010-01-01", periods=rows).strftime("%Y-%m-%d")
+    assets: list[SelectedAsset] = []
+    for index in range(n_files):
+        stem = f"t{index:05d}.us"
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+        (root / f"{stem}.csv").write_text(
+            "date,close\n"
+            + "\n".join(f"{d},{c:.4f}" for d, c in zip(iso_dates, close, strict=True))
+            + "\n",
+        )
+        assets.append(
+            SelectedAsset(
+                symbol=stem.upper(),
+                isin=f"US{index:010d}",
+                name=stem,
+                market="US",
+                region="North America",
+                currency="USD",
+                category="stock",
+                price_start=iso_dates[0],
+                price_end=iso_dates[-1],
+                price_rows=rows,
+                data_status="ok",
+                data_flags="",
+                stooq_path=f"d_us_txt/data/daily/us/{stem}.txt",
+                resolved_currency="USD",
+                currency_status="matched",
+            ),
+        )
+    return assets
+
+
+def time_load(loader: PriceLoader, assets: list, prices_dir: Path) -> float:
+    """Time one load_multiple_prices call."""
+    start = time.perf_counter()
+    loader.load_multiple_prices(assets, prices_dir)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the price panel benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=2_000,
+        help="Number of exported price files (default: 2000)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=2_500,
+        help="Rows per price file (default: 2500)",
+    )
+    parser.add_argument(
+        "--subset",
+        type=int,
+        nargs="+",
+        default=[50, 500, 2_000],
+        help="Assets loaded per call (default: 50 500 2000)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        prices_dir = root / "prices"
+        prices_dir.mkdir()
+        print(f"Generating {args.files} files with {args.rows} rows each...")
+        assets = generate_exports(prices_dir, args.files, args.rows)
+
+        start = time.perf_counter()
+        build_price_panel(prices_dir, root / "panel")
+        print(f"Panel build: {time.perf_counter() - start:.2f}s")
+
+        rng = np.random.default_rng(0)
+        print(f"{'assets':>8}{'files s':>10}{'panel s':>10}{'speedup':>9}")
+        for size in args.subset:
+            picked = [
+                assets[i]
+                for i in rng.choice(len(assets), min(size, len(assets)), replace=False)
+            ]
+            files = time_load(PriceLoader(cache_size=0), picked, prices_dir)
+            panel = time_load(
+                PriceLoader(cache_size=0, panel=root / "panel"),
+                picked,
+                prices_dir,
+            )
+            print(f"{len(picked):>8}{files:>10.3f}{panel:>10.3f}{files / panel:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
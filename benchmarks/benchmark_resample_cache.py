@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark the resample cache of ReturnCalculator on overlapping universes.
+
+The script builds one daily price panel and prepares monthly returns for a
+series of universes drawn as overlapping asset subsets, as a
+``UniverseManager`` does for the universes of one configuration file. It
+times the resampling step of every universe on the shared daily returns:
+
+- ``uncached``: ``ReturnCalculator._resample_to_frequency``, resampling every
+  universe in full.
+- ``cached``: ``ReturnCalculator._resample_cached``, which slices assets
+  already resampled for an earlier universe and resamples only the new ones.
+
+Results are checked for equality.
+
+Usage:
+    python benchmarks/benchmark_resample_cache.py
+    python benchmarks/benchmark_resample_cache.py --assets 3000 --universes 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns import ReturnCalculator, ReturnConfig
+
+
+def make_prices(n_assets: int, n_days: int) -> pd.DataFrame:
+    """Build a complete daily price panel."""
+    rng = np.random.default_rng(42)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_days, n_assets)), axis=0))
+    return pd.DataFrame(
+        values,
+        index=pd.bdate_range("2000-01-03", periods=n_days, name="date"),
+        columns=[f"A{index:05d}" for index in range(n_assets)],
+    )
+
+
+def main() -> None:
+    """Run the resample cache benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=2_000,
+        help="Number of assets in the panel (default: 2000)",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=5_000,
+        help="Business days in the panel (default: 5000)",
+    )
+    parser.add_argument(
+        "--universes",
+        type=int,
+        default=6,
+        help="Number of overlapping universes (default: 6)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"Building a {args.days} x {args.assets} price panel...")
+    prices = make_prices(args.assets, args.days)
+    sources = {symbol: [symbol] for symbol in prices.columns}
+    rng = np.random.default_rng(7)
+    universes = [
+        sorted(rng.choice(prices.columns, size=args.assets // 2, replace=False))
+        for _ in range(args.universes)
+    ]
+
+    print(f"{'method':<8}{'uncached (s)':>14}{'cached (s)':>12}{'speedup':>9}")
+    for method in ("simple", "log"):
+        config = ReturnConfig(method=method, frequency="monthly")
+        daily = ReturnCalculator().calculate_returns(prices, config)
+        panels = [daily[columns] for columns in universes]
+        uncached = ReturnCalculator(resample_cache_size=0)
+        start = time.perf_counter()
+        expected = [
+            uncached._resample_to_frequency(  # noqa: SLF001
+                panel,
+                config.frequency,
+                config.method,
+            )
+            for panel in panels
+        ]
+        uncached_seconds = time.perf_counter() - start
+
+        cached = ReturnCalculator()
+        start = time.perf_counter()
+        actual = [
+            cached._resample_cached(  # noqa: SLF001
+                panel,
+                config,
+                prices.index,
+                sources,
+            )
+            for panel in panels
+        ]
+        cached_seconds = time.perf_counter() - start
+
+        for frame, reference in zip(actual, expected, strict=True):
+            pd.testing.assert_frame_equal(frame, reference)
+        print(
+            f"{method:<8}{uncached_seconds:>14.3f}{cached_seconds:>12.3f}"
+            f"{uncached_seconds / cached_seconds:>8.1f}x",
+        )
+    print(f"Cache counters: {cached.resample_cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Benchmark ReturnCalculator.load_and_prepare with and without a ReturnsCache.
+
+The script writes synthetic ``date,close`` exports and times three calls, each
+with a fresh calculator as in a separate CLI run:
+
+- ``uncached``: the plain pipeline, reading every price file.
+- ``warm``: the same inputs again with the returns cache populated.
+- ``partial``: ``--changed`` files rewritten before the call, so only those
+  assets are reloaded and the pipeline reruns on cached prices.
+
+It then prepares the same returns with ``precision="float64"`` and
+``"float32"`` and reports the size of the returns panel and of its cache
+entry for each.
+
+Usage:
+    python benchmarks/benchmark_returns_cache.py
+    python benchmarks/benchmark_returns_cache.py --files 2000 --changed 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.analytics.returns import (
+    PriceLoader,
+    ReturnCalculator,
+    ReturnConfig,
+)
+from portfolio_management.assets.selection import SelectedAsset
+
+
+def write_exports(root: Path, n_files: int, rows: int) -> list[SelectedAsset]:
+    """Write exported price CSVs and return matching selected assets."""
+    rng = np.random.default_rng(42)
+    iso_dates = pd.bdate_range("2010-01-01", periods=rows).strftime("%Y-%m-%d")
+    template = SelectedAsset(
+        symbol="",
+        isin="",
+        name="",
+        market="US",
+        region="North America",
+        currency="USD",
+        category="stock",
+        price_start=iso_dates[0],
+        price_end=iso_dates[-1],
+        price_rows=rows,
+        data_status="ok",
+        data_flags="",
+        stooq_path="",
+        resolved_currency="USD",
+        currency_status="matched",
+    )
+    assets = []
+    for index in range(n_files):
+        stem = f"t{index:05d}.us"
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+        pd.DataFrame({"date": iso_dates, "close": close.round(4)}).to_csv(
+            root / f"{stem}.csv",
+            index=False,
+        )
+        assets.append(replace(template, symbol=stem.upper(), stooq_path=f"{stem}.txt"))
+    return assets
+
+
+def timed_run(
+    assets: list[SelectedAsset],
+    prices_dir: Path,
+    config: ReturnConfig,
+    cache_dir: Path | None,
+) -> tuple[float, pd.DataFrame]:
+    """Time one load_and_prepare call with a fresh calculator."""
+    calculator = ReturnCalculator(
+        price_loader=PriceLoader(cache_size=0),
+        returns_cache=cache_dir,
+    )
+    start = time.perf_counter()
+    returns = calculator.load_and_prepare(assets, prices_dir, config)
+    return time.perf_counter() - start, returns
+
+
+def entry_bytes(cache_dir: Path) -> int:
+    """Return the size of the cached returns entries."""
+    return sum(path.stat().st_size for path in (cache_dir / "returns").glob("*.npz"))
+
+
+def main() -> None:
+    """Run the returns cache benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=500,
+        help="Number of exported price files (default: 500)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=2_500,
+        help="Rows per price file (default: 2500)",
+    )
+    parser.add_argument(
+        "--changed",
+        type=int,
+        default=5,
+        help="Files rewritten before the partial run (default: 5)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    config = ReturnConfig(frequency="monthly", min_coverage=0.5)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        prices_dir = root / "prices"
+        prices_dir.mkdir()
+        print(f"Generating {args.files} files with {args.rows} rows each...")
+        assets = write_exports(prices_dir, args.files, args.rows)
+        cache_dir = root / "returns_cache"
+
+        uncached, expected = timed_run(assets, prices_dir, config, None)
+        timed_run(assets, prices_dir, config, cache_dir)
+        warm, cached = timed_run(assets, prices_dir, config, cache_dir)
+        pd.testing.assert_frame_equal(cached, expected)
+
+        for asset in assets[: args.changed]:
+            path = prices_dir / f"{Path(asset.stooq_path).stem}.csv"
+            frame = pd.read_csv(path)
+            frame["close"] *= 1.01
+            frame.to_csv(path, index=False)
+        partial, _returns = timed_run(assets, prices_dir, config, cache_dir)
+
+        footprints = {}
+        for precision in ("float64", "float32"):
+            precision_dir = root / f"cache_{precision}"
+            _seconds, returns = timed_run(
+                assets,
+                prices_dir,
+                replace(config, precision=precision),
+                precision_dir,
+            )
+            footprints[precision] = (
+                int(returns.memory_usage(index=False).sum()),
+                entry_bytes(precision_dir),
+            )
+
+    print(f"{'run':<10}{'seconds':>10}{'speedup':>9}")
+    for name, seconds in (
+        ("uncached", uncached),
+        ("warm", warm),
+        ("partial", partial),
+    ):
+        print(f"{name:<10}{seconds:>10.3f}{uncached / seconds:>8.1f}x")
+
+    print(f"\n{'precision':<10}{'panel (KiB)':>13}{'entry (KiB)':>13}")
+    for precision, (panel, entry) in footprints.items():
+        print(f"{precision:<10}{panel / 1024:>13.1f}{entry / 1024:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
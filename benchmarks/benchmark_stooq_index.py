@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Benchmark Stooq index builds, incremental rescans and index loads.
+
+The script generates a synthetic Stooq tree (``daily/{region}/{category}/{n}``
+directories holding empty ``.txt`` files), then times:
+
+- a full walk with `build_stooq_index`,
+- the first and a no-change rescan with `update_stooq_index`,
+- a rescan after files were added to a few directories,
+- loading the CSV index with `read_stooq_index`, and
+- loading the SQLite store with `StooqIndexStore.load_entries`.
+
+Point ``--data-dir`` at a real (e.g. NFS-mounted) archive to measure it
+instead; the tree is then only read, apart from the store and CSV written to a
+temporary directory.
+
+Usage:
+    python benchmarks/benchmark_stooq_index.py
+    python benchmarks/benchmark_stooq_index.py --files 200000 --files-per-dir 500
+    python benchmarks/benchmark_stooq_index.py --data-dir data/stooq
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.data.ingestion import (
+    RACY_MTIME_WINDOW_NS,
+    build_stooq_index,
+    update_stooq_index,
+)
+from portfolio_management.data.io import (
+    StooqIndexStore,
+    read_stooq_index,
+    write_stooq_index,
+)
+
+REGIONS = ("us", "uk", "pl", "hk", "jp", "de")
+CATEGORIES = ("nasdaq stocks", "nyse stocks", "etfs", "lse stocks")
+
+
+def generate_tree(root: Path, n_files: int, files_per_dir: int) -> list[Path]:
+    """Create a synthetic Stooq tree and return its leaf directories."""
+    leaves: list[Path] = []
+    for index in range(n_files):
+        if index % files_per_dir == 0:
+            leaf_index = len(leaves)
+            region = REGIONS[leaf_index % len(REGIONS)]
+            category = CATEGORIES[(leaf_index // len(REGIONS)) % len(CATEGORIES)]
+            leaf = root / "daily" / region / category / str(leaf_index)
+            leaf.mkdir(parents=True)
+            leaves.append(leaf)
+        (leaves[-1] / f"t{index:07d}.{region}.txt").touch()
+    return leaves
+
+
+def age_directories(root: Path) -> None:
+    """Move directory mtimes out of the rescan's racy window."""
+    old_ns = time.time_ns() - 10 * RACY_MTIME_WINDOW_NS
+    for dirpath, _dirs, _files in os.walk(root):
+        os.utime(dirpath, ns=(old_ns, old_ns))
+
+
+def timed(label: str, func: Callable[[], object], results: list) -> object:
+    """Time one call and record it."""
+    start = time.perf_counter()
+    value = func()
+    results.append((label, time.perf_counter() - start))
+    return value
+
+
+def main() -> None:
+    """Run the Stooq index benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=None,
+        help="Existing Stooq tree to benchmark (default: generate one)",
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=50_000,
+        help="Number of files in the generated tree (default: 50000)",
+    )
+    parser.add_argument(
+        "--files-per-dir",
+        type=int,
+        default=250,
+        help="Files per leaf directory in the generated tree (default: 250)",
+    )
+    parser.add_argument(
+        "--changed-dirs",
+        type=int,
+        default=5,
+        help="Leaf directories receiving a new file before the last rescan "
+        "(generated tree only, default: 5)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Scan workers (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        leaves: list[Path] = []
+        data_dir = args.data_dir
+        if data_dir is None:
+            data_dir = tmp_path / "stooq"
+            leaves = generate_tree(data_dir, args.files, args.files_per_dir)
+            age_directories(data_dir)
+        csv_path = tmp_path / "stooq_index.csv"
+        store = StooqIndexStore(tmp_path / "stooq_index.sqlite")
+
+        results: list[tuple[str, float]] = []
+        entries = timed(
+            "full walk (build_stooq_index)",
+            lambda: build_stooq_index(data_dir, max_workers=args.workers),
+            results,
+        )
+        write_stooq_index(entries, csv_path)
+        timed(
+            "first scan (update_stooq_index)",
+            lambda: update_stooq_index(data_dir, store, max_workers=args.workers),
+            results,
+        )
+        timed(
+            "rescan, nothing changed",
+            lambda: update_stooq_index(data_dir, store, max_workers=args.workers),
+            results,
+        )
+        if leaves:
+            for leaf in leaves[: args.changed_dirs]:
+                (leaf / "new.us.txt").touch()
+            age_directories(data_dir)
+            timed(
+                f"rescan, {min(args.changed_dirs, len(leaves))} dirs changed",
+                lambda: update_stooq_index(data_dir, store, max_workers=args.workers),
+                results,
+            )
+        timed(
+            "load CSV (read_stooq_index)",
+            lambda: read_stooq_index(csv_path),
+            results,
+        )
+        timed(
+            "load store (StooqIndexStore)",
+            lambda: store.load_entries(data_dir),
+            results,
+        )
+
+    print(f"Stooq tree: {data_dir} ({len(entries)} files)")
+    width = max(len(label) for label, _ in results)
+    for label, seconds in results:
+        print(f"{label:<{width}}  {seconds:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark matching broker instruments against a large Stooq index.
+
+The script builds a synthetic Stooq index and a broker instrument list that
+mixes suffixed symbols (``ABC:US``), bare symbols with a market name, and
+symbols without any Stooq counterpart, then times `match_tradeables`.
+
+Usage:
+    python benchmarks/benchmark_tradeable_matching.py
+    python benchmarks/benchmark_tradeable_matching.py --index 500000 --instruments 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.data.matching import build_stooq_lookup, match_tradeables
+from portfolio_management.data.models import StooqFile, TradeableInstrument
+
+# Stooq extension -> (broker suffix, market name)
+MARKETS = {
+    ".US": ("US", "NASDAQ"),
+    ".UK": ("LN", "LSE"),
+    ".PL": ("PW", "GPW"),
+    ".DE": ("GR", "XETRA"),
+    ".HK": ("HK", "HKEX"),
+    ".JP": ("JP", "Tokyo"),
+    ".TO": ("TO", "TSX"),
+}
+
+
+def generate(n_index: int, n_instruments: int) -> tuple[list, list]:
+    """Return a synthetic Stooq index and broker instrument list."""
+    rng = np.random.default_rng(42)
+    extensions = list(MARKETS)
+    index = []
+    for position, ext in enumerate(rng.choice(extensions, n_index)):
+        ticker = f"T{position:07d}{ext}"
+        index.append(StooqFile(ticker, ticker, f"daily/{ticker.lower()}.txt"))
+
+    instruments = []
+    for position in rng.integers(0, n_index, n_instruments):
+        base, ext = index[position].ticker.split(".")
+        suffix, market = MARKETS[f".{ext}"]
+        style = rng.random()
+        if style < 0.6:
+            symbol = f"{base}:{suffix}"
+        elif style < 0.9:
+            symbol = base
+        else:
+            symbol = f"X{base}"
+        instruments.append(
+            TradeableInstrument(symbol, "", market, symbol, "", "broker.csv"),
+        )
+    return index, instruments
+
+
+def main() -> None:
+    """Run the tradeable matching benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--index",
+        type=int,
+        default=200_000,
+        help="Number of Stooq index entries (default: 200000)",
+    )
+    parser.add_argument(
+        "--instruments",
+        type=int,
+        default=50_000,
+        help="Number of broker instruments (default: 50000)",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(
+        f"Generating {args.index} index entries and {args.instruments} instruments...",
+    )
+    index, instruments = generate(args.index, args.instruments)
+    lookup = build_stooq_lookup(index)
+
+    start = time.perf_counter()
+    matches, unmatched = match_tradeables(instruments, *lookup)
+    elapsed = time.perf_counter() - start
+    print(f"Matched {len(matches)} / unmatched {len(unmatched)} in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
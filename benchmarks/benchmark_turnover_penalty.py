@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Benchmark the solve-time overhead of turnover-penalised optimisation.
+
+For each universe size the script builds a returns window, constructs an
+unpenalised target, perturbs it into a set of "current" holdings and then
+times the strategy with and without a `TurnoverCostModel`. Besides the solve
+time it reports the turnover and the number of assets traded, which is what
+the penalty is meant to reduce.
+
+Usage:
+    python benchmarks/benchmark_turnover_penalty.py
+    python benchmarks/benchmark_turnover_penalty.py --universe-sizes 50 100 250
+    python benchmarks/benchmark_turnover_penalty.py --trade-aversion 0.5 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from portfolio_management.portfolio import (
+    MeanVarianceStrategy,
+    PortfolioConstraints,
+    PortfolioStrategy,
+    RiskParityStrategy,
+    TurnoverCostModel,
+)
+
+TRADE_THRESHOLD = 1e-4
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and turnover of one strategy/size/aversion combination."""
+
+    strategy: str
+    universe_size: int
+    trade_aversion: float
+    base_time: float
+    penalised_time: float
+    base_turnover: float
+    penalised_turnover: float
+    base_trades: int
+    penalised_trades: int
+
+    @property
+    def overhead(self) -> float:
+        """Return the penalised solve time relative to the unpenalised one."""
+        return self.penalised_time / self.base_time if self.base_time > 0 else 0.0
+
+
+def generate_returns(n_assets: int, periods: int, seed: int = 42) -> pd.DataFrame:
+    """Generate a synthetic daily returns window."""
+    rng = np.random.default_rng(seed)
+    vols = rng.uniform(0.005, 0.025, n_assets)
+    drifts = rng.uniform(-0.0002, 0.0008, n_assets)
+    return pd.DataFrame(
+        rng.normal(drifts, vols, size=(periods, n_assets)),
+        index=pd.date_range("2020-01-01", periods=periods, freq="B"),
+        columns=[f"A{i:04d}" for i in range(n_assets)],
+    )
+
+
+def _timed(strategy: PortfolioStrategy, repeats: int, **kwargs) -> tuple:
+    best = float("inf")
+    portfolio = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        portfolio = strategy.construct(**kwargs)
+        best = min(best, time.perf_counter() - start)
+    return portfolio, best
+
+
+def _turnover(weights: pd.Series, current: pd.Series) -> tuple[float, int]:
+    trades = weights.reindex(current.index, fill_value=0.0) - current
+    return float(trades.abs().sum()), int((trades.abs() > TRADE_THRESHOLD).sum())
+
+
+def run_benchmark(  # noqa: PLR0913, PLR0917
+    strategy_name: str,
+    strategy: PortfolioStrategy,
+    returns: pd.DataFrame,
+    constraints: PortfolioConstraints,
+    trade_aversion: float,
+    repeats: int,
+) -> BenchmarkResult:
+    """Time one strategy with and without the turnover penalty."""
+    target = strategy.construct(returns, constraints).weights
+    rng = np.random.default_rng(7)
+    drifted = target.reindex(returns.columns, fill_value=0.0) * rng.lognormal(
+        0.0,
+        0.2,
+        len(returns.columns),
+    )
+    current = drifted / drifted.sum()
+    cost_model = TurnoverCostModel(
+        linear=0.0015,
+        quadratic=0.0,
+        trade_aversion=trade_aversion,
+    )
+
+    base, base_time = _timed(
+        strategy,
+        repeats,
+        returns=returns,
+        constraints=constraints,
+    )
+    penalised, penalised_time = _timed(
+        strategy,
+        repeats,
+        returns=returns,
+        constraints=constraints,
+        current_weights=current,
+        cost_model=cost_model,
+    )
+    base_turnover, base_trades = _turnover(base.weights, current)
+    penalised_turnover, penalised_trades = _turnover(penalised.weights, current)
+    return BenchmarkResult(
+        strategy=strategy_name,
+        universe_size=returns.shape[1],
+        trade_aversion=trade_aversion,
+        base_time=base_time,
+        penalised_time=penalised_time,
+        base_turnover=base_turnover,
+        penalised_turnover=penalised_turnover,
+        base_trades=base_trades,
+        penalised_trades=penalised_trades,
+    )
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    """Print a results table."""
+    header = (
+        f"{'strategy':<16}{'assets':>7}{'aversion':>9}{'base s':>9}"
+        f"{'cost s':>9}{'overhead':>9}{'turnover':>17}{'trades':>13}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result.strategy:<16}{result.universe_size:>7}"
+            f"{result.trade_aversion:>9.2f}{result.base_time:>9.3f}"
+            f"{result.penalised_time:>9.3f}{result.overhead:>8.2f}x"
+            f"{result.base_turnover:>8.3f} ->{result.penalised_turnover:>6.3f}"
+            f"{result.base_trades:>6} ->{result.penalised_trades:>4}",
+        )
+
+
+def main() -> None:
+    """Run the turnover penalty benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--universe-sizes",
+        type=int,
+        nargs="+",
+        default=[25, 50, 100, 200],
+        help="Number of assets per scenario (default: 25 50 100 200)",
+    )
+    parser.add_argument(
+        "--periods",
+        type=int,
+        default=504,
+        help="Number of return observations (default: 504)",
+    )
+    parser.add_argument(
+        "--trade-aversion",
+        type=float,
+        nargs="+",
+        default=[1.0],
+        help="Trade aversion values to benchmark (default: 1.0)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Timing repeats; the best time is reported (default: 3)",
+    )
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    results = []
+    for n_assets in args.universe_sizes:
+        returns = generate_returns(n_assets, args.periods)
+        constraints = PortfolioConstraints(max_weight=min(1.0, 5.0 / n_assets))
+        strategies = {
+            "mv_min_vol": MeanVarianceStrategy(objective="min_volatility"),
+            "mv_max_sharpe": MeanVarianceStrategy(objective="max_sharpe"),
+            "risk_parity": RiskParityStrategy(),
+        }
+        for name, strategy in strategies.items():
+            for aversion in args.trade_aversion:
+                try:
+                    results.append(
+                        run_benchmark(
+                            name,
+                            strategy,
+                            returns,
+                            constraints,
+                            aversion,
+                            args.repeats,
+                        ),
+                    )
+                except Exception as err:  # report and continue
+                    print(f"{name} with {n_assets} assets failed: {err}")
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
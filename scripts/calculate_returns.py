@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,6 +24,7 @@ from portfolio_management.analytics.returns import ReturnCalculator, ReturnConfi
 from portfolio_management.analytics.returns.loaders import PriceLoader
 from portfolio_management.assets.selection import SelectedAsset
 from portfolio_management.core.exceptions import PortfolioManagementError
+from portfolio_management.core.utils import EXECUTOR_CHOICES
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -89,12 +91,50 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Maximum worker threads for price loading (default: auto)",
     )
+    parser.add_argument(
+        "--price-panel",
+        type=Path,
+        default=None,
+        help="Price panel directory written by prepare_tradeable_data.py "
+        "--price-panel; assets found there skip their per-file CSVs",
+    )
+    parser.add_argument(
+        "--loader-executor",
+        choices=list(EXECUTOR_CHOICES),
+        default="thread",
+        help="Worker pool for price loading: threads (default), processes "
+        "(parallel CSV parsing without the GIL) or auto (processes for large "
+        "batches)",
+    )
     parser.add_argument(
         "--cache-size",
         type=int,
         default=1000,
         help="Maximum number of price series to cache (default: 1000, 0 to disable)",
     )
+    parser.add_argument(
+        "--cache-bytes",
+        type=int,
+        default=None,
+        help="Memory budget of the price series cache in bytes; least recently "
+        "used series are evicted beyond it (default: bounded by --cache-size only)",
+    )
+    parser.add_argument(
+        "--shared-price-cache",
+        type=Path,
+        default=None,
+        help="Directory of a memory-mapped price cache shared by concurrent "
+        "runs on this machine (e.g. under /dev/shm); keyed by price file path "
+        "and mtime",
+    )
+    parser.add_argument(
+        "--returns-cache",
+        type=Path,
+        default=None,
+        help="Directory of a persistent returns cache; repeated runs over "
+        "unchanged price files skip loading, and only changed assets are "
+        "reloaded otherwise",
+    )
     parser.add_argument(
         "--io-backend",
         choices=["pandas", "polars", "pyarrow", "auto"],
@@ -119,6 +159,28 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.8,
         help="Minimum proportion of non-NaN returns required per asset",
     )
+    parser.add_argument(
+        "--precision",
+        choices=["float64", "float32"],
+        default="float64",
+        help="Floating-point type of the price and returns panels; float32 "
+        "halves their memory",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=None,
+        help="Process assets in blocks of this size so that peak memory is "
+        "bounded by the block rather than the universe (default: all at once)",
+    )
+    parser.add_argument(
+        "--returns-store",
+        type=Path,
+        default=None,
+        help="Directory of the columnar returns store written with "
+        "--block-size (default: a temporary directory removed after --output "
+        "is written)",
+    )
     parser.add_argument(
         "--summary",
         action="store_true",
@@ -175,23 +237,25 @@ def _build_config(args: argparse.Namespace) -> ReturnConfig:
         align_method=args.align_method,
         reindex_to_business_days=args.business_days,
         min_coverage=args.min_coverage,
+        precision=args.precision,
     )
 
 
 def _print_summary(
-    returns_df: pd.DataFrame,
+    dates: pd.DatetimeIndex,
+    asset_count: int,
     calculator: ReturnCalculator,
     top: int,
 ) -> None:
     print("--- Return Statistics Summary ---")  # noqa: T201
-    print(f"Assets with returns: {returns_df.shape[1]}")  # noqa: T201
+    print(f"Assets with returns: {asset_count}")  # noqa: T201
 
-    if returns_df.empty:
+    if not asset_count or dates.empty:
         print("No return series available; check filtering criteria.")  # noqa: T201
         return
 
     print(  # noqa: T201
-        f"Date range: {returns_df.index.min().date()} to {returns_df.index.max().date()}",
+        f"Date range: {dates.min().date()} to {dates.max().date()}",
     )
 
     detailed = calculator.latest_summary
@@ -218,7 +282,7 @@ def _print_summary(
     print("\nData coverage (% of periods with data):")  # noqa: T201
     print((detailed.coverage * 100).round(2).to_string())  # noqa: T201
 
-    if detailed.correlation.shape[1] <= top:
+    if 0 < detailed.correlation.shape[1] <= top:
         print("\nCorrelation matrix:")  # noqa: T201
         print(detailed.correlation.round(3).to_string())  # noqa: T201
 
@@ -250,8 +314,18 @@ def run_cli(args: argparse.Namespace) -> int:
         max_workers=args.loader_workers,
         io_backend=args.io_backend,
         cache_size=args.cache_size,
+        cache_bytes=args.cache_bytes,
+        shared_cache=args.shared_price_cache,
+        executor=args.loader_executor,
+        panel=args.price_panel,
+    )
+    calculator = ReturnCalculator(
+        price_loader=price_loader,
+        returns_cache=args.returns_cache,
     )
-    calculator = ReturnCalculator(price_loader=price_loader)
+    if args.block_size is not None:
+        return _run_blocked(args, assets, config, calculator)
+
     try:
         returns_df = calculator.load_and_prepare(assets, args.prices_dir, config)
     except PortfolioManagementError:
@@ -268,13 +342,51 @@ def run_cli(args: argparse.Namespace) -> int:
         logging.info("Returns saved to %s", args.output)
 
     if args.summary:
-        _print_summary(returns_df, calculator, args.top)
+        _print_summary(returns_df.index, returns_df.shape[1], calculator, args.top)
     else:
         print(returns_df.to_string())  # noqa: T201
 
     return 0
 
 
+def _run_blocked(
+    args: argparse.Namespace,
+    assets: list[SelectedAsset],
+    config: ReturnConfig,
+    calculator: ReturnCalculator,
+) -> int:
+    """Prepare returns block by block into a returns store.
+
+    The raw returns are not printed; they are streamed to ``--output`` and
+    stay in ``--returns-store`` when one is given.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store_dir = args.returns_store or Path(tmp_dir) / "returns"
+        try:
+            store = calculator.load_and_prepare_blocks(
+                assets,
+                args.prices_dir,
+                config,
+                store_dir,
+                block_size=args.block_size,
+            )
+        except PortfolioManagementError:
+            logging.exception("Return calculation failed")
+            return 1
+
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            store.to_csv(args.output)
+            logging.info("Returns saved to %s", args.output)
+        if args.returns_store:
+            logging.info("Returns store written to %s", args.returns_store)
+
+        if args.summary:
+            _print_summary(store.dates, len(store.columns), calculator, args.top)
+
+    return 0
+
+
 def main(argv: Sequence[str] | None = None) -> None:
     """Parse arguments and execute the returns CLI."""
     args = parse_args(argv)
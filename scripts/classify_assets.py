@@ -53,6 +53,13 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Path to a CSV file with classification overrides.",
     )
+    parser.add_argument(
+        "--classification-cache",
+        type=Path,
+        default=None,
+        help="Directory of a persistent classification cache; only new or "
+        "changed assets are classified on repeated runs.",
+    )
     parser.add_argument(
         "--export-for-review",
         type=Path,
@@ -105,7 +112,10 @@ def run_cli(args: argparse.Namespace) -> int:
             ClassificationOverrides.from_csv(args.overrides) if args.overrides else None
         )
 
-        classifier = AssetClassifier(overrides=overrides)
+        classifier = AssetClassifier(
+            overrides=overrides,
+            cache=args.classification_cache,
+        )
         classified_df = classifier.classify_universe(assets)
 
         if args.export_for_review:
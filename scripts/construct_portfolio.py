@@ -17,6 +17,7 @@ Usage examples:
     python scripts/construct_portfolio.py \
         --returns data/processed/universe_returns.csv \
         --compare \
+        --share-moments --max-workers 4 \
         --output outputs/portfolio_comparison.csv
 """
 
@@ -84,6 +85,23 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Compare all registered strategies instead of constructing a single one.",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="Number of strategies to construct concurrently with --compare (default: 1).",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="Pool type used when --max-workers > 1 (default: thread).",
+    )
+    parser.add_argument(
+        "--share-moments",
+        action="store_true",
+        help="Compute the sample covariance once and share it across compared strategies.",
+    )
 
     # Constraint knobs
     parser.add_argument(
@@ -165,12 +183,17 @@ def run_cli(args: argparse.Namespace) -> int:
             strategy=args.strategy,
             compare=args.compare,
             asset_classes=args.classifications,
+            share_moments=args.share_moments,
+            max_workers=args.max_workers,
+            executor=args.executor,
         )
 
         if args.compare:
             if result.comparison is None:
                 msg = "Comparison workflow did not produce a comparison table"
                 raise PortfolioConstructionError(msg)
+            for name, elapsed in result.timings.items():
+                logger.info("Strategy '%s' constructed in %.3fs", name, elapsed)
             _save_comparison(result.comparison, args.output)
         else:
             if result.portfolio is None:
@@ -79,6 +79,24 @@ def get_args() -> argparse.Namespace:
         default=Path("data/processed/tradeable_prices"),
         help="Directory with price files.",
     )
+    parser.add_argument(
+        "--price-panel",
+        type=Path,
+        default=None,
+        help="Price panel directory written by prepare_tradeable_data.py.",
+    )
+    parser.add_argument(
+        "--returns-cache",
+        type=Path,
+        default=None,
+        help="Directory of a persistent returns cache reused across runs.",
+    )
+    parser.add_argument(
+        "--classification-cache",
+        type=Path,
+        default=None,
+        help="Directory of a persistent classification cache reused across runs.",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -120,7 +138,14 @@ def main() -> None:
         # For heavy commands, load the full manager with data
         else:
             matches_df = pd.read_csv(args.matches)
-            manager = UniverseManager(args.config, matches_df, args.prices_dir)
+            manager = UniverseManager(
+                args.config,
+                matches_df,
+                args.prices_dir,
+                price_panel=args.price_panel,
+                returns_cache=args.returns_cache,
+                classification_cache=args.classification_cache,
+            )
 
             if args.command == "load":
                 universe = manager.load_universe(args.name)
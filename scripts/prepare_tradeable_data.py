@@ -18,6 +18,41 @@ Incremental Resume Feature:
     entirely, completing in seconds instead of minutes. Use --force-reindex to
     override the cache.
 
+    When inputs did change, a per-file diagnostics manifest (--diagnostics-manifest)
+    records each Stooq file's size, mtime (and, with --hash-contents, SHA-256)
+    together with its diagnostics and export outcome. Only new or changed price
+    files are summarized and exported again; the reports are rebuilt from the
+    manifest. A file that only gained rows after its recorded last row (the
+    usual daily Stooq update) has just those rows appended to its export.
+
+Stooq Index Store:
+    Besides the CSV index, the Stooq index is kept in a SQLite store
+    (--index-store, next to the CSV by default) together with the mtime of every
+    scanned directory. Later runs load the index from the store without parsing
+    the CSV, and --force-reindex only lists directories whose mtime changed
+    instead of walking the whole tree. Use --no-index-store for the plain CSV
+    behaviour.
+
+Price Panel:
+    With --price-panel, the exported price CSVs are also consolidated into a
+    single date-by-ticker close matrix (a memory-mappable ``.npy`` plus a
+    ticker/date index). Pass the same directory to calculate_returns.py or
+    manage_universes.py (--price-panel) to load any universe with one read
+    instead of one file open per asset. With --incremental, rows appended to
+    the exports since the panel was written are added as a small segment
+    instead of rebuilding the panel.
+
+Watch Mode:
+    With --watch the script stays running after the first pass. The Stooq
+    index, matching lookups and diagnostics manifest are kept in memory, and
+    the inputs are watched with inotify (or, where unavailable or with
+    --watch-backend poll, by polling directory and file mtimes every
+    --watch-interval seconds). New, removed or renamed price files refresh
+    only the changed index directories, edited tradeable CSVs are reloaded,
+    and rewritten or appended price files are re-summarized and re-exported
+    on their own; reports, the manifest and the price panel are updated at
+    the end of each cycle.
+
 Example usage:
     # First run - builds everything
     python scripts/prepare_tradeable_data.py \
@@ -34,9 +69,14 @@ Example usage:
     python scripts/prepare_tradeable_data.py \
         --incremental
 
-    # Force full rebuild
+    # Rescan the Stooq tree (only changed directories are listed)
     python scripts/prepare_tradeable_data.py \
         --force-reindex
+
+    # Keep the outputs current as new Stooq files arrive
+    python scripts/prepare_tradeable_data.py \
+        --price-panel data/processed/price_panel \
+        --watch
 """
 
 from __future__ import annotations
@@ -63,17 +103,23 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from portfolio_management.core.utils import log_duration
+from portfolio_management.analytics.returns.loaders import (
+    build_price_panel,
+    update_price_panel,
+)
+from portfolio_management.core.utils import EXECUTOR_CHOICES, log_duration
 from portfolio_management.data import cache
 from portfolio_management.data.analysis import (
     collect_available_extensions,
     infer_currency,
     log_summary_counts,
     resolve_currency,
+    resolve_match_currencies,
     summarize_price_file,
 )
-from portfolio_management.data.ingestion import build_stooq_index
+from portfolio_management.data.ingestion import build_stooq_index, update_stooq_index
 from portfolio_management.data.io import (
+    StooqIndexStore,
     export_tradeable_prices,
     load_tradeable_instruments,
     read_stooq_index,
@@ -93,6 +139,16 @@ from portfolio_management.data.models import (
     TradeableInstrument,
     TradeableMatch,
 )
+from portfolio_management.data.watch import (
+    WATCH_BACKENDS,
+    ChangeSet,
+    InotifyWatcher,
+    PollingWatcher,
+    open_watcher,
+)
+
+# Quiet period that ends a batch of input changes in --watch mode (seconds).
+WATCH_SETTLE_SECONDS = 1.0
 
 __all__ = [
     "ExportConfig",
@@ -110,6 +166,7 @@ __all__ = [
     "match_tradeables",
     "read_stooq_index",
     "resolve_currency",
+    "resolve_match_currencies",
     "summarize_price_file",
     "write_match_report",
     "write_stooq_index",
@@ -137,6 +194,19 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Rebuild the Stooq metadata index even if the CSV already exists.",
     )
+    parser.add_argument(
+        "--index-store",
+        type=Path,
+        default=None,
+        help="SQLite store holding the Stooq index and directory mtimes for fast "
+        "loads and incremental rescans (default: --metadata-output with a "
+        ".sqlite suffix).",
+    )
+    parser.add_argument(
+        "--no-index-store",
+        action="store_true",
+        help="Do not use the SQLite index store; always read or rebuild the CSV.",
+    )
     parser.add_argument(
         "--tradeable-dir",
         type=Path,
@@ -161,6 +231,13 @@ def build_parser() -> argparse.ArgumentParser:
         default=Path("data/processed/tradeable_prices"),
         help="Directory for exported tradeable price histories.",
     )
+    parser.add_argument(
+        "--price-panel",
+        type=Path,
+        default=None,
+        help="Also consolidate the exported prices into a memory-mapped close "
+        "panel at this directory, served by PriceLoader(panel=...).",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -188,7 +265,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--max-workers",
         type=int,
         default=None,
-        help="Maximum number of threads to use for matching and exporting (auto if unset).",
+        help="Maximum number of threads to use for exporting (auto if unset).",
     )
     parser.add_argument(
         "--index-workers",
@@ -196,6 +273,14 @@ def build_parser() -> argparse.ArgumentParser:
         default=0,
         help="Number of threads for directory indexing (0 falls back to --max-workers).",
     )
+    parser.add_argument(
+        "--executor",
+        choices=list(EXECUTOR_CHOICES),
+        default="thread",
+        help="Worker pool for summarizing and exporting price files: threads "
+        "(default), processes (sidesteps the GIL, scales past ~4 workers) or auto "
+        "(processes for large batches).",
+    )
     parser.add_argument(
         "--incremental",
         action="store_true",
@@ -207,6 +292,39 @@ def build_parser() -> argparse.ArgumentParser:
         default=Path("data/metadata/.prepare_cache.json"),
         help="Path to cache metadata file for incremental resume.",
     )
+    parser.add_argument(
+        "--diagnostics-manifest",
+        type=Path,
+        default=None,
+        help="Per-file diagnostics manifest used with --incremental so that only "
+        "changed price files are reprocessed (default: "
+        ".diagnostics_manifest.json next to --cache-metadata).",
+    )
+    parser.add_argument(
+        "--hash-contents",
+        action="store_true",
+        help="Also fingerprint price files by content (SHA-256) so that files "
+        "touched without changes are not reprocessed.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running after the first pass and reprocess only the inputs "
+        "that change (implies --incremental; stop with Ctrl+C).",
+    )
+    parser.add_argument(
+        "--watch-backend",
+        choices=list(WATCH_BACKENDS),
+        default="auto",
+        help="Change detection for --watch: inotify events, directory mtime "
+        "polling, or auto (inotify when available).",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between polls with the polling backend (default: 2.0).",
+    )
     return parser
 
 
@@ -223,31 +341,57 @@ def configure_logging(level: str) -> None:
     )
 
 
+def _diagnostics_manifest_path(args) -> Path:
+    return args.diagnostics_manifest or args.cache_metadata.with_name(
+        ".diagnostics_manifest.json",
+    )
+
+
+def _index_store(args) -> StooqIndexStore | None:
+    if args.no_index_store:
+        return None
+    return StooqIndexStore(
+        args.index_store or args.metadata_output.with_suffix(".sqlite"),
+    )
+
+
 def _handle_stooq_index(args, index_workers):
-    if args.metadata_output.exists() and not args.force_reindex:
-        with log_duration("stooq_index_load"):
-            stooq_index = read_stooq_index(args.metadata_output)
-    else:
-        with log_duration("stooq_index_build"):
+    store = _index_store(args)
+    if not args.force_reindex:
+        if store is not None and store.exists():
+            with log_duration("stooq_index_store_load"):
+                stooq_index = store.load_entries(args.data_dir)
+            if stooq_index is not None:
+                if not args.metadata_output.exists():
+                    with log_duration("stooq_index_write"):
+                        write_stooq_index(stooq_index, args.metadata_output)
+                return stooq_index
+        if args.metadata_output.exists():
+            with log_duration("stooq_index_load"):
+                return read_stooq_index(args.metadata_output)
+
+    with log_duration("stooq_index_build"):
+        if store is None:
             stooq_index = build_stooq_index(args.data_dir, max_workers=index_workers)
-        with log_duration("stooq_index_write"):
-            write_stooq_index(stooq_index, args.metadata_output)
+        else:
+            stooq_index = update_stooq_index(
+                args.data_dir,
+                store,
+                max_workers=index_workers,
+            )
+    with log_duration("stooq_index_write"):
+        write_stooq_index(stooq_index, args.metadata_output)
     return stooq_index
 
 
-def _load_and_match_tradeables(stooq_index, args, max_workers):
-    with log_duration("tradeable_load"):
-        tradeables = load_tradeable_instruments(args.tradeable_dir)
-
-    stooq_by_ticker, stooq_by_stem, stooq_by_base = build_stooq_lookup(stooq_index)
-    available_extensions = collect_available_extensions(stooq_index)
+def _match_instruments(tradeables, lookups, available_extensions):
+    stooq_by_ticker, stooq_by_stem, stooq_by_base = lookups
     with log_duration("tradeable_match"):
         matches, unmatched = match_tradeables(
             tradeables,
             stooq_by_ticker,
             stooq_by_stem,
             stooq_by_base,
-            max_workers=max_workers,
         )
     unmatched = annotate_unmatched_instruments(
         unmatched,
@@ -257,13 +401,32 @@ def _load_and_match_tradeables(stooq_index, args, max_workers):
     return matches, unmatched
 
 
-def _generate_reports(matches, unmatched, args, data_dir, max_workers):
+def _load_and_match_tradeables(stooq_index, args):
+    with log_duration("tradeable_load"):
+        tradeables = load_tradeable_instruments(args.tradeable_dir)
+
+    return _match_instruments(
+        tradeables,
+        build_stooq_lookup(stooq_index),
+        collect_available_extensions(stooq_index),
+    )
+
+
+def _generate_reports(  # noqa: PLR0917
+    matches,
+    unmatched,
+    args,
+    data_dir,
+    max_workers,
+    manifest=None,
+):
     export_config = ExportConfig(
         data_dir=args.data_dir,
         dest_dir=args.prices_output,
         overwrite=args.overwrite_prices,
         max_workers=max_workers,
         include_empty=args.include_empty_prices,
+        executor=args.executor,
     )
     export_config.dest_dir.mkdir(parents=True, exist_ok=True)
     with log_duration("tradeable_match_report"):
@@ -282,6 +445,8 @@ def _generate_reports(matches, unmatched, args, data_dir, max_workers):
             lse_currency_policy=args.lse_currency_policy,
             max_workers=max_workers,
             export_config=export_config,
+            manifest=manifest,
+            executor=args.executor,
         )
     log_summary_counts(currency_counts, data_status_counts)
     if empty_tickers:
@@ -309,9 +474,8 @@ def _generate_reports(matches, unmatched, args, data_dir, max_workers):
     return diagnostics_cache
 
 
-def prepare_tradeable_data(args: argparse.Namespace) -> None:
-    """Run the end-to-end tradeable data preparation workflow."""
-    data_dir = args.data_dir
+def _worker_counts(args: argparse.Namespace) -> tuple[int, int]:
+    """Return the match/export and indexing worker counts."""
     cpu_count = os.cpu_count() or 1
     auto_workers = max(1, (cpu_count - 1) or 1)
     max_workers = (
@@ -325,11 +489,43 @@ def prepare_tradeable_data(args: argparse.Namespace) -> None:
     )
     index_workers = max(1, index_workers)
     LOGGER.info(
-        "Worker configuration: match/export=%s, index=%s (cpu=%s)",
+        "Worker configuration: match/export=%s (%s), index=%s (cpu=%s)",
         max_workers,
+        args.executor,
         index_workers,
         cpu_count,
     )
+    return max_workers, index_workers
+
+
+def _write_price_panel(args, max_workers, *, incremental):
+    if args.price_panel is None:
+        return
+    panel_writer = update_price_panel if incremental else build_price_panel
+    with log_duration("price_panel_build"):
+        panel_writer(
+            args.prices_output,
+            args.price_panel,
+            max_workers=max_workers,
+            executor=args.executor,
+        )
+
+
+def _save_incremental_state(args, manifest):
+    with log_duration("diagnostics_manifest_write"):
+        manifest.save(_diagnostics_manifest_path(args))
+    new_cache_metadata = cache.create_cache_metadata(
+        args.tradeable_dir,
+        args.metadata_output,
+    )
+    cache.save_cache_metadata(args.cache_metadata, new_cache_metadata)
+    LOGGER.debug("Saved cache metadata for future incremental resumes")
+
+
+def prepare_tradeable_data(args: argparse.Namespace) -> None:
+    """Run the end-to-end tradeable data preparation workflow."""
+    data_dir = args.data_dir
+    max_workers, index_workers = _worker_counts(args)
 
     # Check for incremental resume opportunity
     if args.incremental:
@@ -355,25 +551,147 @@ def prepare_tradeable_data(args: argparse.Namespace) -> None:
             "Incremental resume: inputs changed or outputs missing - running full pipeline",
         )
 
+    manifest = None
+    if args.incremental:
+        manifest = cache.DiagnosticsManifest.load(
+            _diagnostics_manifest_path(args),
+            content_hash=args.hash_contents,
+        )
+
     stooq_index = _handle_stooq_index(args, index_workers)
-    matches, unmatched = _load_and_match_tradeables(stooq_index, args, max_workers)
-    _generate_reports(matches, unmatched, args, data_dir, max_workers)
+    matches, unmatched = _load_and_match_tradeables(stooq_index, args)
+    _generate_reports(matches, unmatched, args, data_dir, max_workers, manifest)
+    _write_price_panel(args, max_workers, incremental=args.incremental)
 
     # Save cache metadata for next run if incremental mode enabled
     if args.incremental:
-        new_cache_metadata = cache.create_cache_metadata(
+        _save_incremental_state(args, manifest)
+
+
+def _refresh_stooq_index(args, index_workers):
+    """Rescan the Stooq tree after the watcher saw directory changes."""
+    store = _index_store(args)
+    with log_duration("stooq_index_build"):
+        if store is None:
+            stooq_index = build_stooq_index(args.data_dir, max_workers=index_workers)
+        else:
+            # Only directories whose mtime changed are listed again.
+            stooq_index = update_stooq_index(
+                args.data_dir,
+                store,
+                max_workers=index_workers,
+            )
+    with log_duration("stooq_index_write"):
+        write_stooq_index(stooq_index, args.metadata_output)
+    return stooq_index
+
+
+def watch_tradeable_data(
+    args: argparse.Namespace,
+    *,
+    watcher: PollingWatcher | InotifyWatcher | None = None,
+    max_cycles: int | None = None,
+) -> None:
+    """Run the workflow, then keep the outputs current as the inputs change.
+
+    The Stooq index, the matching lookups and the diagnostics manifest stay in
+    memory between cycles. Each cycle waits for the watcher to report changes
+    and redoes only the affected steps: directory changes refresh the index
+    (listing just the changed directories), tradeable CSV changes reload the
+    broker lists, and either re-matches the instruments. The match report is
+    then rebuilt from the resident manifest, so only new or changed price
+    files are summarized and exported (appended rows are appended), and the
+    price panel gains a segment for the new rows.
+
+    Args:
+        args: Parsed command-line arguments.
+        watcher: Watcher to use; by default one is opened with
+            ``--watch-backend`` and closed on return.
+        max_cycles: Stop after this many wait cycles (runs forever if None).
+
+    """
+    data_dir = args.data_dir
+    max_workers, index_workers = _worker_counts(args)
+    owns_watcher = watcher is None
+    if watcher is None:
+        # Opened before the first run so that changes made during it are seen.
+        watcher = open_watcher(
+            data_dir,
             args.tradeable_dir,
-            args.metadata_output,
+            backend=args.watch_backend,
+            interval=args.watch_interval,
+        )
+    try:
+        manifest = cache.DiagnosticsManifest.load(
+            _diagnostics_manifest_path(args),
+            content_hash=args.hash_contents,
         )
-        cache.save_cache_metadata(args.cache_metadata, new_cache_metadata)
-        LOGGER.debug("Saved cache metadata for future incremental resumes")
+        stooq_index = _handle_stooq_index(args, index_workers)
+        lookups = build_stooq_lookup(stooq_index)
+        available_extensions = collect_available_extensions(stooq_index)
+        with log_duration("tradeable_load"):
+            tradeables = load_tradeable_instruments(args.tradeable_dir)
+
+        cycle = 0
+        changes = None
+        while True:
+            if changes is not None and (changes.rescan or changes.directories):
+                stooq_index = _refresh_stooq_index(args, index_workers)
+                lookups = build_stooq_lookup(stooq_index)
+                available_extensions = collect_available_extensions(stooq_index)
+            if changes is not None and (changes.rescan or changes.tradeables):
+                with log_duration("tradeable_load"):
+                    tradeables = load_tradeable_instruments(args.tradeable_dir)
+            if (
+                changes is None
+                or changes.rescan
+                or changes.directories
+                or changes.tradeables
+            ):
+                matches, unmatched = _match_instruments(
+                    tradeables,
+                    lookups,
+                    available_extensions,
+                )
+                watcher.track(match.stooq_file.rel_path for match in matches)
+            if changes is not None:
+                # Rewrites within one mtime tick keep the stat fingerprint.
+                manifest.invalidate(changes.files)
+            _generate_reports(matches, unmatched, args, data_dir, max_workers, manifest)
+            _write_price_panel(args, max_workers, incremental=True)
+            _save_incremental_state(args, manifest)
+
+            LOGGER.info("Watching %s and %s for changes", data_dir, args.tradeable_dir)
+            changes = ChangeSet()
+            while not changes:
+                if max_cycles is not None and cycle >= max_cycles:
+                    return
+                cycle += 1
+                changes = watcher.wait(args.watch_interval, settle=WATCH_SETTLE_SECONDS)
+            LOGGER.info(
+                "Detected changes: %s directories, %s price files%s%s",
+                len(changes.directories),
+                len(changes.files),
+                ", tradeable lists" if changes.tradeables else "",
+                ", full rescan" if changes.rescan else "",
+            )
+    finally:
+        if owns_watcher:
+            watcher.close()
 
 
 def run_cli(args: argparse.Namespace) -> int:
     """Execute the CLI workflow with logging and error handling."""
     configure_logging(args.log_level)
     try:
-        prepare_tradeable_data(args)
+        if args.watch:
+            watch_tradeable_data(args)
+        else:
+            prepare_tradeable_data(args)
+    except KeyboardInterrupt:
+        if not args.watch:
+            raise
+        LOGGER.info("Watch mode stopped")
     except Exception:  # pragma: no cover - defensive
         LOGGER.exception("Tradeable data preparation failed")
         return 1
@@ -69,7 +69,9 @@ from portfolio_management.core.exceptions import (
 )
 from portfolio_management.portfolio import (
     EqualWeightStrategy,
+    HierarchicalRiskParityStrategy,
     MeanVarianceStrategy,
+    PortfolioResultCache,
     PortfolioStrategy,
     RiskParityStrategy,
 )
@@ -113,7 +115,12 @@ def create_parser() -> argparse.ArgumentParser:
     # Required arguments
     parser.add_argument(
         "strategy",
-        choices=["equal_weight", "risk_parity", "mean_variance"],
+        choices=[
+            "equal_weight",
+            "risk_parity",
+            "hierarchical_risk_parity",
+            "mean_variance",
+        ],
         help="Portfolio construction strategy to use",
     )
 
@@ -156,6 +163,19 @@ def create_parser() -> argparse.ArgumentParser:
         default=Decimal("1.0"),
         help="Minimum commission per trade. Default: 1.0",
     )
+    parser.add_argument(
+        "--cost-aware",
+        action="store_true",
+        help="Optimize target weights net of the commission and slippage of "
+        "trading from current holdings (mean-variance and risk parity).",
+    )
+    parser.add_argument(
+        "--trade-aversion",
+        type=float,
+        default=1.0,
+        help="Weight of trading costs in the cost-aware objective; higher values "
+        "trade less. Default: 1.0",
+    )
 
     # Rebalancing
     parser.add_argument(
@@ -176,6 +196,13 @@ def create_parser() -> argparse.ArgumentParser:
         default=252,
         help="Rolling lookback window for parameter estimation (days). Default: 252 (1 year)",
     )
+    parser.add_argument(
+        "--precision",
+        choices=["float64", "float32"],
+        default="float64",
+        help="Floating-point type of the stored price and returns panels; float32 "
+        "halves their memory. Optimizer inputs stay float64. Default: float64",
+    )
 
     # Data sources
     parser.add_argument(
@@ -337,7 +364,10 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--enable-cache",
         action="store_true",
-        help="Enable on-disk caching for factor scores and PIT eligibility",
+        help=(
+            "Enable on-disk caching for factor scores, PIT eligibility and "
+            "constructed portfolios"
+        ),
     )
     parser.add_argument(
         "--cache-dir",
@@ -515,6 +545,8 @@ def create_strategy(strategy_name: str) -> PortfolioStrategy:
         return EqualWeightStrategy()
     if strategy_name == "risk_parity":
         return RiskParityStrategy()
+    if strategy_name == "hierarchical_risk_parity":
+        return HierarchicalRiskParityStrategy()
     if strategy_name == "mean_variance":
         return MeanVarianceStrategy()
     raise ValueError(f"Unknown strategy: {strategy_name}")
@@ -913,6 +945,8 @@ def save_results(
         "commission_min": float(config.commission_min),
         "slippage_bps": float(config.slippage_bps),
         "cash_reserve_pct": float(config.cash_reserve_pct),
+        "cost_aware_rebalancing": config.cost_aware_rebalancing,
+        "trade_aversion": float(config.trade_aversion),
     }
     with open(output_dir / "config.json", "w") as f:
         json.dump(config_dict, f, indent=2)
@@ -1134,10 +1168,14 @@ def main() -> int:
             use_pit_eligibility=args.use_pit_eligibility,
             min_history_days=args.min_history_days,
             min_price_rows=args.min_price_rows,
+            cost_aware_rebalancing=args.cost_aware,
+            trade_aversion=args.trade_aversion,
+            precision=args.precision,
         )
 
         # Create cache if enabled
         cache = None
+        result_cache = None
         if args.enable_cache:
             from portfolio_management.data.factor_caching import FactorCache
 
@@ -1147,6 +1185,7 @@ def main() -> int:
                 enabled=True,
                 max_cache_age_days=args.cache_max_age_days,
             )
+            result_cache = PortfolioResultCache(cache_dir=cache_dir / "portfolios")
             if args.verbose:
                 print(f"Caching enabled: {cache_dir}")
                 if args.cache_max_age_days:
@@ -1186,6 +1225,7 @@ def main() -> int:
             preselection=preselection,
             membership_policy=membership_policy,
             cache=cache,
+            result_cache=result_cache,
         )
         equity_curve, metrics, rebalance_events = engine.run()
         if args.verbose:
@@ -1198,6 +1238,12 @@ def main() -> int:
         if cache is not None and args.verbose:
             print("\nCache Statistics:")
             cache.print_stats()
+            portfolio_stats = result_cache.get_stats()
+            print(
+                f"Portfolio results: {portfolio_stats['hits']} hits, "
+                f"{portfolio_stats['disk_hits']} disk hits, "
+                f"{portfolio_stats['misses']} misses",
+            )
 
         # Save results
         save_results(
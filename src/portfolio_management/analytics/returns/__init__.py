@@ -5,16 +5,25 @@ This package provides end-to-end return calculation from price data:
 - Price data loaders with validation
 - Return calculator with missing data handling and alignment
 - Summary statistics for prepared returns
+- A persistent returns cache shared across processes
+- A memory-mapped price-series tier shared by concurrent loaders
+- A column-block store for returns of universes too wide for memory
 """
 
+from .cache import ReturnsCache
 from .calculator import ReturnCalculator
 from .config import ReturnConfig
 from .loaders import PriceLoader
 from .models import ReturnSummary
+from .shared_cache import SharedPriceCache
+from .store import ReturnsStore
 
 __all__ = [
     "PriceLoader",
     "ReturnCalculator",
     "ReturnConfig",
     "ReturnSummary",
+    "ReturnsCache",
+    "ReturnsStore",
+    "SharedPriceCache",
 ]
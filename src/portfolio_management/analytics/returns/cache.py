@@ -0,0 +1,351 @@
+"""On-disk cache of prepared returns shared across processes.
+
+`ReturnCalculator.load_and_prepare` otherwise reloads every price file and
+reruns the whole pipeline on each CLI invocation. `ReturnsCache` keeps two
+things on disk:
+
+- ``returns/<key>.npz``: prepared returns and the per-asset fill counts of
+  the run, keyed by the sorted asset list, the (path, size, mtime)
+  fingerprint of each asset's price file, the price panel state and a hash
+  of the `ReturnConfig`. A matching entry is returned without loading any
+  prices.
+- ``prices/``: the close series of every asset loaded so far, each tagged
+  with the fingerprint it was read under. When the returns key misses (new
+  configuration, a few assets added or changed), only assets whose
+  fingerprint moved are loaded again; the others come from the store and the
+  pipeline reruns on the combined prices.
+
+Observations with a missing close are not stored; every other input to the
+pipeline is reproduced exactly, so cached and uncached results are equal.
+
+Key Classes:
+    - ReturnsCache: Persistent returns and price-series cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+import zipfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from ...core.utils import atomic_write
+from .loaders import assemble_price_frame
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ...assets.selection.selection import SelectedAsset
+    from .config import ReturnConfig
+    from .loaders import PriceLoader
+
+logger = logging.getLogger(__name__)
+
+RETURNS_CACHE_VERSION = 1
+
+_PRICE_INDEX = "index.json"
+
+
+def _fingerprint(path: Path | None) -> list | None:
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [str(path.resolve()), stat.st_size, stat.st_mtime_ns]
+
+
+class ReturnsCache:
+    """Persistent cache of prepared returns and the prices behind them.
+
+    Example:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> cache = ReturnsCache(Path(tempfile.mkdtemp()) / "returns_cache")
+        >>> cache.stats()
+        {'hits': 0, 'misses': 0, 'reloaded_assets': 0, 'reused_assets': 0}
+
+    """
+
+    def __init__(self, path: Path | str, *, max_entries: int = 32) -> None:
+        """Initialise the cache.
+
+        Args:
+            path: Directory holding the cache files; created on first write.
+            max_entries: Returns entries kept on disk; the least recently
+                used are removed beyond this.
+
+        Raises:
+            ValueError: If ``max_entries`` is not positive.
+
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "reloaded_assets", "reused_assets"),
+            0,
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and per-asset reuse counters of this instance."""
+        return dict(self._stats)
+
+    @staticmethod
+    def sources(
+        assets: Sequence[SelectedAsset],
+        prices_dir: Path,
+        loader: PriceLoader,
+    ) -> dict[str, list]:
+        """Fingerprint the inputs of a `ReturnCalculator.load_and_prepare` call.
+
+        Args:
+            assets: Assets to be prepared.
+            prices_dir: Directory holding their price files.
+            loader: The calculator's price loader, which resolves each price
+                file; its price panel, if any, is part of every fingerprint.
+
+        Returns:
+            Per symbol, the asset's price file fingerprint and panel state.
+
+        """
+        panel = getattr(loader, "panel", None)
+        panel_state = (
+            _fingerprint(panel.path / _PRICE_INDEX) if panel is not None else None
+        )
+        sources: dict[str, list] = {}
+        for asset in assets:
+            if asset.symbol not in sources:
+                sources[asset.symbol] = [
+                    asset.stooq_path,
+                    _fingerprint(
+                        loader._resolve_price_path(prices_dir, asset),  # noqa: SLF001
+                    ),
+                    panel_state,
+                ]
+        return sources
+
+    def get(
+        self,
+        config: ReturnConfig,
+        sources: dict[str, list],
+    ) -> tuple[pd.DataFrame, pd.Series] | None:
+        """Return the cached returns and fill counts for these inputs, or None.
+
+        Columns follow the order of ``sources``, like a fresh computation; the
+        fill counts are the `ReturnCalculator.latest_fill_counts` of the run
+        that stored the entry.
+        """
+        entry_path = self._entry_path(config, sources)
+        try:
+            with np.load(entry_path, allow_pickle=False) as entry:
+                meta = json.loads(str(entry["meta"]))
+                returns = pd.DataFrame(
+                    entry["values"],
+                    index=pd.DatetimeIndex(
+                        entry["index"].astype("datetime64[ns]"),
+                        freq=meta["freq"],
+                        name=meta["index_name"],
+                    ),
+                    columns=entry["columns"].tolist(),
+                )
+                fill_counts = pd.Series(
+                    entry["fill_counts"],
+                    index=entry["fill_columns"].tolist(),
+                )
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            self._stats["misses"] += 1
+            return None
+        os.utime(entry_path)  # least recently used eviction order
+        self._stats["hits"] += 1
+        logger.info(
+            "Loaded cached returns for %d assets from %s",
+            returns.shape[1],
+            entry_path,
+        )
+        return (
+            returns[[symbol for symbol in sources if symbol in returns.columns]],
+            fill_counts[[symbol for symbol in sources if symbol in fill_counts.index]],
+        )
+
+    def put(
+        self,
+        config: ReturnConfig,
+        sources: dict[str, list],
+        returns: pd.DataFrame,
+        fill_counts: pd.Series,
+    ) -> None:
+        """Store prepared returns and their fill counts for these inputs."""
+        entry_path = self._entry_path(config, sources)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        index = pd.DatetimeIndex(returns.index)
+        meta = {"freq": index.freqstr, "index_name": index.name}
+        with atomic_write(entry_path) as tmp_path, tmp_path.open("wb") as handle:
+            np.savez(
+                handle,
+                values=returns.to_numpy(dtype=config.precision),
+                index=index.to_numpy(dtype="datetime64[ns]").astype(np.int64),
+                columns=np.array([str(column) for column in returns.columns]),
+                meta=np.array(json.dumps(meta)),
+                fill_counts=fill_counts.to_numpy(dtype=np.int64),
+                fill_columns=np.array([str(column) for column in fill_counts.index]),
+            )
+        entries = sorted(
+            entry_path.parent.glob("*.npz"),
+            key=lambda path: path.stat().st_mtime_ns,
+        )
+        for stale in entries[: -self.max_entries]:
+            stale.unlink(missing_ok=True)
+
+    def load_prices(
+        self,
+        assets: Sequence[SelectedAsset],
+        prices_dir: Path,
+        sources: dict[str, list],
+        loader: object,
+    ) -> pd.DataFrame:
+        """Load prices, reading only assets whose fingerprint changed.
+
+        Assets stored under their current fingerprint are served from the
+        price store; the rest go through ``loader.load_multiple_prices`` and
+        replace their stored series.
+
+        Returns:
+            The frame ``loader.load_multiple_prices(assets, prices_dir)``
+            would return.
+
+        """
+        stored = self._read_prices()
+        fresh = {
+            symbol: stored[symbol][1:]
+            for symbol, source in sources.items()
+            if symbol in stored and stored[symbol][0] == source
+        }
+        stale_assets = list(
+            {
+                asset.symbol: asset for asset in assets if asset.symbol not in fresh
+            }.values(),
+        )
+        self._stats["reused_assets"] += len(fresh)
+        self._stats["reloaded_assets"] += len(stale_assets)
+
+        series = {
+            symbol: pd.Series(
+                np.array(values),
+                index=pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="date"),
+            )
+            for symbol, (values, dates) in fresh.items()
+            if values.size
+        }
+        if stale_assets:
+            loaded = loader.load_multiple_prices(stale_assets, prices_dir)
+            for asset in stale_assets:
+                values = (
+                    loaded[asset.symbol].dropna()
+                    if asset.symbol in loaded.columns
+                    else pd.Series(dtype="float64")
+                )
+                stored[asset.symbol] = (
+                    sources[asset.symbol],
+                    values.to_numpy(dtype=np.float64),
+                    values.index.to_numpy(dtype="datetime64[ns]").astype(np.int64),
+                )
+                if not values.empty:
+                    series[asset.symbol] = values
+            self._write_prices(stored)
+            logger.info(
+                "Reused cached prices for %d assets; loaded %d",
+                len(fresh),
+                len(stale_assets),
+            )
+
+        if not series:
+            return pd.DataFrame()
+        frame = assemble_price_frame(series)
+        return frame[[symbol for symbol in sources if symbol in frame.columns]]
+
+    def _entry_path(
+        self,
+        config: ReturnConfig,
+        sources: dict[str, list],
+    ) -> Path:
+        payload = json.dumps(
+            [RETURNS_CACHE_VERSION, asdict(config), sorted(sources.items())],
+            sort_keys=True,
+        )
+        key = hashlib.sha256(payload.encode()).hexdigest()[:32]
+        return self.path / "returns" / f"{key}.npz"
+
+    def _read_prices(self) -> dict[str, tuple[list, np.ndarray, np.ndarray]]:
+        """Return the stored closes and dates (int64 ns) with their fingerprint.
+
+        The arrays are views of the memory-mapped store.
+        """
+        prices_dir = self.path / "prices"
+        try:
+            index = json.loads((prices_dir / _PRICE_INDEX).read_text(encoding="utf-8"))
+            if index.get("version") != RETURNS_CACHE_VERSION:
+                return {}
+            token = index["token"]
+            values = np.load(prices_dir / f"{token}.values.npy", mmap_mode="r")
+            dates = np.load(prices_dir / f"{token}.dates.npy", mmap_mode="r")
+        except (OSError, KeyError, ValueError):
+            return {}
+        return {
+            symbol: (
+                source,
+                values[offset : offset + length],
+                dates[offset : offset + length],
+            )
+            for symbol, (source, offset, length) in index["entries"].items()
+        }
+
+    def _write_prices(
+        self,
+        stored: dict[str, tuple[list, np.ndarray, np.ndarray]],
+    ) -> None:
+        """Replace the price store; readers keep the files they opened."""
+        prices_dir = self.path / "prices"
+        prices_dir.mkdir(parents=True, exist_ok=True)
+        entries = {}
+        offset = 0
+        for symbol, (source, values, _dates) in stored.items():
+            entries[symbol] = [source, offset, int(values.size)]
+            offset += values.size
+        token = uuid.uuid4().hex
+        for name, position, dtype in (
+            ("values", 1, np.float64),
+            ("dates", 2, np.int64),
+        ):
+            column = np.concatenate(
+                [entry[position] for entry in stored.values()] or [np.empty(0)],
+            ).astype(dtype, copy=False)
+            with (
+                atomic_write(prices_dir / f"{token}.{name}.npy") as tmp_path,
+                tmp_path.open("wb") as handle,
+            ):
+                np.save(handle, column)
+        with atomic_write(prices_dir / _PRICE_INDEX) as tmp_path:
+            tmp_path.write_text(
+                json.dumps(
+                    {
+                        "version": RETURNS_CACHE_VERSION,
+                        "token": token,
+                        "entries": entries,
+                    },
+                ),
+                encoding="utf-8",
+            )
+        for path in prices_dir.glob("*.npy"):
+            if not path.name.startswith(token):
+                path.unlink(missing_ok=True)
@@ -43,23 +43,107 @@ Usage Example:
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import tempfile
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
+from threading import Lock
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
 from ...core.exceptions import InsufficientDataError, ReturnCalculationError
+from .cache import ReturnsCache
 from .config import ReturnConfig
 from .loaders import PriceLoader
 from .models import ReturnSummary
+from .store import ReturnsStore
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ...assets.selection.selection import SelectedAsset
 
 logger = logging.getLogger(__name__)
 
+_RESAMPLE_RULES = {
+    "weekly": "W-FRI",
+    "monthly": "ME",
+}
+
+
+def _index_digest(index: pd.DatetimeIndex) -> str:
+    """Return a digest of the dates in *index*."""
+    return hashlib.blake2b(index.asi8.tobytes(), digest_size=16).hexdigest()
+
+
+def _row_positions(n_rows: int, limit: int) -> np.ndarray:
+    """Return the row numbers as a column vector of the narrowest safe dtype."""
+    dtype = np.int32 if n_rows + limit < np.iinfo(np.int32).max else np.int64
+    return np.arange(n_rows, dtype=dtype)[:, np.newaxis]
+
+
+def _last_complete_row(prices: pd.DataFrame, end: int) -> int:
+    """Return the last row before *end* without missing prices, or 0 if none.
+
+    The rows are scanned backwards in doubling spans, so the cost follows the
+    distance to that row rather than the length of *prices*.
+    """
+    span = 1
+    while True:
+        start = max(end - span, 0)
+        complete = np.flatnonzero(prices.iloc[start:end].notna().to_numpy().all(axis=1))
+        if len(complete):
+            return start + int(complete[-1])
+        if not start:
+            return 0
+        span *= 2
+
+
+def _interpolate_limited(
+    values: np.ndarray,
+    limit: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Linearly interpolate each column of *values* within *limit* rows of data.
+
+    Matches ``DataFrame.interpolate(method="linear", limit=limit,
+    limit_direction="both")``: a NaN is filled when a valid value lies within
+    *limit* rows before or after it, leading and trailing gaps take the
+    nearest valid value, and interpolation is over row positions. The
+    neighbouring valid rows come from ``np.maximum.accumulate`` down and
+    ``np.minimum.accumulate`` up each column.
+
+    Returns:
+        The filled copy of *values* and the number of filled cells per column.
+
+    """
+    missing = np.isnan(values)
+    n_rows = values.shape[0]
+    rows = _row_positions(n_rows, limit)
+    last_valid = np.where(missing, rows.dtype.type(-limit - 1), rows)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    next_valid = np.where(missing, rows.dtype.type(n_rows + limit), rows)[::-1]
+    np.minimum.accumulate(next_valid, axis=0, out=next_valid)
+    next_valid = next_valid[::-1]
+    fill = np.greater_equal(last_valid, rows - limit)
+    fill |= np.less_equal(next_valid, rows + limit)
+    fill &= missing
+
+    fill_rows, fill_cols = np.nonzero(fill)
+    before = last_valid[fill_rows, fill_cols]
+    after = next_valid[fill_rows, fill_cols]
+    before = np.where(before >= 0, before, after)
+    after = np.where(after < n_rows, after, before)
+    start = values[before, fill_cols].astype(np.float64)
+    stop = values[after, fill_cols].astype(np.float64)
+    span = np.maximum(after - before, 1)
+    filled = values.copy()
+    filled[fill_rows, fill_cols] = (stop - start) / span * (fill_rows - before) + start
+    return filled, np.bincount(fill_cols, minlength=values.shape[1])
+
 
 class ReturnCalculator:
     """Prepare aligned return series ready for portfolio construction.
@@ -78,11 +162,19 @@ class ReturnCalculator:
     6. Resample returns to the desired frequency (e.g., monthly).
     7. Filter assets based on a minimum data coverage threshold.
 
+    `load_and_prepare_blocks` runs the same pipeline a block of assets at a
+    time into a `ReturnsStore`, for universes whose price matrix does not fit
+    in memory.
+
     Attributes:
         price_loader (PriceLoader): An instance of a price loader to fetch
             raw price data.
         latest_summary (Optional[ReturnSummary]): A summary of the statistics
             from the most recently calculated returns DataFrame.
+        latest_fill_counts (Optional[pd.Series]): The number of price cells
+            filled per asset by the most recent missing-data handling.
+        resample_cache_size (int): Number of weekly or monthly return panels
+            kept in memory for reuse by later calls over overlapping assets.
 
     Example:
         >>> from pathlib import Path
@@ -101,21 +193,61 @@ class ReturnCalculator:
 
     """
 
-    def __init__(self, price_loader: PriceLoader | None = None):
+    def __init__(
+        self,
+        price_loader: PriceLoader | None = None,
+        returns_cache: ReturnsCache | Path | str | None = None,
+        resample_cache_size: int = 8,
+    ):
         """Initializes the ReturnCalculator.
 
         Args:
             price_loader (Optional[PriceLoader]): A price loader instance.
                 If not provided, a default `PriceLoader` will be created.
+            returns_cache (Optional[ReturnsCache | Path | str]): On-disk cache
+                (or its directory) that `load_and_prepare` reuses across
+                processes while the price files and configuration are
+                unchanged.
+            resample_cache_size (int): Number of weekly or monthly return
+                panels kept in memory, one per frequency, configuration and
+                daily calendar. Later calls over overlapping assets slice the
+                cached columns instead of resampling them again; 0 disables.
+
+        Raises:
+            ValueError: If ``resample_cache_size`` is negative.
         """
+        if resample_cache_size < 0:
+            raise ValueError("resample_cache_size must be >= 0")
         self.price_loader = price_loader or PriceLoader()
+        self.returns_cache = (
+            ReturnsCache(returns_cache)
+            if isinstance(returns_cache, (str, Path))
+            else returns_cache
+        )
         self._latest_summary: ReturnSummary | None = None
+        self._latest_fill_counts: pd.Series | None = None
+        self.resample_cache_size = resample_cache_size
+        self._resampled: OrderedDict[tuple, tuple[pd.DataFrame, dict[str, list]]] = (
+            OrderedDict()
+        )
+        self._resample_stats = dict.fromkeys(("reused_columns", "resampled_columns"), 0)
+        self._resample_lock = Lock()
 
     @property
     def latest_summary(self) -> ReturnSummary | None:
         """Return the summary produced by the most recent pipeline run."""
         return self._latest_summary
 
+    @property
+    def latest_fill_counts(self) -> pd.Series | None:
+        """Return the cells filled per asset by the latest `handle_missing_data`."""
+        return self._latest_fill_counts
+
+    def resample_cache_stats(self) -> dict[str, int]:
+        """Return the cached panels and the columns reused from or added to them."""
+        with self._resample_lock:
+            return {"entries": len(self._resampled), **self._resample_stats}
+
     def load_and_prepare(
         self,
         assets: list[SelectedAsset],
@@ -126,7 +258,9 @@ class ReturnCalculator:
 
         This is the main entry point for the class. It takes a list of assets,
         a directory of price files, and a configuration object, then executes
-        the full data preparation pipeline.
+        the full data preparation pipeline. With a `returns_cache`, unchanged
+        inputs are served from disk and only assets whose price files changed
+        are reloaded.
 
         Args:
             assets (list[SelectedAsset]): A list of assets to process.
@@ -144,6 +278,41 @@ class ReturnCalculator:
             ReturnCalculationError: If the prices directory does not exist or the
                 configuration is invalid.
         """
+        self._check_inputs(assets, prices_dir, config)
+        logger.info("Preparing returns for %d assets", len(assets))
+
+        if self.returns_cache is None:
+            prices = self.price_loader.load_multiple_prices(assets, prices_dir)
+            sources = (
+                ReturnsCache.sources(assets, prices_dir, self.price_loader)
+                if self._uses_resample_cache(config)
+                else None
+            )
+            return self._prepare_returns(prices, len(assets), config, sources)
+
+        sources = self.returns_cache.sources(assets, prices_dir, self.price_loader)
+        cached = self.returns_cache.get(config, sources)
+        if cached is not None:
+            returns, self._latest_fill_counts = cached
+            self._latest_summary = self._summarize_returns(returns, config)
+            return returns
+        prices = self.returns_cache.load_prices(
+            assets,
+            prices_dir,
+            sources,
+            self.price_loader,
+        )
+        returns = self._prepare_returns(prices, len(assets), config, sources)
+        self.returns_cache.put(config, sources, returns, self._latest_fill_counts)
+        return returns
+
+    @staticmethod
+    def _check_inputs(
+        assets: list[SelectedAsset] | None,
+        prices_dir: Path,
+        config: ReturnConfig,
+    ) -> None:
+        """Validate the arguments of the load-and-prepare entry points."""
         if assets is None:
             raise InsufficientDataError(
                 "Assets for return preparation cannot be None.",
@@ -169,22 +338,215 @@ class ReturnCalculator:
                 f"Invalid return configuration: {exc}",
             ) from exc
 
-        logger.info("Preparing returns for %d assets", len(assets))
+    def load_and_prepare_blocks(
+        self,
+        assets: list[SelectedAsset],
+        prices_dir: Path,
+        config: ReturnConfig,
+        store: ReturnsStore | Path | str,
+        *,
+        block_size: int = 1000,
+    ) -> ReturnsStore:
+        """Run the pipeline of `load_and_prepare` a block of assets at a time.
+
+        Peak memory is bounded by ``block_size`` assets rather than the whole
+        universe. A first pass counts the prices of each block per date with
+        `PriceLoader.count_prices`, without aligning them into a frame, to
+        build the union calendar (and, for ``handle_missing="drop"``, the
+        dates on which every asset has a price). A second pass fills and
+        computes the returns of each block on that calendar, reusing the
+        series still held by the loader's cache, and stages them on disk
+        while counting the valid returns per date, which resolves the global
+        row alignment.
+        A last pass aligns, resamples and coverage-filters every staged block
+        and appends it to ``store``. The stored returns equal those of
+        `load_and_prepare` for the same inputs.
+
+        `latest_summary` holds the per-asset statistics of the stored returns;
+        its correlation matrix is left empty, as it is as wide as the universe.
+        The returns cache is not used.
+
+        Args:
+            assets (list[SelectedAsset]): A list of assets to process.
+            prices_dir (Path): The directory where asset price CSV files are stored.
+            config (ReturnConfig): Configuration object specifying how to process
+                the returns.
+            store (ReturnsStore | Path | str): Returns store (or its directory)
+                that receives the prepared returns; existing contents are
+                replaced.
+            block_size (int): Number of assets loaded and processed at once.
+
+        Returns:
+            ReturnsStore: The store holding the prepared returns.
+
+        Raises:
+            InsufficientDataError: If no assets are provided, no price data can be
+                found, or if all assets are filtered out during processing.
+            ReturnCalculationError: If the prices directory does not exist, the
+                configuration is invalid or ``block_size`` is not positive.
+        """
+        self._check_inputs(assets, prices_dir, config)
+        if block_size <= 0:
+            raise ReturnCalculationError("block_size must be > 0")
+        store = ReturnsStore(store) if isinstance(store, (str, Path)) else store
+        self._latest_summary = None
+
+        first_assets: dict[str, SelectedAsset] = {}
+        for asset in assets:
+            first_assets.setdefault(asset.symbol, asset)
+        unique_assets = list(first_assets.values())
+        blocks = [
+            unique_assets[start : start + block_size]
+            for start in range(0, len(unique_assets), block_size)
+        ]
+        logger.info(
+            "Preparing returns for %d assets in %d blocks",
+            len(assets),
+            len(blocks),
+        )
+
+        present: pd.Series | None = None
+        loaded_count = 0
+        # Counted in reverse, so the loader's LRU cache ends up holding the
+        # leading blocks, which the second pass reads first.
+        for block in reversed(blocks):
+            counts, count = self.price_loader.count_prices(block, prices_dir)
+            if not count:
+                continue
+            present = counts if present is None else present.add(counts, fill_value=0)
+            loaded_count += count
+        if present is None:
+            raise InsufficientDataError(
+                "No price data available for requested assets.",
+                asset_count=len(assets),
+            )
+        present = present.sort_index()
+        price_rows = present.index
+        if config.handle_missing == "drop":
+            price_rows = price_rows[present.to_numpy() == loaded_count]
+            if price_rows.empty:
+                raise InsufficientDataError(
+                    "All price data was removed during missing-data handling.",
+                    asset_count=len(assets),
+                )
+
+        store.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(
+            prefix=f".{store.path.name}.",
+            dir=store.path.parent,
+        ) as staging_dir:
+            staging = ReturnsStore(staging_dir)
+            staging.create(price_rows, config.precision)
+            valid_counts = np.zeros(len(price_rows), dtype=np.int64)
+            fill_counts = []
+            for block in blocks:
+                prices = self.price_loader.load_multiple_prices(block, prices_dir)
+                if prices.empty:
+                    continue
+                prices = prices.reindex(price_rows).astype(config.precision, copy=False)
+                # Restore rows dropped as empty within the block, so returns
+                # are taken between the same dates as on the full panel.
+                prices = self.handle_missing_data(prices, config).reindex(price_rows)
+                fill_counts.append(self._latest_fill_counts)
+                returns = self.calculate_returns(prices, config)
+                if returns.empty:
+                    continue
+                returns = returns.reindex(price_rows)
+                valid_counts += returns.notna().sum(axis=1).to_numpy()
+                staging.append(returns)
+            self._latest_fill_counts = pd.concat(fill_counts)
+
+            column_count = len(staging.columns)
+            if not column_count:
+                raise InsufficientDataError(
+                    "Unable to compute returns for the selected assets.",
+                    asset_count=len(assets),
+                )
+            if config.align_method == "inner":
+                rows = price_rows[valid_counts == column_count]
+            else:
+                rows = price_rows[valid_counts > 0]
+            aligned_index = rows
+            if config.reindex_to_business_days and not rows.empty:
+                aligned_index = pd.bdate_range(rows.min(), rows.max())
+            # Periods without any valid return are dropped after resampling.
+            has_returns = pd.DataFrame(
+                {"returns": np.where(aligned_index.isin(rows), 0.0, np.nan)},
+                index=aligned_index,
+            )
+            dates = self._resample_to_frequency(
+                has_returns,
+                config.frequency,
+                config.method,
+            ).index
+            if dates.empty:
+                raise InsufficientDataError(
+                    "All assets were removed by the coverage filter.",
+                    asset_count=len(assets),
+                )
+
+            store.create(dates, config.precision)
+            summaries = []
+            for staged in staging.iter_blocks():
+                returns = staged.reindex(rows).reindex(aligned_index)
+                returns = self._resample_to_frequency(
+                    returns,
+                    config.frequency,
+                    config.method,
+                ).reindex(dates)
+                returns = self._apply_coverage_filter(returns, config.min_coverage)
+                if returns.shape[1]:
+                    store.append(returns)
+                    summaries.append(
+                        self._summarize_returns(returns, config, correlation=False),
+                    )
+
+        if not summaries:
+            raise InsufficientDataError(
+                "All assets were removed by the coverage filter.",
+                asset_count=len(assets),
+            )
+        self._latest_summary = ReturnSummary(
+            mean_returns=pd.concat([summary.mean_returns for summary in summaries]),
+            volatility=pd.concat([summary.volatility for summary in summaries]),
+            correlation=pd.DataFrame(),
+            coverage=pd.concat([summary.coverage for summary in summaries]),
+        )
+        logger.info(
+            "Prepared %d assets across %d periods in %s",
+            len(store.columns),
+            len(dates),
+            store.path,
+        )
+        return store
+
+    def _prepare_returns(
+        self,
+        prices: pd.DataFrame,
+        asset_count: int,
+        config: ReturnConfig,
+        sources: dict[str, list] | None = None,
+    ) -> pd.DataFrame:
+        """Run the pipeline of `load_and_prepare` on loaded prices.
 
-        prices = self.price_loader.load_multiple_prices(assets, prices_dir)
+        ``sources`` fingerprints the price inputs per symbol (see
+        `ReturnsCache.sources`); with it, resampled columns are shared with
+        earlier calls through the resample cache.
+        """
         if prices.empty:
             self._latest_summary = None
             raise InsufficientDataError(
                 "No price data available for requested assets.",
-                asset_count=len(assets),
+                asset_count=asset_count,
             )
 
+        prices = prices.astype(config.precision, copy=False)
         prices = self.handle_missing_data(prices, config)
         if prices.empty:
             self._latest_summary = None
             raise InsufficientDataError(
                 "All price data was removed during missing-data handling.",
-                asset_count=len(assets),
+                asset_count=asset_count,
             )
 
         returns = self.calculate_returns(prices, config)
@@ -192,18 +554,25 @@ class ReturnCalculator:
             self._latest_summary = None
             raise InsufficientDataError(
                 "Unable to compute returns for the selected assets.",
-                asset_count=len(assets),
+                asset_count=asset_count,
             )
 
         returns = self._align_dates(returns, config)
-        returns = self._resample_to_frequency(returns, config.frequency, config.method)
+        if sources is None or not self._uses_resample_cache(config):
+            returns = self._resample_to_frequency(
+                returns,
+                config.frequency,
+                config.method,
+            )
+        else:
+            returns = self._resample_cached(returns, config, prices.index, sources)
         returns = self._apply_coverage_filter(returns, config.min_coverage)
 
         if returns.empty:
             self._latest_summary = None
             raise InsufficientDataError(
                 "All assets were removed by the coverage filter.",
-                asset_count=len(assets),
+                asset_count=asset_count,
             )
 
         self._latest_summary = self._summarize_returns(returns, config)
@@ -217,6 +586,90 @@ class ReturnCalculator:
 
         return returns
 
+    def extend_returns(
+        self,
+        returns: pd.DataFrame,
+        prices: pd.DataFrame,
+        config: ReturnConfig,
+    ) -> pd.DataFrame:
+        """Append returns for the price dates after the last row of *returns*.
+
+        Rather than re-running `load_and_prepare` over the whole history after
+        a daily update, only the new dates and the few rows before them that
+        forward filling and the first new return depend on are processed, so
+        the cost is O(new rows). The columns of *returns* are kept: the
+        ``min_periods`` and coverage filters are not re-evaluated.
+
+        Only daily returns prepared with the ``forward_fill`` or ``drop``
+        strategies can be extended; resampled periods and interpolated gaps
+        depend on prices beyond the new rows.
+
+        Args:
+            returns (pd.DataFrame): Daily returns from `load_and_prepare` run
+                with *config*.
+            prices (pd.DataFrame): Prices of at least the assets of
+                *returns*, covering the last ``max_forward_fill_days + 1``
+                dates of *returns* (with ``drop``, back to the last date on
+                which all of them have a price) and the new dates. Earlier
+                rows are ignored.
+            config (ReturnConfig): The configuration *returns* was prepared
+                with.
+
+        Returns:
+            pd.DataFrame: *returns* followed by the returns of the new dates.
+
+        Raises:
+            ReturnCalculationError: If *returns* is empty or *config* cannot
+                be extended incrementally.
+        """
+        if config.frequency != "daily" or config.handle_missing == "interpolate":
+            raise ReturnCalculationError(
+                "Only daily returns with forward_fill or drop missing-data "
+                "handling can be extended; use load_and_prepare instead.",
+            )
+        if returns.empty:
+            raise ReturnCalculationError("Cannot extend an empty returns frame.")
+
+        last_date = returns.index[-1]
+        prices = prices.sort_index()
+        first_new = int(prices.index.searchsorted(last_date, side="right"))
+        if first_new == len(prices.index):
+            return returns
+
+        start = max(first_new - config.max_forward_fill_days - 1, 0)
+        if config.handle_missing == "drop":
+            # Rows are dropped on the assets of *returns* only, and the first
+            # new return is measured from the last date all of them priced.
+            prices = prices.reindex(columns=returns.columns)
+            start = min(start, _last_complete_row(prices, first_new))
+        window = prices.iloc[start:]
+        window = self.handle_missing_data(window, config)
+        new_returns = self.calculate_returns(window, replace(config, min_periods=1))
+        if new_returns.empty:
+            return returns
+        new_returns = new_returns.reindex(columns=returns.columns).astype(
+            config.precision,
+            copy=False,
+        )
+        new_returns = new_returns.loc[new_returns.index > last_date].dropna(how="all")
+
+        if config.align_method == "inner":
+            new_returns = new_returns.dropna(how="any")
+        if config.reindex_to_business_days and not new_returns.empty:
+            business_index = pd.bdate_range(last_date, new_returns.index.max())
+            new_returns = new_returns.reindex(
+                business_index[business_index > last_date],
+            )
+        if new_returns.empty:
+            return returns
+
+        logger.info(
+            "Extended returns by %d periods after %s",
+            len(new_returns),
+            last_date.date(),
+        )
+        return pd.concat([returns, new_returns])
+
     def _calculate_simple_returns(self, prices: pd.Series) -> pd.Series:
         """Calculate simple percentage returns ``r_t = (P_t / P_{t-1}) - 1``."""
         return prices.pct_change().dropna()
@@ -313,17 +766,41 @@ class ReturnCalculator:
         returns = returns.sort_index()
         return returns
 
+    def _fill_missing(
+        self,
+        prices: pd.DataFrame,
+        kernel: Callable[[np.ndarray, int], tuple[np.ndarray, np.ndarray]],
+        max_days: int,
+    ) -> pd.DataFrame:
+        """Fill *prices* with a NumPy *kernel* and record per-asset counts."""
+        values = prices.to_numpy()
+        if values.dtype.kind != "f":
+            values = values.astype(np.float64)
+        filled, counts = kernel(values, max_days)
+        self._record_fill_counts(pd.Series(counts, index=prices.columns))
+        return pd.DataFrame(filled, index=prices.index, columns=prices.columns)
+
+    def _record_fill_counts(self, counts: pd.Series) -> None:
+        """Keep the filled cells per asset and log the most filled assets."""
+        self._latest_fill_counts = counts
+        most_filled = counts.nlargest(5)
+        logger.debug(
+            "Most filled assets: %s",
+            ", ".join(f"{symbol}={count}" for symbol, count in most_filled.items()),
+        )
+
     def _handle_missing_forward_fill(
         self,
         prices: pd.DataFrame,
         max_days: int,
     ) -> pd.DataFrame:
-        """Forward fill gaps up to ``max_days`` for each asset."""
-        before = int(prices.isna().sum().sum())
-        filled = prices.ffill(limit=max_days)
-        after = int(filled.isna().sum().sum())
-        logger.info("Forward filled %d missing values", before - after)
-        return filled
+        """Forward fill gaps up to ``max_days`` for each asset.
+
+        pandas' ``ffill`` is already a single Cython pass over the panel;
+        `handle_missing_data` counts the filled cells from its NaN masks.
+        """
+        # pandas rejects a zero limit; it means no gap is filled.
+        return prices.ffill(limit=max_days) if max_days > 0 else prices
 
     def _handle_missing_drop(self, prices: pd.DataFrame) -> pd.DataFrame:
         """Drop any row containing missing values."""
@@ -338,13 +815,11 @@ class ReturnCalculator:
         max_days: int,
     ) -> pd.DataFrame:
         """Linearly interpolate gaps up to ``max_days`` consecutive NaNs."""
-        interpolated = prices.interpolate(
-            method="linear",
-            limit=max_days,
-            limit_direction="both",
+        interpolated = self._fill_missing(prices, _interpolate_limited, max_days)
+        logger.info(
+            "Interpolated %d missing values",
+            int(self._latest_fill_counts.sum()),
         )
-        filled = int(interpolated.isna().sum().sum())
-        logger.info("Interpolated missing values; %d NaNs remain", filled)
         return interpolated
 
     def handle_missing_data(
@@ -354,6 +829,10 @@ class ReturnCalculator:
     ) -> pd.DataFrame:
         """Apply the configured missing-data strategy to *prices*.
 
+        Forward fills use pandas ``ffill`` and interpolation a vectorized NumPy
+        kernel over the whole panel; the number of cells filled per asset is
+        kept in `latest_fill_counts`.
+
         Args:
             prices (pd.DataFrame): The input price data.
             config (ReturnConfig): Configuration specifying the handling method.
@@ -364,11 +843,12 @@ class ReturnCalculator:
         Raises:
             ValueError: If an unknown missing data handling method is configured.
         """
+        self._latest_fill_counts = pd.Series(0, index=prices.columns)
         if prices.empty:
             return prices
 
-        missing_mask = prices.isna()
-        initial_missing = int(missing_mask.to_numpy().sum())
+        missing_mask = prices.isna().to_numpy()
+        initial_missing = int(np.count_nonzero(missing_mask))
         if initial_missing == 0:
             logger.debug("No missing data detected")
             return prices
@@ -390,11 +870,18 @@ class ReturnCalculator:
                 f"Unknown missing data handling method: {config.handle_missing}",
             )
 
-        remaining = int(handled.isna().sum().sum())
+        remaining_mask = handled.isna().to_numpy()
+        if config.handle_missing == "forward_fill":
+            counts = np.count_nonzero(missing_mask, axis=0)
+            counts -= np.count_nonzero(remaining_mask, axis=0)
+            self._record_fill_counts(pd.Series(counts, index=prices.columns))
+            logger.info("Forward filled %d missing values", int(counts.sum()))
+        remaining = int(np.count_nonzero(remaining_mask))
         if remaining > 0:
             logger.warning("%d NaNs remain after missing-data handling", remaining)
 
-        return handled.dropna(how="all")
+        empty_rows = remaining_mask.all(axis=1)
+        return handled[~empty_rows] if empty_rows.any() else handled
 
     def _align_dates(self, returns: pd.DataFrame, config: ReturnConfig) -> pd.DataFrame:
         """Align return dates according to the configuration."""
@@ -436,20 +923,104 @@ class ReturnCalculator:
         if returns.empty or frequency == "daily":
             return returns
 
-        rule_map = {
-            "weekly": "W-FRI",
-            "monthly": "ME",
-        }
-        rule = rule_map.get(frequency)
+        rule = _RESAMPLE_RULES.get(frequency)
         if rule is None:
             raise ValueError(f"Unsupported frequency: {frequency}")
 
+        return self._resample_periods(returns, rule, method).dropna(how="all")
+
+    @staticmethod
+    def _resample_periods(
+        returns: pd.DataFrame,
+        rule: str,
+        method: str,
+    ) -> pd.DataFrame:
+        """Compound *returns* per period of *rule*, keeping empty periods."""
         if method == "log":
-            resampled = returns.resample(rule).sum(min_count=1)
-        else:
-            resampled = (1 + returns).resample(rule).prod(min_count=1) - 1
+            return returns.resample(rule).sum(min_count=1)
+        return (1 + returns).resample(rule).prod(min_count=1) - 1
 
-        return resampled.dropna(how="all")
+    def _uses_resample_cache(self, config: ReturnConfig) -> bool:
+        """Return True when *config* resamples and the cache is enabled."""
+        return bool(self.resample_cache_size) and config.frequency in _RESAMPLE_RULES
+
+    def _resample_cached(
+        self,
+        returns: pd.DataFrame,
+        config: ReturnConfig,
+        calendar: pd.DatetimeIndex,
+        sources: dict[str, list],
+    ) -> pd.DataFrame:
+        """Resample *returns*, slicing columns already resampled by earlier calls.
+
+        A column's resampled returns depend only on its price source, the
+        price calendar it was filled on, the aligned daily index and the
+        configuration. Panels are cached per configuration and pair of
+        calendars, and columns whose source is unchanged are reused from them.
+        """
+        if returns.empty:
+            return returns
+
+        rule = _RESAMPLE_RULES[config.frequency]
+        key = (
+            config.frequency,
+            config.method,
+            config.risk_free_rate,
+            config.handle_missing,
+            config.max_forward_fill_days,
+            config.precision,
+            _index_digest(calendar),
+            _index_digest(returns.index),
+        )
+        with self._resample_lock:
+            panel, panel_sources = self._resampled.get(key, (None, {}))
+        reused = [
+            column
+            for column in returns.columns
+            if panel is not None
+            and column in sources
+            and panel_sources.get(column) == sources[column]
+        ]
+        reused_set = set(reused)
+        missing = [column for column in returns.columns if column not in reused_set]
+
+        parts = [panel[reused]] if reused else []
+        if missing:
+            resampled = self._resample_periods(
+                returns[missing] if reused else returns,
+                rule,
+                config.method,
+            )
+            parts.append(resampled)
+            cacheable = [column for column in missing if column in sources]
+            if panel is None:
+                panel = resampled[cacheable]
+            else:
+                stale = panel.columns.intersection(cacheable)
+                panel = pd.concat(
+                    [panel.drop(columns=stale), resampled[cacheable]],
+                    axis=1,
+                )
+            panel_sources = {
+                **panel_sources,
+                **{column: sources[column] for column in cacheable},
+            }
+        with self._resample_lock:
+            self._resampled[key] = (panel, panel_sources)
+            self._resampled.move_to_end(key)
+            while len(self._resampled) > self.resample_cache_size:
+                self._resampled.popitem(last=False)
+            self._resample_stats["reused_columns"] += len(reused)
+            self._resample_stats["resampled_columns"] += len(missing)
+
+        logger.debug(
+            "Resampled %d assets to %s and reused %d cached assets",
+            len(missing),
+            config.frequency,
+            len(reused),
+        )
+        resampled = parts[0] if len(parts) == 1 else pd.concat(parts, axis=1)
+        return resampled[returns.columns].dropna(how="all")
 
     def _apply_coverage_filter(
         self,
@@ -487,8 +1058,13 @@ class ReturnCalculator:
         self,
         returns: pd.DataFrame,
         config: ReturnConfig,
+        *,
+        correlation: bool = True,
     ) -> ReturnSummary | None:
-        """Create summary statistics for the prepared returns."""
+        """Create summary statistics for the prepared returns.
+
+        With ``correlation=False`` the correlation matrix is left empty.
+        """
         if returns.empty:
             return None
 
@@ -496,7 +1072,6 @@ class ReturnCalculator:
         factor = annualisation.get(config.frequency, 252)
         mean_returns = returns.mean() * factor
         volatility = returns.std(ddof=0) * np.sqrt(factor)
-        correlation = returns.corr()
         coverage = returns.notna().mean()
 
         logger.debug(
@@ -508,6 +1083,6 @@ class ReturnCalculator:
         return ReturnSummary(
             mean_returns=mean_returns,
             volatility=volatility,
-            correlation=correlation,
+            correlation=returns.corr() if correlation else pd.DataFrame(),
             coverage=coverage,
         )
\ No newline at end of file
@@ -70,6 +70,9 @@ class ReturnConfig:
             to a standard business day calendar. Defaults to False.
         min_coverage (float): The minimum proportion of non-NaN returns an
             asset must have to be kept after processing. Defaults to 0.8.
+        precision (str): The floating-point type of the price and returns
+            panels. Options: 'float64', 'float32'. 'float32' halves their
+            memory at about seven significant digits. Defaults to 'float64'.
 
     Example:
         >>> # Create a config for weekly log returns, requiring at least 1 year of data
@@ -93,6 +96,7 @@ class ReturnConfig:
     align_method: str = "outer"  # outer keeps full union, inner = intersection
     reindex_to_business_days: bool = False
     min_coverage: float = 0.8  # minimum proportion of non-NaN returns per asset
+    precision: str = "float64"  # float64, or float32 to halve panel memory
 
     def validate(self) -> None:
         """Validate the configuration values and raise ``ValueError`` on issues."""
@@ -112,6 +116,8 @@ class ReturnConfig:
             raise ValueError("min_periods must be greater than 1")
         if not 0 < self.min_coverage <= 1:
             raise ValueError("min_coverage must be within (0, 1]")
+        if self.precision not in {"float64", "float32"}:
+            raise ValueError(f"Invalid precision: {self.precision}")
 
     @classmethod
     def default(cls) -> ReturnConfig:
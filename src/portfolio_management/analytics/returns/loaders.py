@@ -3,11 +3,20 @@
 This module provides the `PriceLoader` class, a robust utility for reading
 financial price data from CSV files into pandas DataFrames. It is designed
 for efficiency and resilience, with features like parallel loading for speed,
-a configurable LRU cache to manage memory, and automatic data cleaning.
+an LRU cache bounded by entry count and bytes, an optional memory-mapped tier
+shared across processes (`SharedPriceCache`), and automatic data cleaning.
 
 Key Classes:
     - PriceLoader: Loads, caches, and standardizes price data from files.
 
+Key Functions:
+    - assemble_price_frame: Aligns many price series on their union calendar
+      with one sorted merge and a scatter per series.
+    - build_price_panel: Consolidates exported price files into a
+      `PricePanelStore` that `PriceLoader` can serve from.
+    - update_price_panel: Appends rows added to the exported files since the
+      panel was built, rebuilding it only when files changed otherwise.
+
 Usage Example:
     >>> from pathlib import Path
     >>> from portfolio_management.analytics.returns.loaders import PriceLoader
@@ -32,6 +41,7 @@ Usage Example:
 
 from __future__ import annotations
 
+import io
 import logging
 import os
 from collections import OrderedDict, defaultdict
@@ -40,8 +50,15 @@ from pathlib import Path
 from threading import Lock
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from portfolio_management.core.utils import _run_in_parallel, resolve_executor
+from portfolio_management.data.io.io import price_file_checkpoint
+from portfolio_management.data.io.panel_store import PricePanelStore
+
+from .shared_cache import SharedPriceCache
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
@@ -50,7 +67,88 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Import fast IO utilities
-from portfolio_management.data.io.fast_io import Backend, read_csv_fast, select_backend
+from portfolio_management.data.io.fast_io import (
+    Backend,
+    read_csv_columns,
+    read_csv_fast,
+    select_backend,
+)
+
+# Appended panel segments tolerated before update_price_panel rebuilds (and so
+# compacts) the panel.
+MAX_PANEL_SEGMENTS = 64
+
+# Header names of the date and close columns: the export layout first, then
+# the raw Stooq conventions handled by `_standardize_price_dataframe`.
+_DATE_COLUMNS = ("date", "<DATE>", "DATE")
+_CLOSE_COLUMNS = ("close", "<CLOSE>", "CLOSE")
+
+
+def _sniff_price_layout(path: Path) -> tuple[str, str, bool] | None:
+    """Identify the date and close columns of a price file from its first lines.
+
+    Returns:
+        The date column, the close column and whether dates are compact
+        ``YYYYMMDD`` integers, or None for an unrecognised or empty file.
+
+    """
+    with path.open("rb") as handle:
+        header = handle.readline().decode("latin-1").strip().split(",")
+        first_row = handle.readline().decode("latin-1").strip().split(",")
+    date_column = next((name for name in _DATE_COLUMNS if name in header), None)
+    close_column = next((name for name in _CLOSE_COLUMNS if name in header), None)
+    if date_column is None or close_column is None or len(first_row) != len(header):
+        return None
+    first_date = first_row[header.index(date_column)]
+    return date_column, close_column, len(first_date) == 8 and first_date.isdigit()
+
+
+def _decode_compact_dates(values: np.ndarray) -> np.ndarray | None:
+    """Convert ``YYYYMMDD`` integers to ``datetime64[ns]`` arithmetically.
+
+    Returns:
+        The dates, or None if any value is not a valid calendar date.
+
+    """
+    values = np.asarray(values, dtype=np.int64)
+    years, month_days = np.divmod(values, 10_000)
+    months, days = np.divmod(month_days, 100)
+    if values.size and not (
+        (years.min() > pd.Timestamp.min.year) & (years.max() < pd.Timestamp.max.year)
+    ):
+        return None
+    month_starts = (years - 1970) * 12 + months - 1
+    dates = month_starts.astype("datetime64[M]").astype("datetime64[D]") + (days - 1)
+    # Day 0, day 32 or 30 February land outside the intended month.
+    valid = (months >= 1) & (months <= 12) & (days >= 1)
+    valid &= dates.astype("datetime64[M]").astype(np.int64) == month_starts
+    if not valid.all():
+        return None
+    return dates.astype("datetime64[ns]")
+
+
+def _load_price_file_task(
+    path: Path,
+    io_backend: Backend,
+    shared_cache: SharedPriceCache | None = None,
+    shared_key: str | None = None,
+) -> tuple[Path, pd.Series | None, str | None]:
+    """Load one price file in a worker process.
+
+    The loaded series is also written to ``shared_cache`` under
+    ``shared_key``, so other processes can map it instead of parsing the file.
+
+    Returns the path, the series (None on failure) and the error message, so a
+    single bad file does not abort the whole batch.
+    """
+    loader = PriceLoader(max_workers=1, cache_size=0, io_backend=io_backend)
+    try:
+        series = loader.load_price_file(path)
+    except Exception as exc:  # noqa: BLE001 - reported by the parent process
+        return path, None, f"{type(exc).__name__}: {exc}"
+    if shared_cache is not None and shared_key is not None and not series.empty:
+        shared_cache.put(shared_key, series)
+    return path, series, None
 
 
 class PriceLoader:
@@ -69,9 +167,17 @@ class PriceLoader:
             parallel loading. If None, a default is calculated based on CPU cores.
         cache_size (int): Maximum number of price series to hold in the LRU cache.
             Set to 0 to disable caching.
+        cache_bytes (int | None): Memory budget of the LRU cache, measured with
+            ``Series.memory_usage(deep=True)``. None bounds by count only.
+        shared_cache (SharedPriceCache | None): Memory-mapped tier consulted on
+            in-memory misses and shared with other processes.
         io_backend (Backend): The backend to use for reading CSV files. Options
             include 'pandas', 'polars', and 'pyarrow'. 'auto' selects the
             fastest available option.
+        executor (str): Worker pool for parallel loading: 'thread' (default),
+            'process' or 'auto' (see `resolve_executor`).
+        panel (PricePanelStore | None): Consolidated price panel consulted
+            before the per-asset files (see `build_price_panel`).
 
     Example:
         >>> from pathlib import Path
@@ -90,16 +196,20 @@ class PriceLoader:
         >>>
         >>> # Check cache status
         >>> stats = loader.get_cache_stats()
-        >>> print(f"Cache entries: {stats['cache_entries']}, "
-        ...       f"Cache size: {stats['cache_size']}")
+        >>> print(f"Cache entries: {stats['size']}, Cache size: {stats['maxsize']}")
         Cache entries: 0, Cache size: 500
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         max_workers: int | None = None,
         cache_size: int = 1000,
         io_backend: Backend = "pandas",
+        executor: str = "thread",
+        panel: PricePanelStore | Path | str | None = None,
+        *,
+        cache_bytes: int | None = None,
+        shared_cache: SharedPriceCache | Path | str | None = None,
     ):
         """Initializes the PriceLoader.
 
@@ -112,12 +222,47 @@ class PriceLoader:
                 - 'polars': Use polars for faster CSV parsing (requires polars)
                 - 'pyarrow': Use pyarrow for faster CSV parsing (requires pyarrow)
                 - 'auto': Automatically select fastest available backend
+            executor: Worker pool for parallel loading. Options:
+                - 'thread' (default): Thread pool; best when I/O dominates
+                - 'process': Process pool, sidestepping the GIL while parsing
+                - 'auto': Processes for large batches, threads otherwise
+            panel: Price panel store (or its directory). Assets found in the
+                panel are served from it with a single memory-mapped read;
+                the rest are loaded from their price files.
+            cache_bytes: Memory budget of the in-memory cache in bytes. Least
+                recently used series are evicted once either this or
+                ``cache_size`` is exceeded; a series larger than the budget is
+                not cached. None (default) bounds by entry count only.
+            shared_cache: Shared cache tier (or its directory, e.g. under
+                ``/dev/shm``). Series missing from the in-memory cache are
+                looked up there by file path, size and mtime before parsing,
+                and every parsed series is added to it.
+
+        Raises:
+            ValueError: If ``executor`` is not a supported pool type or
+                ``cache_bytes`` is negative.
         """
+        resolve_executor(executor, task_count=0, max_workers=1)
+        if cache_bytes is not None and cache_bytes < 0:
+            raise ValueError("cache_bytes must be >= 0")
         self.max_workers = max_workers
         self.cache_size = max(0, cache_size)  # Ensure non-negative
         self.io_backend = io_backend
+        self.executor = executor
+        self.panel = (
+            PricePanelStore(panel) if isinstance(panel, (str, Path)) else panel
+        )
+        self.cache_bytes = cache_bytes
+        self.shared_cache = (
+            SharedPriceCache(shared_cache)
+            if isinstance(shared_cache, (str, Path))
+            else shared_cache
+        )
         self._cache: OrderedDict[Path, pd.Series] = OrderedDict()
+        self._cache_nbytes: dict[Path, int] = {}
+        self._cached_bytes = 0
         self._cache_lock = Lock()
+        self._stats = dict.fromkeys(("hits", "misses", "evictions"), 0)
 
     def load_price_file(self, path: Path) -> pd.Series:
         """Load a single price file into a ``Series`` indexed by date.
@@ -142,32 +287,21 @@ class PriceLoader:
 
         selected_backend = select_backend(self.io_backend)
 
-        if path.suffix.lower() == ".csv" and selected_backend == "pandas":
-            df = read_csv_fast(
-                path,
-                backend=self.io_backend,
-                header=0,
-                usecols=["date", "close"],
-                parse_dates=["date"],
-                index_col="date",
-            )
-        else:
-            raw_kwargs = {}
-            if selected_backend == "pandas":
-                raw_kwargs["header"] = 0
-            raw = read_csv_fast(path, backend=self.io_backend, **raw_kwargs)
-            df = self._standardize_price_dataframe(raw, path)
+        df = self._read_price_columns(path, selected_backend)
+        if df is None:
+            df = self._read_price_frame(path, selected_backend)
 
-        df = df.sort_index()
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
 
-        if df.index.duplicated().any():
-            duplicate_count = int(df.index.duplicated().sum())
+        if not df.index.is_unique:
+            duplicated = df.index.duplicated(keep="last")
             logger.warning(
                 "%s contains %d duplicate dates; keeping latest entries",
                 path,
-                duplicate_count,
+                int(duplicated.sum()),
             )
-            df = df[~df.index.duplicated(keep="last")]
+            df = df[~duplicated]
 
         non_positive_mask = df["close"] <= 0
         if non_positive_mask.any():
@@ -180,8 +314,7 @@ class PriceLoader:
             return pd.Series(dtype="float64")
 
         if len(df.index) > 1:
-            gaps = df.index.to_series().diff().dt.days.dropna()
-            max_gap = int(gaps.max()) if not gaps.empty else 0
+            max_gap = int(np.diff(df.index.to_numpy()).max() // np.timedelta64(1, "D"))
             if max_gap > 10:
                 logger.warning("Detected maximum gap of %d days in %s", max_gap, path)
 
@@ -195,8 +328,10 @@ class PriceLoader:
         """Load price data for many assets and align on the union of dates.
 
         This method orchestrates the loading of price files for a list of assets
-        in parallel. It resolves file paths, submits loading tasks to a thread
-        pool, and assembles the resulting Series into a single DataFrame.
+        in parallel. Assets present in the price panel (if configured) are read
+        from it in one call; for the rest it resolves file paths, submits
+        loading tasks to a thread pool, and assembles the resulting Series into
+        a single DataFrame.
 
         Args:
             assets (list[SelectedAsset]): The list of assets to load prices for.
@@ -213,6 +348,130 @@ class PriceLoader:
             len(assets),
             prices_dir,
         )
+        symbols = list(dict.fromkeys(asset.symbol for asset in assets))
+        panel_prices = pd.DataFrame()
+        if self.panel is not None:
+            panel_prices, assets = self._load_from_panel(assets)
+        file_prices = (
+            self._load_from_files(assets, prices_dir) if assets else pd.DataFrame()
+        )
+
+        if panel_prices.empty:
+            df = file_prices
+        elif file_prices.empty:
+            df = panel_prices
+        else:
+            df = pd.concat([panel_prices, file_prices], axis=1).sort_index()
+        if df.empty:
+            logger.warning("No price files were successfully loaded")
+            return pd.DataFrame()
+
+        df = df[[symbol for symbol in symbols if symbol in df.columns]]
+        logger.info("Loaded price matrix with shape %s", df.shape)
+        return df
+
+    def _load_from_panel(
+        self,
+        assets: list[SelectedAsset],
+    ) -> tuple[pd.DataFrame, list[SelectedAsset]]:
+        """Serve assets from the price panel.
+
+        Returns:
+            The panel prices keyed by asset symbol, and the assets that are
+            not in the panel and must be loaded from their files.
+
+        """
+        panel = self.panel
+        if not panel.exists():
+            logger.warning("Price panel %s not found; reading price files", panel.path)
+            return pd.DataFrame(), assets
+
+        keys: dict[str, str] = {}
+        remaining: list[SelectedAsset] = []
+        for asset in assets:
+            key = Path(asset.stooq_path).stem.lower()
+            if key in panel:
+                keys[asset.symbol] = key
+            else:
+                remaining.append(asset)
+        if not keys:
+            return pd.DataFrame(), remaining
+
+        frame = panel.load(keys.values())
+        prices = frame[list(keys.values())].set_axis(list(keys), axis=1)
+        logger.debug(
+            "Served %d assets from price panel %s (%d from files)",
+            len(keys),
+            panel.path,
+            len(remaining),
+        )
+        return prices, remaining
+
+    def count_prices(
+        self,
+        assets: list[SelectedAsset],
+        prices_dir: Path,
+    ) -> tuple[pd.Series, int]:
+        """Count the assets with a close price on each date.
+
+        Reads the same series as `load_multiple_prices`, through the cache,
+        but never aligns them into a price frame, so the union calendar of a
+        large universe can be found without materialising its prices.
+
+        Args:
+            assets (list[SelectedAsset]): The assets to count prices for.
+            prices_dir (Path): The base directory containing the price CSV files.
+
+        Returns:
+            tuple[pd.Series, int]: The number of assets with a non-missing
+                close on each date of the union calendar, sorted by date, and
+                the number of assets that `load_multiple_prices` would return.
+
+        """
+        dates: list[np.ndarray] = []
+        counts: list[np.ndarray] = []
+        names: list[str | None] = []
+        loaded = 0
+        if self.panel is not None:
+            panel_prices, assets = self._load_from_panel(assets)
+            if not panel_prices.empty:
+                dates.append(panel_prices.index.to_numpy(dtype="datetime64[ns]"))
+                counts.append(panel_prices.notna().sum(axis=1).to_numpy())
+                names.append(panel_prices.index.name)
+                loaded += panel_prices.shape[1]
+        if assets:
+            for series in self._load_file_series(assets, prices_dir).values():
+                dates.append(series.index.to_numpy(dtype="datetime64[ns]"))
+                counts.append(series.notna().to_numpy(dtype=np.int64))
+                names.append(series.index.name)
+                loaded += 1
+        if not loaded:
+            return pd.Series(dtype=np.int64), 0
+
+        present = pd.Series(
+            np.concatenate(counts),
+            index=pd.DatetimeIndex(np.concatenate(dates), name=names[0]),
+        )
+        return present.groupby(level=0).sum(), loaded
+
+    def _load_from_files(
+        self,
+        assets: list[SelectedAsset],
+        prices_dir: Path,
+    ) -> pd.DataFrame:
+        """Load and align the per-asset price files."""
+        all_prices = self._load_file_series(assets, prices_dir)
+        if not all_prices:
+            return pd.DataFrame()
+
+        return assemble_price_frame(all_prices)
+
+    def _load_file_series(
+        self,
+        assets: list[SelectedAsset],
+        prices_dir: Path,
+    ) -> dict[str, pd.Series]:
+        """Load the per-asset price files into close series keyed by symbol."""
         symbol_to_path: dict[str, Path] = {}
         path_to_symbols: dict[Path, list[str]] = defaultdict(list)
 
@@ -225,13 +484,15 @@ class PriceLoader:
 
         if not symbol_to_path:
             logger.warning("No price files were successfully resolved")
-            return pd.DataFrame()
+            return {}
 
         unique_paths = list(path_to_symbols.keys())
         logger.debug("Resolved %d unique price files", len(unique_paths))
 
         price_series: dict[Path, pd.Series] = {}
         tasks = self._submit_load_tasks(unique_paths)
+        if self.shared_cache is not None:
+            self.shared_cache.prune()
         for path, series in tasks:
             if series is None or series.empty:
                 logger.warning("Skipping %s because the price series is empty", path)
@@ -239,8 +500,7 @@ class PriceLoader:
             price_series[path] = series
 
         if not price_series:
-            logger.warning("No price files were successfully loaded")
-            return pd.DataFrame()
+            return {}
 
         all_prices: dict[str, pd.Series] = {}
         for path, symbols in path_to_symbols.items():
@@ -252,14 +512,68 @@ class PriceLoader:
             for symbol in symbols:
                 all_prices[symbol] = series
 
-        if not all_prices:
-            logger.warning("No price files were successfully loaded")
-            return pd.DataFrame()
+        return all_prices
 
-        df = pd.DataFrame(all_prices).sort_index()
-        logger.info("Loaded price matrix with shape %s", df.shape)
+    def _read_price_frame(self, path: Path, backend: str) -> pd.DataFrame:
+        """Read a whole price file and normalize its columns.
+
+        Used for files `_read_price_columns` cannot decode; rows with
+        unparseable dates are dropped rather than failing the file.
+        """
+        raw_kwargs = {}
+        if backend == "pandas":
+            raw_kwargs["header"] = 0
+        raw = read_csv_fast(path, backend=self.io_backend, **raw_kwargs)
+        df = self._standardize_price_dataframe(raw, path)
+        if df.index.hasnans:
+            invalid = df.index.isna()
+            logger.warning(
+                "Dropping %d rows with unparseable dates from %s",
+                int(invalid.sum()),
+                path,
+            )
+            df = df.loc[~invalid]
         return df
 
+    @staticmethod
+    def _read_price_columns(path: Path, backend: str) -> pd.DataFrame | None:
+        """Decode only the date and close columns of a price file.
+
+        The two columns are parsed with explicit types by ``backend`` and
+        compact ``YYYYMMDD`` dates are converted arithmetically, skipping the
+        full-frame read, column probing and string date parsing of the
+        general path.
+
+        Returns:
+            A frame of close prices indexed by date, or None when the layout
+            is not recognised or a value does not parse; the caller then
+            falls back to the general path.
+
+        """
+        layout = _sniff_price_layout(path)
+        if layout is None:
+            return None
+        date_column, close_column, compact = layout
+        try:
+            columns = read_csv_columns(
+                path,
+                {date_column: "int64" if compact else "date", close_column: "float64"},
+                backend=backend,
+            )
+        except ValueError as exc:
+            logger.debug("Fast decode of %s failed (%s); reading full file", path, exc)
+            return None
+        dates = columns[date_column]
+        if compact:
+            dates = _decode_compact_dates(dates)
+            if dates is None:
+                logger.debug("Invalid compact dates in %s; reading full file", path)
+                return None
+        return pd.DataFrame(
+            {"close": columns[close_column]},
+            index=pd.DatetimeIndex(dates, name="date"),
+        )
+
     @staticmethod
     def _standardize_price_dataframe(raw: pd.DataFrame, path: Path) -> pd.DataFrame:
         """Normalize various price file column conventions to a standard format."""
@@ -282,7 +596,15 @@ class PriceLoader:
                 f"Unsupported price file structure for {path}: columns={list(raw.columns)}",
             )
 
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        if pd.api.types.is_integer_dtype(df["date"]):
+            # Compact YYYYMMDD integers, not epoch offsets.
+            df["date"] = pd.to_datetime(
+                df["date"].astype(str),
+                format="%Y%m%d",
+                errors="coerce",
+            )
+        else:
+            df["date"] = pd.to_datetime(df["date"], errors="coerce")
         df = df.set_index("date")
         return df
 
@@ -293,22 +615,48 @@ class PriceLoader:
             if path in self._cache:
                 # Move to end (most recently used)
                 self._cache.move_to_end(path)
+                self._stats["hits"] += 1
                 return self._cache[path]
+            self._stats["misses"] += 1
+
+        # Cache miss - try the shared tier, then load from disk
+        shared = self.shared_cache
+        shared_key = shared.key(path) if shared is not None else None
+        series = shared.get(shared_key) if shared_key is not None else None
+        if series is None:
+            series = self.load_price_file(path)
+            if shared_key is not None and not series.empty:
+                shared.put(shared_key, series)
+        self._store_in_cache(path, series)
+        return series
 
-        # Cache miss - load from disk
-        series = self.load_price_file(path)
-
+    def _store_in_cache(self, path: Path, series: pd.Series) -> None:
+        """Add a loaded series to the LRU cache, evicting the oldest if full."""
         # Store in cache if non-empty and caching is enabled
-        if not series.empty and self.cache_size > 0:
-            with self._cache_lock:
-                # Remove oldest entry if at capacity
-                if len(self._cache) >= self.cache_size:
-                    # Remove from beginning (least recently used)
-                    self._cache.popitem(last=False)
-                # Add new entry at end (most recently used)
-                self._cache[path] = series
-
-        return series
+        if series.empty or self.cache_size <= 0:
+            return
+        nbytes = int(series.memory_usage(index=True, deep=True))
+        if self.cache_bytes is not None and nbytes > self.cache_bytes:
+            return
+        with self._cache_lock:
+            if path in self._cache:
+                self._cache.move_to_end(path)
+                return
+            # Remove least recently used entries until the new one fits
+            while self._cache and (
+                len(self._cache) >= self.cache_size
+                or (
+                    self.cache_bytes is not None
+                    and self._cached_bytes + nbytes > self.cache_bytes
+                )
+            ):
+                evicted, _series = self._cache.popitem(last=False)
+                self._cached_bytes -= self._cache_nbytes.pop(evicted)
+                self._stats["evictions"] += 1
+            # Add new entry at end (most recently used)
+            self._cache[path] = series
+            self._cache_nbytes[path] = nbytes
+            self._cached_bytes += nbytes
 
     def clear_cache(self) -> None:
         """Clear all cached price series.
@@ -319,23 +667,37 @@ class PriceLoader:
         """
         with self._cache_lock:
             self._cache.clear()
+            self._cache_nbytes.clear()
+            self._cached_bytes = 0
             logger.debug("Cleared price loader cache")
 
-    def get_cache_stats(self) -> dict[str, int]:
+    def get_cache_stats(self) -> dict[str, int | None]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with 'size' (current entries) and 'maxsize' (capacity).
+            Dictionary with 'size' (current entries), 'maxsize' (capacity),
+            'bytes' (memory held by cached series), 'max_bytes' (byte budget
+            or None) and the 'hits', 'misses' and 'evictions' counters. With
+            a shared tier, its counters are added as 'shared_hits',
+            'shared_misses', 'shared_writes', 'shared_bytes_read' and
+            'shared_bytes_written'.
 
         Useful for testing and monitoring.
         """
         with self._cache_lock:
-            return {
+            stats: dict[str, int | None] = {
                 "size": len(self._cache),
                 "maxsize": self.cache_size,
+                "bytes": self._cached_bytes,
+                "max_bytes": self.cache_bytes,
+                **self._stats,
             }
+        if self.shared_cache is not None:
+            for name, value in self.shared_cache.stats().items():
+                stats[f"shared_{name}"] = value
+        return stats
 
-    def cache_info(self) -> dict[str, int]:
+    def cache_info(self) -> dict[str, int | None]:
         """Return cache statistics for monitoring.
 
         This method is an alias for get_cache_stats for backward compatibility.
@@ -364,6 +726,12 @@ class PriceLoader:
         if max_workers <= 1:
             return [(path, self._load_price_with_cache(path)) for path in paths]
 
+        if resolve_executor(self.executor, len(paths), max_workers) == "process":
+            if self.max_workers is None:
+                # The thread default oversubscribes CPUs for I/O waits.
+                max_workers = min(os.cpu_count() or 1, len(paths))
+            return self._load_in_processes(paths, max_workers)
+
         results: list[tuple[Path, pd.Series | None]] = []
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_path = {
@@ -381,6 +749,54 @@ class PriceLoader:
 
         return results
 
+    def _load_in_processes(
+        self,
+        paths: list[Path],
+        max_workers: int,
+    ) -> list[tuple[Path, pd.Series | None]]:
+        """Load cache misses on a process pool and cache the results."""
+        results: list[tuple[Path, pd.Series | None]] = []
+        misses: list[Path] = []
+        with self._cache_lock:
+            for path in paths:
+                if path in self._cache:
+                    self._cache.move_to_end(path)
+                    self._stats["hits"] += 1
+                    results.append((path, self._cache[path]))
+                else:
+                    self._stats["misses"] += 1
+                    misses.append(path)
+
+        # Shared-tier hits are mapped here; only real misses are parsed.
+        shared = self.shared_cache
+        tasks = []
+        for path in misses:
+            key = shared.key(path) if shared is not None else None
+            series = shared.get(key) if key is not None else None
+            if series is None:
+                tasks.append((path, self.io_backend, shared, key))
+            else:
+                self._store_in_cache(path, series)
+                results.append((path, series))
+
+        loaded = (
+            _run_in_parallel(
+                _load_price_file_task,
+                tasks,
+                max_workers,
+                executor="process",
+            )
+            if tasks
+            else []
+        )
+        for path, series, error in loaded:
+            if series is None:
+                logger.error("Failed to load %s: %s", path, error)
+            else:
+                self._store_in_cache(path, series)
+            results.append((path, series))
+        return results
+
     def _resolve_price_path(
         self,
         prices_dir: Path,
@@ -400,4 +816,349 @@ class PriceLoader:
             asset.symbol,
             price_path,
         )
-        return None
\ No newline at end of file
+        return None
+
+
+def assemble_price_frame(
+    prices: dict[str, pd.Series],
+    *,
+    calendar: pd.DatetimeIndex | None = None,
+    dtype: np.dtype | type = np.float64,
+) -> pd.DataFrame:
+    """Align many price series on one date index without pandas reindexing.
+
+    Equivalent to ``pd.DataFrame(prices).sort_index()`` for series with
+    unique dates, but the union calendar is computed once from the int64
+    dates of all series and each series is scattered into a preallocated
+    column-major matrix with `numpy.searchsorted`. A series covering a
+    contiguous run of the calendar is copied as one slice, and symbols
+    sharing one series object reuse its positions.
+
+    Args:
+        prices: Close series keyed by column name, each indexed by unique
+            dates.
+        calendar: Sorted trading calendar to align on instead of the union
+            of the series' dates; dates outside it are dropped.
+        dtype: Float dtype of the matrix.
+
+    Returns:
+        Prices with one column per key (in key order) on the sorted calendar,
+        NaN where a series has no observation. Unlike pandas alignment, the
+        index never carries an inferred frequency.
+
+    """
+    if not prices:
+        return pd.DataFrame()
+    columns = list(prices)
+    sources: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    for series in prices.values():
+        if id(series) not in sources:
+            sources[id(series)] = (
+                series.index.to_numpy(dtype="datetime64[ns]").view(np.int64),
+                series.to_numpy(dtype=dtype),
+            )
+    if calendar is None:
+        # Hash-based distinct values, then one sort of the (short) calendar.
+        dates = pd.unique(np.concatenate([dates for dates, _ in sources.values()]))
+        dates.sort()
+    else:
+        dates = calendar.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+    matrix = np.full((len(dates), len(columns)), np.nan, dtype=dtype, order="F")
+    positions: dict[int, tuple[slice | np.ndarray, np.ndarray]] = {}
+    for column, series in enumerate(prices.values()):
+        if id(series) not in positions:
+            positions[id(series)] = _calendar_positions(dates, *sources[id(series)])
+        rows, values = positions[id(series)]
+        matrix[rows, column] = values
+
+    first_index = next(iter(prices.values())).index
+    return pd.DataFrame(
+        matrix,
+        index=pd.DatetimeIndex(dates.view("datetime64[ns]"), name=first_index.name),
+        columns=columns,
+    )
+
+
+def _calendar_positions(
+    calendar: np.ndarray,
+    dates: np.ndarray,
+    values: np.ndarray,
+) -> tuple[slice | np.ndarray, np.ndarray]:
+    """Locate sorted ``dates`` in ``calendar``, dropping dates not in it.
+
+    Returns:
+        The calendar rows (a slice when the dates are a contiguous run of
+        the calendar) and the values observed on them.
+
+    """
+    if not len(dates):
+        return slice(0, 0), values
+    start = int(np.searchsorted(calendar, dates[0]))
+    stop = start + len(dates)
+    if stop <= len(calendar) and np.array_equal(calendar[start:stop], dates):
+        return slice(start, stop), values
+    rows = np.searchsorted(calendar, dates)
+    found = rows < len(calendar)
+    found[found] = calendar[rows[found]] == dates[found]
+    if found.all():
+        return rows, values
+    return rows[found], values[found]
+
+
+def build_price_panel(
+    prices_dir: Path,
+    panel_path: Path,
+    *,
+    max_workers: int | None = None,
+    executor: str = "thread",
+) -> PricePanelStore:
+    """Consolidate the exported price files of a directory into a panel.
+
+    Every ``*.csv`` file in ``prices_dir`` is loaded and cleaned exactly as
+    `PriceLoader.load_price_file` does, then written to a `PricePanelStore`
+    keyed by the lower-case file stem. The size, last line and last date of
+    each file are recorded so that `update_price_panel` can later read only
+    the rows appended after them.
+
+    Args:
+        prices_dir: Directory of exported price CSVs.
+        panel_path: Directory to write the panel to.
+        max_workers: Worker count for loading the files.
+        executor: Worker pool for loading the files (see `PriceLoader`).
+
+    Returns:
+        The written panel store.
+
+    """
+    loader = PriceLoader(max_workers=max_workers, cache_size=0, executor=executor)
+    paths = sorted(prices_dir.glob("*.csv"))
+    series: dict[str, pd.Series] = {}
+    sources: dict[str, dict] = {}
+    for path, values in loader._submit_load_tasks(paths):  # noqa: SLF001
+        key = path.stem.lower()
+        if values is not None and not values.empty:
+            series[key] = values
+        checkpoint = price_file_checkpoint(
+            path,
+            _date_key(values.index[-1]) if values is not None and len(values) else None,
+        )
+        if checkpoint is not None:
+            sources[key] = checkpoint
+    store = PricePanelStore(panel_path)
+    store.write(series, sources)
+    return store
+
+
+def update_price_panel(
+    prices_dir: Path,
+    panel_path: Path,
+    *,
+    max_workers: int | None = None,
+    executor: str = "thread",
+    max_segments: int = MAX_PANEL_SEGMENTS,
+) -> PricePanelStore:
+    """Bring a price panel up to date with the exported price files.
+
+    Files that only gained rows since their recorded checkpoint (see
+    `build_price_panel`) are read from the checkpoint onwards; the new rows
+    of all files are parsed together and appended to the panel as one
+    segment, so a daily refresh costs O(new rows). A new, removed, shrunk or
+    rewritten file, a missing or unreadable panel, or ``max_segments``
+    appended segments trigger a full `build_price_panel` instead.
+
+    Args:
+        prices_dir: Directory of exported price CSVs.
+        panel_path: Directory of the panel to update.
+        max_workers: Worker count for a full rebuild.
+        executor: Worker pool for a full rebuild (see `PriceLoader`).
+        max_segments: Segments tolerated before the panel is rebuilt.
+
+    Returns:
+        The updated panel store.
+
+    """
+    store = PricePanelStore(panel_path)
+    paths = {path.stem.lower(): path for path in sorted(prices_dir.glob("*.csv"))}
+    reason = _panel_rebuild_reason(store, paths, max_segments)
+
+    appended: dict[str, tuple[bytes, bytes, int]] = {}
+    if reason is None:
+        sources = store.sources
+        for key, path in paths.items():
+            try:
+                block = _read_appended_block(path, sources[key])
+            except OSError as exc:
+                logger.debug("Cannot read new rows of %s: %s", path, exc)
+                block = None
+            if block is None:
+                reason = f"{path.name} was rewritten"
+                break
+            if block[1]:
+                appended[key] = block
+
+    new_rows: dict[str, pd.Series] = {}
+    if reason is None and appended:
+        try:
+            new_rows = _parse_appended_blocks(appended)
+        except ValueError as exc:
+            reason = f"new rows could not be parsed ({exc})"
+    if reason is None:
+        reason = _append_conflict(store, new_rows, sources)
+
+    if reason is not None:
+        logger.info("Rebuilding price panel %s: %s", store.path, reason)
+        return build_price_panel(
+            prices_dir,
+            panel_path,
+            max_workers=max_workers,
+            executor=executor,
+        )
+    if not appended:
+        logger.info("Price panel %s is up to date", store.path)
+        return store
+
+    checkpoints = {}
+    for key, (_header, block, size) in appended.items():
+        lines = str(sources[key]["tail"]).encode("latin-1") + block
+        values = new_rows.get(key)
+        checkpoints[key] = {
+            "offset": size,
+            "tail": lines[lines.rfind(b"\n", 0, len(lines) - 1) + 1 :].decode(
+                "latin-1",
+            ),
+            "last_date": (
+                _date_key(values.index[-1])
+                if values is not None
+                else sources[key]["last_date"]
+            ),
+        }
+    store.append(new_rows, checkpoints)
+    return store
+
+
+def _panel_rebuild_reason(
+    store: PricePanelStore,
+    paths: dict[str, Path],
+    max_segments: int,
+) -> str | None:
+    """Return why the panel cannot be updated in place, or None."""
+    if not store.exists():
+        return "no panel yet"
+    try:
+        sources, segments = store.sources, store.segments
+    except ValueError as exc:
+        return str(exc)
+    if set(sources) != set(paths):
+        return "price files were added or removed"
+    if segments >= max_segments:
+        return f"{segments} appended segments"
+    return None
+
+
+def _append_conflict(
+    store: PricePanelStore,
+    new_rows: dict[str, pd.Series],
+    sources: dict[str, dict],
+) -> str | None:
+    """Return why ``new_rows`` cannot be appended to the panel, or None."""
+    for key, values in new_rows.items():
+        if key not in store:
+            return f"{key} has its first prices"
+        last_date = sources[key]["last_date"]
+        if last_date is not None and _date_key(values.index[0]) <= int(last_date):
+            return f"{key} has rows dated before its last panel date"
+    return None
+
+
+def _date_key(date: pd.Timestamp) -> int:
+    """Return ``date`` as the ``YYYYMMDD`` integer stored in checkpoints."""
+    return date.year * 10_000 + date.month * 100 + date.day
+
+
+def _read_appended_block(
+    path: Path,
+    checkpoint: dict,
+) -> tuple[bytes, bytes, int] | None:
+    """Read the bytes appended to an exported price file since ``checkpoint``.
+
+    The file must still hold the checkpoint's last line at the recorded
+    offset. Only the header line and the bytes past the offset are read.
+
+    Returns:
+        The header line, the appended complete lines (empty when nothing was
+        appended) and the file size, or None when the file was not simply
+        extended.
+
+    Raises:
+        OSError: If the file cannot be read.
+
+    """
+    offset = int(checkpoint["offset"])
+    tail = str(checkpoint["tail"]).encode("latin-1")
+    with path.open("rb") as handle:
+        header = handle.readline()
+        size = handle.seek(0, os.SEEK_END)
+        if size < offset or offset < len(tail):
+            return None
+        handle.seek(offset - len(tail))
+        if handle.read(len(tail)) != tail:
+            return None
+        block = handle.read()
+    if block and not block.endswith(b"\n"):
+        return None
+    return header, block, size
+
+
+def _parse_appended_blocks(
+    blocks: dict[str, tuple[bytes, bytes, int]],
+) -> dict[str, pd.Series]:
+    """Parse the appended rows of many files with one ``read_csv`` per header.
+
+    Rows are cleaned like `PriceLoader.load_price_file` cleans whole files:
+    sorted by date, the last of duplicate dates kept and non-positive closes
+    dropped.
+
+    Returns:
+        The new close prices keyed like ``blocks``; files whose new rows were
+        all dropped are omitted.
+
+    Raises:
+        ValueError: If the rows cannot be parsed or a block holds blank lines.
+
+    """
+    groups: dict[bytes, list[str]] = defaultdict(list)
+    for key, (header, _block, _size) in blocks.items():
+        groups[header].append(key)
+
+    parsed: dict[str, pd.Series] = {}
+    for header, keys in groups.items():
+        data = [blocks[key][1] for key in keys]
+        counts = [block.count(b"\n") for block in data]
+        frame = pd.read_csv(
+            io.BytesIO(header + b"".join(data)),
+            usecols=["date", "close"],
+            parse_dates=["date"],
+        )
+        if len(frame) != sum(counts):
+            raise ValueError("unexpected line structure in appended rows")
+        if not pd.api.types.is_datetime64_any_dtype(frame["date"]):
+            raise ValueError("unparseable dates in appended rows")
+        frame["key"] = np.repeat(np.arange(len(keys)), counts)
+        frame = frame.sort_values(["key", "date"], kind="stable")
+        frame = frame.drop_duplicates(["key", "date"], keep="last")
+        frame = frame.loc[~(frame["close"] <= 0)]
+
+        codes = frame["key"].to_numpy()
+        dates = frame["date"].to_numpy()
+        closes = frame["close"].to_numpy(dtype=float)
+        bounds = np.searchsorted(codes, np.arange(len(keys) + 1))
+        for position, key in enumerate(keys):
+            start, end = bounds[position], bounds[position + 1]
+            if start < end:
+                parsed[key] = pd.Series(
+                    closes[start:end],
+                    index=pd.DatetimeIndex(dates[start:end], name="date"),
+                    name="close",
+                )
+    return parsed
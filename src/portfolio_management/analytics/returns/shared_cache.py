@@ -0,0 +1,181 @@
+"""Memory-mapped price-series cache shared by every process on a machine.
+
+The in-memory cache of `PriceLoader` is private to one process, so parallel
+sweep workers each parse the same price files. `SharedPriceCache` is a second
+tier behind it: a directory of ``<key>.npy`` files, one per loaded series,
+that any process can map instead of parsing the CSV again. Pointing it at a
+tmpfs such as ``/dev/shm`` keeps the tier in shared memory; on a regular
+disk the page cache serves repeated reads.
+
+Entries are keyed by the source file's resolved path, size and mtime, so a
+rewritten price file misses and is loaded afresh; the stale entry is removed
+by `SharedPriceCache.prune` once the tier exceeds its byte budget. Files are
+written through a temporary name and renamed into place, so concurrent
+readers never see a partial entry.
+
+Key Classes:
+    - SharedPriceCache: Cross-process tier of cached close series.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+import pandas as pd
+
+from ...core.utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_VERSION = 1
+
+
+class SharedPriceCache:
+    """Directory of memory-mapped close series keyed by source file state.
+
+    Example:
+        >>> import tempfile
+        >>> cache = SharedPriceCache(tempfile.mkdtemp(), max_bytes=64 * 2**20)
+        >>> cache.stats()
+        {'hits': 0, 'misses': 0, 'writes': 0, 'bytes_read': 0, 'bytes_written': 0}
+
+    """
+
+    def __init__(self, path: Path | str, *, max_bytes: int | None = None) -> None:
+        """Initialise the cache.
+
+        Args:
+            path: Directory holding the entries; created on first write.
+            max_bytes: Budget for the files in ``path``; `prune` removes the
+                least recently used entries beyond it. None keeps every entry.
+
+        Raises:
+            ValueError: If ``max_bytes`` is negative.
+
+        """
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "writes", "bytes_read", "bytes_written"),
+            0,
+        )
+        self._lock = Lock()
+
+    def __getstate__(self) -> dict:
+        """Drop the lock so the cache can be handed to worker processes."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled cache with a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and byte counters of this instance."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                self._stats[name] += value
+
+    def key(self, source: Path) -> str | None:
+        """Return the entry key of a price file, or None if it is unreadable."""
+        try:
+            stat = source.stat()
+            resolved = source.resolve()
+        except OSError:
+            return None
+        payload = f"{SHARED_CACHE_VERSION}:{resolved}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def get(self, key: str) -> pd.Series | None:
+        """Return the series stored under ``key``, or None."""
+        entry_path = self.path / f"{key}.npy"
+        try:
+            entry = np.load(entry_path, mmap_mode="r", allow_pickle=False)
+            series = pd.Series(
+                np.array(entry["close"]),
+                index=pd.DatetimeIndex(np.array(entry["date"]), name="date"),
+                name="close",
+            )
+            os.utime(entry_path)  # least recently used eviction order
+        except (OSError, ValueError):
+            self._count(misses=1)
+            return None
+        self._count(hits=1, bytes_read=int(entry.nbytes))
+        return series
+
+    def put(self, key: str, series: pd.Series) -> None:
+        """Store a close series indexed by naive dates under ``key``."""
+        index = series.index
+        if not isinstance(index, pd.DatetimeIndex) or index.tz is not None:
+            return
+        entry = np.empty(
+            len(series),
+            dtype=[("date", index.dtype), ("close", np.float64)],
+        )
+        entry["date"] = index.to_numpy()
+        entry["close"] = series.to_numpy(dtype=np.float64)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        entry_path = self.path / f"{key}.npy"
+        try:
+            with atomic_write(entry_path) as tmp_path, tmp_path.open("wb") as handle:
+                np.save(handle, entry)
+        except OSError:
+            logger.warning("Could not write shared price cache entry %s", entry_path)
+            return
+        self._count(writes=1, bytes_written=int(entry.nbytes))
+
+    def size_bytes(self) -> int:
+        """Return the total size of the entries on disk."""
+        return sum(size for _mtime, size, _path in self._entries())
+
+    def prune(self) -> int:
+        """Remove least recently used entries beyond ``max_bytes``.
+
+        Returns:
+            Number of entries removed.
+
+        """
+        if self.max_bytes is None:
+            return 0
+        entries = sorted(self._entries(), reverse=True)
+        total = 0
+        removed = 0
+        for _mtime, size, path in entries:
+            total += size
+            if total > self.max_bytes:
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.debug("Pruned %d entries from shared price cache", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for _mtime, _size, path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _entries(self) -> list[tuple[int, int, Path]]:
+        if not self.path.is_dir():
+            return []
+        entries = []
+        for path in self.path.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
@@ -0,0 +1,267 @@
+"""Column-block store for returns of universes too wide to hold in memory.
+
+`ReturnCalculator.load_and_prepare_blocks` computes returns a block of assets
+at a time and appends every finished block here, so the full date-by-asset
+matrix never has to exist in memory. All blocks share one date index.
+
+On disk the store is a directory holding:
+
+- ``returns.<n>.npy``: matrix of shape ``(dates, block columns)`` in
+  column-major (Fortran) order, so each asset's history is contiguous;
+  missing returns are NaN.
+- ``index.json``: store version, dtype, ISO dates (row order), the name of
+  the date index and the asset columns of every block file.
+
+Blocks are read back through memory maps: `ReturnsStore.load` gathers a
+subset of assets and `ReturnsStore.to_csv` streams the whole matrix in row
+chunks, in the layout of ``DataFrame.to_csv``.
+
+Key Classes:
+    - ReturnsStore: Append and read column blocks of returns.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from ...core.utils import atomic_write
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+RETURNS_STORE_VERSION = 1
+
+_BLOCK_PATTERN = "returns.*.npy"
+_INDEX_NAME = "index.json"
+
+
+class ReturnsStore:
+    """Directory of column blocks of returns sharing one date index.
+
+    Example:
+        >>> import tempfile
+        >>> import pandas as pd
+        >>> store = ReturnsStore(tempfile.mkdtemp())
+        >>> dates = pd.to_datetime(["2024-01-31", "2024-02-29"])
+        >>> store.create(dates)
+        >>> store.append(pd.DataFrame({"AAA": [0.01, 0.02]}, index=dates))
+        >>> store.load().shape
+        (2, 1)
+
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialise the store.
+
+        Args:
+            path: Directory holding the block files; created by `create`.
+
+        """
+        self.path = Path(path)
+        self._index: dict | None = None
+
+    def exists(self) -> bool:
+        """Return True when the store has been created."""
+        return (self.path / _INDEX_NAME).is_file()
+
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """Dates shared by every block, in row order."""
+        index = self._read_index()
+        return pd.DatetimeIndex(
+            np.array(index["dates"], dtype="datetime64[D]").astype("datetime64[ns]"),
+            name=index["index_name"],
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        """Asset columns of all blocks in append order."""
+        return [
+            column
+            for block in self._read_index()["blocks"]
+            for column in block["columns"]
+        ]
+
+    @property
+    def blocks(self) -> int:
+        """Number of appended blocks."""
+        return len(self._read_index()["blocks"])
+
+    def create(
+        self,
+        dates: pd.DatetimeIndex,
+        dtype: np.dtype | str = np.float64,
+    ) -> None:
+        """Start an empty store over ``dates``, removing any previous blocks.
+
+        Args:
+            dates: Date index shared by every block that will be appended.
+            dtype: Floating dtype the blocks are stored in.
+
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        for block_path in self.path.glob(_BLOCK_PATTERN):
+            block_path.unlink(missing_ok=True)
+        self._write_index(
+            {
+                "version": RETURNS_STORE_VERSION,
+                "dtype": np.dtype(dtype).name,
+                "index_name": dates.name,
+                "dates": np.datetime_as_string(
+                    dates.to_numpy(dtype="datetime64[D]"),
+                    unit="D",
+                ).tolist(),
+                "blocks": [],
+            },
+        )
+
+    def append(self, returns: pd.DataFrame) -> None:
+        """Write the columns of ``returns`` as a new block.
+
+        Args:
+            returns: Returns indexed by the dates of the store.
+
+        Raises:
+            FileNotFoundError: If the store has not been created.
+            ValueError: If the index differs from the store dates or a column
+                is already stored.
+
+        """
+        index = self._read_index()
+        if not returns.index.equals(self.dates):
+            raise ValueError("Block dates do not match the returns store dates")
+        duplicated = sorted(set(returns.columns).intersection(self.columns))
+        if duplicated:
+            raise ValueError(
+                f"Columns already in returns store: {', '.join(duplicated[:5])}",
+            )
+
+        name = _BLOCK_PATTERN.replace("*", str(len(index["blocks"])))
+        block_path = self.path / name
+        with atomic_write(block_path) as tmp_path, tmp_path.open("wb") as handle:
+            np.save(
+                handle,
+                np.asfortranarray(returns.to_numpy(dtype=index["dtype"])),
+            )
+        index["blocks"].append(
+            {"file": name, "columns": [str(column) for column in returns.columns]},
+        )
+        self._write_index(index)
+        logger.debug("Appended %d columns to returns store %s", returns.shape[1], name)
+
+    def iter_blocks(self) -> Iterator[pd.DataFrame]:
+        """Yield every block as a DataFrame over the store dates."""
+        dates = self.dates
+        for block in self._read_index()["blocks"]:
+            yield pd.DataFrame(
+                self._map(block),
+                index=dates,
+                columns=block["columns"],
+            )
+
+    def load(self, columns: Iterable[str] | None = None) -> pd.DataFrame:
+        """Return the stored returns, optionally restricted to ``columns``.
+
+        Args:
+            columns: Assets to load in the given order; unknown assets are
+                skipped. None loads every column.
+
+        Returns:
+            A DataFrame indexed by the store dates.
+
+        """
+        index = self._read_index()
+        dates = self.dates
+        wanted = None if columns is None else list(dict.fromkeys(columns))
+        wanted_set = set(wanted or ())
+        frames = []
+        for block in index["blocks"]:
+            positions = [
+                position
+                for position, column in enumerate(block["columns"])
+                if wanted is None or column in wanted_set
+            ]
+            if not positions:
+                continue
+            keep = [block["columns"][position] for position in positions]
+            frames.append(
+                pd.DataFrame(
+                    self._map(block)[:, positions],
+                    index=dates,
+                    columns=keep,
+                ),
+            )
+        if not frames:
+            return pd.DataFrame(index=dates, dtype=index["dtype"])
+        frame = pd.concat(frames, axis=1) if len(frames) > 1 else frames[0]
+        if wanted is not None:
+            frame = frame[[column for column in wanted if column in frame.columns]]
+        return frame
+
+    def to_csv(self, path: Path | str, *, chunk_rows: int = 256) -> None:
+        """Write the stored returns as one CSV, ``chunk_rows`` dates at a time.
+
+        The file matches ``DataFrame.to_csv`` of the full matrix, while at
+        most ``chunk_rows`` rows of it are held in memory.
+
+        Args:
+            path: Output CSV file.
+            chunk_rows: Dates per written chunk.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is not positive.
+
+        """
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be > 0")
+        index = self._read_index()
+        dates = self.dates
+        columns = self.columns
+        blocks = [self._map(block) for block in index["blocks"]]
+        with Path(path).open("w", encoding="utf-8", newline="") as handle:
+            for start in range(0, max(len(dates), 1), chunk_rows):
+                stop = start + chunk_rows
+                values = (
+                    np.hstack([block[start:stop] for block in blocks])
+                    if blocks
+                    else np.empty((len(dates[start:stop]), 0))
+                )
+                pd.DataFrame(
+                    values,
+                    index=dates[start:stop],
+                    columns=columns,
+                ).to_csv(handle, header=start == 0)
+
+    def _map(self, block: dict) -> np.ndarray:
+        """Memory-map the matrix of one block."""
+        matrix = np.load(self.path / block["file"], mmap_mode="r")
+        if matrix.shape != (len(self._read_index()["dates"]), len(block["columns"])):
+            raise ValueError(f"Inconsistent returns store at {self.path}")
+        return matrix
+
+    def _read_index(self) -> dict:
+        """Read ``index.json`` on first use."""
+        if self._index is None:
+            index_path = self.path / _INDEX_NAME
+            if not index_path.is_file():
+                raise FileNotFoundError(index_path)
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            if index.get("version") != RETURNS_STORE_VERSION:
+                raise ValueError(f"Inconsistent returns store at {self.path}")
+            self._index = index
+        return self._index
+
+    def _write_index(self, index: dict) -> None:
+        """Atomically replace ``index.json``."""
+        index_path = self.path / _INDEX_NAME
+        with atomic_write(index_path) as tmp_path:
+            tmp_path.write_text(json.dumps(index), encoding="utf-8")
+        self._index = index
@@ -66,6 +66,7 @@ from .classification import (
     AssetClass,
     AssetClassification,
     AssetClassifier,
+    ClassificationCache,
     ClassificationOverrides,
     Geography,
     SubClass,
@@ -88,6 +89,7 @@ __all__ = [
     "SubClass",
     "AssetClassification",
     "AssetClassifier",
+    "ClassificationCache",
     "ClassificationOverrides",
     # Universes
     "UniverseDefinition",
@@ -1,5 +1,6 @@
 """Asset classification taxonomy and logic."""
 
+from .cache import ClassificationCache
 from .classification import (
     AssetClass,
     AssetClassification,
@@ -13,6 +14,7 @@ __all__ = [
     "AssetClass",
     "AssetClassification",
     "AssetClassifier",
+    "ClassificationCache",
     "ClassificationOverrides",
     "Geography",
     "SubClass",
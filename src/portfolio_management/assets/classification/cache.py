@@ -0,0 +1,234 @@
+"""On-disk cache of asset classifications shared across runs.
+
+Asset names, categories and classification overrides rarely change between
+runs, yet `AssetClassifier.classify_universe` would classify every asset of
+every universe again. `ClassificationCache` keeps one file,
+``classifications.json``, holding:
+
+- ``state``: a hash of the classifier rules (keyword sets, geography patterns
+  and `AssetClassifier.RULES_VERSION`) and of the overrides in use. Entries
+  written under another state are discarded, so editing the rules or the
+  overrides file reclassifies everything once.
+- ``entries``: the classification of each asset, keyed by its symbol, ISIN,
+  name, category, region and currency.
+- ``enums``: per entry, the enum type of every field that was classified as
+  an enum member (geographies set by overrides), so that it is re-hydrated
+  on read.
+
+Only assets without an entry are classified; the others are merged from the
+cache. Results equal an uncached run.
+
+Key Classes:
+    - ClassificationCache: Persistent per-asset classification cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from enum import Enum
+from operator import attrgetter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from ...core.utils import atomic_write
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from ..selection.selection import SelectedAsset
+
+logger = logging.getLogger(__name__)
+
+CLASSIFICATION_CACHE_VERSION = 1
+
+KEY_FIELDS = ("symbol", "isin", "name", "category", "region", "currency")
+IDENTITY_FIELDS = ("symbol", "isin", "name")
+RESULT_FIELDS = ("asset_class", "sub_class", "geography", "sector", "confidence")
+
+_CACHE_NAME = "classifications.json"
+
+
+class ClassificationCache:
+    """Persistent cache of classifications keyed by asset metadata.
+
+    Example:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> cache = ClassificationCache(Path(tempfile.mkdtemp()) / "classes")
+        >>> cache.stats()
+        {'reused_assets': 0, 'classified_assets': 0}
+
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialise the cache.
+
+        Args:
+            path: Directory holding the cache file; created on first write.
+
+        """
+        self.path = Path(path)
+        self._stats = dict.fromkeys(("reused_assets", "classified_assets"), 0)
+        self._loaded: (
+            tuple[object, str, dict[str, list], dict[str, dict[str, str]]] | None
+        ) = None
+
+    def stats(self) -> dict[str, int]:
+        """Return per-asset reuse counters of this instance."""
+        return dict(self._stats)
+
+    @staticmethod
+    def asset_keys(assets: Sequence[SelectedAsset]) -> list[str]:
+        """Return the cache key of every asset.
+
+        Args:
+            assets: Assets to classify.
+
+        Returns:
+            The classification inputs of each asset joined into one string,
+            in order.
+
+        """
+        read = attrgetter(*KEY_FIELDS)
+        return ["\x1f".join(map(str, read(asset))) for asset in assets]
+
+    def classify(
+        self,
+        assets: Sequence[SelectedAsset],
+        classify: Callable[[list[SelectedAsset]], pd.DataFrame],
+        state: str,
+    ) -> pd.DataFrame:
+        """Classify ``assets``, running ``classify`` on uncached assets only.
+
+        Args:
+            assets: Assets to classify.
+            classify: Function returning the classification frame of a list
+                of assets, one row per asset in order.
+            state: Hash of the classifier rules and overrides in use.
+
+        Returns:
+            The frame ``classify(assets)`` would return.
+
+        """
+        keys = self.asset_keys(assets)
+        entries, enums = self._read(state)
+        missing = [position for position, key in enumerate(keys) if key not in entries]
+        self._stats["reused_assets"] += len(keys) - len(missing)
+        self._stats["classified_assets"] += len(missing)
+
+        if missing:
+            fresh = classify([assets[position] for position in missing])
+            for position, row in zip(
+                missing,
+                fresh[list(RESULT_FIELDS)].itertuples(index=False, name=None),
+                strict=True,
+            ):
+                entries[keys[position]] = [
+                    value.value if isinstance(value, Enum) else value for value in row
+                ]
+                tagged = {
+                    field: type(value).__name__
+                    for field, value in zip(RESULT_FIELDS, row, strict=True)
+                    if isinstance(value, Enum)
+                }
+                if tagged:
+                    enums[keys[position]] = tagged
+                else:
+                    enums.pop(keys[position], None)
+            self._write(state, entries, enums)
+        logger.info(
+            "Reused cached classifications for %d assets; classified %d",
+            len(keys) - len(missing),
+            len(missing),
+        )
+
+        result = pd.DataFrame(
+            list(map(attrgetter(*IDENTITY_FIELDS), assets)),
+            columns=list(IDENTITY_FIELDS),
+            dtype=object,
+        )
+        cached = pd.DataFrame(
+            [entries[key] for key in keys],
+            columns=list(RESULT_FIELDS),
+            dtype=object,
+        )
+        tagged_rows = [
+            (row, enums[key]) for row, key in enumerate(keys) if key in enums
+        ]
+        if tagged_rows:
+            enum_types = _enum_types()
+            for row, tagged in tagged_rows:
+                for field, type_name in tagged.items():
+                    cached.at[row, field] = enum_types[type_name](cached.at[row, field])
+        for field in RESULT_FIELDS:
+            result[field] = (
+                cached[field].astype("float64")
+                if field == "confidence"
+                else cached[field]
+            )
+        return result
+
+    def _read(self, state: str) -> tuple[dict[str, list], dict[str, dict[str, str]]]:
+        """Return the entries and enum types stored under ``state``.
+
+        Both are empty on any mismatch. The parsed file is kept in memory
+        until it changes on disk.
+        """
+        cache_path = self.path / _CACHE_NAME
+        try:
+            stat = cache_path.stat()
+        except OSError:
+            return {}, {}
+        fingerprint = (stat.st_size, stat.st_mtime_ns)
+        if self._loaded is None or self._loaded[0] != fingerprint:
+            try:
+                payload = json.loads(cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return {}, {}
+            if payload.get("version") != CLASSIFICATION_CACHE_VERSION:
+                return {}, {}
+            self._loaded = (
+                fingerprint,
+                payload.get("state", ""),
+                payload.get("entries", {}),
+                payload.get("enums", {}),
+            )
+        _, stored_state, entries, enums = self._loaded
+        if stored_state != state:
+            return {}, {}
+        return dict(entries), dict(enums)
+
+    def _write(
+        self,
+        state: str,
+        entries: dict[str, list],
+        enums: dict[str, dict[str, str]],
+    ) -> None:
+        """Atomically replace the cache file with ``entries`` and ``enums``."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        cache_path = self.path / _CACHE_NAME
+        with atomic_write(cache_path) as tmp_path:
+            tmp_path.write_text(
+                json.dumps(
+                    {
+                        "version": CLASSIFICATION_CACHE_VERSION,
+                        "state": state,
+                        "entries": entries,
+                        "enums": enums,
+                    },
+                ),
+                encoding="utf-8",
+            )
+        stat = cache_path.stat()
+        self._loaded = ((stat.st_size, stat.st_mtime_ns), state, entries, enums)
+
+
+def _enum_types() -> dict[str, type[Enum]]:
+    """Return the classification enums that cached values are re-hydrated into."""
+    # Imported here: the classification module imports this one.
+    from .classification import AssetClass, Geography, SubClass
+
+    return {enum.__name__: enum for enum in (AssetClass, Geography, SubClass)}
@@ -67,19 +67,25 @@ Usage Example:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import pathlib
 import re
-from dataclasses import asdict, dataclass, field, is_dataclass
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 import pandas as pd
 
 from ...core.exceptions import ClassificationError, DataValidationError
+from .cache import ClassificationCache
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
     from ..selection.selection import SelectedAsset
 
 
@@ -231,6 +237,94 @@ class ClassificationOverrides:
         return cls(overrides=overrides)
 
 
+_SEPARATOR = "\0"
+_JOINER = "\1"
+
+
+def _trie_pattern(node: dict[str, dict]) -> str:
+    """Return a regex matching the longest keyword of a prefix trie."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if "" in node:
+        # A keyword ends here; longer keywords are tried first (greedy).
+        return f"(?:{'|'.join(branches)})?" if branches else ""
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+class _KeywordScanner:
+    """Labels many strings by the keywords they contain in one regex scan.
+
+    Every keyword belongs to one or more labels. The keywords are compiled
+    once into a prefix trie expressed as a single regex, wrapped in a
+    lookahead so that the scan visits every position and reports the longest
+    keyword starting there, overlapping occurrences included (``"eur"``
+    inside ``"europe"``). Shorter keywords starting at the same position are
+    prefixes of the reported one, so each keyword maps to the labels of all
+    its keyword prefixes. Strings are joined with a separator and scanned in
+    one pass of the compiled pattern, which acts as the keyword automaton.
+    """
+
+    def __init__(self, labels: Iterable[tuple[Hashable, frozenset[str]]]) -> None:
+        keyword_labels: dict[str, set[Hashable]] = {}
+        for label, keywords in labels:
+            for keyword in keywords:
+                if keyword:
+                    keyword_labels.setdefault(keyword, set()).add(label)
+        self._labels: dict[str, frozenset[Hashable]] = {_SEPARATOR: frozenset()}
+        trie: dict[str, dict] = {}
+        for keyword in keyword_labels:
+            self._labels[keyword] = frozenset().union(
+                *(
+                    prefix_labels
+                    for prefix, prefix_labels in keyword_labels.items()
+                    if keyword.startswith(prefix)
+                ),
+            )
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        alternatives = "|".join(
+            pattern
+            for pattern in (re.escape(_SEPARATOR), _trie_pattern(trie))
+            if pattern
+        )
+        self._pattern = re.compile(f"(?=({alternatives}))")
+
+    def find(self, text: str) -> frozenset[Hashable]:
+        """Return the labels of the keywords found in ``text``."""
+        return frozenset().union(*map(self._labels.get, self._pattern.findall(text)))
+
+    def scan(self, texts: list[str]) -> list[frozenset[Hashable]]:
+        """Return the labels found in each of ``texts``, in one pass."""
+        if not texts:
+            return []
+        joined = _SEPARATOR.join(texts)
+        if joined.count(_SEPARATOR) != len(texts) - 1:
+            return [self.find(text) for text in texts]
+        # Split the flat match list back into rows at the separator matches.
+        rows = _JOINER.join(self._pattern.findall(joined)).split(_SEPARATOR)
+        found: dict[str, frozenset[Hashable]] = {}
+        distinct: dict[frozenset[Hashable], frozenset[Hashable]] = {}
+        for row in dict.fromkeys(rows):
+            labels = frozenset().union(
+                *map(self._labels.get, filter(None, row.split(_JOINER))),
+            )
+            found[row] = distinct.setdefault(labels, labels)
+        return [found[row] for row in rows]
+
+
+@lru_cache(maxsize=16)
+def _compile_keywords(
+    labels: tuple[tuple[Hashable, frozenset[str]], ...],
+) -> _KeywordScanner:
+    """Return the scanner of a set of labelled keywords, compiled once."""
+    return _KeywordScanner(labels)
+
+
 class AssetClassifier:
     """Applies a rule-based engine to classify assets.
 
@@ -240,11 +334,16 @@ class AssetClassifier:
     that can be augmented with manual overrides for improved accuracy.
 
     The classification logic is primarily handled by the `_classify_dataframe`
-    method, which uses vectorized pandas operations for efficiency.
+    method. All keyword sets are compiled once into a single pattern, so each
+    name and category is scanned once and every class, geography and
+    sub-class rule is decided from the set of keywords the scan found.
 
     Attributes:
         overrides (ClassificationOverrides): A collection of manual overrides
             that will take precedence over the rule-based engine.
+        cache (ClassificationCache | None): Optional persistent cache;
+            `classify_universe` then classifies only assets it has not seen
+            under the current rules and overrides.
 
     Methods:
         - `classify_universe`: Classifies a list of assets and returns a DataFrame.
@@ -278,6 +377,8 @@ class AssetClassifier:
     COMMODITY_KEYWORDS: ClassVar[set[str]] = {"gold", "silver", "oil", "commodity"}
     REAL_ESTATE_KEYWORDS: ClassVar[set[str]] = {"reit", "real estate"}
     LOW_CONFIDENCE_THRESHOLD: ClassVar[float] = 0.6
+    # Bump when the classification logic changes, to invalidate cached results.
+    RULES_VERSION: ClassVar[int] = 1
 
     GEOGRAPHY_PATTERNS: ClassVar[dict[Geography, list[str]]] = {
         Geography.NORTH_AMERICA: ["us", "usa", "america", "usd", "north america"],
@@ -286,9 +387,71 @@ class AssetClassifier:
         Geography.ASIA_PACIFIC: ["jp", "jpy", "asia"],
     }
 
-    def __init__(self, overrides: ClassificationOverrides | None = None):
-        """Initialise the classifier with optional manual overrides."""
+    CATEGORY_KEYWORDS: ClassVar[dict[str, AssetClass]] = {
+        "stock": AssetClass.EQUITY,
+        "etf": AssetClass.EQUITY,
+        "bond": AssetClass.FIXED_INCOME,
+    }
+
+    # Ordered by precedence: `classify_asset` keeps the first matching
+    # sub-class, `classify_universe` the last one.
+    SUB_CLASS_KEYWORDS: ClassVar[dict[AssetClass, dict[SubClass, set[str]]]] = {
+        AssetClass.EQUITY: {
+            SubClass.LARGE_CAP: {"large cap"},
+            SubClass.SMALL_CAP: {"small cap"},
+            SubClass.VALUE: {"value"},
+            SubClass.GROWTH: {"growth"},
+            SubClass.DIVIDEND: {"dividend"},
+        },
+        AssetClass.FIXED_INCOME: {
+            SubClass.GOVERNMENT: {"government", "gilt", "treasury"},
+            SubClass.CORPORATE: {"corporate"},
+            SubClass.HIGH_YIELD: {"high yield"},
+        },
+        AssetClass.COMMODITY: {SubClass.GOLD: {"gold"}},
+        AssetClass.REAL_ESTATE: {SubClass.REIT: {"reit"}},
+    }
+
+    def __init__(
+        self,
+        overrides: ClassificationOverrides | None = None,
+        cache: ClassificationCache | Path | str | None = None,
+    ):
+        """Initialise the classifier.
+
+        Args:
+            overrides: Optional manual overrides.
+            cache: Optional `ClassificationCache`, or the directory of one,
+                reused by `classify_universe` across runs.
+        """
         self.overrides = overrides or ClassificationOverrides()
+        self.cache = (
+            ClassificationCache(cache) if isinstance(cache, (str, Path)) else cache
+        )
+        self._geography_patterns = {
+            geography: frozenset(pattern.lower() for pattern in patterns)
+            for geography, patterns in self.GEOGRAPHY_PATTERNS.items()
+        }
+        labels = [
+            (("name", AssetClass.EQUITY), frozenset(self.EQUITY_KEYWORDS)),
+            (("name", AssetClass.FIXED_INCOME), frozenset(self.BOND_KEYWORDS)),
+            (("name", AssetClass.COMMODITY), frozenset(self.COMMODITY_KEYWORDS)),
+            (("name", AssetClass.REAL_ESTATE), frozenset(self.REAL_ESTATE_KEYWORDS)),
+        ]
+        labels.extend(
+            (("category", keyword), frozenset({keyword}))
+            for keyword in self.CATEGORY_KEYWORDS
+        )
+        labels.extend(
+            (("geography", geography), patterns)
+            for geography, patterns in self._geography_patterns.items()
+        )
+        labels.extend(
+            ((asset_class, sub_class), frozenset(keywords))
+            for asset_class, rules in self.SUB_CLASS_KEYWORDS.items()
+            for sub_class, keywords in rules.items()
+        )
+        self._scanner = _compile_keywords(tuple(labels))
 
     def classify_asset(self, asset: SelectedAsset) -> AssetClassification:
         """Classifies a single asset using keyword-based rules.
@@ -320,30 +483,17 @@ class AssetClassifier:
                 confidence=1.0,
             )
 
-        asset_class_from_name = self._classify_by_name(asset)
-        asset_class_from_cat = self._classify_by_category(asset)
-
-        if {
-            asset_class_from_name,
-            asset_class_from_cat,
-        } == {AssetClass.UNKNOWN}:
-            asset_class = AssetClass.UNKNOWN
-            confidence = 0.5
-        elif AssetClass.UNKNOWN not in {
-            asset_class_from_name,
-            asset_class_from_cat,
-        }:
-            asset_class = asset_class_from_name
-            confidence = 0.9
-        elif asset_class_from_name != AssetClass.UNKNOWN:
-            asset_class = asset_class_from_name
-            confidence = 0.7
-        else:
-            asset_class = asset_class_from_cat
-            confidence = 0.7
-
-        geography = self._classify_geography(asset)
-        sub_class = self._classify_sub_class(asset, asset_class)
+        name_labels = self._scan(asset.name)
+        asset_class, confidence = self._combine_classes(
+            self._class_from_labels(name_labels),
+            self._category_from_labels(self._scan(asset.category)),
+        )
+        geography = self._geography_from_labels(
+            self._lower(asset.region),
+            self._lower(asset.currency),
+            name_labels,
+        )
+        sub_class = self._sub_class_from_labels(asset_class, name_labels)
 
         return AssetClassification(
             symbol=asset.symbol,
@@ -402,15 +552,14 @@ class AssetClassifier:
                 ],
             )
 
-        try:
-            asset_dicts = [asdict(asset) for asset in assets]
-        except TypeError as exc:  # pragma: no cover - defensive
-            raise ClassificationError(
-                "Failed to serialise assets for classification."
-            ) from exc
-
-        assets_df = pd.DataFrame(asset_dicts)
-        df = self._classify_dataframe(assets_df)
+        if self.cache is None:
+            df = self._classify_records(assets)
+        else:
+            df = self.cache.classify(
+                assets,
+                self._classify_records,
+                self._cache_state(),
+            )
 
         logger = logging.getLogger(__name__)
         logger.info("Classified %d assets.", len(df))
@@ -429,14 +578,6 @@ class AssetClassifier:
 
         return df
 
-    def _contains_keywords(self, series: pd.Series, keywords: set[str]) -> pd.Series:
-        if series.empty or not keywords:
-            return pd.Series(False, index=series.index)
-        pattern = "|".join(re.escape(keyword) for keyword in keywords if keyword)
-        if not pattern:
-            return pd.Series(False, index=series.index)
-        return series.str.contains(pattern, na=False)
-
     def _classify_dataframe(self, assets_df: pd.DataFrame) -> pd.DataFrame:
         def column_or_empty(column: str) -> pd.Series:
             if column in assets_df:
@@ -457,129 +598,38 @@ class AssetClassifier:
             index=assets_df.index,
         )
 
-        unknown_class = AssetClass.UNKNOWN.value
-        asset_class_name = pd.Series(unknown_class, index=result_df.index, dtype=object)
-
-        equity_mask = self._contains_keywords(name_lower, self.EQUITY_KEYWORDS)
-        asset_class_name[equity_mask] = AssetClass.EQUITY.value
-
-        remaining = asset_class_name == unknown_class
-        bond_mask = remaining & self._contains_keywords(name_lower, self.BOND_KEYWORDS)
-        asset_class_name[bond_mask] = AssetClass.FIXED_INCOME.value
-
-        remaining = asset_class_name == unknown_class
-        commodity_mask = remaining & self._contains_keywords(
-            name_lower, self.COMMODITY_KEYWORDS
+        name_labels = self._scan_column(name_lower)
+        category_labels = self._scan_column(category_lower)
+        # Rows sharing labels, region and currency share a classification.
+        decided: dict[tuple, tuple[str, str, str, float]] = {}
+        rows = []
+        for row in zip(
+            name_labels,
+            category_labels,
+            region_lower,
+            currency_lower,
+            strict=True,
+        ):
+            if row not in decided:
+                decided[row] = self._classify_labels(*row)
+            rows.append(decided[row])
+        asset_classes, sub_classes, geographies, confidences = (
+            zip(*rows, strict=True) if rows else ((), (), (), ())
         )
-        asset_class_name[commodity_mask] = AssetClass.COMMODITY.value
 
-        remaining = asset_class_name == unknown_class
-        real_estate_mask = remaining & self._contains_keywords(
-            name_lower, self.REAL_ESTATE_KEYWORDS
+        result_df["asset_class"] = pd.Series(
+            asset_classes, index=result_df.index, dtype=object
         )
-        asset_class_name[real_estate_mask] = AssetClass.REAL_ESTATE.value
-
-        class_from_category = pd.Series(
-            unknown_class, index=result_df.index, dtype=object
+        result_df["sub_class"] = pd.Series(
+            sub_classes, index=result_df.index, dtype=object
         )
-        stock_mask = category_lower.str.contains("stock", na=False)
-        class_from_category[stock_mask] = AssetClass.EQUITY.value
-
-        remaining_cat = class_from_category == unknown_class
-        etf_mask = remaining_cat & category_lower.str.contains("etf", na=False)
-        class_from_category[etf_mask] = AssetClass.EQUITY.value
-
-        remaining_cat = class_from_category == unknown_class
-        bond_cat_mask = remaining_cat & category_lower.str.contains("bond", na=False)
-        class_from_category[bond_cat_mask] = AssetClass.FIXED_INCOME.value
-
-        unknown_name_mask = asset_class_name == unknown_class
-        unknown_cat_mask = class_from_category == unknown_class
-
-        asset_class = asset_class_name.copy()
-        confidence = pd.Series(0.7, index=result_df.index, dtype=float)
-
-        both_unknown = unknown_name_mask & unknown_cat_mask
-        asset_class[both_unknown] = unknown_class
-        confidence[both_unknown] = 0.5
-
-        both_known = (~unknown_name_mask) & (~unknown_cat_mask)
-        confidence[both_known] = 0.9
-
-        name_only_known = (~unknown_name_mask) & unknown_cat_mask
-        asset_class[name_only_known] = asset_class_name[name_only_known]
-        confidence[name_only_known] = 0.7
-
-        cat_only_known = unknown_name_mask & (~unknown_cat_mask)
-        asset_class[cat_only_known] = class_from_category[cat_only_known]
-        confidence[cat_only_known] = 0.7
-
-        geography = pd.Series(Geography.UNKNOWN, index=result_df.index, dtype=object)
-        assigned_geo = geography != Geography.UNKNOWN
-
-        for geo_enum, patterns in self.GEOGRAPHY_PATTERNS.items():
-            patterns_lower = [pattern.lower() for pattern in patterns]
-            mask_region = region_lower.isin(patterns_lower)
-            mask_currency = currency_lower.isin(patterns_lower)
-            pattern_regex = "|".join(
-                re.escape(pattern) for pattern in patterns_lower if pattern
-            )
-            mask_name = (
-                name_lower.str.contains(pattern_regex, na=False)
-                if pattern_regex
-                else pd.Series(False, index=result_df.index)
-            )
-            combined = (~assigned_geo) & (mask_region | mask_currency | mask_name)
-            geography[combined] = geo_enum
-            assigned_geo = geography != Geography.UNKNOWN
-
-        sub_class = pd.Series(
-            SubClass.UNKNOWN.value, index=result_df.index, dtype=object
+        result_df["geography"] = pd.Series(
+            geographies, index=result_df.index, dtype=object
         )
-        equity_asset_mask = asset_class == AssetClass.EQUITY.value
-        sub_class[
-            equity_asset_mask & name_lower.str.contains("large cap", na=False)
-        ] = SubClass.LARGE_CAP.value
-        sub_class[
-            equity_asset_mask & name_lower.str.contains("small cap", na=False)
-        ] = SubClass.SMALL_CAP.value
-        sub_class[equity_asset_mask & name_lower.str.contains("value", na=False)] = (
-            SubClass.VALUE.value
-        )
-        sub_class[equity_asset_mask & name_lower.str.contains("growth", na=False)] = (
-            SubClass.GROWTH.value
-        )
-        sub_class[equity_asset_mask & name_lower.str.contains("dividend", na=False)] = (
-            SubClass.DIVIDEND.value
-        )
-
-        fixed_income_mask = asset_class == AssetClass.FIXED_INCOME.value
-        sub_class[
-            fixed_income_mask
-            & name_lower.str.contains("government|gilt|treasury", na=False)
-        ] = SubClass.GOVERNMENT.value
-        sub_class[
-            fixed_income_mask & name_lower.str.contains("corporate", na=False)
-        ] = SubClass.CORPORATE.value
-        sub_class[
-            fixed_income_mask & name_lower.str.contains("high yield", na=False)
-        ] = SubClass.HIGH_YIELD.value
-
-        commodity_asset_mask = asset_class == AssetClass.COMMODITY.value
-        sub_class[commodity_asset_mask & name_lower.str.contains("gold", na=False)] = (
-            SubClass.GOLD.value
-        )
-
-        real_estate_asset_mask = asset_class == AssetClass.REAL_ESTATE.value
-        sub_class[
-            real_estate_asset_mask & name_lower.str.contains("reit", na=False)
-        ] = SubClass.REIT.value
-
-        result_df["asset_class"] = asset_class.astype(str)
-        result_df["sub_class"] = sub_class.astype(str)
-        result_df["geography"] = geography.apply(lambda x: x.value)
         result_df["sector"] = None
-        result_df["confidence"] = confidence
+        result_df["confidence"] = pd.Series(
+            confidences, index=result_df.index, dtype=float
+        )
 
         if self.overrides.overrides:
             isin_series = assets_df.get("isin", pd.Series([], dtype=str)).fillna("")
@@ -618,76 +668,164 @@ class AssetClassifier:
 
         return result_df
 
-    def _classify_by_name(self, asset: SelectedAsset) -> AssetClass:
-        if pd.isna(asset.name):
-            return AssetClass.UNKNOWN
-        name = asset.name.lower()
-        if any(keyword in name for keyword in self.EQUITY_KEYWORDS):
-            return AssetClass.EQUITY
-        if any(keyword in name for keyword in self.BOND_KEYWORDS):
-            return AssetClass.FIXED_INCOME
-        if any(keyword in name for keyword in self.COMMODITY_KEYWORDS):
-            return AssetClass.COMMODITY
-        if any(keyword in name for keyword in self.REAL_ESTATE_KEYWORDS):
-            return AssetClass.REAL_ESTATE
+    def _classify_records(self, assets: list[SelectedAsset]) -> pd.DataFrame:
+        """Classify assets through a DataFrame of their fields."""
+        # Assets hold scalar fields only, so a shallow read matches `asdict`.
+        try:
+            assets_df = pd.DataFrame(
+                {
+                    column.name: [getattr(asset, column.name) for asset in assets]
+                    for column in fields(assets[0])
+                },
+            )
+        except (TypeError, AttributeError) as exc:  # pragma: no cover - defensive
+            raise ClassificationError(
+                "Failed to serialise assets for classification."
+            ) from exc
+        return self._classify_dataframe(assets_df)
+
+    def _cache_state(self) -> str:
+        """Hash the rules and overrides that classification results depend on."""
+        state = {
+            "version": self.RULES_VERSION,
+            "name": [
+                sorted(keywords)
+                for keywords in (
+                    self.EQUITY_KEYWORDS,
+                    self.BOND_KEYWORDS,
+                    self.COMMODITY_KEYWORDS,
+                    self.REAL_ESTATE_KEYWORDS,
+                )
+            ],
+            # Rule order is precedence, so ordered rules are hashed as lists.
+            "category": list(self.CATEGORY_KEYWORDS.items()),
+            "geography": list(self.GEOGRAPHY_PATTERNS.items()),
+            "sub_class": [
+                [
+                    asset_class,
+                    [
+                        [sub_class, sorted(keywords)]
+                        for sub_class, keywords in sub_classes.items()
+                    ],
+                ]
+                for asset_class, sub_classes in self.SUB_CLASS_KEYWORDS.items()
+            ],
+            "overrides": self.overrides.overrides,
+        }
+        payload = json.dumps(state, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _lower(value: object) -> str:
+        """Lower-case a metadata field, mapping missing values to ``""``."""
+        if isinstance(value, str):
+            return value.lower()
+        return "" if pd.isna(value) else str(value).lower()
+
+    def _scan(self, value: object) -> frozenset[Hashable]:
+        """Return the keyword labels of one metadata field."""
+        return self._scanner.find(self._lower(value))
+
+    def _scan_column(self, values: pd.Series) -> list[frozenset[Hashable]]:
+        """Return the keyword labels of every string of a column, in one pass."""
+        return self._scanner.scan(values.tolist())
+
+    def _classify_labels(
+        self,
+        names: frozenset[Hashable],
+        categories: frozenset[Hashable],
+        region: str,
+        currency: str,
+    ) -> tuple[str, str, str, float]:
+        """Classify one row of `_classify_dataframe` from its keyword labels."""
+        asset_class, confidence = self._combine_classes(
+            self._class_from_labels(names),
+            self._category_from_labels(categories),
+        )
+        sub_class = self._sub_class_from_labels(asset_class, names, last_match=True)
+        geography = self._geography_from_labels(region, currency, names)
+        return asset_class.value, sub_class.value, geography.value, confidence
+
+    @staticmethod
+    def _combine_classes(
+        from_name: AssetClass,
+        from_category: AssetClass,
+    ) -> tuple[AssetClass, float]:
+        """Reconcile the name and category classes into a class and confidence."""
+        if from_name == AssetClass.UNKNOWN and from_category == AssetClass.UNKNOWN:
+            return AssetClass.UNKNOWN, 0.5
+        if from_name != AssetClass.UNKNOWN and from_category != AssetClass.UNKNOWN:
+            return from_name, 0.9
+        if from_name != AssetClass.UNKNOWN:
+            return from_name, 0.7
+        return from_category, 0.7
+
+    @staticmethod
+    def _class_from_labels(labels: frozenset[Hashable]) -> AssetClass:
+        for asset_class in (
+            AssetClass.EQUITY,
+            AssetClass.FIXED_INCOME,
+            AssetClass.COMMODITY,
+            AssetClass.REAL_ESTATE,
+        ):
+            if ("name", asset_class) in labels:
+                return asset_class
         return AssetClass.UNKNOWN
 
-    def _classify_by_category(self, asset: SelectedAsset) -> AssetClass:
-        if pd.isna(asset.category):
-            return AssetClass.UNKNOWN
-        category = asset.category.lower()
-        if "stock" in category:
-            return AssetClass.EQUITY
-        if "etf" in category:
-            return AssetClass.EQUITY
-        if "bond" in category:
-            return AssetClass.FIXED_INCOME
+    def _category_from_labels(self, labels: frozenset[Hashable]) -> AssetClass:
+        for keyword, asset_class in self.CATEGORY_KEYWORDS.items():
+            if ("category", keyword) in labels:
+                return asset_class
         return AssetClass.UNKNOWN
 
-    def _classify_geography(self, asset: SelectedAsset) -> Geography:
-        for geo, patterns in self.GEOGRAPHY_PATTERNS.items():
-            if not pd.isna(asset.region) and asset.region.lower() in patterns:
-                return geo
-            if not pd.isna(asset.currency) and asset.currency.lower() in patterns:
-                return geo
-            if not pd.isna(asset.name) and any(
-                pattern.lower() in asset.name.lower() for pattern in patterns
-            ):
-                return geo
+    def _geography_from_labels(
+        self,
+        region: str,
+        currency: str,
+        labels: frozenset[Hashable],
+    ) -> Geography:
+        for geography, patterns in self._geography_patterns.items():
+            if region in patterns or currency in patterns:
+                return geography
+            if ("geography", geography) in labels:
+                return geography
         return Geography.UNKNOWN
 
-    def _classify_sub_class(  # noqa: C901, PLR0911, PLR0912
+    def _sub_class_from_labels(
         self,
-        asset: SelectedAsset,
         asset_class: AssetClass,
-    ) -> str:
-        if pd.isna(asset.name):
+        labels: frozenset[Hashable],
+        *,
+        last_match: bool = False,
+    ) -> SubClass:
+        matched = [
+            sub_class
+            for sub_class in self.SUB_CLASS_KEYWORDS.get(asset_class, {})
+            if (asset_class, sub_class) in labels
+        ]
+        if not matched:
             return SubClass.UNKNOWN
-        name = asset.name.lower()
-        if asset_class == AssetClass.EQUITY:
-            if "large cap" in name:
-                return SubClass.LARGE_CAP
-            if "small cap" in name:
-                return SubClass.SMALL_CAP
-            if "value" in name:
-                return SubClass.VALUE
-            if "growth" in name:
-                return SubClass.GROWTH
-            if "dividend" in name:
-                return SubClass.DIVIDEND
-        if asset_class == AssetClass.FIXED_INCOME:
-            if "government" in name or "gilt" in name or "treasury" in name:
-                return SubClass.GOVERNMENT
-            if "corporate" in name:
-                return SubClass.CORPORATE
-            if "high yield" in name:
-                return SubClass.HIGH_YIELD
-        if asset_class == AssetClass.COMMODITY and "gold" in name:
-            return SubClass.GOLD
-        if asset_class == AssetClass.REAL_ESTATE:
-            if "reit" in name:
-                return SubClass.REIT
-        return SubClass.UNKNOWN
+        return matched[-1] if last_match else matched[0]
+
+    def _classify_by_name(self, asset: SelectedAsset) -> AssetClass:
+        return self._class_from_labels(self._scan(asset.name))
+
+    def _classify_by_category(self, asset: SelectedAsset) -> AssetClass:
+        return self._category_from_labels(self._scan(asset.category))
+
+    def _classify_geography(self, asset: SelectedAsset) -> Geography:
+        return self._geography_from_labels(
+            self._lower(asset.region),
+            self._lower(asset.currency),
+            self._scan(asset.name),
+        )
+
+    def _classify_sub_class(
+        self,
+        asset: SelectedAsset,
+        asset_class: AssetClass,
+    ) -> SubClass:
+        return self._sub_class_from_labels(asset_class, self._scan(asset.name))
 
     @staticmethod
     def export_for_review(
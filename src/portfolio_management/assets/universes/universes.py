@@ -61,7 +61,11 @@ import pandas as pd
 import yaml
 
 from portfolio_management.analytics.indicators import IndicatorConfig
-from portfolio_management.analytics.returns import ReturnCalculator, ReturnConfig
+from portfolio_management.analytics.returns import (
+    PriceLoader,
+    ReturnCalculator,
+    ReturnConfig,
+)
 
 from ...core.exceptions import (
     AssetSelectionError,
@@ -250,21 +254,39 @@ class UniverseManager:
         # us_equity = manager.load_universe("us_equity_large_cap")
     """
 
-    def __init__(self, config_path: Path, matches_df: pd.DataFrame, prices_dir: Path):
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        config_path: Path,
+        matches_df: pd.DataFrame,
+        prices_dir: Path,
+        price_panel: Path | None = None,
+        returns_cache: Path | None = None,
+        classification_cache: Path | None = None,
+    ):
         """Initializes the UniverseManager.
 
         Args:
             config_path: Path to the universe YAML configuration file.
             matches_df: DataFrame containing metadata for all tradeable assets.
             prices_dir: Path to the directory containing historical price data.
+            price_panel: Optional price panel directory (see
+                `build_price_panel`) to load universe prices from.
+            returns_cache: Optional directory of a `ReturnsCache` that keeps
+                prepared returns across processes, not just in this manager.
+            classification_cache: Optional directory of a
+                `ClassificationCache`; only assets that are new or whose
+                metadata changed since earlier runs are classified.
         """
         self.config_path = config_path
         self.matches_df = matches_df
         self.prices_dir = prices_dir
         self.universes = UniverseConfigLoader.load_config(config_path)
         self.asset_selector = AssetSelector()
-        self.asset_classifier = AssetClassifier()
-        self.return_calculator = ReturnCalculator()
+        self.asset_classifier = AssetClassifier(cache=classification_cache)
+        self.return_calculator = ReturnCalculator(
+            price_loader=PriceLoader(panel=price_panel) if price_panel else None,
+            returns_cache=returns_cache,
+        )
         self._cache: dict[str, dict[str, pd.DataFrame | pd.Series]] = {}
 
     def list_universes(self) -> list[str]:
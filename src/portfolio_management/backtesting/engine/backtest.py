@@ -59,6 +59,7 @@ from portfolio_management.core.exceptions import (
     InsufficientHistoryError,
     RebalanceError,
 )
+from portfolio_management.portfolio.costs import TurnoverCostModel
 
 
 class BacktestEngine:
@@ -96,6 +97,8 @@ class BacktestEngine:
         preselection: Optional preselection filter for asset screening.
         membership_policy: Optional policy to control portfolio turnover.
         cache: Optional cache for factors and eligibility data to improve performance.
+        result_cache: Optional cache of constructed portfolios keyed on the
+            returns window, strategy parameters and constraints.
         cost_model (TransactionCostModel): The model for calculating trade costs.
         holdings (dict[str, int]): The current number of shares held for each asset.
         cash (Decimal): The current cash balance in the portfolio.
@@ -140,6 +143,7 @@ class BacktestEngine:
         preselection=None,
         membership_policy=None,
         cache=None,
+        result_cache=None,
     ) -> None:
         """Initialize the backtesting engine.
 
@@ -152,18 +156,21 @@ class BacktestEngine:
             preselection: Optional Preselection instance for asset filtering.
             membership_policy: Optional MembershipPolicy for controlling portfolio churn.
             cache: Optional FactorCache instance for caching factor scores and PIT eligibility.
+            result_cache: Optional PortfolioResultCache consulted before each
+                strategy construction.
 
         Raises:
             InsufficientHistoryError: If data doesn't cover the backtest period.
         """
         self.config = config
         self.strategy = strategy
-        self.prices = prices.copy()
-        self.returns = returns.copy()
+        self.prices = prices.astype(config.precision)
+        self.returns = returns.astype(config.precision)
         self.classifications = classifications or {}
         self.preselection = preselection
         self.membership_policy = membership_policy
         self.cache = cache
+        self.result_cache = result_cache
         self.holding_periods: dict[str, int] = (
             {}
         )  # Track holding periods for membership policy
@@ -196,6 +203,15 @@ class BacktestEngine:
             slippage_bps=config.slippage_bps,
         )
 
+        # Trading costs in weight space for cost-aware rebalancing
+        self.turnover_cost_model: TurnoverCostModel | None = None
+        if config.cost_aware_rebalancing:
+            self.turnover_cost_model = TurnoverCostModel.from_transaction_costs(
+                commission_pct=config.commission_pct,
+                slippage_bps=config.slippage_bps,
+                trade_aversion=config.trade_aversion,
+            )
+
         # Tracking state
         self.holdings: dict[str, int] = {}  # Current share counts
         self.cash: Decimal = config.initial_capital
@@ -294,6 +310,21 @@ class BacktestEngine:
                 holdings_value += Decimal(str(shares)) * price
         return holdings_value + self.cash
 
+    def _current_weights(self, prices: pd.Series, portfolio_value: Decimal) -> pd.Series:
+        """Return current holdings as weights of the investable portfolio value.
+
+        Weights are expressed relative to the value net of the cash reserve so
+        that they are comparable with the strategy's target weights.
+        """
+        investable = float(portfolio_value) * (1 - self.config.cash_reserve_pct)
+        weights: dict[str, float] = {}
+        if investable <= 0:
+            return pd.Series(weights, dtype=float)
+        for ticker, shares in self.holdings.items():
+            if shares and ticker in prices.index and not pd.isna(prices[ticker]):
+                weights[ticker] = shares * float(prices[ticker]) / investable
+        return pd.Series(weights, dtype=float)
+
     def _should_rebalance_scheduled(self, date: datetime.date) -> bool:
         """Check if scheduled rebalancing is due."""
         if not self.rebalance_events:
@@ -555,12 +586,36 @@ class BacktestEngine:
                     asset_classes.index.isin(candidate_assets)
                 ]
 
-            # Construct target portfolio (on selected subset)
-            portfolio = self.strategy.construct(
-                returns=eligible_returns,
-                constraints=constraints,
-                asset_classes=asset_classes,
-            )
+            # Construct target portfolio (on selected subset); optimisers get
+            # float64 inputs whatever the precision of the stored panels
+            eligible_returns = eligible_returns.astype("float64", copy=False)
+            cost_kwargs = {}
+            if self.turnover_cost_model is not None:
+                cost_kwargs = {
+                    "current_weights": self._current_weights(date_prices, pre_value),
+                    "cost_model": self.turnover_cost_model,
+                }
+            if self.result_cache is not None:
+                portfolio = self.result_cache.get_or_construct(
+                    self.strategy,
+                    eligible_returns,
+                    constraints,
+                    asset_classes,
+                    **cost_kwargs,
+                )
+            elif cost_kwargs:
+                portfolio = self.strategy.construct_with_costs(
+                    eligible_returns,
+                    constraints,
+                    asset_classes,
+                    **cost_kwargs,
+                )
+            else:
+                portfolio = self.strategy.construct(
+                    returns=eligible_returns,
+                    constraints=constraints,
+                    asset_classes=asset_classes,
+                )
             target_weights = portfolio.weights
 
             # Calculate investable cash (keeping reserve)
@@ -93,6 +93,14 @@ class BacktestConfig:
         use_pit_eligibility (bool): If True, enables point-in-time eligibility filtering.
         min_history_days (int): The minimum calendar days of history for PIT eligibility.
         min_price_rows (int): The minimum number of price observations for PIT eligibility.
+        cost_aware_rebalancing (bool): If True, strategies that support it optimise
+            target weights net of the commission and slippage of trading from the
+            current holdings.
+        trade_aversion (float): Multiplier on the modelled trading cost in the
+            cost-aware objective; higher values trade less.
+        precision (str): Floating-point type the engine stores the price and
+            returns panels in, 'float64' or 'float32'. Strategies always
+            receive float64 returns windows.
     """
 
     start_date: datetime.date
@@ -110,6 +118,9 @@ class BacktestConfig:
     use_pit_eligibility: bool = False  # Enable point-in-time eligibility filtering
     min_history_days: int = 252  # Minimum days for eligibility (1 year)
     min_price_rows: int = 252  # Minimum price rows for eligibility
+    cost_aware_rebalancing: bool = False  # Penalise turnover in the optimiser
+    trade_aversion: float = 1.0  # Weight of trading costs in the objective
+    precision: str = "float64"  # float32 halves the memory of the panels
 
     def __post_init__(self) -> None:
         """Validate configuration values after initialization."""
@@ -161,6 +172,18 @@ class BacktestConfig:
                 invalid_value=self.min_price_rows,
                 reason="Must be positive",
             )
+        if not self.trade_aversion >= 0:
+            raise InvalidBacktestConfigError(
+                config_field="trade_aversion",
+                invalid_value=self.trade_aversion,
+                reason="Cannot be negative",
+            )
+        if self.precision not in {"float64", "float32"}:
+            raise InvalidBacktestConfigError(
+                config_field="precision",
+                invalid_value=self.precision,
+                reason="Must be 'float64' or 'float32'",
+            )
 
 
 @dataclass
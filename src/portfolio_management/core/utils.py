@@ -1,17 +1,22 @@
-"""Shared utilities for parallel execution and performance monitoring.
+"""Shared utilities for parallel execution, performance monitoring and file writes.
 
 This module provides high-level helper functions for common tasks such as
 concurrent execution and performance timing. These utilities are designed to be
 robust, with clear error handling and configurable behavior.
 
 The `run_in_parallel` function is a powerful tool for speeding up I/O-bound
-or CPU-bound tasks that can be broken into independent chunks of work. The
+or CPU-bound tasks that can be broken into independent chunks of work. It runs
+tasks on a thread pool by default; GIL-bound work such as parsing price files
+can instead be sent to a process pool, with tasks batched into chunks so that
+pickling is paid once per chunk rather than once per task. The
 `log_duration` context manager provides a simple way to measure and log the
 time taken by critical sections of code.
 
 Key Functions:
     run_in_parallel: Executes a function over a list of arguments in parallel.
+    resolve_executor: Picks the thread or process pool for a workload.
     log_duration: A context manager for timing a code block.
+    atomic_write: A context manager for replacing a file atomically.
 
 Example:
     Using `run_in_parallel` to execute tasks and handle errors.
@@ -38,30 +43,181 @@ Example:
 from __future__ import annotations
 
 import logging
+import math
+import multiprocessing
+import os
+import pickle
+import threading
 import time
+import traceback
 from collections.abc import Callable, Generator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+EXECUTOR_CHOICES = ("thread", "process", "auto")
+# Below this many tasks, spawning worker processes costs more than it saves.
+AUTO_PROCESS_MIN_TASKS = 64
+# Chunks per worker when no chunk size is given; a few per worker keeps the
+# pool balanced when task durations vary.
+CHUNKS_PER_WORKER = 4
+
+
+def resolve_executor(executor: str, task_count: int, max_workers: int) -> str:
+    """Return the concrete pool type, ``"thread"`` or ``"process"``, for a workload.
+
+    ``"auto"`` selects processes when there are at least
+    `AUTO_PROCESS_MIN_TASKS` tasks, more than one worker and more than one CPU,
+    and threads otherwise.
+
+    Args:
+        executor: ``"thread"``, ``"process"`` or ``"auto"``.
+        task_count: Number of tasks to run.
+        max_workers: Maximum number of workers.
+
+    Returns:
+        ``"thread"`` or ``"process"``.
+
+    Raises:
+        ValueError: If ``executor`` is not one of `EXECUTOR_CHOICES`.
+
+    Example:
+        >>> resolve_executor("auto", task_count=10, max_workers=8)
+        'thread'
+        >>> resolve_executor("process", task_count=10, max_workers=8)
+        'process'
+
+    """
+    if executor not in EXECUTOR_CHOICES:
+        msg = f"Invalid executor '{executor}'. Expected one of {EXECUTOR_CHOICES}"
+        raise ValueError(msg)
+    if executor != "auto":
+        return executor
+    if (
+        max_workers > 1
+        and task_count >= AUTO_PROCESS_MIN_TASKS
+        and (os.cpu_count() or 1) > 1
+    ):
+        return "process"
+    return "thread"
+
+
+class _RemoteTraceback(Exception):  # noqa: N818 - not raised, only chained
+    """Worker traceback attached as the cause of a re-raised task exception."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__(text)
+        self.text = text
+
+    def __str__(self) -> str:
+        return self.text
+
+
+def _run_chunk(
+    func: Callable[..., T],
+    start: int,
+    chunk: list[tuple[Any, ...]],
+) -> tuple[list[T], tuple[int, BaseException, str] | None]:
+    """Run a chunk of tasks in a worker process.
+
+    Returns the results and, if a task failed, its index, exception and
+    formatted traceback (tracebacks do not survive pickling); the remaining
+    tasks of the chunk are not run.
+    """
+    results: list[T] = []
+    for offset, args in enumerate(chunk):
+        try:
+            results.append(func(*args))
+        except Exception as exc:  # noqa: BLE001 - re-raised by the parent
+            error: BaseException = exc
+            try:
+                pickle.dumps(error)
+            except Exception:  # noqa: BLE001 - unpicklable exception
+                error = RuntimeError(repr(exc))
+            text = "".join(traceback.format_exception(exc))
+            return results, (start + offset, error, f'\n"""\n{text}"""')
+    return results, None
+
+
+def _run_in_processes(  # noqa: PLR0913
+    func: Callable[..., T],
+    args_list: list[tuple[Any, ...]],
+    max_workers: int,
+    *,
+    preserve_order: bool,
+    log_tasks: bool,
+    chunksize: int | None,
+) -> list[T]:
+    """Run tasks in chunks on a spawn-based process pool."""
+    size = chunksize or math.ceil(len(args_list) / (max_workers * CHUNKS_PER_WORKER))
+    size = max(1, size)
+    chunks = [
+        (start, args_list[start : start + size])
+        for start in range(0, len(args_list), size)
+    ]
+    context = multiprocessing.get_context("spawn")
+    results: list[T] = []
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(chunks)),
+        mp_context=context,
+    ) as executor:
+        future_to_start = {
+            executor.submit(_run_chunk, func, start, chunk): start
+            for start, chunk in chunks
+        }
+        # Dict order is submission order, i.e. task order.
+        futures = future_to_start if preserve_order else as_completed(future_to_start)
+        try:
+            for future in futures:
+                if log_tasks:
+                    LOGGER.debug(
+                        "Collecting chunk starting at task %d",
+                        future_to_start[future],
+                    )
+                try:
+                    chunk_results, failure = future.result()
+                except Exception as exc:
+                    idx = future_to_start[future]
+                    LOGGER.exception("Task %d failed", idx)
+                    raise RuntimeError(f"Task {idx} failed: {exc}") from exc
+                results.extend(chunk_results)
+                if failure is not None:
+                    idx, error, text = failure
+                    error.__cause__ = _RemoteTraceback(text)
+                    LOGGER.error("Task %d failed", idx, exc_info=error)
+                    raise RuntimeError(f"Task {idx} failed: {error}") from error
+        finally:
+            for f in future_to_start:
+                f.cancel()
+    return results
+
 
-def _run_in_parallel(
+def _run_in_parallel(  # noqa: PLR0913
     func: Callable[..., T],
     args_list: list[tuple[Any, ...]],
     max_workers: int,
     *,
     preserve_order: bool = True,
     log_tasks: bool = False,
+    executor: str = "thread",
+    chunksize: int | None = None,
 ) -> list[T]:
     """Runs a function in parallel over a list of argument sets.
 
-    This function uses a `ThreadPoolExecutor` to distribute work across
-    multiple threads. It includes robust error handling that wraps and
-    re-raises exceptions from worker threads.
+    By default this function uses a `ThreadPoolExecutor` to distribute work
+    across multiple threads. With ``executor="process"`` (or ``"auto"`` on a
+    large workload, see `resolve_executor`) tasks are batched into chunks and
+    run on a spawn-based `ProcessPoolExecutor`, which sidesteps the GIL for
+    CPU-bound work. ``func``, its arguments and its results must then be
+    picklable, and ``func`` must be importable (a module-level function). In
+    both modes exceptions from workers are wrapped and re-raised.
 
     If `max_workers` is 1 or less, the function executes sequentially, which is
     useful for debugging.
@@ -75,6 +231,10 @@ def _run_in_parallel(
             same order as `args_list`. If `False`, results are returned in the
             order of completion.
         log_tasks: If `True`, logs task start/completion at DEBUG level.
+        executor: ``"thread"`` (default), ``"process"`` or ``"auto"``.
+        chunksize: Tasks per process-pool submission. Defaults to spreading
+            the tasks over `CHUNKS_PER_WORKER` chunks per worker. Ignored for
+            threads.
 
     Returns:
         A list containing the results from each call to `func`.
@@ -82,6 +242,7 @@ def _run_in_parallel(
     Raises:
         RuntimeError: If any worker task raises an exception. The original
             exception is chained.
+        ValueError: If ``executor`` is not one of `EXECUTOR_CHOICES`.
 
     Example:
         Running a simple task and preserving order.
@@ -108,6 +269,7 @@ def _run_in_parallel(
         Caught expected error: Task 1 failed: Failure
 
     """
+    pool_type = resolve_executor(executor, len(args_list), max_workers)
     if max_workers <= 1:
         # Sequential execution for easy debugging
         results_seq: list[T] = []
@@ -118,13 +280,23 @@ def _run_in_parallel(
                 result = func(*args)
                 results_seq.append(result)
             except Exception as exc:
-                LOGGER.error("Task %d failed: %s", idx, exc, exc_info=log_tasks)
+                LOGGER.exception("Task %d failed", idx)
                 raise RuntimeError(f"Task {idx} failed: {exc}") from exc
         return results_seq
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    if pool_type == "process" and args_list:
+        return _run_in_processes(
+            func,
+            args_list,
+            max_workers,
+            preserve_order=preserve_order,
+            log_tasks=log_tasks,
+            chunksize=chunksize,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
         future_to_index = {
-            executor.submit(func, *args): idx for idx, args in enumerate(args_list)
+            pool.submit(func, *args): idx for idx, args in enumerate(args_list)
         }
 
         if preserve_order:
@@ -135,7 +307,7 @@ def _run_in_parallel(
                 try:
                     results[idx] = future.result()
                 except Exception as exc:
-                    LOGGER.error("Task %d failed: %s", idx, exc, exc_info=log_tasks)
+                    LOGGER.exception("Task %d failed", idx)
                     for f in future_to_index:
                         f.cancel()
                     raise RuntimeError(f"Task {idx} failed: {exc}") from exc
@@ -148,7 +320,7 @@ def _run_in_parallel(
                 try:
                     results_unordered.append(future.result())
                 except Exception as exc:
-                    LOGGER.error("Task %d failed: %s", idx, exc, exc_info=log_tasks)
+                    LOGGER.exception("Task %d failed", idx)
                     # Raise the first exception encountered.
                     raise RuntimeError(f"Task {idx} failed: {exc}") from exc
         finally:
@@ -196,3 +368,39 @@ def log_duration(step: str) -> Generator[None, None, None]:
     finally:
         elapsed = time.perf_counter() - start_time
         LOGGER.info("%s completed in %.2fs", step, elapsed)
+
+
+@contextmanager
+def atomic_write(path: Path) -> Generator[Path, None, None]:
+    """Context manager to replace a file atomically.
+
+    The block writes to a temporary file next to ``path``, which is renamed
+    over ``path`` when the block succeeds and removed when it raises. The
+    temporary name is unique per process and thread, so concurrent writers
+    never share it and readers see either the old or the new file.
+
+    Args:
+        path: The file to replace.
+
+    Yields:
+        The temporary path to write to.
+
+    Example:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>>
+        >>> target = Path(tempfile.mkdtemp()) / "state.json"
+        >>> with atomic_write(target) as tmp_path:
+        ...     _ = tmp_path.write_text("{}", encoding="utf-8")
+        >>> target.read_text(encoding="utf-8")
+        '{}'
+
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        yield tmp_path
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -8,6 +8,7 @@ Key Modules:
     - ingestion: Tools for scanning and indexing raw Stooq data files.
     - io: High-level I/O operations for reading/writing analysis-ready data.
     - cache: Caching and change detection to accelerate data pipelines.
+    - watch: Change detection for the long-running --watch pipeline mode.
     - matching: Logic for matching tradeable instruments to Stooq tickers.
     - models: Data models for representing instruments, matches, and files.
     - analysis: Functions for data quality analysis and currency resolution.
@@ -5,6 +5,7 @@ from portfolio_management.data.analysis.analysis import (
     infer_currency,
     log_summary_counts,
     resolve_currency,
+    resolve_match_currencies,
     summarize_clean_price_frame,
     summarize_price_file,
 )
@@ -14,6 +15,7 @@ __all__ = [
     "infer_currency",
     "log_summary_counts",
     "resolve_currency",
+    "resolve_match_currencies",
     "summarize_clean_price_frame",
     "summarize_price_file",
 ]
@@ -5,11 +5,13 @@ provides functions for summarizing price files, inferring currencies from metada
 and resolving discrepancies between different data sources.
 
 Key Functions:
-    - summarize_price_file: Computes diagnostics for a Stooq file via streaming
-      to minimize memory usage.
+    - summarize_price_file: Computes diagnostics for a Stooq file with a
+      vectorized byte scan, falling back to chunked streaming.
     - infer_currency: Guesses the trading currency from Stooq metadata.
     - resolve_currency: Reconciles broker and Stooq currencies with a policy for
       special cases like the London Stock Exchange (LSE).
+    - resolve_match_currencies: Applies `resolve_currency` to many matches
+      through a table of the distinct (region, market, currency) keys.
     - log_summary_counts: Logs aggregate statistics for data quality.
 
 """
@@ -19,13 +21,19 @@ from __future__ import annotations
 import logging
 import pathlib
 from collections.abc import Mapping, Sequence
+from functools import cache
 from typing import TYPE_CHECKING
 
 from portfolio_management.core.config import REGION_CURRENCY_MAP, STOOQ_COLUMNS
 from portfolio_management.core.exceptions import DependencyNotInstalledError
+from portfolio_management.data.analysis.stooq_scan import scan_stooq_file
 
 if TYPE_CHECKING:
-    from portfolio_management.data.models import StooqFile, TradeableInstrument
+    from portfolio_management.data.models import (
+        StooqFile,
+        TradeableInstrument,
+        TradeableMatch,
+    )
 
 try:
     import pandas as pd
@@ -46,6 +54,12 @@ ZERO_VOLUME_CRITICAL_THRESHOLD = 0.5
 ZERO_VOLUME_HIGH_THRESHOLD = 0.1
 ZERO_VOLUME_MODERATE_THRESHOLD = 0.01
 
+# Broker symbol suffixes that denote a London Stock Exchange listing.
+_LSE_SYMBOL_SUFFIXES = (":LN", ":L", ".LN", ".L")
+
+# Columns of the currency-resolution table, see `resolve_match_currencies`.
+_CURRENCY_KEY_COLUMNS = ["region", "market", "currency", "lse_symbol"]
+
 
 def _read_stooq_csv(
     file_path: pathlib.Path,
@@ -219,45 +233,97 @@ def _stream_stooq_file_for_diagnostics(
     except OSError as exc:
         return _initialize_diagnostics(), f"error:{exc.__class__.__name__}"
 
-    # Build diagnostics
-    diagnostics = _initialize_diagnostics()
-
     if valid_row_count == 0:
+        diagnostics = _initialize_diagnostics()
         diagnostics["data_status"] = "empty"
         return diagnostics, "empty"
 
-    # Calculate zero volume ratio
-    zero_volume_ratio = (zero_volume / valid_row_count) if valid_row_count else 0.0
+    diagnostics = _diagnostics_from_counts(
+        row_count=valid_row_count,
+        price_start=first_valid_date.date().isoformat(),
+        price_end=last_valid_date.date().isoformat(),
+        invalid_rows=invalid_row_count,
+        non_numeric_prices=non_numeric_prices,
+        non_positive_close=non_positive_close,
+        missing_volume=missing_volume,
+        zero_volume=zero_volume,
+        duplicate_dates=has_duplicate_dates,
+        non_monotonic_dates=has_non_monotonic_dates,
+    )
+    return diagnostics, "ok"
+
 
-    # Determine severity
+def _diagnostics_from_counts(  # noqa: PLR0913
+    *,
+    row_count: int,
+    price_start: str,
+    price_end: str,
+    invalid_rows: int,
+    non_numeric_prices: int,
+    non_positive_close: int,
+    missing_volume: int,
+    zero_volume: int,
+    duplicate_dates: bool,
+    non_monotonic_dates: bool,
+) -> dict[str, str]:
+    """Build the diagnostics dictionary from accumulated row statistics."""
+    zero_volume_ratio = zero_volume / row_count
     zero_volume_severity = (
         _determine_zero_volume_severity(zero_volume_ratio) if zero_volume else None
     )
-
-    # Generate flags
     flags = _generate_flags(
-        invalid_rows=invalid_row_count,
+        invalid_rows=invalid_rows,
         non_numeric_prices=non_numeric_prices,
         non_positive_close=non_positive_close,
         missing_volume=missing_volume,
         zero_volume=zero_volume,
         zero_volume_ratio=zero_volume_ratio,
         zero_volume_severity=zero_volume_severity,
-        duplicate_dates=has_duplicate_dates,
-        non_monotonic_dates=has_non_monotonic_dates,
+        duplicate_dates=duplicate_dates,
+        non_monotonic_dates=non_monotonic_dates,
     )
 
-    # Populate diagnostics
-    diagnostics["price_start"] = first_valid_date.date().isoformat()
-    diagnostics["price_end"] = last_valid_date.date().isoformat()
-    diagnostics["price_rows"] = str(valid_row_count)
+    diagnostics = _initialize_diagnostics()
+    diagnostics["price_start"] = price_start
+    diagnostics["price_end"] = price_end
+    diagnostics["price_rows"] = str(row_count)
     diagnostics["data_status"] = _determine_data_status(
-        valid_row_count,
+        row_count,
         zero_volume_severity,
         has_flags=bool(flags),
     )
     diagnostics["data_flags"] = ";".join(flags)
+    return diagnostics
+
 
+def _scan_stooq_file_for_diagnostics(
+    file_path: pathlib.Path,
+) -> tuple[dict[str, str], str] | None:
+    """Compute diagnostics with the vectorized byte scanner.
+
+    Returns:
+        The diagnostics and status, or None when the file needs the chunked
+        pandas reader (irregular rows, header-only or empty files).
+
+    """
+    try:
+        scan = scan_stooq_file(file_path)
+    except OSError as exc:
+        return _initialize_diagnostics(), f"error:{exc.__class__.__name__}"
+    if scan is None:
+        return None
+    diagnostics = _diagnostics_from_counts(
+        row_count=scan.rows,
+        price_start=scan.start_iso,
+        price_end=scan.end_iso,
+        invalid_rows=0,
+        non_numeric_prices=0,
+        non_positive_close=scan.non_positive_close,
+        missing_volume=0,
+        zero_volume=scan.zero_volume,
+        duplicate_dates=scan.duplicate_dates,
+        non_monotonic_dates=scan.non_monotonic_dates,
+    )
     return diagnostics, "ok"
 
 
@@ -467,10 +533,12 @@ def summarize_price_file(
     base_dir: pathlib.Path,
     stooq_file: StooqFile,
 ) -> dict[str, str]:
-    """Extract diagnostics from a Stooq price file using streaming.
+    """Extract diagnostics from a Stooq price file.
 
-    This function minimizes memory usage by reading the file in chunks and
-    accumulating statistics, rather than loading the entire file.
+    Well-formed files are memory-mapped and scanned with vectorized byte
+    operations (see `stooq_scan`). Files the scanner rejects are read in
+    chunks with pandas, accumulating statistics rather than loading the
+    entire file.
 
     Args:
         base_dir: The root directory where Stooq data is stored.
@@ -481,7 +549,15 @@ def summarize_price_file(
         data quality flags.
     """
     file_path = base_dir / stooq_file.rel_path
-    diagnostics, status = _stream_stooq_file_for_diagnostics(file_path)
+    if not file_path.exists():
+        diagnostics, status = _initialize_diagnostics(), "missing_file"
+    else:
+        scanned = _scan_stooq_file_for_diagnostics(file_path)
+        diagnostics, status = (
+            scanned
+            if scanned is not None
+            else _stream_stooq_file_for_diagnostics(file_path)
+        )
 
     # If status is not "ok", update data_status accordingly
     if status != "ok":
@@ -522,7 +598,7 @@ def _is_lse_listing(symbol: str, market: str) -> bool:
     market_upper = (market or "").upper()
     if "LSE" in market_upper or "LONDON" in market_upper or "GBR-LSE" in market_upper:
         return True
-    return symbol_upper.endswith((":LN", ":L", ".LN", ".L"))
+    return symbol_upper.endswith(_LSE_SYMBOL_SUFFIXES)
 
 
 def resolve_currency(
@@ -557,49 +633,131 @@ def resolve_currency(
     market = (instrument.market or "").upper()
     symbol = (instrument.symbol or "").upper()
 
-    # Default outputs
-    resolved = inferred
-    status = ""
-
     lse_listing = stooq_file.region.lower() == "uk" and _is_lse_listing(symbol, market)
+    resolved, status = _resolve_currency_key(
+        expected,
+        inferred,
+        lse_listing,
+        _normalize_lse_policy(lse_policy),
+    )
+    return expected, inferred, resolved, status
+
 
+def resolve_match_currencies(
+    matches: Sequence[TradeableMatch],
+    *,
+    lse_policy: str = "broker",
+) -> pd.DataFrame:
+    """Resolve the currency of every match through a per-market lookup table.
+
+    The outcome of `resolve_currency` only depends on the Stooq region, the
+    broker market and currency, and whether the symbol carries an LSE suffix.
+    The table holds one resolution per distinct combination and is mapped
+    onto the matches with a join, so the resolution work scales with the
+    number of distinct markets rather than the number of instruments.
+
+    Args:
+        matches: The matches to resolve.
+        lse_policy: The policy for LSE listings ('broker', 'stooq', 'strict').
+
+    Returns:
+        A DataFrame aligned with ``matches`` holding the ``expected_currency``,
+        ``inferred_currency``, ``resolved_currency`` and ``currency_status``
+        columns, equal to the `resolve_currency` results for
+        `infer_currency` of each Stooq file.
+    """
+    keys = pd.DataFrame(
+        {
+            "region": pd.Series(
+                [match.stooq_file.region or "" for match in matches],
+                dtype=object,
+            ).str.lower(),
+            "market": pd.Series(
+                [match.instrument.market or "" for match in matches],
+                dtype=object,
+            ).str.upper(),
+            "currency": pd.Series(
+                [match.instrument.currency or "" for match in matches],
+                dtype=object,
+            ).str.upper(),
+            "lse_symbol": pd.Series(
+                [match.instrument.symbol or "" for match in matches],
+                dtype=object,
+            )
+            .str.upper()
+            .str.endswith(_LSE_SYMBOL_SUFFIXES),
+        },
+    )
+    table = keys.drop_duplicates()
+    policy = _normalize_lse_policy(lse_policy)
+    inferred = [
+        (REGION_CURRENCY_MAP.get(region) or "").upper() for region in table["region"]
+    ]
+    resolutions = [
+        _resolve_currency_key(
+            currency,
+            inferred_currency,
+            region == "uk" and (lse_symbol or _is_lse_listing("", market)),
+            policy,
+        )
+        for (region, market, currency, lse_symbol), inferred_currency in zip(
+            table.itertuples(index=False),
+            inferred,
+            strict=True,
+        )
+    ]
+    table = table.assign(
+        inferred_currency=inferred,
+        resolved_currency=[resolved for resolved, _status in resolutions],
+        currency_status=[status for _resolved, status in resolutions],
+    )
+    resolved = keys.merge(table, on=_CURRENCY_KEY_COLUMNS, how="left")
+    return resolved.rename(columns={"currency": "expected_currency"})[
+        [
+            "expected_currency",
+            "inferred_currency",
+            "resolved_currency",
+            "currency_status",
+        ]
+    ]
+
+
+def _normalize_lse_policy(lse_policy: str) -> str:
+    """Lower-case the LSE policy, falling back to 'broker' for unknown values."""
+    policy = lse_policy.lower()
+    if policy not in {"broker", "stooq", "strict"}:
+        LOGGER.warning(
+            "Unknown LSE currency policy '%s'; defaulting to broker.",
+            lse_policy,
+        )
+        return "broker"
+    return policy
+
+
+@cache
+def _resolve_currency_key(
+    expected: str,
+    inferred: str,
+    lse_listing: bool,
+    lse_policy: str,
+) -> tuple[str, str]:
+    """Return the resolved currency and status for normalized inputs."""
     if expected and inferred:
         if expected == inferred:
-            resolved = inferred
-            status = "match"
-        elif lse_listing:
-            policy = lse_policy.lower()
-            if policy == "broker":
-                # LSE multi-currency lines are often denominated per share class; keep broker currency.
-                resolved = expected
-                status = "override"
-            elif policy == "stooq":
-                resolved = inferred
-                status = "mismatch"
-            elif policy == "strict":
-                resolved = ""
-                status = "error:lse_currency_override"
-            else:
-                LOGGER.warning(
-                    "Unknown LSE currency policy '%s'; defaulting to broker.",
-                    lse_policy,
-                )
-                resolved = expected
-                status = "override"
-        else:
-            resolved = inferred
-            status = "mismatch"
-    elif expected:
-        resolved = expected
-        status = "expected_only"
-    elif inferred:
-        resolved = inferred
-        status = "inferred_only"
-    else:
-        resolved = ""
-        status = "unknown"
-
-    return expected, inferred, resolved, status
+            return inferred, "match"
+        if not lse_listing:
+            return inferred, "mismatch"
+        if lse_policy == "stooq":
+            return inferred, "mismatch"
+        if lse_policy == "strict":
+            return "", "error:lse_currency_override"
+        # LSE multi-currency lines are often denominated per share class; keep broker currency.
+        return expected, "override"
+    if expected:
+        return expected, "expected_only"
+    if inferred:
+        return inferred, "inferred_only"
+    return "", "unknown"
 
 
 def log_summary_counts(
@@ -0,0 +1,252 @@
+"""Vectorized byte-level scanner for Stooq price files.
+
+Diagnostics only need row counts, the first and last date, date ordering,
+duplicate dates, non-positive closes and zero volumes. Instead of parsing
+every field through `pandas.read_csv`, this module memory-maps the file and
+locates rows and fields with NumPy: newline and comma offsets give the date,
+close and volume spans of every row, and all statistics are reductions over
+those spans.
+
+The scanner only accepts files that the pandas path would read without any
+special handling: ten comma-separated fields per row, ``YYYYMMDD`` dates,
+plain decimal close and volume values, ASCII only, no quoting or stray
+whitespace, and ``<`` only on header lines. Anything else makes
+`scan_stooq_file` return None so callers fall back to the pandas reader,
+which owns the invalid-row and non-numeric accounting.
+
+Key Classes:
+    - StooqFileScan: Statistics extracted from a well-formed Stooq file.
+
+Key Functions:
+    - scan_stooq_file: Scan a Stooq file, or return None when it is irregular.
+"""
+
+from __future__ import annotations
+
+import mmap
+import pathlib
+from dataclasses import dataclass
+
+import numpy as np
+
+from portfolio_management.core.config import STOOQ_COLUMNS
+
+_NEWLINE, _CR, _COMMA, _LT, _DOT, _MINUS = (ord(c) for c in "\n\r,<.-")
+_DIGIT_0, _DIGIT_1, _DIGIT_9 = ord("0"), ord("1"), ord("9")
+
+_FIELD_COUNT = len(STOOQ_COLUMNS)
+_DATE_FIELD = STOOQ_COLUMNS.index("date")
+_CLOSE_FIELD = STOOQ_COLUMNS.index("close")
+_VOLUME_FIELD = STOOQ_COLUMNS.index("volume")
+_DATE_WIDTH = 8
+
+# Widest numeric field accepted; longer values go through pandas.
+MAX_NUMBER_WIDTH = 32
+
+# Dates representable as pandas nanosecond timestamps for the whole year.
+_MIN_YEAR, _MAX_YEAR = 1678, 2261
+
+# Bytes that the pandas path treats specially (quotes, whitespace it strips,
+# non-ASCII text it decodes).
+_IRREGULAR_BYTES = np.zeros(256, dtype=bool)
+_IRREGULAR_BYTES[[ord('"'), ord(" "), ord("\t"), 0x0B, 0x0C]] = True
+_IRREGULAR_BYTES[0x80:] = True
+
+
+@dataclass(frozen=True)
+class StooqFileScan:
+    """Statistics extracted from a well-formed Stooq file.
+
+    Attributes:
+        rows: Number of price rows.
+        first_date: Date of the first row as ``YYYYMMDD``.
+        last_date: Date of the last row as ``YYYYMMDD``.
+        non_positive_close: Rows whose close is zero or negative.
+        zero_volume: Rows whose volume is zero.
+        duplicate_dates: True when any date appears more than once.
+        non_monotonic_dates: True when a date is earlier than its predecessor.
+
+    """
+
+    rows: int
+    first_date: int
+    last_date: int
+    non_positive_close: int
+    zero_volume: int
+    duplicate_dates: bool
+    non_monotonic_dates: bool
+
+    @property
+    def start_iso(self) -> str:
+        """Return the first date in ISO format."""
+        return _iso_date(self.first_date)
+
+    @property
+    def end_iso(self) -> str:
+        """Return the last date in ISO format."""
+        return _iso_date(self.last_date)
+
+
+def scan_stooq_file(file_path: pathlib.Path) -> StooqFileScan | None:
+    """Scan a Stooq price file with vectorized byte operations.
+
+    Args:
+        file_path: Path to the Stooq ``.txt`` file.
+
+    Returns:
+        The file statistics, or None when the file is empty, has no price
+        rows or contains anything the scanner does not handle.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+
+    """
+    with file_path.open("rb") as handle:
+        if not handle.seek(0, 2):
+            return None
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _scan_buffer(np.frombuffer(mapped, dtype=np.uint8))
+
+
+def _scan_buffer(buf: np.ndarray) -> StooqFileScan | None:
+    """Scan the mapped file contents; see `scan_stooq_file`."""
+    if _IRREGULAR_BYTES[buf].any():
+        return None
+
+    newlines = np.flatnonzero(buf == _NEWLINE)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [buf.size]))
+    nonempty = ends > starts
+    has_cr = nonempty & (buf[np.maximum(ends - 1, 0)] == _CR)
+    if np.count_nonzero(buf == _CR) != np.count_nonzero(has_cr):
+        return None  # carriage return outside a CRLF terminator
+    ends = ends - has_cr
+    nonempty = ends > starts
+
+    starts, ends = starts[nonempty], ends[nonempty]
+    header = buf[starts] == _LT
+    less_than = np.flatnonzero(buf == _LT)
+    if less_than.size:
+        owner = np.searchsorted(starts, less_than, side="right") - 1
+        if not header[owner].all():
+            return None  # "<" inside a price row would start a comment
+    starts, ends = starts[~header], ends[~header]
+    if not starts.size:
+        return None
+
+    commas = np.flatnonzero(buf == _COMMA)
+    first_comma = np.searchsorted(commas, starts)
+    comma_counts = np.searchsorted(commas, ends) - first_comma
+    if (comma_counts != _FIELD_COUNT - 1).any():
+        return None
+    rows = (starts, ends, commas, first_comma)
+    dates = _parse_dates(buf, *_field_span(_DATE_FIELD, *rows))
+    close = _classify_numbers(buf, *_field_span(_CLOSE_FIELD, *rows))
+    volume = _classify_numbers(buf, *_field_span(_VOLUME_FIELD, *rows))
+    if dates is None or close is None or volume is None:
+        return None
+
+    steps = np.diff(dates)
+    non_monotonic = bool((steps < 0).any())
+    duplicates = (
+        np.unique(dates).size < dates.size
+        if non_monotonic
+        else bool((steps == 0).any())
+    )
+    close_negative, close_zero = close
+    _volume_negative, volume_zero = volume
+    return StooqFileScan(
+        rows=int(dates.size),
+        first_date=int(dates[0]),
+        last_date=int(dates[-1]),
+        non_positive_close=int(np.count_nonzero(close_negative | close_zero)),
+        zero_volume=int(np.count_nonzero(volume_zero)),
+        duplicate_dates=bool(duplicates),
+        non_monotonic_dates=non_monotonic,
+    )
+
+
+def _field_span(
+    field: int,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    commas: np.ndarray,
+    first_comma: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the byte offsets delimiting ``field`` in every row."""
+    start = starts if field == 0 else commas[first_comma + field - 1] + 1
+    end = ends if field == _FIELD_COUNT - 1 else commas[first_comma + field]
+    return start, end
+
+
+def _gather(
+    buf: np.ndarray,
+    starts: np.ndarray,
+    width: int,
+) -> np.ndarray:
+    """Return a ``(rows, width)`` matrix of the bytes following each start."""
+    index = np.minimum(starts[:, None] + np.arange(width), buf.size - 1)
+    return buf[index]
+
+
+def _parse_dates(
+    buf: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+) -> np.ndarray | None:
+    """Decode ``YYYYMMDD`` fields to integers; None if any date is invalid."""
+    if ((ends - starts) != _DATE_WIDTH).any():
+        return None
+    digits = _gather(buf, starts, _DATE_WIDTH) - np.uint8(_DIGIT_0)
+    if (digits > 9).any():  # uint8 wraps below "0"
+        return None
+    values = digits.astype(np.int64) @ (10 ** np.arange(_DATE_WIDTH - 1, -1, -1))
+    year, month, day = values // 10_000, values // 100 % 100, values % 100
+    if (
+        (year < _MIN_YEAR).any()
+        or (year > _MAX_YEAR).any()
+        or (month < 1).any()
+        or (month > 12).any()
+        or (day < 1).any()
+    ):
+        return None
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    next_months = months + np.timedelta64(1, "M")
+    month_days = next_months.astype("datetime64[D]") - months.astype("datetime64[D]")
+    if (day > month_days.astype(np.int64)).any():
+        return None
+    return values
+
+
+def _classify_numbers(
+    buf: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Classify plain decimal fields as negative and/or zero.
+
+    Returns:
+        Boolean ``(negative, zero)`` arrays, or None when any field is not of
+        the form ``-?digits[.digits]`` (digits on at least one side).
+
+    """
+    widths = ends - starts
+    if not widths.size or widths.min() < 1 or widths.max() > MAX_NUMBER_WIDTH:
+        return None
+    chars = _gather(buf, starts, int(widths.max()))
+    inside = np.arange(chars.shape[1]) < widths[:, None]
+    negative = chars[:, 0] == _MINUS
+    digit = inside & (chars >= _DIGIT_0) & (chars <= _DIGIT_9)
+    dot = inside & (chars == _DOT)
+    sign = np.zeros_like(inside)
+    sign[:, 0] = negative
+    if (inside & ~(digit | dot | sign)).any() or (dot.sum(axis=1) > 1).any():
+        return None
+    if not digit.any(axis=1).all():
+        return None
+    nonzero = inside & (chars >= _DIGIT_1) & (chars <= _DIGIT_9)
+    return negative, ~nonzero.any(axis=1)
+
+
+def _iso_date(value: int) -> str:
+    return f"{value // 10_000:04d}-{value // 100 % 100:02d}-{value % 100:02d}"
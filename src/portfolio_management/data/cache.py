@@ -10,6 +10,9 @@ Key Functions:
     - save_cache_metadata: Saves metadata for the current run.
     - inputs_unchanged: Compares current input hashes with cached ones.
     - create_cache_metadata: Generates new metadata for the current inputs.
+    - file_fingerprint: Cheap (size, mtime) fingerprint of a single file.
+    - DiagnosticsManifest: Per-file record of price diagnostics and export
+      outcomes, so that only changed Stooq files are reprocessed.
 
 Usage Example:
     >>> import tempfile
@@ -44,9 +47,12 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+from portfolio_management.core.utils import atomic_write
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -88,6 +94,51 @@ def compute_directory_hash(directory: Path, pattern: str = "*.csv") -> str:
     return hasher.hexdigest()
 
 
+def reusable_entry(
+    entry: dict[str, Any] | None,
+    path: Path,
+    *,
+    content_hash: bool = False,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Return a stored manifest entry if its file is unchanged.
+
+    This is `DiagnosticsManifest.lookup` for a single entry, so that worker
+    processes only need the entry for the file they process rather than the
+    whole manifest.
+
+    Args:
+        entry: The stored entry for the file, or None if there is none.
+        path: The file's absolute path.
+        content_hash: Whether files are also fingerprinted by content.
+
+    Returns:
+        A tuple of the reusable entry (or None if the file is new or has
+        changed) and the file's current fingerprint (None if the file is
+        missing).
+    """
+    fingerprint = file_fingerprint(path)
+    if fingerprint is None:
+        return None, None
+    stored = entry.get("fingerprint", {}) if entry is not None else {}
+    stat_matches = (
+        stored.get("size") == fingerprint["size"]
+        and stored.get("mtime_ns") == fingerprint["mtime_ns"]
+    )
+    if not content_hash:
+        return (entry if stat_matches else None), fingerprint
+
+    if stat_matches and "sha256" in stored:
+        fingerprint["sha256"] = stored["sha256"]
+        return entry, fingerprint
+    digest = _content_hash(path)
+    if digest is None:
+        return None, None
+    fingerprint["sha256"] = digest
+    if entry is not None and stored.get("sha256") == digest:
+        return entry, fingerprint
+    return None, fingerprint
+
+
 def compute_stooq_index_hash(index_path: Path) -> str:
     """Compute the hash of the Stooq index file.
 
@@ -253,4 +304,237 @@ def create_cache_metadata(
     return {
         "tradeable_hash": compute_directory_hash(tradeable_dir, "*.csv"),
         "stooq_index_hash": compute_stooq_index_hash(stooq_index_path),
-    }
\ No newline at end of file
+    }
+
+
+MANIFEST_VERSION = 1
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_fingerprint(
+    path: Path,
+    *,
+    content_hash: bool = False,
+) -> dict[str, Any] | None:
+    """Return the fingerprint used to detect changes to a single file.
+
+    Args:
+        path: The file to fingerprint.
+        content_hash: If True, also include a SHA-256 digest of the contents.
+
+    Returns:
+        A dictionary with ``size`` and ``mtime_ns`` (and ``sha256`` when
+        requested), or None if the file does not exist.
+
+    Example:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>>
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     p = Path(tmpdir) / "a.txt"
+        ...     _ = p.write_text("abc")
+        ...     fingerprint = file_fingerprint(p, content_hash=True)
+        ...     print(fingerprint["size"], len(fingerprint["sha256"]))
+        3 64
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    fingerprint: dict[str, Any] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if content_hash:
+        digest = _content_hash(path)
+        if digest is None:
+            return None
+        fingerprint["sha256"] = digest
+    return fingerprint
+
+
+def _content_hash(path: Path) -> str | None:
+    hasher = hashlib.sha256()
+    try:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+    except OSError:
+        return None
+    return hasher.hexdigest()
+
+
+class DiagnosticsManifest:
+    """Per-file manifest of price diagnostics and export outcomes.
+
+    Each entry is keyed by the Stooq file's relative path and stores the file
+    fingerprint (size, ``mtime_ns`` and, with ``content_hash=True``, a SHA-256
+    digest) together with the `summarize_price_file` diagnostics and the
+    outcome of exporting the file. On the next run, files whose fingerprint is
+    unchanged reuse their stored results, so a refresh that touches a few
+    hundred of 60k files only reprocesses those few hundred.
+
+    When content hashing is enabled, a file whose size or mtime changed but
+    whose contents did not (e.g. after re-extracting an archive) is also
+    treated as unchanged.
+
+    Export outcomes are only reused while the export settings recorded in
+    ``export_signature`` are unchanged. When a changed file merely gained rows
+    after its checkpoint, only those rows are appended to the existing export.
+
+    Example:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>>
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     price_file = Path(tmpdir) / "aapl.us.txt"
+        ...     _ = price_file.write_text("data")
+        ...     manifest = DiagnosticsManifest()
+        ...     entry, fingerprint = manifest.lookup("aapl.us.txt", price_file)
+        ...     manifest.record("aapl.us.txt", fingerprint, {"data_status": "ok"})
+        ...     manifest.save(Path(tmpdir) / "manifest.json")
+        ...     reloaded = DiagnosticsManifest.load(Path(tmpdir) / "manifest.json")
+        ...     entry, _ = reloaded.lookup("aapl.us.txt", price_file)
+        ...     print(entry["diagnostics"]["data_status"])
+        ok
+    """
+
+    def __init__(
+        self,
+        entries: dict[str, dict[str, Any]] | None = None,
+        *,
+        content_hash: bool = False,
+        export_signature: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the manifest.
+
+        Args:
+            entries: Existing entries keyed by relative path.
+            content_hash: Whether to fingerprint files by content as well.
+            export_signature: Export settings the stored outcomes were produced with.
+        """
+        self.entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self.content_hash = content_hash
+        self.export_signature = export_signature
+
+    @classmethod
+    def load(cls, path: Path, *, content_hash: bool = False) -> DiagnosticsManifest:
+        """Load a manifest from JSON, returning an empty one if unusable.
+
+        Args:
+            path: The path to the manifest JSON file.
+            content_hash: Whether to fingerprint files by content as well.
+
+        Returns:
+            The loaded manifest, or an empty manifest if the file is missing,
+            corrupted or was written by an incompatible version.
+        """
+        payload = load_cache_metadata(path)
+        if payload.get("version") != MANIFEST_VERSION:
+            if payload:
+                LOGGER.info("Ignoring diagnostics manifest with unknown version")
+            return cls(content_hash=content_hash)
+        return cls(
+            payload.get("entries", {}),
+            content_hash=content_hash,
+            export_signature=payload.get("export_signature"),
+        )
+
+    def save(self, path: Path) -> None:
+        """Atomically write the manifest to JSON.
+
+        Args:
+            path: The path to the manifest JSON file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": MANIFEST_VERSION,
+            "export_signature": self.export_signature,
+            "entries": self.entries,
+        }
+        try:
+            with atomic_write(path) as tmp_path, tmp_path.open("w") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            LOGGER.debug("Saved diagnostics manifest (%s entries)", len(self.entries))
+        except OSError as e:
+            LOGGER.warning("Failed to save diagnostics manifest to %s: %s", path, e)
+
+    def lookup(
+        self,
+        rel_path: str,
+        path: Path,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Return the stored entry for a file if it is unchanged.
+
+        Args:
+            rel_path: The file's path relative to the data directory.
+            path: The file's absolute path.
+
+        Returns:
+            A tuple of the reusable entry (or None if the file is new or has
+            changed) and the file's current fingerprint (None if the file is
+            missing). The fingerprint is what `record` should store.
+        """
+        return reusable_entry(
+            self.entries.get(rel_path),
+            path,
+            content_hash=self.content_hash,
+        )
+
+    def record(
+        self,
+        rel_path: str,
+        fingerprint: dict[str, Any],
+        diagnostics: dict[str, str],
+        export: dict[str, Any] | None = None,
+    ) -> None:
+        """Store the diagnostics and export outcome for a file.
+
+        Args:
+            rel_path: The file's path relative to the data directory.
+            fingerprint: The fingerprint returned by `lookup`.
+            diagnostics: The file's `summarize_price_file` diagnostics.
+            export: Optional ``{"exported": bool, "skipped": bool}`` outcome,
+                plus the ``checkpoint`` of an exported file (source offset,
+                last date and last row) used to append new rows next time.
+        """
+        self.entries[rel_path] = {
+            "fingerprint": fingerprint,
+            "diagnostics": diagnostics,
+            "export": export,
+        }
+
+    def invalidate(self, rel_paths: Iterable[str]) -> None:
+        """Force files to be fingerprinted again on the next lookup.
+
+        Their stored size and mtime are dropped, so a rewrite that kept both
+        (within one timestamp tick) is still reprocessed. Content digests and
+        export checkpoints are kept: unchanged contents are still reused and
+        grown files are still appended to.
+
+        Args:
+            rel_paths: Relative paths of the files reported as changed.
+        """
+        for rel_path in rel_paths:
+            entry = self.entries.get(rel_path)
+            if entry is not None:
+                fingerprint = entry.get("fingerprint") or {}
+                entry["fingerprint"] = {
+                    key: value for key, value in fingerprint.items() if key == "sha256"
+                }
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Drop entries for files that are no longer processed.
+
+        Args:
+            keep: Relative paths to retain.
+
+        Returns:
+            The number of entries removed.
+        """
+        keep_set = set(keep)
+        stale = [rel_path for rel_path in self.entries if rel_path not in keep_set]
+        for rel_path in stale:
+            del self.entries[rel_path]
+        return len(stale)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.entries)
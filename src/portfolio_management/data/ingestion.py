@@ -8,6 +8,8 @@ efficient lookup and processing of price data.
 Key Functions:
     - build_stooq_index: The main entry point to create an index of all
       Stooq price files.
+    - update_stooq_index: Incrementally rescan the tree against a persisted
+      `StooqIndexStore`, listing only directories whose mtime changed.
     - derive_region_and_category: A helper to infer metadata from file paths.
 
 Usage Example:
@@ -36,10 +38,14 @@ from __future__ import annotations
 
 import logging
 import os
+import posixpath
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 from portfolio_management.core.exceptions import DataDirectoryNotFoundError
 from portfolio_management.core.utils import _run_in_parallel
+from portfolio_management.data.io.index_store import StooqIndexStore
 from portfolio_management.data.models import StooqFile
 
 LOGGER = logging.getLogger(__name__)
@@ -50,6 +56,12 @@ DAILY_INDEX_OFFSET = 1  # component immediately after "daily" gives the region
 DAILY_CATEGORY_OFFSET = 2  # components between region and file describe category
 MIN_PARTS_FOR_CATEGORY = 2
 
+# Directories modified this close to the scan are re-listed on the next rescan:
+# a change landing in the same mtime tick as the scan would otherwise be missed
+# on filesystems with coarse timestamps (NFS, FAT: 1-2 s).
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+UNTRUSTED_MTIME = -1
+
 
 def _scan_directory(base_dir: Path, start_dir: Path) -> list[str]:
     """Scan a directory tree and return relative *.txt paths."""
@@ -166,20 +178,216 @@ def build_stooq_index(
     workers = max(1, max_workers or os.cpu_count() or 1)
     relative_paths = _collect_relative_paths(data_dir, workers)
 
-    entries: list[StooqFile] = []
-    for rel_path_str in relative_paths:
-        rel_path = Path(rel_path_str)
-        ticker = rel_path.stem.upper()
-        region, category = derive_region_and_category(rel_path)
-        entries.append(
-            StooqFile(
-                ticker=ticker,
-                stem=rel_path.stem.upper(),
-                rel_path=rel_path_str,
-                region=region,
-                category=category,
+    entries = [_make_stooq_file(rel_path) for rel_path in relative_paths]
+
+    LOGGER.info("Indexed %s Stooq files from %s", len(entries), data_dir)
+    return entries
+
+
+def _make_stooq_file(rel_path_str: str) -> StooqFile:
+    """Build the index entry for a relative price file path."""
+    rel_path = Path(rel_path_str)
+    region, category = derive_region_and_category(rel_path)
+    return StooqFile(
+        ticker=rel_path.stem.upper(),
+        stem=rel_path.stem.upper(),
+        rel_path=rel_path_str,
+        region=region,
+        category=category,
+    )
+
+
+@dataclass(frozen=True)
+class _DirectoryState:
+    """Contents of a directory as recorded by the previous scan."""
+
+    mtime_ns: int
+    files: tuple[str, ...]
+    subdirs: tuple[str, ...]
+
+
+@dataclass
+class _SubtreeScan:
+    """Result of rescanning one subtree."""
+
+    rel_paths: list[str]
+    mtimes: dict[str, int]
+    listed: int = 0
+
+
+def _previous_states(
+    entries: list[StooqFile],
+    mtimes: dict[str, int],
+) -> dict[str, _DirectoryState]:
+    """Rebuild per-directory listings from a stored index."""
+    files: dict[str, list[str]] = {rel_dir: [] for rel_dir in mtimes}
+    subdirs: dict[str, list[str]] = {rel_dir: [] for rel_dir in mtimes}
+    for entry in entries:
+        rel_dir, name = posixpath.split(entry.rel_path)
+        files.setdefault(rel_dir, []).append(name)
+    for rel_dir in mtimes:
+        if rel_dir:
+            parent, name = posixpath.split(rel_dir)
+            subdirs.setdefault(parent, []).append(name)
+    return {
+        rel_dir: _DirectoryState(
+            mtime_ns=mtime_ns,
+            files=tuple(files.get(rel_dir, ())),
+            subdirs=tuple(subdirs.get(rel_dir, ())),
+        )
+        for rel_dir, mtime_ns in mtimes.items()
+    }
+
+
+def _list_directory(
+    path: Path,
+    *,
+    follow_dir_symlinks: bool = False,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the price file names and subdirectory names of ``path``."""
+    files: list[str] = []
+    subdirs: list[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=follow_dir_symlinks):
+                subdirs.append(entry.name)
+            elif entry.name.lower().endswith(".txt") and entry.is_file():
+                files.append(entry.name)
+    return tuple(files), tuple(subdirs)
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _visit_directory(
+    base_dir: Path,
+    rel_dir: str,
+    previous: dict[str, _DirectoryState],
+    racy_cutoff_ns: int,
+    scan: _SubtreeScan,
+) -> list[str]:
+    """Record one directory in ``scan`` and return its subdirectories.
+
+    The directory is listed only when its mtime differs from the recorded one;
+    otherwise the recorded listing is reused.
+    """
+    path = base_dir / rel_dir if rel_dir else base_dir
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+        state = previous.get(rel_dir)
+        if state is not None and state.mtime_ns == mtime_ns:
+            files, subdirs = state.files, state.subdirs
+        else:
+            # Top-level directories are followed like `build_stooq_index` does.
+            files, subdirs = _list_directory(path, follow_dir_symlinks=not rel_dir)
+            scan.listed += 1
+    except OSError as exc:
+        LOGGER.warning("Unable to scan %s: %s", path, exc)
+        return []
+    scan.mtimes[rel_dir] = mtime_ns if mtime_ns < racy_cutoff_ns else UNTRUSTED_MTIME
+    scan.rel_paths.extend(_join(rel_dir, name) for name in files)
+    return [_join(rel_dir, name) for name in subdirs]
+
+
+def _rescan_subtree(
+    base_dir: Path,
+    start_dir: str,
+    previous: dict[str, _DirectoryState],
+    racy_cutoff_ns: int,
+) -> _SubtreeScan:
+    """Rescan a subtree, listing only directories whose mtime changed.
+
+    A directory's mtime changes whenever an entry is created, removed or
+    renamed in it, which are the only changes that affect the index. Unchanged
+    directories are still stat'ed to reach their subdirectories, as nested
+    changes do not propagate to parents.
+    """
+    scan = _SubtreeScan(rel_paths=[], mtimes={})
+    stack = [start_dir]
+    while stack:
+        stack.extend(
+            _visit_directory(base_dir, stack.pop(), previous, racy_cutoff_ns, scan),
+        )
+    return scan
+
+
+def update_stooq_index(
+    data_dir: Path,
+    store: StooqIndexStore | Path,
+    max_workers: int | None = None,
+) -> list[StooqFile]:
+    """Rescan the Stooq tree incrementally and persist the refreshed index.
+
+    Directory modification times recorded in ``store`` by the previous scan
+    decide which directories need listing again; all others reuse their stored
+    contents, so a rescan of an unchanged tree costs one ``stat`` per directory
+    instead of a listing of every file. Without a usable store (first run,
+    different root, corrupt file) this is a full scan. The result is identical
+    to `build_stooq_index` either way.
+
+    Args:
+        data_dir: The root directory of the unpacked Stooq data.
+        store: The persisted index, or the path of its database file.
+        max_workers: The maximum number of parallel workers used to rescan
+                     top-level directories. Defaults to the number of CPU cores.
+
+    Returns:
+        A list of `StooqFile` objects sorted by relative path.
+
+    Raises:
+        DataDirectoryNotFoundError: If the specified `data_dir` does not exist.
+    """
+    if not data_dir.exists():
+        raise DataDirectoryNotFoundError(data_dir)
+    if not isinstance(store, StooqIndexStore):
+        store = StooqIndexStore(store)
+
+    previous_mtimes = store.load_directories(data_dir)
+    previous_entries = store.load_entries(data_dir) if previous_mtimes else None
+    previous = (
+        _previous_states(previous_entries, previous_mtimes)
+        if previous_entries is not None
+        else {}
+    )
+    racy_cutoff_ns = time.time_ns() - RACY_MTIME_WINDOW_NS
+
+    # Rescan the root on its own, then fan its subdirectories out to workers.
+    root = _SubtreeScan(rel_paths=[], mtimes={})
+    subdirs = _visit_directory(data_dir, "", previous, racy_cutoff_ns, root)
+
+    workers = max(1, max_workers or os.cpu_count() or 1)
+    scans = [root]
+    if subdirs:
+        scans.extend(
+            _run_in_parallel(
+                _rescan_subtree,
+                [(data_dir, rel_dir, previous, racy_cutoff_ns) for rel_dir in subdirs],
+                workers,
+                preserve_order=False,
             ),
         )
 
-    LOGGER.info("Indexed %s Stooq files from %s", len(entries), data_dir)
-    return entries
\ No newline at end of file
+    rel_paths: list[str] = []
+    mtimes: dict[str, int] = {}
+    for scan in scans:
+        rel_paths.extend(scan.rel_paths)
+        mtimes.update(scan.mtimes)
+    rel_paths.sort()
+
+    reused = {entry.rel_path: entry for entry in previous_entries or ()}
+    entries = [reused.get(path) or _make_stooq_file(path) for path in rel_paths]
+    listed = sum(scan.listed for scan in scans)
+    if listed or mtimes != previous_mtimes:
+        store.save(data_dir, entries, mtimes)
+
+    LOGGER.info(
+        "Indexed %s Stooq files from %s (listed %s of %s directories)",
+        len(entries),
+        data_dir,
+        listed,
+        len(mtimes),
+    )
+    return entries
@@ -7,6 +7,7 @@ from portfolio_management.data.io.fast_io import (
     read_parquet_fast,
     select_backend,
 )
+from portfolio_management.data.io.index_store import StooqIndexStore
 from portfolio_management.data.io.io import (
     export_tradeable_prices,
     load_tradeable_instruments,
@@ -15,8 +16,11 @@ from portfolio_management.data.io.io import (
     write_stooq_index,
     write_unmatched_report,
 )
+from portfolio_management.data.io.panel_store import PricePanelStore
 
 __all__ = [
+    "PricePanelStore",
+    "StooqIndexStore",
     "export_tradeable_prices",
     "get_available_backends",
     "is_backend_available",
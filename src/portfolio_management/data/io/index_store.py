@@ -0,0 +1,201 @@
+"""Persistent binary store for the Stooq index.
+
+The CSV index written by `write_stooq_index` is the interchange format read by
+downstream tools, but re-reading it means parsing every row through pandas and
+rebuilding it means walking the whole Stooq tree. `StooqIndexStore` keeps the
+same entries in a SQLite database together with the modification time of every
+scanned directory, so that:
+
+- loading the index is a single columnar query with no text parsing, and
+- `portfolio_management.data.ingestion.update_stooq_index` only lists the
+  directories whose mtime changed since the previous scan.
+
+SQLite ships with Python, so the store adds no dependency.
+
+Key Classes:
+    - StooqIndexStore: Read and write index entries and directory mtimes.
+"""
+
+from __future__ import annotations
+
+import logging
+import pathlib
+import posixpath
+import sqlite3
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+from portfolio_management.core.utils import atomic_write
+from portfolio_management.data.models import StooqFile
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+LOGGER = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+
+_SCHEMA = (
+    "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE directories (rel_dir TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL)",
+    (
+        "CREATE TABLE files ("
+        "rel_path TEXT PRIMARY KEY, rel_dir TEXT NOT NULL, ticker TEXT NOT NULL, "
+        "stem TEXT NOT NULL, region TEXT NOT NULL, category TEXT NOT NULL)"
+    ),
+)
+
+
+class StooqIndexStore:
+    """SQLite-backed Stooq index with per-directory modification times.
+
+    The store is bound to the resolved Stooq root it was built from; reading
+    it for a different root behaves like a missing store. Any unreadable,
+    corrupt or version-mismatched file is likewise treated as missing, so
+    callers can always fall back to a full scan.
+
+    Example:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> root = Path(tempfile.mkdtemp())
+        >>> store = StooqIndexStore(root / "stooq_index.sqlite")
+        >>> entry = StooqFile("AAPL.US", "AAPL.US", "daily/us/aapl.us.txt", "us", "")
+        >>> store.save(root, [entry], {"": 1, "daily": 2, "daily/us": 3})
+        >>> store.load_entries(root)[0].ticker
+        'AAPL.US'
+        >>> store.load_directories(root)["daily/us"]
+        3
+
+    """
+
+    def __init__(self, path: pathlib.Path | str) -> None:
+        """Initialise the store.
+
+        Args:
+            path: Location of the SQLite database file.
+
+        """
+        self.path = pathlib.Path(path)
+
+    def exists(self) -> bool:
+        """Return True when the database file exists."""
+        return self.path.is_file()
+
+    def load_entries(self, data_dir: pathlib.Path) -> list[StooqFile] | None:
+        """Load the index entries recorded for ``data_dir``.
+
+        Args:
+            data_dir: Stooq root the index must have been built from.
+
+        Returns:
+            Entries ordered by relative path, or None when the store is
+            missing, unreadable or was built for another root.
+
+        """
+        rows = self._query(
+            data_dir,
+            "SELECT ticker, stem, rel_path, region, category FROM files "
+            "ORDER BY rel_path",
+        )
+        if rows is None:
+            return None
+        entries = [StooqFile(*row) for row in rows]
+        LOGGER.info("Loaded %s Stooq index entries from %s", len(entries), self.path)
+        return entries
+
+    def load_directories(self, data_dir: pathlib.Path) -> dict[str, int]:
+        """Return the recorded directory mtimes keyed by relative directory.
+
+        The Stooq root itself is keyed by ``""``. An empty mapping is returned
+        when the store is unusable for ``data_dir``.
+        """
+        rows = self._query(data_dir, "SELECT rel_dir, mtime_ns FROM directories")
+        return dict(rows) if rows is not None else {}
+
+    def save(
+        self,
+        data_dir: pathlib.Path,
+        entries: Sequence[StooqFile],
+        directories: Mapping[str, int],
+    ) -> None:
+        """Replace the store contents atomically.
+
+        The database is written to a temporary file and moved into place, so
+        readers never observe a partially written index.
+
+        Args:
+            data_dir: Stooq root the entries were scanned from.
+            entries: Index entries to persist.
+            directories: Modification time (ns) of every scanned directory,
+                keyed by path relative to ``data_dir``.
+
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with (
+            atomic_write(self.path) as tmp_path,
+            closing(sqlite3.connect(tmp_path)) as conn,
+            conn,
+        ):
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [
+                    ("version", str(STORE_VERSION)),
+                    ("data_dir", _root_key(data_dir)),
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO directories VALUES (?, ?)",
+                directories.items(),
+            )
+            conn.executemany(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        entry.rel_path,
+                        posixpath.dirname(entry.rel_path),
+                        entry.ticker,
+                        entry.stem,
+                        entry.region,
+                        entry.category,
+                    )
+                    for entry in entries
+                ),
+            )
+        LOGGER.info(
+            "Stooq index store written to %s (%s entries, %s directories)",
+            self.path,
+            len(entries),
+            len(directories),
+        )
+
+    def _query(self, data_dir: pathlib.Path, sql: str) -> list[tuple] | None:
+        """Run ``sql`` if the store is valid for ``data_dir``."""
+        if not self.exists():
+            return None
+        uri = f"{self.path.resolve().as_uri()}?mode=ro"
+        try:
+            with closing(sqlite3.connect(uri, uri=True)) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta"))
+                if meta.get("version") != str(STORE_VERSION):
+                    LOGGER.info(
+                        "Ignoring Stooq index store %s: version mismatch",
+                        self.path,
+                    )
+                    return None
+                if meta.get("data_dir") != _root_key(data_dir):
+                    LOGGER.info(
+                        "Ignoring Stooq index store %s: built for %s",
+                        self.path,
+                        meta.get("data_dir"),
+                    )
+                    return None
+                return conn.execute(sql).fetchall()
+        except sqlite3.Error as exc:
+            LOGGER.warning("Unable to read Stooq index store %s: %s", self.path, exc)
+            return None
+
+
+def _root_key(data_dir: pathlib.Path) -> str:
+    return pathlib.Path(data_dir).resolve().as_posix()
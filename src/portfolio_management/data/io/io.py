@@ -16,19 +16,24 @@ Key Functions:
 from __future__ import annotations
 
 import collections
+import errno
+import itertools
 import logging
+import mmap
+import os
 import pathlib
+import shutil
 from collections.abc import Sequence
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
 
 from portfolio_management.core.config import STOOQ_COLUMNS
 from portfolio_management.core.exceptions import DependencyNotInstalledError
 from portfolio_management.core.utils import _run_in_parallel
 from portfolio_management.data.analysis import (
-    infer_currency,
-    resolve_currency,
+    resolve_match_currencies,
     summarize_price_file,
 )
+from portfolio_management.data.cache import DiagnosticsManifest, reusable_entry
 from portfolio_management.data.models import (
     ExportConfig,
     StooqFile,
@@ -37,6 +42,7 @@ from portfolio_management.data.models import (
 )
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError as exc:  # pragma: no cover - pandas is required for this module
     raise DependencyNotInstalledError(
@@ -46,6 +52,21 @@ except ImportError as exc:  # pragma: no cover - pandas is required for this mod
 
 LOGGER = logging.getLogger(__name__)
 
+# Bytes read from the end of a price file to find its last row when recording
+# a checkpoint.
+_CHECKPOINT_TAIL_BYTES = 4 * 1024
+
+_DATE_FIELD = STOOQ_COLUMNS.index("date")
+
+_LF, _CR, _SPACE, _LT, _TILDE = (ord(c) for c in "\n\r <~")
+_TICKER = np.frombuffer(b"ticker", dtype=np.uint8)
+
+# Errors meaning the kernel cannot copy between these two files; the copy then
+# continues through user space.
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF},
+)
+
 
 def write_stooq_index(entries: Sequence[StooqFile], output_path: pathlib.Path) -> None:
     """Persist the Stooq index to a CSV file.
@@ -208,6 +229,166 @@ def _summarize_and_export_match(
     return match.stooq_file.ticker.upper(), diagnostics, outcome
 
 
+def _reusable_export_outcome(
+    entry: dict,
+    match: TradeableMatch,
+    export_config: ExportConfig,
+) -> _ExportOutcome | None:
+    """Return the stored export outcome if it still holds, else None."""
+    export = entry.get("export")
+    if not export:
+        return None
+    if export.get("skipped"):
+        return _ExportOutcome(exported=False, skipped=True)
+    target_path = export_config.dest_dir / f"{match.stooq_file.ticker.lower()}.csv"
+    if not target_path.exists():
+        return None
+    return _ExportOutcome(
+        exported=bool(export.get("exported")),
+        skipped=False,
+        checkpoint=export.get("checkpoint"),
+    )
+
+
+def _summarize_match_incremental(  # noqa: PLR0917
+    match: TradeableMatch,
+    data_dir: pathlib.Path,
+    export_config: ExportConfig | None,
+    previous: dict | None,
+    content_hash: bool,
+    reuse_exports: bool,
+) -> tuple[str, dict[str, str], _ExportOutcome | None, dict | None, bool]:
+    """Summarize (and export) a match unless its manifest entry is up to date."""
+    ticker_key = match.stooq_file.ticker.upper()
+    entry, fingerprint = reusable_entry(
+        previous,
+        data_dir / match.stooq_file.rel_path,
+        content_hash=content_hash,
+    )
+    if entry is not None:
+        diagnostics = entry["diagnostics"]
+        if export_config is None:
+            return ticker_key, diagnostics, None, fingerprint, True
+        outcome = (
+            _reusable_export_outcome(entry, match, export_config)
+            if reuse_exports
+            else None
+        )
+        if outcome is not None:
+            return ticker_key, diagnostics, outcome, fingerprint, True
+    else:
+        diagnostics = summarize_price_file(data_dir, match.stooq_file)
+
+    outcome = None
+    if export_config is not None:
+        previous_export = (previous or {}).get("export") or {}
+        if reuse_exports and previous_export.get("exported"):
+            outcome = _append_export(
+                match,
+                export_config,
+                diagnostics,
+                previous_export.get("checkpoint"),
+            )
+            if outcome is None:
+                # The existing export was written from an older version of the file.
+                export_config = replace(export_config, overwrite=True)
+        if outcome is None:
+            outcome = _export_streaming_match(match, export_config, diagnostics)
+            if outcome.exported:
+                outcome = replace(
+                    outcome,
+                    checkpoint=price_file_checkpoint(
+                        data_dir / match.stooq_file.rel_path,
+                    ),
+                )
+    return ticker_key, diagnostics, outcome, fingerprint, False
+
+
+def _export_signature(export_config: ExportConfig) -> dict[str, object]:
+    """Return the export settings that determine stored export outcomes."""
+    return {
+        "dest_dir": str(export_config.dest_dir.resolve()),
+        "include_empty": export_config.include_empty,
+    }
+
+
+def _run_incremental_diagnostics(  # noqa: PLR0917
+    unique_matches: Sequence[TradeableMatch],
+    data_dir: pathlib.Path,
+    export_config: ExportConfig | None,
+    manifest: DiagnosticsManifest,
+    worker_count: int,
+    executor: str = "thread",
+) -> tuple[dict[str, dict[str, str]], int, int]:
+    """Process only the files that changed since the manifest was written."""
+    reuse_exports = False
+    if export_config is not None:
+        signature = _export_signature(export_config)
+        # An explicit overwrite request re-exports even unchanged files.
+        reuse_exports = (
+            manifest.export_signature == signature and not export_config.overwrite
+        )
+        manifest.export_signature = signature
+
+    results = _run_in_parallel(
+        _summarize_match_incremental,
+        [
+            (
+                match,
+                data_dir,
+                export_config,
+                manifest.entries.get(match.stooq_file.rel_path),
+                manifest.content_hash,
+                reuse_exports,
+            )
+            for match in unique_matches
+        ],
+        worker_count,
+        preserve_order=False,
+        executor=executor,
+    )
+
+    diagnostics_cache: dict[str, dict[str, str]] = {}
+    exported_total = 0
+    skipped_total = 0
+    appended_total = 0
+    reused_total = 0
+    paths_by_ticker = {
+        match.stooq_file.ticker.upper(): match.stooq_file.rel_path
+        for match in unique_matches
+    }
+    for ticker_key, diagnostics, outcome, fingerprint, reused in results:
+        diagnostics_cache[ticker_key] = diagnostics
+        reused_total += int(reused)
+        export = None
+        if outcome is not None:
+            exported_total += int(outcome.exported)
+            skipped_total += int(outcome.skipped)
+            appended_total += int(outcome.appended)
+            export = {"exported": outcome.exported, "skipped": outcome.skipped}
+            if outcome.checkpoint is not None:
+                export["checkpoint"] = outcome.checkpoint
+        if fingerprint is not None:
+            manifest.record(
+                paths_by_ticker[ticker_key],
+                fingerprint,
+                diagnostics,
+                export,
+            )
+
+    pruned = manifest.prune(paths_by_ticker.values())
+    LOGGER.info(
+        "Diagnostics manifest: reused %s of %s files, reprocessed %s (pruned %s)",
+        reused_total,
+        len(unique_matches),
+        len(unique_matches) - reused_total,
+        pruned,
+    )
+    if appended_total:
+        LOGGER.info("Appended new rows to %s existing exports", appended_total)
+    return diagnostics_cache, exported_total, skipped_total
+
+
 def _prepare_match_report_data(
     matches: Sequence[TradeableMatch],
     data_dir: pathlib.Path,
@@ -215,6 +396,8 @@ def _prepare_match_report_data(
     *,
     max_workers: int,
     export_config: ExportConfig | None = None,
+    manifest: DiagnosticsManifest | None = None,
+    executor: str = "thread",
 ) -> tuple[
     list[dict[str, str]],
     dict[str, dict[str, str]],
@@ -225,7 +408,12 @@ def _prepare_match_report_data(
     int,
     int,
 ]:
-    """Prepare data for the match report."""
+    """Prepare data for the match report.
+
+    With a ``manifest``, files whose fingerprint is unchanged reuse their
+    stored diagnostics and export outcome; only new or changed files are
+    summarized and exported. The report rows are always rebuilt.
+    """
     diagnostics_cache: dict[str, dict[str, str]] = {}
     currency_counts: collections.Counter[str] = collections.Counter()
     data_status_counts: collections.Counter[str] = collections.Counter()
@@ -236,13 +424,23 @@ def _prepare_match_report_data(
     skipped_total = 0
 
     unique_matches = _deduplicate_matches(matches)
-    if export_config is None:
+    if manifest is not None:
+        diagnostics_cache, exported_total, skipped_total = _run_incremental_diagnostics(
+            unique_matches,
+            data_dir,
+            export_config,
+            manifest,
+            max(max_workers or 1, 1),
+            executor,
+        )
+    elif export_config is None:
         worker_count = max(max_workers or 1, 1)
         diagnostics_results = _run_in_parallel(
             _summarize_match_for_report,
             [(match, data_dir) for match in unique_matches],
             worker_count,
             preserve_order=False,
+            executor=executor,
         )
         diagnostics_cache.update(dict(diagnostics_results))
     else:
@@ -253,6 +451,7 @@ def _prepare_match_report_data(
             tasks,
             worker_count,
             preserve_order=False,
+            executor=executor,
         )
         for ticker_key, diagnostics, outcome in results:
             diagnostics_cache[ticker_key] = diagnostics
@@ -261,19 +460,20 @@ def _prepare_match_report_data(
             if outcome.skipped:
                 skipped_total += 1
 
-    for match in matches:
+    currencies = resolve_match_currencies(matches, lse_policy=lse_currency_policy)
+    currency_counts.update(currencies["currency_status"].tolist())
+    for match, inferred, resolved, currency_status in zip(
+        matches,
+        currencies["inferred_currency"].tolist(),
+        currencies["resolved_currency"].tolist(),
+        currencies["currency_status"].tolist(),
+        strict=True,
+    ):
         ticker_key = match.stooq_file.ticker.upper()
         diagnostics = diagnostics_cache.get(ticker_key)
         if diagnostics is None:
             diagnostics = summarize_price_file(data_dir, match.stooq_file)
             diagnostics_cache[ticker_key] = diagnostics
-        _expected, inferred, resolved, currency_status = resolve_currency(
-            match.instrument,
-            match.stooq_file,
-            infer_currency(match.stooq_file),
-            lse_policy=lse_currency_policy,
-        )
-        currency_counts[currency_status] += 1
         data_status = diagnostics["data_status"]
         data_status_counts[data_status] += 1
         if data_status == "empty":
@@ -326,6 +526,8 @@ def write_match_report(
     lse_currency_policy: str,
     max_workers: int | None = None,
     export_config: ExportConfig | None = None,
+    manifest: DiagnosticsManifest | None = None,
+    executor: str = "thread",
 ) -> tuple[
     dict[str, dict[str, str]],
     collections.Counter[str],
@@ -347,6 +549,12 @@ def write_match_report(
         lse_currency_policy: The policy for resolving LSE currency ('GBp' or 'GBP').
         max_workers: The maximum number of parallel workers for diagnostics.
         export_config: Optional configuration for exporting price data concurrently.
+        manifest: Optional per-file manifest; unchanged files reuse their stored
+            diagnostics and export outcome. The manifest is updated in place
+            and saving it is left to the caller.
+        executor: ``"thread"``, ``"process"`` or ``"auto"`` pool used to
+            summarize and export price files. Parsing is GIL-bound, so
+            processes scale further with ``max_workers`` than threads.
 
     Returns:
         A tuple containing various summary statistics from the report generation.
@@ -366,6 +574,8 @@ def write_match_report(
         lse_currency_policy,
         max_workers=max(max_workers or 1, 1),
         export_config=export_config,
+        manifest=manifest,
+        executor=executor,
     )
     columns = [
         "symbol",
@@ -407,6 +617,8 @@ class _ExportOutcome:
 
     exported: bool
     skipped: bool
+    appended: bool = False
+    checkpoint: dict[str, object] | None = None
 
 
 def _deduplicate_matches(matches: Sequence[TradeableMatch]) -> list[TradeableMatch]:
@@ -456,7 +668,12 @@ def _remove_existing_export(
 
 
 def _stream_price_file(source_path: pathlib.Path, target_path: pathlib.Path) -> int:
-    """Stream the raw Stooq file to CSV with a normalized header."""
+    """Stream the raw Stooq file to CSV with a normalized header.
+
+    Rows are stripped, and blank and repeated header rows are dropped. Every
+    line ends with the terminator of the source's first line, so CRLF sources
+    produce CRLF CSVs like `_copy_price_file` does.
+    """
     target_path.parent.mkdir(parents=True, exist_ok=True)
     rows_written = 0
     with (
@@ -467,19 +684,274 @@ def _stream_price_file(source_path: pathlib.Path, target_path: pathlib.Path) ->
             newline="",
         ) as dst,
     ):
-        dst.write(",".join(STOOQ_COLUMNS) + "\n")
-        for raw_line in src:
+        first_line = src.readline()
+        terminator = "\r\n" if first_line.endswith("\r\n") else "\n"
+        dst.write(",".join(STOOQ_COLUMNS) + terminator)
+        for raw_line in itertools.chain((first_line,), src):
             if not raw_line or raw_line.startswith("<"):
                 continue
             stripped = raw_line.strip()
             if not stripped or stripped.lower().startswith("ticker"):
                 continue
             dst.write(stripped)
-            dst.write("\n")
+            dst.write(terminator)
             rows_written += 1
     return rows_written
 
 
+def _is_verbatim_price_body(body: np.ndarray, terminator: bytes) -> bool:
+    """Return True when `_stream_price_file` would write ``body`` unchanged.
+
+    ``body`` holds the rows after the header as bytes. Every line must end in
+    ``terminator``, be non-blank, hold printable ASCII without surrounding
+    spaces, and be neither a ``<`` header nor a ``ticker`` header line. The
+    check is vectorized, so it can run over a whole memory-mapped file.
+    """
+    if not body.size:
+        return True
+    if body[-1] != _LF or body.max() > _TILDE:
+        return False
+    newlines = np.flatnonzero(body == _LF)
+    # Control bytes other than the terminators would be stripped or decoded.
+    controls = np.count_nonzero(body < _SPACE)
+    if terminator == b"\r\n":
+        ends = newlines - 1
+        if controls != 2 * newlines.size or (body[ends] != _CR).any():
+            return False
+    elif controls != newlines.size:
+        return False
+    else:
+        ends = newlines
+    starts = np.concatenate(([0], newlines[:-1] + 1))
+    if (ends <= starts).any():
+        return False
+    first, last = body[starts], body[ends - 1]
+    if (first == _SPACE).any() or (first == _LT).any() or (last == _SPACE).any():
+        return False
+    # Narrow the line starts letter by letter to the case-insensitive
+    # "ticker" prefixes; the final newline never matches a letter.
+    candidates = starts
+    for offset, letter in enumerate(_TICKER):
+        probe = np.minimum(candidates + offset, body.size - 1)
+        candidates = candidates[(body[probe] | 0x20) == letter]
+    return not candidates.size
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy bytes between files in the kernel, preferring copy_file_range.
+
+    ``copy_file_range`` lets copy-on-write filesystems (Btrfs, XFS) share
+    extents instead of copying them; ``sendfile`` is the fallback for kernels
+    or filesystem pairs that refuse it.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            return copy_file_range(src_fd, dst_fd, count, offset)
+        except OSError as exc:
+            if exc.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is None:
+        raise OSError(errno.ENOSYS, "sendfile is not available")
+    return sendfile(dst_fd, src_fd, offset, count)
+
+
+def _copy_byte_range(source, target, offset: int, end: int) -> None:
+    """Append ``source[offset:end]`` to ``target`` without buffering in Python."""
+    target.flush()
+    src_fd, dst_fd = source.fileno(), target.fileno()
+    try:
+        while offset < end:
+            copied = _kernel_copy(src_fd, dst_fd, offset, end - offset)
+            if copied == 0:
+                return
+            offset += copied
+    except OSError as exc:
+        if exc.errno not in _KERNEL_COPY_UNSUPPORTED:
+            raise
+        source.seek(offset)
+        target.seek(0, os.SEEK_END)
+        shutil.copyfileobj(source, target)
+
+
+def _copy_price_file(
+    source_path: pathlib.Path,
+    target_path: pathlib.Path,
+) -> int | None:
+    """Export a Stooq file by replacing its header and copying the rest.
+
+    The whole file is memory-mapped and checked with
+    `_is_verbatim_price_body`, so only files that `_stream_price_file` would
+    write unchanged take this path and both produce the same bytes. The
+    normalized header is written with the source's line terminator, then the
+    remaining byte range is copied by the kernel, so the rows never pass
+    through the interpreter.
+
+    Returns:
+        The number of row bytes copied (0 for a header-only file), or None
+        when the file is not a well-formed Stooq file and nothing was written.
+
+    """
+    with source_path.open("rb") as src:
+        size = os.fstat(src.fileno()).st_size
+        if not size:
+            return None
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            header_end = mapped.find(b"\n") + 1
+            if not header_end or mapped[:1] != b"<":
+                return None
+            terminator = b"\r\n" if mapped[header_end - 2] == _CR else b"\n"
+            body = np.frombuffer(mapped, dtype=np.uint8)[header_end:]
+            clean = _is_verbatim_price_body(body, terminator)
+            del body  # release the buffer before the map is closed
+        if not clean:
+            return None
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        with target_path.open("wb") as dst:
+            dst.write(",".join(STOOQ_COLUMNS).encode("ascii") + terminator)
+            _copy_byte_range(src, dst, header_end, size)
+    return size - header_end
+
+
+def _row_date(line: bytes) -> int | None:
+    """Return the ``YYYYMMDD`` date of a Stooq price row, or None."""
+    fields = line.split(b",")
+    if len(fields) != len(STOOQ_COLUMNS):
+        return None
+    date = fields[_DATE_FIELD]
+    if len(date) != 8 or not date.isdigit():
+        return None
+    return int(date)
+
+
+def price_file_checkpoint(
+    source_path: pathlib.Path,
+    last_date: int | None = None,
+) -> dict[str, object] | None:
+    """Record where a price file ends, so that rows appended later can be read alone.
+
+    Used for Stooq source files (see `_append_price_rows`) and for exported
+    price files (see `update_price_panel`).
+
+    Args:
+        source_path: Price file to checkpoint.
+        last_date: ``YYYYMMDD`` date of the file's last price, when the caller
+            already parsed it. Read from the last row otherwise.
+
+    Returns:
+        The file size (``offset``), the date of its last row (``last_date``,
+        None when that row is not a dated Stooq row) and that row's bytes
+        including the terminator (``tail``), or None when the file does not
+        end with a complete line.
+
+    """
+    try:
+        with source_path.open("rb") as src:
+            size = os.fstat(src.fileno()).st_size
+            start = max(size - _CHECKPOINT_TAIL_BYTES, 0)
+            src.seek(start)
+            block = src.read()
+    except OSError:
+        return None
+    if not block.endswith(b"\n"):
+        return None
+    line_start = block.rfind(b"\n", 0, len(block) - 1) + 1
+    if not line_start and start:
+        return None  # last row longer than the window
+    tail = block[line_start:]
+    if last_date is None:
+        last_date = _row_date(tail.rstrip(b"\r\n"))
+    return {"offset": size, "last_date": last_date, "tail": tail.decode("latin-1")}
+
+
+def _append_price_rows(
+    source_path: pathlib.Path,
+    target_path: pathlib.Path,
+    checkpoint: dict[str, object],
+) -> dict[str, object] | None:
+    """Append the rows a Stooq file gained since ``checkpoint`` to its export.
+
+    The source must still hold the checkpoint's last row at the recorded
+    offset, the export must end with that same row, and every new row must
+    be dated after it. Only the bytes past the offset are read, so a daily
+    update costs O(new rows) rather than O(history). A rewrite that keeps
+    the last row in place is not detected.
+
+    Returns:
+        The checkpoint after the append, or None when the file was not simply
+        extended and must be exported again.
+
+    Raises:
+        OSError: If either file cannot be read or written.
+
+    """
+    offset = int(checkpoint["offset"])
+    tail = str(checkpoint["tail"]).encode("latin-1")
+    terminator = b"\r\n" if tail.endswith(b"\r\n") else b"\n"
+    with source_path.open("rb") as src, target_path.open("r+b") as dst:
+        size = os.fstat(src.fileno()).st_size
+        target_size = os.fstat(dst.fileno()).st_size
+        if size < offset or offset < len(tail) or target_size < len(tail):
+            return None
+        src.seek(offset - len(tail))
+        dst.seek(target_size - len(tail))
+        if src.read(len(tail)) != tail or dst.read(len(tail)) != tail:
+            return None
+        if size == offset:
+            return dict(checkpoint)
+
+        block = src.read(size - offset)
+        if not _is_verbatim_price_body(
+            np.frombuffer(block, dtype=np.uint8),
+            terminator,
+        ):
+            return None
+        lines = block[: -len(terminator)].split(terminator)
+        dates = [_row_date(line) for line in lines]
+        last_date = checkpoint["last_date"]
+        if any(
+            date is None or (last_date is not None and date <= int(last_date))
+            for date in dates
+        ):
+            return None
+        dst.write(block)
+    return {
+        "offset": size,
+        "last_date": dates[-1],
+        "tail": (lines[-1] + terminator).decode("latin-1"),
+    }
+
+
+def _append_export(
+    match: TradeableMatch,
+    config: ExportConfig,
+    diagnostics: dict[str, str],
+    checkpoint: dict[str, object] | None,
+) -> _ExportOutcome | None:
+    """Extend an existing export in place; None if it must be rewritten."""
+    if not checkpoint or _requires_skip(
+        diagnostics.get("data_status", ""),
+        include_empty=config.include_empty,
+    ):
+        return None
+    source_path = config.data_dir / match.stooq_file.rel_path
+    target_path = config.dest_dir / f"{match.stooq_file.ticker.lower()}.csv"
+    try:
+        updated = _append_price_rows(source_path, target_path, checkpoint)
+    except (OSError, KeyError, ValueError) as exc:
+        LOGGER.debug("Cannot append to %s export: %s", match.stooq_file.ticker, exc)
+        return None
+    if updated is None:
+        return None
+    return _ExportOutcome(
+        exported=True,
+        skipped=False,
+        appended=updated["offset"] != checkpoint["offset"],
+        checkpoint=updated,
+    )
+
+
 def _export_streaming_match(
     match: TradeableMatch,
     config: ExportConfig,
@@ -504,7 +976,9 @@ def _export_streaming_match(
 
     source_path = config.data_dir / match.stooq_file.rel_path
     try:
-        rows_written = _stream_price_file(source_path, target_path)
+        written = _copy_price_file(source_path, target_path)
+        if written is None:
+            written = _stream_price_file(source_path, target_path)
     except OSError as exc:
         LOGGER.warning(
             "Failed to export %s -> %s: %s",
@@ -514,7 +988,7 @@ def _export_streaming_match(
         )
         return _ExportOutcome(exported=False, skipped=False)
 
-    if rows_written == 0 and not config.include_empty:
+    if written == 0 and not config.include_empty:
         if config.overwrite:
             _remove_existing_export(target_path, match.stooq_file.ticker, "empty")
         return _ExportOutcome(exported=False, skipped=False)
@@ -635,6 +1109,7 @@ def export_tradeable_prices(
         _export_match,
         [(match, config) for match in unique_matches],
         worker_count,
+        executor=config.executor,
     )
 
     exported = sum(1 for outcome in outcomes if outcome.exported)
@@ -643,4 +1118,4 @@ def export_tradeable_prices(
     LOGGER.info("Exported %s price files to %s", exported, config.dest_dir)
     if skipped:
         LOGGER.warning("Skipped %s price files without usable data", skipped)
-    return exported, skipped
\ No newline at end of file
+    return exported, skipped
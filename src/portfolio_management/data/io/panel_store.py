@@ -0,0 +1,344 @@
+"""Consolidated close-price panel built from the per-ticker price exports.
+
+Downstream stages (`PriceLoader.load_multiple_prices`, the universe manager
+and ``calculate_returns.py``) otherwise open one CSV per asset. The panel
+stores every exported close series in a single date-by-ticker matrix so that
+any subset of tickers and dates is served by one memory-mapped read.
+
+On disk the panel is a directory holding:
+
+- ``close.npy``: float64 matrix of shape ``(dates, tickers)`` in column-major
+  (Fortran) order, so each ticker's history is contiguous; missing
+  observations are NaN.
+- ``close.<n>.npy``: segments appended since the last full write, laid out
+  like ``close.npy`` over the same tickers and the segment's own dates.
+- ``index.json``: store version, ticker keys (column order), ISO dates (row
+  order) of the matrix and of every segment, and the per-ticker source
+  checkpoints the panel was built from.
+
+Tickers are keyed like the export files, i.e. the lower-case file stem
+(``aapl.us`` for ``aapl.us.csv``). The panel is a snapshot of the exports:
+`PricePanelStore.append` adds new trading days as a small segment, and a full
+`PricePanelStore.write` compacts the segments again.
+
+Key Classes:
+    - PricePanelStore: Write and query the close-price panel.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import pathlib
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from portfolio_management.core.utils import atomic_write
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+LOGGER = logging.getLogger(__name__)
+
+PANEL_VERSION = 2
+
+_MATRIX_NAME = "close.npy"
+_SEGMENT_PATTERN = "close.*.npy"
+_INDEX_NAME = "index.json"
+
+
+class PricePanelStore:
+    """Memory-mapped date-by-ticker close-price panel.
+
+    Example:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import pandas as pd
+        >>> root = Path(tempfile.mkdtemp())
+        >>> store = PricePanelStore(root / "price_panel")
+        >>> dates = pd.to_datetime(["2024-01-02", "2024-01-03"])
+        >>> store.write({"aaa.us": pd.Series([1.0, 2.0], index=dates)})
+        >>> store.load(["aaa.us"]).iloc[-1, 0]
+        np.float64(2.0)
+
+    """
+
+    def __init__(self, path: pathlib.Path | str) -> None:
+        """Initialise the store.
+
+        Args:
+            path: Directory holding the panel files.
+
+        """
+        self.path = pathlib.Path(path)
+        self._lock = Lock()
+        self._parts: list[tuple[np.ndarray, np.ndarray]] | None = None
+        self._columns: dict[str, int] | None = None
+        self._sources: dict[str, dict] | None = None
+
+    def exists(self) -> bool:
+        """Return True when both panel files are present."""
+        return (self.path / _MATRIX_NAME).is_file() and (
+            self.path / _INDEX_NAME
+        ).is_file()
+
+    @property
+    def tickers(self) -> list[str]:
+        """Ticker keys in column order."""
+        return list(self._open()[1])
+
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """Dates with at least one row in the matrix or a segment, sorted."""
+        parts = self._open()[0]
+        return self._date_index(np.unique(np.concatenate([d for _m, d in parts])))
+
+    @property
+    def segments(self) -> int:
+        """Number of segments appended since the last full write."""
+        return len(self._open()[0]) - 1
+
+    @property
+    def sources(self) -> dict[str, dict]:
+        """Per-ticker checkpoints of the files the panel was built from."""
+        return dict(self._open()[2])
+
+    def __contains__(self, ticker: object) -> bool:
+        """Return True when ``ticker`` has a column in the panel."""
+        return ticker in self._open()[1]
+
+    def write(
+        self,
+        series: Mapping[str, pd.Series],
+        sources: Mapping[str, dict] | None = None,
+    ) -> None:
+        """Replace the panel with the given close series.
+
+        Columns are written one at a time into a memory-mapped file, so the
+        dense matrix is never held in memory. Appended segments are dropped.
+
+        Args:
+            series: Close prices keyed by ticker, each indexed by date.
+            sources: Optional JSON-serializable checkpoint per source file,
+                returned by `sources` (see `update_price_panel`).
+
+        """
+        tickers = sorted(key for key, values in series.items() if not values.empty)
+        self.path.mkdir(parents=True, exist_ok=True)
+        stale_segments = list(self.path.glob(_SEGMENT_PATTERN))
+        dates = self._write_matrix(self.path / _MATRIX_NAME, tickers, series)
+        self._write_index(
+            {
+                "version": PANEL_VERSION,
+                "tickers": tickers,
+                "dates": np.datetime_as_string(dates, unit="D").tolist(),
+                "segments": [],
+                "sources": dict(sources or {}),
+            },
+        )
+        for segment_path in stale_segments:
+            segment_path.unlink(missing_ok=True)
+
+        with self._lock:
+            self._parts = self._columns = self._sources = None
+        LOGGER.info(
+            "Price panel written to %s (%s tickers x %s dates)",
+            self.path,
+            len(tickers),
+            dates.size,
+        )
+
+    def append(
+        self,
+        series: Mapping[str, pd.Series],
+        sources: Mapping[str, dict] | None = None,
+    ) -> None:
+        """Add new observations for existing tickers as a panel segment.
+
+        Only the new rows are written, so a daily update costs O(new rows x
+        tickers) instead of rewriting the panel. Each (date, ticker) must be
+        new: a value already present in the panel is not replaced.
+
+        Args:
+            series: New close prices keyed by ticker, each indexed by date.
+            sources: Checkpoints to record for the given source files.
+
+        Raises:
+            FileNotFoundError: If the panel has not been written.
+            ValueError: If a ticker has no column in the panel.
+
+        """
+        _parts, columns, _sources = self._open()
+        unknown = sorted(key for key in series if key not in columns)
+        if unknown:
+            raise ValueError(f"Tickers not in price panel: {', '.join(unknown[:5])}")
+        tickers = list(columns)
+        new_rows = {key: values for key, values in series.items() if not values.empty}
+        index = json.loads((self.path / _INDEX_NAME).read_text(encoding="utf-8"))
+        if new_rows:
+            name = _SEGMENT_PATTERN.replace("*", str(len(index["segments"]) + 1))
+            dates = self._write_matrix(self.path / name, tickers, new_rows)
+            index["segments"].append(
+                {
+                    "file": name,
+                    "dates": np.datetime_as_string(dates, unit="D").tolist(),
+                },
+            )
+        index["sources"].update(sources or {})
+        self._write_index(index)
+
+        with self._lock:
+            self._parts = self._columns = self._sources = None
+        LOGGER.info(
+            "Appended %s new observations for %s tickers to price panel %s",
+            sum(len(values) for values in new_rows.values()),
+            len(new_rows),
+            self.path,
+        )
+
+    def load(
+        self,
+        tickers: Iterable[str],
+        start: pd.Timestamp | str | None = None,
+        end: pd.Timestamp | str | None = None,
+    ) -> pd.DataFrame:
+        """Return close prices for a subset of tickers and dates.
+
+        Args:
+            tickers: Ticker keys to load; keys missing from the panel are
+                skipped.
+            start: First date to include (inclusive), or None.
+            end: Last date to include (inclusive), or None.
+
+        Returns:
+            A DataFrame indexed by date with one column per available ticker,
+            restricted to dates on which at least one of them has a price.
+
+        Raises:
+            FileNotFoundError: If the panel has not been written.
+            ValueError: If the panel files are inconsistent.
+
+        """
+        parts, columns, _sources = self._open()
+        keys = [key for key in dict.fromkeys(tickers) if key in columns]
+        positions = [columns[key] for key in keys]
+        frames = []
+        for part, (matrix, dates) in enumerate(parts):
+            first = 0 if start is None else np.searchsorted(dates, _day(start))
+            last = (
+                dates.size
+                if end is None
+                else np.searchsorted(dates, _day(end), side="right")
+            )
+            if part and last <= first:
+                continue
+            frames.append(
+                pd.DataFrame(
+                    matrix[first:last, positions],
+                    index=self._date_index(dates[first:last]),
+                    columns=keys,
+                ),
+            )
+        frame = frames[0]
+        if len(frames) > 1:
+            frame = pd.concat(frames)
+            # Segments may repeat dates of the matrix for tickers that lagged.
+            frame = (
+                frame.groupby(level=0).first()
+                if frame.index.has_duplicates
+                else frame.sort_index()
+            )
+        return frame.dropna(how="all")
+
+    def _open(
+        self,
+    ) -> tuple[list[tuple[np.ndarray, np.ndarray]], dict[str, int], dict[str, dict]]:
+        """Map the matrix and segments and read the index on first use."""
+        with self._lock:
+            if self._parts is None:
+                if not self.exists():
+                    raise FileNotFoundError(self.path / _INDEX_NAME)
+                index = json.loads(
+                    (self.path / _INDEX_NAME).read_text(encoding="utf-8"),
+                )
+                if index.get("version") != PANEL_VERSION:
+                    raise ValueError(f"Inconsistent price panel at {self.path}")
+                tickers = index.get("tickers", [])
+                files = [
+                    (_MATRIX_NAME, index.get("dates", [])),
+                    *(
+                        (segment["file"], segment["dates"])
+                        for segment in index.get("segments", [])
+                    ),
+                ]
+                parts = []
+                for name, iso_dates in files:
+                    matrix = np.load(self.path / name, mmap_mode="r")
+                    dates = np.array(iso_dates, dtype="datetime64[D]")
+                    if matrix.shape != (dates.size, len(tickers)):
+                        raise ValueError(f"Inconsistent price panel at {self.path}")
+                    parts.append((matrix, dates))
+                self._parts = parts
+                self._columns = {key: position for position, key in enumerate(tickers)}
+                self._sources = index.get("sources", {})
+            return self._parts, self._columns, self._sources
+
+    def _write_matrix(
+        self,
+        path: pathlib.Path,
+        tickers: list[str],
+        series: Mapping[str, pd.Series],
+    ) -> np.ndarray:
+        """Write ``series`` as a column-major matrix over ``tickers``.
+
+        Returns:
+            The sorted dates of the matrix rows.
+
+        """
+        day_indexes = {
+            key: values.index.to_numpy(dtype="datetime64[D]")
+            for key, values in series.items()
+            if not values.empty
+        }
+        dates = (
+            np.unique(np.concatenate(list(day_indexes.values())))
+            if day_indexes
+            else np.array([], dtype="datetime64[D]")
+        )
+        with atomic_write(path) as tmp_path:
+            matrix = np.lib.format.open_memmap(
+                tmp_path,
+                mode="w+",
+                dtype=np.float64,
+                shape=(dates.size, len(tickers)),
+                fortran_order=True,
+            )
+            column = np.empty(dates.size, dtype=np.float64)
+            for position, key in enumerate(tickers):
+                if key not in day_indexes:
+                    matrix[:, position] = np.nan
+                    continue
+                column.fill(np.nan)
+                rows = np.searchsorted(dates, day_indexes[key])
+                column[rows] = series[key].to_numpy(dtype=np.float64)
+                matrix[:, position] = column
+            matrix.flush()
+            del matrix
+        return dates
+
+    def _write_index(self, index: dict) -> None:
+        """Atomically replace ``index.json``."""
+        index_path = self.path / _INDEX_NAME
+        with atomic_write(index_path) as tmp_path:
+            tmp_path.write_text(json.dumps(index), encoding="utf-8")
+
+    @staticmethod
+    def _date_index(dates: np.ndarray) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="date")
+
+
+def _day(value: pd.Timestamp | str) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value).date(), "D")
@@ -5,6 +5,11 @@ instrument lists with the Stooq price data index. It uses a series of strategies
 from direct ticker matching to suffix mapping and alias lookups, to find the
 correct Stooq file for each instrument.
 
+`match_tradeables` runs every strategy as a batched join: the candidate tickers
+of all instruments are laid out in one ranked DataFrame and merged against the
+Stooq lookups, so the cost is a handful of hash joins rather than a Python loop
+per instrument.
+
 Key Functions:
     - match_tradeables: The main entry point to run the matching process.
     - candidate_tickers: Generates potential Stooq ticker variations for a symbol.
@@ -16,13 +21,16 @@ Key Functions:
 from __future__ import annotations
 
 import logging
-import os
 import re
-from dataclasses import dataclass, replace
+import warnings
+from dataclasses import replace
+from functools import cache
 from typing import TYPE_CHECKING
 
+import numpy as np
+import pandas as pd
+
 from portfolio_management.core.config import LEGACY_PREFIXES, SYMBOL_ALIAS_MAP
-from portfolio_management.core.utils import _run_in_parallel
 from portfolio_management.data.models import (
     StooqFile,
     TradeableInstrument,
@@ -30,20 +38,75 @@ from portfolio_management.data.models import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
 
-@dataclass(frozen=True)
-class _MatchContext:
-    instrument: TradeableInstrument
-    normalized_symbol: str
-    desired_exts: list[str]
-    stooq_by_ticker: dict[str, StooqFile]
-    original_symbol: str
-    has_suffix: bool
+LOGGER = logging.getLogger(__name__)
 
+# Broker suffix (or exchange code) to Stooq extensions, in preference order.
+_SUFFIX_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "PW": (".PL",),
+    "PL": (".PL",),
+    "GPW": (".PL",),
+    "LN": (".UK",),
+    "L": (".UK",),
+    "GB": (".UK",),
+    "US": (".US",),
+    "UN": (".US",),
+    "U": (".US",),
+    "NYSE": (".US",),
+    "NASDAQ": (".US",),
+    "NSQ": (".US",),
+    "NAS": (".US",),
+    "NASDAQ (USD)": (".US",),
+    "NYSE-MKT": (".US",),
+    "AMEX": (".US",),
+    "HK": (".HK",),
+    "H": (".HK",),
+    "JP": (".JP",),
+    "T": (".JP",),
+    "HU": (".HU",),
+    "BSE": (".HU",),
+    "TSX": (".TO",),
+    "TSXV": (".V",),
+    "TO": (".TO",),
+    "V": (".V",),
+    "CN": (".CN",),
+    "C": (".TO",),
+    "GR": (".DE",),
+    "DE": (".DE",),
+    "PA": (".PA", ".FR"),
+    "PAR": (".PA", ".FR"),
+    "AMS": (".NL", ".AS"),
+    "AS": (".AS", ".NL"),
+    "SWX": (".CH",),
+    "SW": (".CH",),
+    "CH": (".CH",),
+    "BRU": (".BE",),
+    "BR": (".BE",),
+    "BRX": (".BE",),
+}
+
+# Market-name patterns tried in order when the suffix is not in the table.
+_MARKET_EXTENSIONS: tuple[tuple[re.Pattern[str], tuple[str, ...]], ...] = tuple(
+    (re.compile(pattern), extensions)
+    for pattern, extensions in (
+        (r"XETRA|FRANKFURT|GER|DEU", (".DE",)),
+        (r"EURONEXT\s*PARIS|\bPAR\b|PARIS|FRANCE", (".PA", ".FR")),
+        (r"EURONEXT\s*AMSTERDAM|AMSTERDAM|NED|NETHERLANDS", (".NL", ".AS")),
+        (r"NSQ|NASDAQ|NYSE|USA|UNITED STATES|AMERICAN", (".US",)),
+        (r"TSX|TORONTO|CANADA", (".TO",)),
+        (r"GPW|WARSAW|POL", (".PL",)),
+        (r"LSE|LONDON|UNITED KINGDOM|UK", (".UK",)),
+        (r"HK", (".HK",)),
+        (r"JPX|TOKYO|JAPAN", (".JP",)),
+        (r"HUNGARY|BUDAPEST", (".HU",)),
+        (r"SWISS|ZURICH|SWX|SIX|SWITZERLAND", (".CH",)),
+        (r"BRUSSELS|BELGIUM", (".BE",)),
+    )
+)
 
-LOGGER = logging.getLogger(__name__)
+_NO_EXTENSION: tuple[str, ...] = ("",)
 
 
 def _stooq_extension(ticker: str) -> str:
@@ -52,14 +115,6 @@ def _stooq_extension(ticker: str) -> str:
     return ""
 
 
-def _extension_is_acceptable(entry_ext: str, desired_exts_set: set[str]) -> bool:
-    if not desired_exts_set:
-        return True
-    if entry_ext:
-        return entry_ext in desired_exts_set
-    return "" in desired_exts_set
-
-
 def split_symbol(symbol: str) -> tuple[str, str]:
     """Split a broker symbol into its base and suffix components.
 
@@ -86,77 +141,21 @@ def suffix_to_extensions(suffix: str, market: str) -> Sequence[str]:
         market: The market name (e.g., 'LSE', 'NASDAQ').
 
     Returns:
-        A sequence of possible Stooq extensions (e.g., ['.UK'], ['.US']).
+        A sequence of possible Stooq extensions (e.g., ('.UK',), ('.US',)).
     """
-    suffix = suffix.upper()
-    market = (market or "").upper()
-
-    mapping = {
-        "PW": [".PL"],
-        "PL": [".PL"],
-        "GPW": [".PL"],
-        "LN": [".UK"],
-        "L": [".UK"],
-        "GB": [".UK"],
-        "US": [".US"],
-        "UN": [".US"],
-        "U": [".US"],
-        "NYSE": [".US"],
-        "NASDAQ": [".US"],
-        "NSQ": [".US"],
-        "NAS": [".US"],
-        "NASDAQ (USD)": [".US"],
-        "NYSE-MKT": [".US"],
-        "AMEX": [".US"],
-        "HK": [".HK"],
-        "H": [".HK"],
-        "JP": [".JP"],
-        "T": [".JP"],
-        "HU": [".HU"],
-        "BSE": [".HU"],
-        "TSX": [".TO"],
-        "TSXV": [".V"],
-        "TO": [".TO"],
-        "V": [".V"],
-        "CN": [".CN"],
-        "C": [".TO"],
-        "GR": [".DE"],
-        "DE": [".DE"],
-        "PA": [".PA", ".FR"],
-        "PAR": [".PA", ".FR"],
-        "AMS": [".NL", ".AS"],
-        "AS": [".AS", ".NL"],
-        "SWX": [".CH"],
-        "SW": [".CH"],
-        "CH": [".CH"],
-        "BRU": [".BE"],
-        "BR": [".BE"],
-        "BRX": [".BE"],
-    }
-
-    if suffix in mapping:
-        return mapping[suffix]
-
-    market_matchers = [
-        (r"XETRA|FRANKFURT|GER|DEU", [".DE"]),
-        (r"EURONEXT\s*PARIS|\bPAR\b|PARIS|FRANCE", [".PA", ".FR"]),
-        (r"EURONEXT\s*AMSTERDAM|AMSTERDAM|NED|NETHERLANDS", [".NL", ".AS"]),
-        (r"NSQ|NASDAQ|NYSE|USA|UNITED STATES|AMERICAN", [".US"]),
-        (r"TSX|TORONTO|CANADA", [".TO"]),
-        (r"GPW|WARSAW|POL", [".PL"]),
-        (r"LSE|LONDON|UNITED KINGDOM|UK", [".UK"]),
-        (r"HK", [".HK"]),
-        (r"JPX|TOKYO|JAPAN", [".JP"]),
-        (r"HUNGARY|BUDAPEST", [".HU"]),
-        (r"SWISS|ZURICH|SWX|SIX|SWITZERLAND", [".CH"]),
-        (r"BRUSSELS|BELGIUM", [".BE"]),
-    ]
+    extensions = _SUFFIX_EXTENSIONS.get(suffix.upper())
+    if extensions is not None:
+        return extensions
+    return _market_extensions((market or "").upper())
 
-    for pattern, exts in market_matchers:
-        if re.search(pattern, market):
-            return exts
 
-    return [""]
+@cache
+def _market_extensions(market: str) -> tuple[str, ...]:
+    """Resolve an upper-cased market name against the market patterns."""
+    for pattern, extensions in _MARKET_EXTENSIONS:
+        if pattern.search(market):
+            return extensions
+    return _NO_EXTENSION
 
 
 def _get_desired_extensions(
@@ -173,7 +172,8 @@ def candidate_tickers(symbol: str, market: str) -> Iterable[str]:
     """Generate possible Stooq tickers for a tradeable symbol.
 
     This function produces a sequence of potential ticker variations to try
-    when matching against the Stooq index.
+    when matching against the Stooq index. `match_tradeables` tries the same
+    candidates, in the same order, for all instruments at once.
 
     Args:
         symbol: The broker symbol (e.g., 'AAPL:US').
@@ -201,7 +201,7 @@ def candidate_tickers(symbol: str, market: str) -> Iterable[str]:
         if "." in normalized:
             candidates.append(normalized.upper())
 
-    desired_exts = set(_get_desired_extensions(extensions, market))
+    desired_exts = dict.fromkeys(_get_desired_extensions(extensions, market))
     base_upper = base.upper()
     for ext in desired_exts:
         key = (base_upper, ext.upper())
@@ -251,178 +251,284 @@ def build_stooq_lookup(
     return by_ticker, by_stem, by_base
 
 
-def _match_instrument(
-    instrument: TradeableInstrument,
+def match_tradeables(
+    tradeables: Sequence[TradeableInstrument],
     stooq_by_ticker: dict[str, StooqFile],
     stooq_by_stem: dict[str, StooqFile],
     stooq_by_base: dict[str, list[StooqFile]],
-    available_extensions: set[str],
-) -> tuple[TradeableMatch | None, TradeableInstrument | None]:
-    symbol = (instrument.symbol or "").strip()
-    if not symbol:
-        return None, replace(instrument, reason="missing_symbol")
-
-    normalized = symbol.replace(" ", "").upper()
-    base, suffix = split_symbol(normalized)
-    desired_exts = [
-        ext.upper() for ext in suffix_to_extensions(suffix, instrument.market or "")
-    ]
-    context = _MatchContext(
-        instrument=instrument,
-        normalized_symbol=normalized,
-        desired_exts=desired_exts,
-        stooq_by_ticker=stooq_by_ticker,
-        original_symbol=symbol,
-        has_suffix=bool(suffix),
-    )
-
-    direct = _match_candidates(context)
-    if direct is not None:
-        return direct, None
+    max_workers: int | None = None,
+) -> tuple[list[TradeableMatch], list[TradeableInstrument]]:
+    """Match a sequence of tradeable instruments to Stooq files.
 
-    stem = _match_by_stem(instrument, base, desired_exts, stooq_by_stem)
-    if stem is not None:
-        return stem, None
+    Each instrument is resolved by the first strategy that succeeds:
 
-    base_match = _match_by_base(instrument, base, desired_exts, stooq_by_base)
-    if base_match is not None:
-        return base_match, None
+    1. ``ticker``/``base_market``: the first of its `candidate_tickers` found
+       in ``stooq_by_ticker`` with an acceptable extension.
+    2. ``base_market``: its base symbol found in ``stooq_by_stem``.
+    3. ``base_market``: a unique entry for its base symbol in
+       ``stooq_by_base`` (preferring acceptable extensions).
 
-    reason = determine_unmatched_reason(
-        instrument,
-        stooq_by_base,
-        available_extensions,
-    )
-    return None, replace(instrument, reason=reason)
+    Every strategy is a vectorized join over all instruments.
 
+    Args:
+        tradeables: A sequence of `TradeableInstrument` objects.
+        stooq_by_ticker: A lookup from Stooq ticker to `StooqFile`.
+        stooq_by_stem: A lookup from Stooq stem to `StooqFile`.
+        stooq_by_base: A lookup from base symbol to a list of `StooqFile`s.
+        max_workers: Deprecated and ignored; matching no longer runs in a
+            worker pool.
 
-def _match_candidates(context: _MatchContext) -> TradeableMatch | None:
-    for candidate in candidate_tickers(
-        context.original_symbol,
-        context.instrument.market or "",
-    ):
-        entry = context.stooq_by_ticker.get(candidate.upper())
-        if entry is None:
-            continue
-        entry_ext = _stooq_extension(entry.ticker)
-        if not _extension_is_acceptable(entry_ext, set(context.desired_exts)):
-            continue
-        strategy_name = (
-            "ticker"
-            if context.has_suffix or candidate.upper() == context.normalized_symbol
-            else "base_market"
-        )
-        return TradeableMatch(
-            instrument=context.instrument,
-            stooq_file=entry,
-            matched_ticker=entry.ticker.upper(),
-            strategy=strategy_name,
+    Returns:
+        A tuple containing a list of successful matches and a list of
+        unmatched instruments (annotated with a reason), both in input order.
+    """
+    if max_workers is not None:
+        warnings.warn(
+            "match_tradeables() ignores max_workers, which is deprecated and will "
+            "be removed; matching no longer runs in a worker pool.",
+            DeprecationWarning,
+            stacklevel=2,
         )
-    return None
+    if not tradeables:
+        return [], []
 
+    symbols, allowed, extensions = _symbol_frame(tradeables)
+    live = symbols[symbols["normalized"] != ""]
 
-def _match_by_stem(
-    instrument: TradeableInstrument,
-    base: str,
-    desired_exts: list[str],
-    stooq_by_stem: dict[str, StooqFile],
-) -> TradeableMatch | None:
-    stem_entry = stooq_by_stem.get(base.upper())
-    if stem_entry is None:
-        return None
-    entry_ext = _stooq_extension(stem_entry.ticker)
-    if not _extension_is_acceptable(entry_ext, set(desired_exts)):
-        return None
-    return TradeableMatch(
-        instrument=instrument,
-        stooq_file=stem_entry,
-        matched_ticker=stem_entry.ticker.upper(),
-        strategy="base_market",
+    candidates = _ranked_candidates(live, extensions)
+    found = candidates.merge(
+        _lookup_frame(stooq_by_ticker, candidates["candidate"], key="candidate"),
+        on="candidate",
     )
+    found = found.merge(allowed, on=["group", "ext"]).sort_values(
+        ["pos", "rank"],
+        kind="stable",
+    )
+    found = found.drop_duplicates("pos")
+    exact = (
+        found["candidate"].to_numpy() == symbols["normalized"].to_numpy()[found["pos"]]
+    )
+    found["strategy"] = np.where(
+        exact | (symbols["suffix"].to_numpy()[found["pos"]] != ""),
+        "ticker",
+        "base_market",
+    )
+    resolved = [found[["pos", "entry", "strategy"]]]
+
+    remaining = live[~live["pos"].isin(found["pos"])]
+    by_stem = remaining.merge(
+        _lookup_frame(stooq_by_stem, remaining["base"], key="base"),
+        on="base",
+    ).merge(allowed, on=["group", "ext"])
+    resolved.append(by_stem[["pos", "entry"]].assign(strategy="base_market"))
+
+    remaining = remaining[~remaining["pos"].isin(by_stem["pos"])]
+    by_base = _unique_base_matches(
+        remaining,
+        _lookup_frame(stooq_by_base, remaining["base"], key="base"),
+        allowed,
+    )
+    resolved.append(by_base[["pos", "entry"]].assign(strategy="base_market"))
 
-
-def _match_by_base(
-    instrument: TradeableInstrument,
-    base: str,
-    desired_exts: list[str],
-    stooq_by_base: dict[str, list[StooqFile]],
-) -> TradeableMatch | None:
-    candidates = stooq_by_base.get(base.upper(), [])
-    filtered = [
-        entry
-        for entry in candidates
-        if _extension_is_acceptable(_stooq_extension(entry.ticker), set(desired_exts))
-    ]
-    if len(filtered) == 1:
-        entry = filtered[0]
-        return TradeableMatch(
-            instrument=instrument,
+    picked = pd.concat(resolved).set_index("pos").sort_index()
+    matches = [
+        TradeableMatch(
+            instrument=tradeables[pos],
             stooq_file=entry,
             matched_ticker=entry.ticker.upper(),
-            strategy="base_market",
+            strategy=strategy,
         )
-    if not filtered and len(candidates) == 1:
-        entry = candidates[0]
-        return TradeableMatch(
-            instrument=instrument,
-            stooq_file=entry,
-            matched_ticker=entry.ticker.upper(),
-            strategy="base_market",
+        for pos, entry, strategy in zip(
+            picked.index.tolist(),
+            picked["entry"].tolist(),
+            picked["strategy"].tolist(),
+            strict=True,
         )
-    return None
+    ]
 
+    unmatched: list[TradeableInstrument] = []
+    if len(matches) < len(tradeables):
+        # Lookup keys are upper-cased tickers, so the extension is a plain slice.
+        available_extensions = {
+            key[key.find(".") :] if "." in key else "" for key in stooq_by_ticker
+        }
+        matched = set(picked.index.tolist())
+        unmatched = annotate_unmatched_instruments(
+            [
+                instrument
+                for pos, instrument in enumerate(tradeables)
+                if pos not in matched
+            ],
+            stooq_by_base,
+            available_extensions,
+        )
 
-def match_tradeables(
-    tradeables: Sequence[TradeableInstrument],
-    stooq_by_ticker: dict[str, StooqFile],
-    stooq_by_stem: dict[str, StooqFile],
-    stooq_by_base: dict[str, list[StooqFile]],
-    max_workers: int | None = None,
-) -> tuple[list[TradeableMatch], list[TradeableInstrument]]:
-    """Match a sequence of tradeable instruments to Stooq files in parallel.
+    return matches, unmatched
 
-    Args:
-        tradeables: A sequence of `TradeableInstrument` objects.
-        stooq_by_ticker: A lookup from Stooq ticker to `StooqFile`.
-        stooq_by_stem: A lookup from Stooq stem to `StooqFile`.
-        stooq_by_base: A lookup from base symbol to a list of `StooqFile`s.
-        max_workers: The maximum number of parallel workers to use.
+
+def _symbol_frame(
+    tradeables: Sequence[TradeableInstrument],
+) -> tuple[pd.DataFrame, pd.DataFrame, list[tuple[str, ...]]]:
+    """Normalize and split every symbol, grouping instruments by extensions.
 
     Returns:
-        A tuple containing a list of successful matches and a list of
-        unmatched instruments.
+        A frame with ``pos``, ``normalized``, ``base``, ``suffix`` and
+        ``group`` columns, a frame of the acceptable ``(group, ext)`` pairs,
+        and the desired extension tuple of each group.
+
     """
-    if not tradeables:
-        return [], []
+    normalized = [
+        (instrument.symbol or "").strip().replace(" ", "").upper()
+        for instrument in tradeables
+    ]
+    parts = [split_symbol(symbol) for symbol in normalized]
+    frame = pd.DataFrame(
+        {
+            "pos": np.arange(len(tradeables)),
+            "normalized": normalized,
+            "base": [base for base, _suffix in parts],
+            "suffix": [suffix for _base, suffix in parts],
+            "market": [instrument.market or "" for instrument in tradeables],
+        },
+    )
+
+    pair_codes, pairs = pd.MultiIndex.from_frame(
+        frame[["suffix", "market"]],
+    ).factorize()
+    groups: dict[tuple[str, ...], int] = {}
+    pair_groups = [
+        groups.setdefault(
+            tuple(ext.upper() for ext in suffix_to_extensions(suffix, market)),
+            len(groups),
+        )
+        for suffix, market in pairs
+    ]
+    frame["group"] = np.asarray(pair_groups, dtype=np.int64)[pair_codes]
+    allowed = pd.DataFrame(
+        [(group, ext) for exts, group in groups.items() for ext in exts],
+        columns=["group", "ext"],
+    ).drop_duplicates()
+    return frame.drop(columns="market"), allowed, list(groups)
 
-    available_extensions = {_stooq_extension(ticker) for ticker in stooq_by_ticker}
 
-    workers = max(1, max_workers or os.cpu_count() or 1)
-    results = _run_in_parallel(
-        _match_instrument,
+def _ranked_candidates(
+    live: pd.DataFrame,
+    extensions: list[tuple[str, ...]],
+) -> pd.DataFrame:
+    """Lay out `candidate_tickers` of every instrument as ranked rows.
+
+    Returns:
+        A frame with ``pos``, ``group``, ``rank`` and ``candidate`` columns;
+        lower ranks are tried first.
+
+    """
+    width = max(len(exts) for exts in extensions)
+    aliases = pd.DataFrame(
         [
-            (
-                instrument,
-                stooq_by_ticker,
-                stooq_by_stem,
-                stooq_by_base,
-                available_extensions,
-            )
-            for instrument in tradeables
+            (base, ext, alias.upper(), rank)
+            for (base, ext), targets in SYMBOL_ALIAS_MAP.items()
+            for rank, alias in enumerate(targets)
         ],
-        workers,
-        preserve_order=True,
+        columns=["base", "ext", "candidate", "rank"],
+    )
+    block = int(aliases["rank"].max() + 1 if len(aliases) else 0) + len(
+        LEGACY_PREFIXES,
     )
+    normalized_rank = width + 1
+
+    parts: list[pd.DataFrame] = []
+
+    def add(rows: pd.DataFrame, rank: int | pd.Series, candidate: pd.Series) -> None:
+        parts.append(
+            pd.DataFrame(
+                {
+                    "pos": rows["pos"],
+                    "group": rows["group"],
+                    "rank": rank,
+                    "candidate": candidate,
+                },
+            ),
+        )
 
-    matches: list[TradeableMatch] = []
-    unmatched: list[TradeableInstrument] = []
-    for match, missing in results:
-        if match is not None:
-            matches.append(match)
-        elif missing is not None:
-            unmatched.append(missing)
+    no_suffix = live[live["suffix"] == ""]
+    add(no_suffix, 0, no_suffix["base"])
+    dotted = (live["suffix"] != "") | live["normalized"].str.contains(".", regex=False)
+    add(live[dotted], normalized_rank, live.loc[dotted, "normalized"])
 
-    return matches, unmatched
+    for group, exts in enumerate(extensions):
+        rows = live[live["group"] == group]
+        if rows.empty:
+            continue
+        for position, ext in enumerate(exts):
+            if ext:
+                add(rows, 1 + position, rows["base"] + ext)
+        for position, ext in enumerate(dict.fromkeys(ext for ext in exts if ext)):
+            first = normalized_rank + 1 + position * block
+            found = rows.merge(aliases[aliases["ext"] == ext], on="base")
+            add(found, first + found["rank"], found["candidate"])
+            legacy = first + block - len(LEGACY_PREFIXES)
+            for offset, prefix in enumerate(LEGACY_PREFIXES):
+                add(rows, legacy + offset, prefix + rows["base"] + ext)
+
+    return pd.concat(parts, ignore_index=True)
+
+
+def _lookup_frame(
+    lookup: Mapping[str, StooqFile] | Mapping[str, list[StooqFile]],
+    keys: pd.Series,
+    *,
+    key: str,
+) -> pd.DataFrame:
+    """Tabulate the lookup entries for the probed keys.
+
+    Only keys present in ``keys`` are materialized, so the join costs are
+    proportional to the instruments being matched rather than to the index.
+
+    Returns:
+        A frame with the ``key`` column, the ``entry`` (`StooqFile`) and its
+        Stooq extension ``ext``; list-valued lookups yield one row per entry.
+
+    """
+    present = [probe for probe in pd.unique(keys) if probe in lookup]
+    entries = [lookup[probe] for probe in present]
+    if entries and isinstance(entries[0], list):
+        present = [
+            probe for probe, group in zip(present, entries, strict=True) for _ in group
+        ]
+        entries = [entry for group in entries for entry in group]
+    return pd.DataFrame(
+        {
+            key: present,
+            "entry": entries,
+            "ext": [_stooq_extension(entry.ticker) for entry in entries],
+        },
+        dtype=object,
+    )
+
+
+def _unique_base_matches(
+    remaining: pd.DataFrame,
+    base_table: pd.DataFrame,
+    allowed: pd.DataFrame,
+) -> pd.DataFrame:
+    """Return the rows of instruments with a unique entry for their base.
+
+    An instrument matches when exactly one entry for its base symbol has an
+    acceptable extension, or when none does and the base has a single entry.
+    """
+    rows = remaining[["pos", "base", "group"]].merge(base_table, on="base")
+    rows["acceptable"] = (
+        rows.merge(allowed, on=["group", "ext"], how="left", indicator=True)["_merge"]
+        == "both"
+    ).to_numpy()
+    counts = rows.groupby("pos").agg(
+        total=("entry", "size"),
+        acceptable=("acceptable", "sum"),
+    )
+    filtered = rows[rows["acceptable"]]
+    filtered = filtered[filtered["pos"].map(counts["acceptable"]) == 1]
+    single = rows[rows["pos"].map((counts["acceptable"] == 0) & (counts["total"] == 1))]
+    return pd.concat([filtered, single])
 
 
 def annotate_unmatched_instruments(
@@ -87,6 +87,7 @@ class ExportConfig:
         include_empty: If True, files with no data will still be exported.
         max_workers: The maximum number of parallel workers for the export.
         diagnostics: A cache of pre-computed diagnostics to speed up processing.
+        executor: Worker pool for the export: "thread", "process" or "auto".
     """
 
     data_dir: Path
@@ -94,4 +95,5 @@ class ExportConfig:
     overwrite: bool = False
     include_empty: bool = False
     max_workers: int | None = None
-    diagnostics: dict[str, dict[str, str]] = field(default_factory=dict)
\ No newline at end of file
+    diagnostics: dict[str, dict[str, str]] = field(default_factory=dict)
+    executor: str = "thread"
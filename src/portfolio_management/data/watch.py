@@ -0,0 +1,530 @@
+r"""Change detection for the ``prepare_tradeable_data.py --watch`` daemon.
+
+A watcher reports which pipeline inputs changed since it was last asked:
+
+- the broker tradeable CSVs,
+- Stooq directories in which price files were created, removed or renamed
+  (the only changes that affect the Stooq index), and
+- tracked Stooq price files (the matched ones) that were rewritten in place.
+
+`InotifyWatcher` receives these as Linux inotify events through ``ctypes``,
+so nothing is stat'ed while the inputs are idle. `PollingWatcher` is the
+portable fallback: every poll it stats each directory of the Stooq tree, the
+tradeable CSVs and the tracked price files, which is still far cheaper than
+walking and fingerprinting every price file. `open_watcher` picks inotify when
+the platform supports it.
+
+Key Classes:
+    - ChangeSet: The inputs that changed between two polls.
+    - PollingWatcher: Detect changes by comparing ``stat`` snapshots.
+    - InotifyWatcher: Detect changes from inotify events (Linux only).
+
+Key Functions:
+    - open_watcher: Return the best available watcher.
+
+Usage Example:
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> root = Path(tempfile.mkdtemp())
+    >>> (root / "stooq").mkdir()
+    >>> (root / "tradeable").mkdir()
+    >>> with PollingWatcher(root / "stooq", root / "tradeable") as watcher:
+    ...     _ = (root / "tradeable" / "broker.csv").write_text("symbol\n")
+    ...     watcher.wait(0).tradeables
+    True
+
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+LOGGER = logging.getLogger(__name__)
+
+WATCH_BACKENDS = ("auto", "inotify", "poll")
+
+_TRADEABLE_SUFFIX = ".csv"
+_PRICE_SUFFIX = ".txt"
+
+# inotify(7) event bits.
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_MEMBERSHIP_EVENTS = _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO
+_WATCH_MASK = (
+    _MEMBERSHIP_EVENTS
+    | _IN_CLOSE_WRITE
+    | _IN_MODIFY
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """The inputs that changed between two polls.
+
+    Attributes:
+        tradeables: True when a tradeable CSV was created, removed or modified.
+        directories: Stooq directories (relative to the data root, ``""`` for
+            the root) whose price file listing may have changed.
+        files: Tracked price files (relative paths) whose contents changed.
+        rescan: True when events were lost and every input must be rechecked.
+
+    """
+
+    tradeables: bool = False
+    directories: frozenset[str] = frozenset()
+    files: frozenset[str] = frozenset()
+    rescan: bool = False
+
+    def __bool__(self) -> bool:
+        """Return True when anything changed."""
+        return self.tradeables or self.rescan or bool(self.directories or self.files)
+
+    def merge(self, other: ChangeSet) -> ChangeSet:
+        """Return the union of two change sets."""
+        return ChangeSet(
+            tradeables=self.tradeables or other.tradeables,
+            directories=self.directories | other.directories,
+            files=self.files | other.files,
+            rescan=self.rescan or other.rescan,
+        )
+
+
+class _Watcher(ABC):
+    """Shared ``wait``/context-manager behaviour of the watchers."""
+
+    def __init__(self, data_dir: Path, tradeable_dir: Path) -> None:
+        self.data_dir = Path(data_dir)
+        self.tradeable_dir = Path(tradeable_dir)
+
+    @abstractmethod
+    def track(self, rel_paths: Iterable[str]) -> None:
+        """Set the price files whose in-place modifications are reported."""
+
+    @abstractmethod
+    def poll(self, timeout: float) -> ChangeSet:
+        """Return the changes seen within ``timeout`` seconds."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook, nothing to release
+        """Release the watcher's resources."""
+
+    def wait(self, timeout: float, *, settle: float = 0.0) -> ChangeSet:
+        """Wait for changes and return them once the inputs are quiet.
+
+        Args:
+            timeout: Maximum number of seconds to wait for a first change.
+            settle: After a change, keep collecting until no further change
+                arrives for this many seconds, so that a batch of writes (an
+                unpacked archive, a rewritten CSV) is handled in one cycle.
+
+        Returns:
+            The merged changes; empty when nothing changed before ``timeout``.
+
+        """
+        changes = self.poll(timeout)
+        while changes and settle > 0:
+            more = self.poll(settle)
+            if not more:
+                break
+            changes = changes.merge(more)
+        return changes
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _subdirectories(path: Path, *, follow_symlinks: bool) -> list[str]:
+    """Return the names of the non-hidden subdirectories of ``path``."""
+    try:
+        with os.scandir(path) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if not entry.name.startswith(".")
+                and entry.is_dir(follow_symlinks=follow_symlinks)
+            ]
+    except OSError:
+        return []
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _walk_directories(data_dir: Path, start: str) -> list[str]:
+    """Return ``start`` and every directory below it, like the index scan."""
+    found = []
+    stack = [start]
+    while stack:
+        rel_dir = stack.pop()
+        found.append(rel_dir)
+        path = data_dir / rel_dir if rel_dir else data_dir
+        # Top-level directories are followed like `build_stooq_index` does.
+        stack.extend(
+            _join(rel_dir, name)
+            for name in _subdirectories(path, follow_symlinks=not rel_dir)
+        )
+    return found
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class PollingWatcher(_Watcher):
+    """Detect input changes by comparing ``stat`` snapshots.
+
+    Directory mtimes change whenever an entry is created, removed or renamed
+    in them, so one ``stat`` per directory finds every index change; only
+    directories whose mtime moved are listed again to discover new
+    subdirectories. Tradeable CSVs and tracked price files are compared by
+    size and mtime.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        tradeable_dir: Path,
+        *,
+        interval: float = 2.0,
+    ) -> None:
+        """Take the initial snapshot.
+
+        Args:
+            data_dir: Root of the unpacked Stooq tree.
+            tradeable_dir: Directory holding the tradeable CSVs.
+            interval: Seconds between two snapshots while waiting.
+
+        """
+        super().__init__(data_dir, tradeable_dir)
+        self.interval = max(interval, 0.01)
+        self._directories = {
+            rel_dir: self._directory_mtime(rel_dir)
+            for rel_dir in _walk_directories(self.data_dir, "")
+        }
+        self._tradeables = self._tradeable_snapshot()
+        self._files: dict[str, tuple[int, int] | None] = {}
+
+    def track(self, rel_paths: Iterable[str]) -> None:
+        """Set the price files whose in-place modifications are reported."""
+        previous = self._files
+        self._files = {
+            rel_path: (
+                previous[rel_path]
+                if rel_path in previous
+                else _stat_key(self.data_dir / rel_path)
+            )
+            for rel_path in rel_paths
+        }
+
+    def poll(self, timeout: float) -> ChangeSet:
+        """Snapshot the inputs every ``interval`` seconds until one changed."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(min(self.interval, remaining))
+            changes = self._scan()
+            if changes or remaining <= self.interval:
+                return changes
+
+    def _directory_mtime(self, rel_dir: str) -> int | None:
+        path = self.data_dir / rel_dir if rel_dir else self.data_dir
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _tradeable_snapshot(self) -> dict[str, tuple[int, int] | None]:
+        return {
+            path.name: _stat_key(path)
+            for path in self.tradeable_dir.glob(f"*{_TRADEABLE_SUFFIX}")
+        }
+
+    def _scan(self) -> ChangeSet:
+        changed: set[str] = set()
+        for rel_dir, mtime_ns in list(self._directories.items()):
+            current = self._directory_mtime(rel_dir)
+            if current == mtime_ns:
+                continue
+            changed.add(rel_dir)
+            if current is None:
+                del self._directories[rel_dir]
+                continue
+            self._directories[rel_dir] = current
+            path = self.data_dir / rel_dir if rel_dir else self.data_dir
+            for name in _subdirectories(path, follow_symlinks=not rel_dir):
+                subdir = _join(rel_dir, name)
+                if subdir not in self._directories:
+                    for new_dir in _walk_directories(self.data_dir, subdir):
+                        self._directories[new_dir] = self._directory_mtime(new_dir)
+                        changed.add(new_dir)
+
+        tradeables = self._tradeable_snapshot()
+        tradeables_changed = tradeables != self._tradeables
+        self._tradeables = tradeables
+
+        files = set()
+        for rel_path, key in self._files.items():
+            current = _stat_key(self.data_dir / rel_path)
+            if current != key:
+                self._files[rel_path] = current
+                files.add(rel_path)
+        return ChangeSet(
+            tradeables=tradeables_changed,
+            directories=frozenset(changed),
+            files=frozenset(files),
+        )
+
+
+class InotifyWatcher(_Watcher):
+    """Detect input changes from Linux inotify events.
+
+    Every directory of the Stooq tree and the tradeable directory get a watch;
+    watches are added for directories created later and dropped for removed
+    ones. When the kernel event queue overflows, or a new directory cannot be
+    watched (it was removed again, or ``fs.inotify.max_user_watches`` is
+    exhausted), the change set asks for a full rescan.
+    """
+
+    def __init__(self, data_dir: Path, tradeable_dir: Path) -> None:
+        """Create the inotify instance and watch every input directory.
+
+        Args:
+            data_dir: Root of the unpacked Stooq tree.
+            tradeable_dir: Directory holding the tradeable CSVs.
+
+        Raises:
+            OSError: If inotify is unavailable or a watch cannot be added
+                (for example when ``fs.inotify.max_user_watches`` is too low).
+
+        """
+        super().__init__(data_dir, tradeable_dir)
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        # Watch descriptor -> directory relative to the data root, or None for
+        # the tradeable directory.
+        self._watches: dict[int, str | None] = {}
+        self._tracked: frozenset[str] = frozenset()
+        self._rescan = False
+        try:
+            self._add_watch(self.tradeable_dir, None)
+            for rel_dir in _walk_directories(self.data_dir, ""):
+                self._add_watch(self.data_dir / rel_dir, rel_dir)
+        except OSError:
+            self.close()
+            raise
+
+    def track(self, rel_paths: Iterable[str]) -> None:
+        """Set the price files whose in-place modifications are reported."""
+        self._tracked = frozenset(rel_paths)
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def poll(self, timeout: float) -> ChangeSet:
+        """Block until events arrive or ``timeout`` seconds pass."""
+        readable, _writable, _errored = select.select(
+            [self._fd],
+            [],
+            [],
+            max(timeout, 0),
+        )
+        if not readable:
+            return ChangeSet()
+        return self._read_events()
+
+    def _add_watch(self, path: Path, rel_dir: str | None) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"Cannot watch {path}: {os.strerror(errno)}")
+        self._watches[wd] = rel_dir
+
+    def _remove_subtree(self, rel_dir: str) -> None:
+        prefix = f"{rel_dir}/"
+        for wd, watched in list(self._watches.items()):
+            if watched is not None and (
+                watched == rel_dir or watched.startswith(prefix)
+            ):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+    def _read_events(self) -> ChangeSet:
+        tradeables = False
+        rescan, self._rescan = self._rescan, False
+        directories: set[str] = set()
+        files: set[str] = set()
+        for wd, mask, name in self._drain():
+            if mask & _IN_Q_OVERFLOW:
+                rescan = True
+                continue
+            if wd not in self._watches:
+                continue
+            rel_dir = self._watches[wd]
+            if mask & _IN_IGNORED:
+                del self._watches[wd]
+                continue
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                # A watched root vanished; everything below it is stale.
+                rescan = rescan or rel_dir in {None, ""}
+                continue
+            if not name or name.startswith("."):
+                continue
+            if rel_dir is None:
+                tradeables = tradeables or name.lower().endswith(_TRADEABLE_SUFFIX)
+                continue
+            if mask & _IN_ISDIR:
+                if mask & _MEMBERSHIP_EVENTS:
+                    directories.add(rel_dir)
+                    self._update_directory(rel_dir, name, mask, directories)
+                continue
+            if not name.lower().endswith(_PRICE_SUFFIX):
+                continue
+            if mask & _MEMBERSHIP_EVENTS:
+                directories.add(rel_dir)
+            rel_path = _join(rel_dir, name)
+            if rel_path in self._tracked:
+                files.add(rel_path)
+        return ChangeSet(
+            tradeables=tradeables,
+            directories=frozenset(directories),
+            files=frozenset(files),
+            rescan=rescan or self._rescan,
+        )
+
+    def _update_directory(
+        self,
+        rel_dir: str,
+        name: str,
+        mask: int,
+        directories: set[str],
+    ) -> None:
+        """Add or drop watches for a subdirectory created, moved or removed."""
+        subdir = _join(rel_dir, name)
+        if mask & (_IN_DELETE | _IN_MOVED_FROM):
+            self._remove_subtree(subdir)
+            return
+        # Entries created before the watch was added produce no events, so
+        # the whole new subtree counts as changed.
+        for new_dir in _walk_directories(self.data_dir, subdir):
+            directories.add(new_dir)
+            try:
+                self._add_watch(self.data_dir / new_dir, new_dir)
+            except OSError as exc:
+                # ENOENT when the directory is already gone again, ENOSPC when
+                # the watch limit is reached; the rescan re-lists everything.
+                LOGGER.warning("%s; requesting a full rescan", exc)
+                self._rescan = True
+
+    def _drain(self) -> list[tuple[int, int, str]]:
+        """Read and decode every queued event."""
+        buffer = b""
+        while True:
+            try:
+                chunk = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            buffer += chunk
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            events.append((wd, mask, os.fsdecode(raw_name)))
+        return events
+
+
+def open_watcher(
+    data_dir: Path,
+    tradeable_dir: Path,
+    *,
+    backend: str = "auto",
+    interval: float = 2.0,
+) -> PollingWatcher | InotifyWatcher:
+    """Return a watcher for the pipeline inputs.
+
+    Args:
+        data_dir: Root of the unpacked Stooq tree.
+        tradeable_dir: Directory holding the tradeable CSVs.
+        backend: ``"inotify"``, ``"poll"`` or ``"auto"`` (inotify when it is
+            available, polling otherwise).
+        interval: Seconds between snapshots for the polling backend.
+
+    Returns:
+        The watcher; use it as a context manager or call ``close``.
+
+    Raises:
+        ValueError: If ``backend`` is unknown.
+        OSError: If ``backend`` is ``"inotify"`` and inotify cannot be used.
+
+    """
+    if backend not in WATCH_BACKENDS:
+        raise ValueError(
+            f"Unknown watch backend {backend!r}; expected one of "
+            f"{', '.join(WATCH_BACKENDS)}",
+        )
+    if backend != "poll":
+        try:
+            return InotifyWatcher(data_dir, tradeable_dir)
+        except (OSError, AttributeError) as exc:
+            if backend == "inotify":
+                raise
+            LOGGER.info("inotify unavailable (%s); polling every %ss", exc, interval)
+    return PollingWatcher(data_dir, tradeable_dir, interval=interval)
@@ -10,12 +10,15 @@ Key Components:
       a factory for different portfolio strategies.
     - PortfolioStrategy: An interface for all portfolio construction strategies,
       with concrete implementations like `EqualWeightStrategy`,
-      `MeanVarianceStrategy`, and `RiskParityStrategy`.
+      `MeanVarianceStrategy`, `RiskParityStrategy`, and
+      `HierarchicalRiskParityStrategy`.
     - PortfolioConstraints: A data class to define investment constraints such as
       min/max weights, asset class exposure limits, and more.
     - CardinalityConstraints: A data class for advanced constraints on the number
       of assets in a portfolio.
     - RebalanceConfig: Configuration for defining rebalancing frequency and tolerance.
+    - TurnoverCostModel: Trading costs in weight space for turnover-penalised
+      optimisation.
 
 Usage Example:
     >>> import pandas as pd
@@ -61,6 +64,7 @@ from .cardinality import (
     validate_cardinality_constraints,
 )
 from .constraints import CardinalityConstraints, CardinalityMethod, PortfolioConstraints
+from .costs import TurnoverCostModel
 from .membership import MembershipPolicy, apply_membership_policy
 from .models import Portfolio, StrategyType
 from .preselection import (
@@ -70,9 +74,11 @@ from .preselection import (
     create_preselection_from_dict,
 )
 from .rebalancing import RebalanceConfig
-from .statistics import StatisticsCache
+from .result_cache import PortfolioResultCache, window_fingerprint
+from .statistics import PortfolioMoments, StatisticsCache
 from .strategies import (
     EqualWeightStrategy,
+    HierarchicalRiskParityStrategy,
     MeanVarianceStrategy,
     PortfolioStrategy,
     RiskParityStrategy,
@@ -86,7 +92,9 @@ __all__ = [
     "CardinalityConstraints",
     "CardinalityMethod",
     "PortfolioConstraints",
-    # Cardinality (design stubs)
+    # Costs
+    "TurnoverCostModel",
+    # Cardinality
     "CardinalityNotImplementedError",
     "get_cardinality_optimizer",
     "optimize_with_cardinality_heuristic",
@@ -103,13 +111,18 @@ __all__ = [
     "create_preselection_from_dict",
     # Rebalancing
     "RebalanceConfig",
+    # Result caching
+    "PortfolioResultCache",
+    "window_fingerprint",
     # Statistics
+    "PortfolioMoments",
     "StatisticsCache",
     # Strategies
     "PortfolioStrategy",
     "EqualWeightStrategy",
     "MeanVarianceStrategy",
     "RiskParityStrategy",
+    "HierarchicalRiskParityStrategy",
     # Builder
     "PortfolioConstructor",
 ]
@@ -12,20 +12,64 @@ Key Classes:
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Sequence
 
 import pandas as pd
 
 from ..core.exceptions import InvalidStrategyError, PortfolioConstructionError
+from ..core.utils import _run_in_parallel
 from .constraints.models import PortfolioConstraints
 from .models import Portfolio, StrategyType
+from .result_cache import PortfolioResultCache
+from .statistics.moments import PortfolioMoments
 from .strategies.base import PortfolioStrategy
 from .strategies.equal_weight import EqualWeightStrategy
+from .strategies.hierarchical_risk_parity import HierarchicalRiskParityStrategy
 from .strategies.mean_variance import MeanVarianceStrategy
 from .strategies.risk_parity import RiskParityStrategy
 
 logger = logging.getLogger(__name__)
 
+COMPARISON_EXECUTORS = ("thread", "process")
+
+
+def _timed_construct(  # noqa: PLR0913, PLR0917
+    name: str,
+    strategy: PortfolioStrategy,
+    returns: pd.DataFrame,
+    constraints: PortfolioConstraints,
+    asset_classes: pd.Series | None,
+    moments: PortfolioMoments | None,
+    result_cache: PortfolioResultCache | None,
+) -> tuple[str, pd.Series | None, float, str | None]:
+    """Construct one strategy for a comparison and time it.
+
+    Construction errors are returned as messages rather than raised so that a
+    failing strategy does not abort the other workers, and so that nothing
+    needs to be unpickled across a process boundary.
+    """
+    start = time.perf_counter()
+    try:
+        if result_cache is not None:
+            portfolio = result_cache.get_or_construct(
+                strategy,
+                returns,
+                constraints,
+                asset_classes,
+                moments,
+            )
+        else:
+            portfolio = strategy.construct_with_moments(
+                returns,
+                constraints,
+                asset_classes,
+                moments,
+            )
+    except PortfolioConstructionError as err:
+        return name, None, time.perf_counter() - start, str(err)
+    return name, portfolio.weights, time.perf_counter() - start, None
+
 
 class PortfolioConstructor:
     """Coordinates portfolio strategy selection and construction.
@@ -36,13 +80,16 @@ class PortfolioConstructor:
     of comparing different strategies under the same constraints.
 
     It comes with several common strategies pre-registered, such as equal weight,
-    minimum volatility, and maximum Sharpe ratio.
+    risk parity, hierarchical risk parity, minimum volatility, and maximum Sharpe
+    ratio.
 
     Attributes:
         _default_constraints (PortfolioConstraints): Default constraints to apply
             if none are provided during construction.
         _strategies (dict[str, PortfolioStrategy]): A registry of available
             portfolio construction strategies.
+        _result_cache (PortfolioResultCache | None): Optional cache of
+            constructed portfolios consulted before running a strategy.
 
     Example:
         >>> import pandas as pd
@@ -86,14 +133,30 @@ class PortfolioConstructor:
 
     """
 
-    def __init__(self, constraints: PortfolioConstraints | None = None) -> None:
-        """Initialise the constructor with optional default constraints."""
+    def __init__(
+        self,
+        constraints: PortfolioConstraints | None = None,
+        result_cache: PortfolioResultCache | None = None,
+    ) -> None:
+        """Initialise the constructor.
+
+        Args:
+            constraints: Default constraints applied when none are passed
+            result_cache: Optional cache of constructed portfolios shared by all
+                registered strategies
+
+        """
         self._default_constraints = constraints or PortfolioConstraints()
+        self._result_cache = result_cache
         self._strategies: dict[str, PortfolioStrategy] = {}
 
         # Register baseline strategies
         self.register_strategy(StrategyType.EQUAL_WEIGHT.value, EqualWeightStrategy())
         self.register_strategy(StrategyType.RISK_PARITY.value, RiskParityStrategy())
+        self.register_strategy(
+            StrategyType.HIERARCHICAL_RISK_PARITY.value,
+            HierarchicalRiskParityStrategy(),
+        )
         self.register_strategy(
             "mean_variance_max_sharpe",
             MeanVarianceStrategy(objective="max_sharpe"),
@@ -128,29 +191,123 @@ class PortfolioConstructor:
             raise InvalidStrategyError(msg)
 
         active_constraints = constraints or self._default_constraints
+        if self._result_cache is not None:
+            return self._result_cache.get_or_construct(
+                strategy,
+                returns,
+                active_constraints,
+                asset_classes,
+            )
         return strategy.construct(returns, active_constraints, asset_classes)
 
-    def compare_strategies(
+    def compare_strategies(  # noqa: PLR0913
         self,
         strategy_names: Sequence[str],
         returns: pd.DataFrame,
         constraints: PortfolioConstraints | None = None,
         asset_classes: pd.Series | None = None,
+        *,
+        share_moments: bool = False,
+        max_workers: int = 1,
+        executor: str = "thread",
     ) -> pd.DataFrame:
-        """Construct and compare multiple strategies."""
-        portfolios: dict[str, pd.Series] = {}
+        """Construct and compare multiple strategies.
+
+        Strategies that fail with a `PortfolioConstructionError` are logged and
+        left out of the comparison.
+
+        Args:
+            strategy_names: Registered names of the strategies to compare
+            returns: DataFrame with returns (assets as columns, dates as index)
+            constraints: Constraints to apply; defaults to the constructor's
+            asset_classes: Optional Series mapping tickers to asset classes
+            share_moments: Compute the sample mean and covariance once and hand
+                them to every strategy instead of letting each recompute them
+            max_workers: Number of strategies constructed concurrently; 1 runs
+                them sequentially
+            executor: ``"thread"`` or ``"process"`` pool for concurrent runs.
+                Process workers receive pickled copies of the strategies, so
+                per-strategy caches are not updated in this process.
+
+        Returns:
+            DataFrame of weights with assets as rows and strategies as columns.
+            ``comparison.attrs["timings"]`` maps each constructed strategy to
+            its construction time in seconds, and
+            ``comparison.attrs["moments_time"]`` holds the time spent computing
+            the shared moments (0.0 when they are not shared).
+
+        Raises:
+            ValueError: If ``executor`` is not a supported pool type
+            RuntimeError: If every requested strategy fails
+
+        """
+        if executor not in COMPARISON_EXECUTORS:
+            msg = (
+                f"Invalid executor '{executor}'. Expected one of "
+                f"{list(COMPARISON_EXECUTORS)}."
+            )
+            raise ValueError(msg)
+
+        active_constraints = constraints or self._default_constraints
+        moments: PortfolioMoments | None = None
+        moments_time = 0.0
+        if share_moments:
+            start = time.perf_counter()
+            moments = PortfolioMoments.from_returns(returns)
+            moments_time = time.perf_counter() - start
+
+        tasks: list[tuple] = []
         for name in strategy_names:
-            try:
-                portfolio = self.construct(name, returns, constraints, asset_classes)
-            except (
-                PortfolioConstructionError
-            ) as err:  # pragma: no cover - tolerant comparison
-                logger.warning("Strategy '%s' failed: %s", name, err)
+            strategy = self._strategies.get(name)
+            if strategy is None:  # pragma: no cover - tolerant comparison
+                logger.warning("Strategy '%s' failed: unknown strategy", name)
+                continue
+            tasks.append(
+                (
+                    name,
+                    strategy,
+                    returns,
+                    active_constraints,
+                    asset_classes,
+                    moments,
+                    self._result_cache,
+                ),
+            )
+
+        results = self._run_comparison(tasks, max_workers, executor)
+
+        portfolios: dict[str, pd.Series] = {}
+        timings: dict[str, float] = {}
+        for name, weights, elapsed, error in results:
+            if weights is None:
+                logger.warning("Strategy '%s' failed: %s", name, error)
                 continue
-            portfolios[name] = portfolio.weights
+            portfolios[name] = weights
+            timings[name] = elapsed
+            logger.debug("Strategy '%s' constructed in %.3fs", name, elapsed)
 
         if not portfolios:
             msg = "All requested strategies failed to construct portfolios."
             raise RuntimeError(msg)
 
-        return pd.DataFrame(portfolios).fillna(0.0)
+        comparison = pd.DataFrame(portfolios).fillna(0.0)
+        comparison.attrs["timings"] = timings
+        comparison.attrs["moments_time"] = moments_time
+        return comparison
+
+    @staticmethod
+    def _run_comparison(
+        tasks: list[tuple],
+        max_workers: int,
+        executor: str,
+    ) -> list[tuple[str, pd.Series | None, float, str | None]]:
+        """Run the comparison tasks sequentially or on the requested pool."""
+        workers = min(max_workers, len(tasks))
+        # One strategy per submission: the tasks are few and individually slow.
+        return _run_in_parallel(
+            _timed_construct,
+            tasks,
+            workers,
+            executor=executor,
+            chunksize=1,
+        )
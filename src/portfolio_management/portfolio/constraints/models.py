@@ -78,7 +78,7 @@ class CardinalityMethod(str, Enum):
 
     Attributes:
         PRESELECTION: Use factor-based preselection before optimization (current default)
-        MIQP: Mixed-Integer Quadratic Programming (future: requires commercial solver)
+        MIQP: Mixed-Integer Quadratic Programming (built-in branch-and-bound)
         HEURISTIC: Iterative heuristic approach (future: custom implementation)
         RELAXATION: Continuous relaxation with post-processing (future)
 
@@ -139,7 +139,8 @@ class CardinalityConstraints:
         - `preselection`: Very fast, suitable for all optimizers. Sub-optimal
           as it doesn't consider correlations during selection.
         - `miqp`: Provides the optimal solution but is computationally expensive
-          (NP-hard) and requires a specialized solver (e.g., Gurobi, CBC).
+          (NP-hard); solved with the built-in branch-and-bound in
+          `cardinality.optimize_with_cardinality_miqp`.
           Complexity scales exponentially with the number of assets.
 
     """
@@ -14,6 +14,7 @@ class StrategyType(str, Enum):
 
     EQUAL_WEIGHT = "equal_weight"
     RISK_PARITY = "risk_parity"
+    HIERARCHICAL_RISK_PARITY = "hierarchical_risk_parity"
     MEAN_VARIANCE = "mean_variance"
 
 
@@ -4,6 +4,7 @@ This package provides efficient rolling statistics computation for portfolio str
 including caching mechanisms to avoid redundant calculations during rebalancing.
 """
 
+from .moments import PortfolioMoments
 from .rolling_statistics import StatisticsCache, RollingStatistics
 
-__all__ = ["StatisticsCache", "RollingStatistics"]
+__all__ = ["PortfolioMoments", "StatisticsCache", "RollingStatistics"]
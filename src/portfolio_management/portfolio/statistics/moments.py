@@ -0,0 +1,100 @@
+"""Sample moments shared between strategies evaluated on the same window.
+
+When several strategies are compared on one returns window, each of them would
+otherwise recompute the same sample covariance (an O(n²·T) pass). The
+`PortfolioMoments` snapshot is computed once and handed to every strategy via
+`PortfolioStrategy.construct_with_moments`.
+
+Key Classes:
+    - PortfolioMoments: Per-period sample mean, covariance and observation counts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class PortfolioMoments:
+    """Per-period (non-annualized) sample moments of a returns window.
+
+    The values are exactly what ``returns.mean()`` and ``returns.cov()`` yield
+    for the window, so strategies that reuse them produce the same weights as
+    strategies that compute the moments themselves.
+
+    Attributes:
+        mean: Sample mean of each asset's returns.
+        covariance: Sample covariance matrix (``ddof=1``, pairwise complete).
+        counts: Number of non-missing observations per asset.
+        n_periods: Number of rows in the window the moments were computed on.
+
+    """
+
+    mean: pd.Series
+    covariance: pd.DataFrame
+    counts: pd.Series
+    n_periods: int
+
+    @classmethod
+    def from_returns(cls, returns: pd.DataFrame) -> PortfolioMoments:
+        """Compute the moments of ``returns``.
+
+        Args:
+            returns: DataFrame with returns (assets as columns, dates as index)
+
+        Returns:
+            The moments snapshot for the window.
+
+        """
+        return cls(
+            mean=returns.mean(),
+            covariance=returns.cov(),
+            counts=returns.count(),
+            n_periods=len(returns),
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        """Return True when no asset has missing observations in the window."""
+        return bool((self.counts == self.n_periods).all())
+
+    def matches(self, returns: pd.DataFrame) -> bool:
+        """Return True when these moments describe ``returns``.
+
+        The check compares the column labels and the number of rows, which is
+        sufficient for the comparison workflow where moments are derived from
+        the very frame being passed to each strategy.
+
+        Args:
+            returns: DataFrame the caller is about to construct a portfolio from
+
+        Returns:
+            Whether the moments can be used in place of recomputing them.
+
+        """
+        return len(returns) == self.n_periods and self.covariance.columns.equals(
+            returns.columns,
+        )
+
+    def std(self, ddof: int = 1) -> pd.Series:
+        """Return per-asset standard deviations derived from the covariance.
+
+        Args:
+            ddof: Delta degrees of freedom, matching ``DataFrame.std``
+
+        Returns:
+            Series of standard deviations indexed by asset.
+
+        """
+        variances = pd.Series(
+            np.diag(self.covariance.to_numpy()),
+            index=self.covariance.columns,
+            dtype=float,
+        )
+        if ddof != 1:
+            counts = self.counts.astype(float)
+            variances = variances * (counts - 1.0) / (counts - ddof)
+        return np.sqrt(variances)
@@ -19,6 +19,8 @@ class StatisticsCache:
     This class maintains cached covariance matrices and expected returns that can be
     incrementally updated when new data is added, significantly improving performance
     for large universes with overlapping data windows (e.g., monthly rebalances).
+    The sums and cross products are accumulated in float64 even when the returns
+    are stored as float32, so the statistics keep full precision.
 
     The cache is automatically invalidated when:
     - The asset set changes (different tickers)
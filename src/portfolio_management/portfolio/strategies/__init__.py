@@ -10,6 +10,8 @@ Available Strategies:
       optimization (MVO), targeting either minimum volatility or maximum Sharpe ratio.
     - RiskParityStrategy: Constructs a portfolio where each asset contributes equally
       to the total portfolio risk.
+    - HierarchicalRiskParityStrategy: Allocates risk by recursive bisection over a
+      correlation-based clustering, scaling to large universes without a solver.
 
 The `PortfolioStrategy` base class provides a common interface for constructing
 portfolios, making it easy to interchange and compare different strategies.
@@ -17,11 +19,13 @@ portfolios, making it easy to interchange and compare different strategies.
 
 from .base import PortfolioStrategy
 from .equal_weight import EqualWeightStrategy
+from .hierarchical_risk_parity import HierarchicalRiskParityStrategy
 from .mean_variance import MeanVarianceStrategy
 from .risk_parity import RiskParityStrategy
 
 __all__ = [
     "EqualWeightStrategy",
+    "HierarchicalRiskParityStrategy",
     "MeanVarianceStrategy",
     "PortfolioStrategy",
     "RiskParityStrategy",
@@ -13,12 +13,17 @@ Key Components:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from ..constraints.models import PortfolioConstraints
 from ..models import Portfolio
 
+if TYPE_CHECKING:
+    from ..costs import TurnoverCostModel
+    from ..statistics.moments import PortfolioMoments
+
 
 class PortfolioStrategy(ABC):
     """Abstract base class for all portfolio construction strategies.
@@ -68,6 +73,77 @@ class PortfolioStrategy(ABC):
                 infeasible under the given constraints.
         """
 
+    def construct_with_moments(
+        self,
+        returns: pd.DataFrame,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None = None,
+        moments: PortfolioMoments | None = None,
+    ) -> Portfolio:
+        """Construct a portfolio, optionally reusing precomputed sample moments.
+
+        Strategies that estimate a sample covariance override this method to
+        use ``moments`` instead of recomputing them when they describe the same
+        window. The default implementation ignores ``moments`` and delegates to
+        `construct`, so custom strategies work unchanged.
+
+        Args:
+            returns (pd.DataFrame): A DataFrame of asset returns, with assets
+                as columns and dates as the index.
+            constraints (PortfolioConstraints): The investment rules to enforce.
+            asset_classes (pd.Series | None): Optional ticker to asset class map.
+            moments (PortfolioMoments | None): Sample moments of ``returns``
+                shared by several strategies, e.g. during a comparison.
+
+        Returns:
+            Portfolio: The constructed portfolio, identical to what `construct`
+            returns for the same inputs.
+        """
+        del moments  # only used by overriding strategies
+        return self.construct(returns, constraints, asset_classes)
+
+    def construct_with_costs(
+        self,
+        returns: pd.DataFrame,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None = None,
+        *,
+        current_weights: pd.Series | None = None,
+        cost_model: TurnoverCostModel | None = None,
+    ) -> Portfolio:
+        """Construct a portfolio net of the cost of trading from current holdings.
+
+        Optimising strategies override this method to add a turnover penalty
+        to their objective. The default implementation ignores the costs and
+        delegates to `construct`, so custom strategies work unchanged.
+
+        Args:
+            returns (pd.DataFrame): A DataFrame of asset returns, with assets
+                as columns and dates as the index.
+            constraints (PortfolioConstraints): The investment rules to enforce.
+            asset_classes (pd.Series | None): Optional ticker to asset class map.
+            current_weights (pd.Series | None): Current portfolio weights by
+                ticker; None or empty when starting from cash.
+            cost_model (TurnoverCostModel | None): Cost of trading away from
+                ``current_weights``.
+
+        Returns:
+            Portfolio: The constructed portfolio.
+        """
+        del current_weights, cost_model  # only used by overriding strategies
+        return self.construct(returns, constraints, asset_classes)
+
+    @property
+    def cache_params(self) -> dict[str, object] | None:
+        """Return the parameters that, with the inputs, determine the result.
+
+        A `PortfolioResultCache` only serves strategies that return a dict here;
+        the dict must capture every setting that changes the weights. The
+        default ``None`` marks the strategy as not cacheable, which is the safe
+        choice for strategies with unlisted parameters or internal state.
+        """
+        return None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -74,6 +74,11 @@ class EqualWeightStrategy(PortfolioStrategy):
         """Return minimum number of return periods required."""
         return 1  # Only need to know which assets exist
 
+    @property
+    def cache_params(self) -> dict[str, object]:
+        """Return the parameters that determine the result (none)."""
+        return {}
+
     def construct(
         self,
         returns: pd.DataFrame,
@@ -0,0 +1,390 @@
+"""Implements the Hierarchical Risk Parity (HRP) portfolio construction strategy.
+
+This module provides the `HierarchicalRiskParityStrategy`, which allocates risk
+through a hierarchical clustering of assets instead of inverting the covariance
+matrix or calling an iterative solver. It therefore remains stable and fast for
+large universes where `RiskParityStrategy` falls back to inverse volatility.
+
+Key Classes:
+    - HierarchicalRiskParityStrategy: Correlation-distance clustering,
+      quasi-diagonalization and recursive bisection, with a linkage cache that
+      is reused across rebalances while the asset set and correlation structure
+      change only marginally.
+
+Dependencies:
+    - scipy: Used for the hierarchical clustering linkage.
+
+References:
+    - López de Prado (2016): "Building Diversified Portfolios that Outperform
+      Out-of-Sample"
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from portfolio_management.core.exceptions import (
+    ConstraintViolationError,
+    DependencyError,
+    InsufficientDataError,
+    OptimizationError,
+)
+from portfolio_management.portfolio.models import Portfolio
+
+from .base import PortfolioStrategy
+from .risk_parity import RiskParityStrategy
+
+if TYPE_CHECKING:
+    from portfolio_management.portfolio.constraints.models import PortfolioConstraints
+    from portfolio_management.portfolio.statistics.moments import PortfolioMoments
+    from portfolio_management.portfolio.statistics.rolling_statistics import (
+        RollingStatistics,
+    )
+
+logger = logging.getLogger(__name__)
+
+VALID_LINKAGE_METHODS = frozenset({"single", "complete", "average", "ward"})
+
+
+class HierarchicalRiskParityStrategy(PortfolioStrategy):
+    """Constructs a portfolio by hierarchical risk parity (HRP).
+
+    HRP proceeds in three steps:
+
+    1. Tree clustering: assets are clustered on the correlation distance
+       dᵢⱼ = sqrt((1 - ρᵢⱼ) / 2).
+    2. Quasi-diagonalization: the dendrogram leaf order places similar assets
+       next to each other so the covariance matrix becomes block-diagonal.
+    3. Recursive bisection: the ordered list is split in halves and capital is
+       divided between halves in inverse proportion to their cluster variance
+       (inverse-variance weights within each cluster).
+
+    The whole procedure is O(n² log n) and never inverts the covariance matrix,
+    so it has no large-universe threshold.
+
+    Linkage caching:
+        The dendrogram leaf order from the previous call is reused when the
+        asset set changed by at most ``max_asset_turnover`` (fraction of the
+        universe) and no pairwise correlation among the common assets moved by
+        more than ``correlation_tolerance`` since the linkage was built. Removed assets are dropped from the
+        cached order and new assets are inserted next to their most correlated
+        neighbour, so monthly rebalances of a slowly changing universe skip the
+        clustering step entirely.
+
+    Example:
+        >>> import numpy as np
+        >>> import pandas as pd
+        >>> from portfolio_management.portfolio.strategies import (
+        ...     HierarchicalRiskParityStrategy,
+        ... )
+        >>> from portfolio_management.portfolio.constraints import PortfolioConstraints
+        >>>
+        >>> np.random.seed(42)
+        >>> returns = pd.DataFrame(
+        ...     np.random.normal(0, 0.01, (300, 4)),
+        ...     columns=["A", "B", "C", "D"],
+        ... )
+        >>> strategy = HierarchicalRiskParityStrategy(min_periods=60)
+        >>> portfolio = strategy.construct(returns, PortfolioConstraints(max_weight=0.5))
+        >>> print(round(portfolio.weights.sum(), 2))
+        1.0
+
+    """
+
+    def __init__(
+        self,
+        min_periods: int = 252,
+        linkage_method: str = "single",
+        correlation_tolerance: float = 0.05,
+        max_asset_turnover: float = 0.1,
+        statistics_cache: RollingStatistics | None = None,
+    ) -> None:
+        """Initialize the hierarchical risk parity strategy.
+
+        Args:
+            min_periods: Minimum periods for covariance estimation
+            linkage_method: Hierarchical clustering linkage method
+            correlation_tolerance: Maximum absolute change of any pairwise
+                correlation for which the cached linkage is reused
+            max_asset_turnover: Maximum fraction of added/removed assets for which
+                the cached linkage is updated incrementally instead of rebuilt
+            statistics_cache: Optional statistics cache to avoid redundant calculations
+
+        """
+        if linkage_method not in VALID_LINKAGE_METHODS:
+            msg = (
+                f"Invalid linkage_method '{linkage_method}'. Expected one of "
+                f"{sorted(VALID_LINKAGE_METHODS)}."
+            )
+            raise ValueError(msg)
+        if correlation_tolerance < 0:
+            msg = f"correlation_tolerance must be >= 0, got {correlation_tolerance}"
+            raise ValueError(msg)
+        if not 0.0 <= max_asset_turnover <= 1.0:
+            msg = f"max_asset_turnover must be in [0, 1], got {max_asset_turnover}"
+            raise ValueError(msg)
+
+        self._min_periods = min_periods
+        self._linkage_method = linkage_method
+        self._correlation_tolerance = correlation_tolerance
+        self._max_asset_turnover = max_asset_turnover
+        self._statistics_cache = statistics_cache
+        self._cached_order: list[str] | None = None
+        self._cached_correlation: pd.DataFrame | None = None
+
+    @property
+    def name(self) -> str:
+        """Return the strategy name."""
+        return "hierarchical_risk_parity"
+
+    @property
+    def min_history_periods(self) -> int:
+        """Return minimum number of return periods required."""
+        return self._min_periods
+
+    @property
+    def cache_params(self) -> dict[str, object] | None:
+        """Return the parameters that determine the result.
+
+        With linkage reuse enabled the weights depend on earlier calls, so the
+        strategy is only cacheable when both reuse tolerances are zero.
+        """
+        if self._correlation_tolerance > 0 or self._max_asset_turnover > 0:
+            return None
+        return {"min_periods": self._min_periods, "linkage": self._linkage_method}
+
+    def construct(
+        self,
+        returns: pd.DataFrame,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None = None,
+    ) -> Portfolio:
+        """Construct a hierarchical risk parity portfolio.
+
+        Args:
+            returns: DataFrame with returns (assets as columns, dates as index)
+            constraints: Portfolio constraints to enforce
+            asset_classes: Optional Series mapping tickers to asset classes
+
+        Returns:
+            Portfolio with HRP weights
+
+        Raises:
+            InsufficientDataError: If insufficient data for covariance estimation
+            OptimizationError: If an asset has zero or undefined variance
+            ConstraintViolationError: If the weights violate the constraints
+            DependencyError: If scipy is not installed
+
+        """
+        return self.construct_with_moments(returns, constraints, asset_classes)
+
+    def construct_with_moments(
+        self,
+        returns: pd.DataFrame,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None = None,
+        moments: PortfolioMoments | None = None,
+    ) -> Portfolio:
+        """Construct an HRP portfolio, reusing shared moments if they match.
+
+        Args:
+            returns: DataFrame with returns (assets as columns, dates as index)
+            constraints: Portfolio constraints to enforce
+            asset_classes: Optional Series mapping tickers to asset classes
+            moments: Optional precomputed sample moments of ``returns``
+
+        Returns:
+            Portfolio with HRP weights
+
+        """
+        self._validate_history(returns)
+
+        if moments is not None and moments.matches(returns):
+            cov_matrix = moments.covariance
+        elif self._statistics_cache is not None:
+            cov_matrix = self._statistics_cache.get_covariance_matrix(
+                returns,
+                annualize=False,
+            )
+        else:
+            cov_matrix = returns.cov()
+
+        variances = np.diag(cov_matrix.to_numpy())
+        if not np.all(np.isfinite(variances)) or (variances <= 0).any():
+            raise OptimizationError(
+                strategy_name=self.name,
+                message="Hierarchical risk parity requires positive asset variances.",
+            )
+
+        std = np.sqrt(variances)
+        correlation = pd.DataFrame(
+            np.clip(cov_matrix.to_numpy() / np.outer(std, std), -1.0, 1.0),
+            index=cov_matrix.index,
+            columns=cov_matrix.columns,
+        ).fillna(0.0)
+
+        order, reused = self._resolve_order(correlation)
+        weights = self._recursive_bisection(cov_matrix, order)
+        weights = self._apply_weight_cap(weights, constraints)
+        weights = weights.reindex(returns.columns)
+
+        RiskParityStrategy.validate_constraints(weights, constraints, asset_classes)
+
+        weights_array = weights.to_numpy()
+        portfolio_vol = float(
+            np.sqrt(weights_array @ cov_matrix.to_numpy() @ weights_array),
+        )
+        return Portfolio(
+            weights=weights,
+            strategy=self.name,
+            metadata={
+                "n_assets": len(weights),
+                "portfolio_volatility": portfolio_vol,
+                "linkage_method": self._linkage_method,
+                "linkage_reused": reused,
+            },
+        )
+
+    def clear_cache(self) -> None:
+        """Drop the cached linkage so the next call reclusters from scratch."""
+        self._cached_order = None
+        self._cached_correlation = None
+
+    def _validate_history(self, returns: pd.DataFrame) -> None:
+        if returns.empty:
+            raise InsufficientDataError(
+                required_periods=self.min_history_periods,
+                available_periods=0,
+            )
+
+        if len(returns) < self.min_history_periods:
+            raise InsufficientDataError(
+                required_periods=self.min_history_periods,
+                available_periods=len(returns),
+            )
+
+    def _resolve_order(self, correlation: pd.DataFrame) -> tuple[list[str], bool]:
+        """Return the quasi-diagonal asset order, reusing the cache when possible."""
+        order = self._reuse_cached_order(correlation)
+        reused = order is not None
+        if order is None:
+            order = self._cluster_order(correlation)
+            # Drift is measured against the correlation the linkage was built
+            # from, so many small moves still trigger a recluster.
+            self._cached_correlation = correlation
+
+        self._cached_order = order
+        return order, reused
+
+    def _reuse_cached_order(self, correlation: pd.DataFrame) -> list[str] | None:
+        if self._cached_order is None or self._cached_correlation is None:
+            return None
+
+        tickers = correlation.index
+        anchor_index = self._cached_correlation.index
+        common = tickers.intersection(anchor_index, sort=False)
+        if common.empty:
+            return None
+        turnover = len(tickers.difference(anchor_index)) + len(
+            anchor_index.difference(tickers),
+        )
+        if turnover > self._max_asset_turnover * len(tickers):
+            return None
+
+        drift = np.abs(
+            correlation.loc[common, common].to_numpy()
+            - self._cached_correlation.loc[common, common].to_numpy(),
+        )
+        if drift.size and float(drift.max()) > self._correlation_tolerance:
+            return None
+
+        present = set(tickers)
+        order = [ticker for ticker in self._cached_order if ticker in present]
+        placed = set(order)
+        for ticker in tickers:
+            if ticker in placed:
+                continue
+            neighbours = correlation.loc[ticker, order]
+            anchor = order.index(neighbours.idxmax())
+            order.insert(anchor + 1, ticker)
+        return order
+
+    def _cluster_order(self, correlation: pd.DataFrame) -> list[str]:
+        """Cluster on correlation distance and return the dendrogram leaf order."""
+        if len(correlation) == 1:
+            return correlation.index.tolist()
+
+        try:
+            hierarchy = importlib.import_module("scipy.cluster.hierarchy")
+            distance = importlib.import_module("scipy.spatial.distance")
+        except ImportError as err:  # pragma: no cover - dependency check
+            raise DependencyError(dependency_name="scipy") from err
+
+        dist = np.sqrt(np.clip((1.0 - correlation.to_numpy()) / 2.0, 0.0, 1.0))
+        np.fill_diagonal(dist, 0.0)
+        condensed = distance.squareform(dist, checks=False)
+        link = hierarchy.linkage(condensed, method=self._linkage_method)
+        leaves = hierarchy.leaves_list(link)
+        return correlation.index[leaves].tolist()
+
+    @staticmethod
+    def _recursive_bisection(
+        cov_matrix: pd.DataFrame,
+        order: list[str],
+    ) -> pd.Series:
+        """Allocate capital top-down by splitting the ordered assets in halves."""
+        ordered_cov = cov_matrix.loc[order, order].to_numpy()
+        inv_diag = 1.0 / np.diag(ordered_cov)
+        weights = np.ones(len(order))
+
+        def cluster_variance(start: int, stop: int) -> float:
+            ivp = inv_diag[start:stop] / inv_diag[start:stop].sum()
+            block = ordered_cov[start:stop, start:stop]
+            return float(ivp @ block @ ivp)
+
+        clusters = [(0, len(order))]
+        while clusters:
+            next_clusters = []
+            for start, stop in clusters:
+                if stop - start <= 1:
+                    continue
+                mid = (start + stop) // 2
+                left_var = cluster_variance(start, mid)
+                right_var = cluster_variance(mid, stop)
+                total = left_var + right_var
+                alpha = 0.5 if total <= 0 else 1.0 - left_var / total
+                weights[start:mid] *= alpha
+                weights[mid:stop] *= 1.0 - alpha
+                next_clusters.extend([(start, mid), (mid, stop)])
+            clusters = next_clusters
+
+        return pd.Series(weights / weights.sum(), index=order, dtype=float)
+
+    def _apply_weight_cap(
+        self,
+        weights: pd.Series,
+        constraints: PortfolioConstraints,
+    ) -> pd.Series:
+        """Cap weights at ``max_weight`` and redistribute the excess pro rata."""
+        cap = constraints.max_weight
+        if len(weights) * cap < 1.0 - 1e-9:
+            raise ConstraintViolationError(
+                constraint_name="max_weight",
+                violated_value=1.0 / len(weights),
+            )
+
+        capped = weights.copy()
+        for _ in range(len(capped)):
+            over = capped > cap + 1e-12
+            if not over.any():
+                break
+            excess = float((capped[over] - cap).sum())
+            capped[over] = cap
+            room = capped < cap - 1e-12
+            capped[room] += excess * capped[room] / capped[room].sum()
+        return capped / capped.sum()
@@ -32,6 +32,7 @@ from portfolio_management.core.exceptions import (
     InsufficientDataError,
     OptimizationError,
 )
+from portfolio_management.portfolio.costs import align_weights
 from portfolio_management.portfolio.models import Portfolio
 
 from .base import PortfolioStrategy
@@ -39,6 +40,8 @@ from .risk_parity import RiskParityStrategy
 
 if TYPE_CHECKING:
     from portfolio_management.portfolio.constraints.models import PortfolioConstraints
+    from portfolio_management.portfolio.costs import TurnoverCostModel
+    from portfolio_management.portfolio.statistics.moments import PortfolioMoments
     from portfolio_management.portfolio.statistics.rolling_statistics import (
         RollingStatistics,
     )
@@ -131,11 +134,6 @@ class MeanVarianceStrategy(PortfolioStrategy):
         self._risk_free_rate = risk_free_rate
         self._min_periods = min_periods
         self._statistics_cache = statistics_cache
-        self._cached_signature: (
-            tuple[tuple[str, ...], tuple[pd.Timestamp, ...]] | None
-        ) = None
-        self._cached_weights: pd.Series | None = None
-        self._cached_metadata: dict[str, float] | None = None
 
     @property
     def name(self) -> str:
@@ -147,13 +145,75 @@ class MeanVarianceStrategy(PortfolioStrategy):
         """Return the minimum number of periods needed for estimation."""
         return self._min_periods
 
+    @property
+    def cache_params(self) -> dict[str, object]:
+        """Return the parameters that determine the result."""
+        return {
+            "objective": self._objective,
+            "risk_free_rate": self._risk_free_rate,
+            "min_periods": self._min_periods,
+        }
+
     def construct(
         self,
         returns: pd.DataFrame,
         constraints: PortfolioConstraints,
         asset_classes: pd.Series | None = None,
+        *,
+        current_weights: pd.Series | None = None,
+        cost_model: TurnoverCostModel | None = None,
+    ) -> Portfolio:
+        """Construct a mean-variance optimised portfolio.
+
+        When ``current_weights`` and ``cost_model`` are given, the objective is
+        penalised by the cost of trading away from the current weights.
+        """
+        return self.construct_with_moments(
+            returns,
+            constraints,
+            asset_classes,
+            current_weights=current_weights,
+            cost_model=cost_model,
+        )
+
+    def construct_with_costs(
+        self,
+        returns: pd.DataFrame,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None = None,
+        *,
+        current_weights: pd.Series | None = None,
+        cost_model: TurnoverCostModel | None = None,
     ) -> Portfolio:
-        """Construct a mean-variance optimised portfolio."""
+        """Construct a mean-variance portfolio net of turnover costs."""
+        return self.construct(
+            returns,
+            constraints,
+            asset_classes,
+            current_weights=current_weights,
+            cost_model=cost_model,
+        )
+
+    def construct_with_moments(  # noqa: PLR0913
+        self,
+        returns: pd.DataFrame,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None = None,
+        moments: PortfolioMoments | None = None,
+        *,
+        current_weights: pd.Series | None = None,
+        cost_model: TurnoverCostModel | None = None,
+    ) -> Portfolio:
+        """Construct a mean-variance portfolio, reusing shared sample moments.
+
+        The shared moments replace the sample mean and covariance used by the
+        large-universe analytic fallback and the equal-weight fallback. The
+        main optimisation path keeps its own shrinkage estimator.
+
+        Turnover costs (``current_weights`` and ``cost_model``) are applied on
+        the main optimisation path only; the analytic and equal-weight
+        fallbacks ignore them.
+        """
         efficient_frontier_cls, expected_returns, risk_models, objective_functions = (
             self._load_backend()
         )
@@ -163,24 +223,13 @@ class MeanVarianceStrategy(PortfolioStrategy):
         self._validate_returns(prepared_returns)
         n_assets = prepared_returns.shape[1]
 
-        signature = (
-            tuple(prepared_returns.columns),
-            tuple(prepared_returns.index),
-        )
-        if (
-            self._cached_signature == signature
-            and self._cached_weights is not None
-            and self._cached_metadata is not None
+        if moments is not None and not (
+            moments.is_complete and moments.matches(prepared_returns)
         ):
-            return Portfolio(
-                weights=self._cached_weights.copy(),
-                strategy=self.name,
-                metadata={**self._cached_metadata},
-            )
+            moments = None
 
         if n_assets > LARGE_UNIVERSE_THRESHOLD:
-            mu = prepared_returns.mean() * 252
-            cov_matrix = prepared_returns.cov() * 252
+            mu, cov_matrix = self._sample_moments(prepared_returns, moments)
 
             weights, performance = self._analytic_tangency_fallback(
                 mu,
@@ -242,6 +291,7 @@ class MeanVarianceStrategy(PortfolioStrategy):
 
         final_weights: pd.Series | None = None
         final_ef = None
+        final_attempt: dict | None = None
         last_error: OptimizationError | None = None
 
         for attempt in attempts:
@@ -275,6 +325,7 @@ class MeanVarianceStrategy(PortfolioStrategy):
                     continue
                 final_weights = weights_candidate / weight_sum
                 final_ef = candidate_ef
+                final_attempt = attempt
                 break
             except OptimizationError as error:
                 last_error = error
@@ -290,8 +341,32 @@ class MeanVarianceStrategy(PortfolioStrategy):
                 )
             )
 
+        current = None
+        if cost_model is not None and not cost_model.is_zero:
+            current = align_weights(current_weights, mu.index)
+        cost_metadata: dict[str, float] = {}
+        if current is not None and final_attempt is not None:
+            penalised = self._optimise_with_costs(
+                efficient_frontier_cls,
+                mu,
+                final_attempt,
+                final_weights,
+                constraints,
+                asset_classes,
+                current,
+                cost_model,
+            )
+            if penalised is not None:
+                final_weights, final_ef = penalised
+
         weights = self._enforce_weight_bounds(final_weights, constraints)
         ef = final_ef
+        if current is not None:
+            weights_array = weights.reindex(mu.index, fill_value=0.0).to_numpy()
+            cost_metadata = {
+                "turnover": float(np.abs(weights_array - current).sum()),
+                "transaction_cost": cost_model.cost(current, weights_array),
+            }
         try:
             RiskParityStrategy.validate_constraints(weights, constraints, asset_classes)
             performance = self._summarise_portfolio(ef)
@@ -309,8 +384,7 @@ class MeanVarianceStrategy(PortfolioStrategy):
                 constraints,
                 asset_classes,
             )
-            cov_matrix = prepared_returns.cov() * 252
-            mu_vector = prepared_returns.mean() * 252
+            mu_vector, cov_matrix = self._sample_moments(prepared_returns, moments)
             exp_ret = float(fallback_weights @ mu_vector)
             vol = float(np.sqrt(fallback_weights @ cov_matrix @ fallback_weights))
             sharpe = exp_ret / vol if vol > 0 else 0.0
@@ -322,9 +396,6 @@ class MeanVarianceStrategy(PortfolioStrategy):
                 "objective": self._objective,
                 "method": "fallback_equal_weight",
             }
-            self._cached_signature = signature
-            self._cached_weights = fallback_weights.copy()
-            self._cached_metadata = metadata.copy()
             return Portfolio(
                 weights=fallback_weights,
                 strategy=self.name,
@@ -336,10 +407,8 @@ class MeanVarianceStrategy(PortfolioStrategy):
             "n_assets": int(weights.size),
             **performance,
             "objective": self._objective,
+            **cost_metadata,
         }
-        self._cached_signature = signature
-        self._cached_weights = weights.copy()
-        self._cached_metadata = metadata.copy()
         return Portfolio(
             weights=weights,
             strategy=self.name,
@@ -407,6 +476,16 @@ class MeanVarianceStrategy(PortfolioStrategy):
                 message="Not enough return observations for mean-variance optimisation.",
             )
 
+    @staticmethod
+    def _sample_moments(
+        returns: pd.DataFrame,
+        moments: PortfolioMoments | None,
+    ) -> tuple[pd.Series, pd.DataFrame]:
+        """Return the annualised sample mean and covariance of ``returns``."""
+        if moments is not None:
+            return moments.mean * 252, moments.covariance * 252
+        return returns.mean() * 252, returns.cov() * 252
+
     def _estimate_moments(self, returns: pd.DataFrame, expected_returns, risk_models):
         # Use cached statistics if available
         if self._statistics_cache is not None:
@@ -671,6 +750,76 @@ class MeanVarianceStrategy(PortfolioStrategy):
                 message=f"Mean-variance optimisation failed: {err}",
             ) from err
 
+    def _optimise_with_costs(  # noqa: PLR0913, PLR0917
+        self,
+        efficient_frontier_cls,
+        mu: pd.Series,
+        attempt: dict,
+        target_weights: pd.Series,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None,
+        current: np.ndarray,
+        cost_model: TurnoverCostModel,
+    ) -> tuple[pd.Series, object] | None:
+        """Re-solve the successful attempt with the turnover penalty added.
+
+        ``min_volatility`` and ``efficient_risk`` take the penalty as an extra
+        objective term. PyPortfolioOpt's ``max_sharpe`` uses a variable
+        transformation that does not admit extra objectives, so it is replaced
+        by the quadratic utility ``μᵀw - δ/2 wᵀΣw`` with
+        ``δ = (μᵀw* - r_f) / (w*ᵀΣw*)`` calibrated at the max-Sharpe weights
+        ``w*``; without costs that problem has ``w*`` as its optimum, so the
+        penalty is measured against the same target.
+
+        Returns:
+            The penalised weights and frontier, or None if the penalised problem
+            could not be solved (the unpenalised result is then kept).
+
+        """
+        cov_matrix = attempt["cov"]
+        objective = attempt["objective"]
+        risk_aversion = None
+        if objective == "max_sharpe":
+            target = target_weights.reindex(mu.index, fill_value=0.0).to_numpy()
+            variance = float(target @ cov_matrix.to_numpy() @ target)
+            excess_return = float(mu.to_numpy() @ target) - self._risk_free_rate
+            if variance > 0 and excess_return > 0:
+                risk_aversion = excess_return / variance
+            else:
+                objective = "min_volatility"
+
+        try:
+            ef = self._build_frontier(
+                efficient_frontier_cls,
+                mu,
+                cov_matrix,
+                constraints,
+                asset_classes,
+            )
+            if attempt["l2_gamma"]:
+                objective_functions = importlib.import_module(
+                    "pypfopt.objective_functions",
+                )
+                ef.add_objective(objective_functions.L2_reg, gamma=attempt["l2_gamma"])
+            ef.add_objective(cost_model.penalty, current=current)
+            if attempt["solver"]:
+                ef._solver = attempt["solver"]
+            if risk_aversion is not None:
+                try:
+                    ef.max_quadratic_utility(risk_aversion=risk_aversion)
+                except Exception as err:  # pragma: no cover - backend errors vary
+                    raise OptimizationError(
+                        strategy_name=self.name,
+                        message=f"Mean-variance optimisation failed: {err}",
+                    ) from err
+            else:
+                self._optimise_frontier(ef, objective=objective)
+            weights = self._extract_weights(ef)
+        except OptimizationError as error:
+            logger.warning("Turnover-penalised optimisation failed: %s", error)
+            return None
+        return weights, ef
+
     def _extract_weights(self, ef) -> pd.Series:
         cleaned_weights = ef.clean_weights()
         weights = pd.Series(cleaned_weights, dtype=float)
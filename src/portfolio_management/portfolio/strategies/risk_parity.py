@@ -28,12 +28,15 @@ from portfolio_management.core.exceptions import (
     InsufficientDataError,
     OptimizationError,
 )
+from portfolio_management.portfolio.costs import align_weights
 from portfolio_management.portfolio.models import Portfolio
 
 from .base import PortfolioStrategy
 
 if TYPE_CHECKING:
     from portfolio_management.portfolio.constraints.models import PortfolioConstraints
+    from portfolio_management.portfolio.costs import TurnoverCostModel
+    from portfolio_management.portfolio.statistics.moments import PortfolioMoments
     from portfolio_management.portfolio.statistics.rolling_statistics import (
         RollingStatistics,
     )
@@ -109,18 +112,32 @@ class RiskParityStrategy(PortfolioStrategy):
         """Return minimum number of return periods required."""
         return self._min_periods
 
+    @property
+    def cache_params(self) -> dict[str, object]:
+        """Return the parameters that determine the result."""
+        return {"min_periods": self._min_periods}
+
     def construct(
         self,
         returns: pd.DataFrame,
         constraints: PortfolioConstraints,
         asset_classes: pd.Series | None = None,
+        *,
+        current_weights: pd.Series | None = None,
+        cost_model: TurnoverCostModel | None = None,
     ) -> Portfolio:
         """Construct a risk parity portfolio.
 
+        When ``current_weights`` and ``cost_model`` are given, the equal risk
+        contribution target is traded off against the cost of reaching it
+        (see `_apply_turnover_penalty`).
+
         Args:
             returns: DataFrame with returns (assets as columns, dates as index)
             constraints: Portfolio constraints to enforce
             asset_classes: Optional Series mapping tickers to asset classes
+            current_weights: Optional current portfolio weights by ticker
+            cost_model: Optional cost of trading away from ``current_weights``
 
         Returns:
             Portfolio with risk-parity weights
@@ -130,9 +147,64 @@ class RiskParityStrategy(PortfolioStrategy):
             OptimizationError: If optimization fails to converge
             DependencyError: If riskparityportfolio library is not installed
 
+        """
+        return self.construct_with_moments(
+            returns,
+            constraints,
+            asset_classes,
+            current_weights=current_weights,
+            cost_model=cost_model,
+        )
+
+    def construct_with_costs(
+        self,
+        returns: pd.DataFrame,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None = None,
+        *,
+        current_weights: pd.Series | None = None,
+        cost_model: TurnoverCostModel | None = None,
+    ) -> Portfolio:
+        """Construct a risk parity portfolio net of turnover costs."""
+        return self.construct(
+            returns,
+            constraints,
+            asset_classes,
+            current_weights=current_weights,
+            cost_model=cost_model,
+        )
+
+    def construct_with_moments(  # noqa: PLR0913
+        self,
+        returns: pd.DataFrame,
+        constraints: PortfolioConstraints,
+        asset_classes: pd.Series | None = None,
+        moments: PortfolioMoments | None = None,
+        *,
+        current_weights: pd.Series | None = None,
+        cost_model: TurnoverCostModel | None = None,
+    ) -> Portfolio:
+        """Construct a risk parity portfolio, reusing shared moments if they match.
+
+        Args:
+            returns: DataFrame with returns (assets as columns, dates as index)
+            constraints: Portfolio constraints to enforce
+            asset_classes: Optional Series mapping tickers to asset classes
+            moments: Optional precomputed sample moments of ``returns``
+            current_weights: Optional current portfolio weights by ticker
+            cost_model: Optional cost of trading away from ``current_weights``
+
+        Returns:
+            Portfolio with risk-parity weights
+
         """
         rpp = self._load_backend()
         self._validate_history(returns)
+        if moments is not None and not moments.matches(returns):
+            moments = None
+        current = None
+        if cost_model is not None and not cost_model.is_zero:
+            current = align_weights(current_weights, returns.columns)
 
         n_assets = returns.shape[1]
         if n_assets > LARGE_UNIVERSE_THRESHOLD:
@@ -140,10 +212,15 @@ class RiskParityStrategy(PortfolioStrategy):
                 returns,
                 constraints,
                 asset_classes,
+                moments,
+                current=current,
+                cost_model=cost_model,
             )
 
+        if moments is not None:
+            cov_matrix = moments.covariance
         # Use cached covariance if available
-        if self._statistics_cache is not None:
+        elif self._statistics_cache is not None:
             cov_matrix = self._statistics_cache.get_covariance_matrix(
                 returns,
                 annualize=False,
@@ -204,6 +281,18 @@ class RiskParityStrategy(PortfolioStrategy):
             )
             weights_array = weights.to_numpy()
 
+        cost_metadata: dict[str, float] = {}
+        if current is not None:
+            weights = self._apply_turnover_penalty(
+                weights,
+                cov_matrix.to_numpy() * 252,
+                current,
+                cost_model,
+                constraints,
+            )
+            weights_array = weights.to_numpy()
+            cost_metadata = self._turnover_metadata(weights_array, current, cost_model)
+
         self.validate_constraints(weights, constraints, asset_classes)
 
         portfolio_vol = self._portfolio_volatility(weights_array, cov_matrix)
@@ -221,6 +310,7 @@ class RiskParityStrategy(PortfolioStrategy):
                 "n_assets": n_assets,
                 "portfolio_volatility": portfolio_vol,
                 "risk_contributions": risk_contrib,
+                **cost_metadata,
             },
         )
 
@@ -243,17 +333,36 @@ class RiskParityStrategy(PortfolioStrategy):
                 available_periods=len(returns),
             )
 
-    def _inverse_volatility_portfolio(
+    def _inverse_volatility_portfolio(  # noqa: PLR0913
         self,
         returns: pd.DataFrame,
         constraints: PortfolioConstraints,
         asset_classes: pd.Series | None,
+        moments: PortfolioMoments | None = None,
+        *,
+        current: np.ndarray | None = None,
+        cost_model: TurnoverCostModel | None = None,
     ) -> Portfolio:
-        vols = returns.std(ddof=0)
+        vols = moments.std(ddof=0) if moments is not None else returns.std(ddof=0)
         if (vols <= 0).any():
             raise OptimizationError(strategy_name=self.name)
         inv_vol = 1.0 / vols.to_numpy()
         weights = pd.Series(inv_vol / inv_vol.sum(), index=returns.columns, dtype=float)
+        cost_metadata: dict[str, float] = {}
+        if current is not None:
+            # Inverse volatility is risk parity under a diagonal covariance.
+            weights = self._apply_turnover_penalty(
+                weights,
+                np.diag(np.square(vols.to_numpy()) * 252),
+                current,
+                cost_model,
+                constraints,
+            )
+            cost_metadata = self._turnover_metadata(
+                weights.to_numpy(),
+                current,
+                cost_model,
+            )
         self.validate_constraints(weights, constraints, asset_classes)
         return Portfolio(
             weights=weights,
@@ -261,9 +370,85 @@ class RiskParityStrategy(PortfolioStrategy):
             metadata={
                 "n_assets": len(returns.columns),
                 "method": "inverse_volatility_fallback",
+                **cost_metadata,
             },
         )
 
+    def _apply_turnover_penalty(
+        self,
+        target: pd.Series,
+        cov_array: np.ndarray,
+        current: np.ndarray,
+        cost_model: TurnoverCostModel,
+        constraints: PortfolioConstraints,
+    ) -> pd.Series:
+        """Trade the risk parity target off against the cost of reaching it.
+
+        Solves::
+
+            min ½ (w - w*)ᵀ Σ (w - w*) + cost(w - w_current)
+            s.t. Σw = 1, min_weight ≤ w ≤ max_weight
+
+        where ``w*`` is the unpenalised target and ``Σ`` the annualised
+        covariance, i.e. the tracking variance against the target is weighed
+        against the one-off trading cost. Without costs the solution is ``w*``
+        itself, so the penalty only holds back trades whose risk reduction is
+        not worth paying for. If the solver fails, the target is returned.
+        """
+        try:
+            cp = importlib.import_module("cvxpy")
+        except ImportError as err:  # pragma: no cover - dependency check
+            raise DependencyError(dependency_name="cvxpy") from err
+
+        n_assets = len(target)
+        target_array = target.to_numpy()
+        weights = cp.Variable(n_assets)
+        objective = 0.5 * cp.quad_form(
+            weights - target_array,
+            cp.psd_wrap(cov_array),
+        ) + cost_model.penalty(weights, current)
+        problem = cp.Problem(
+            cp.Minimize(objective),
+            [
+                cp.sum(weights) == 1,
+                weights >= constraints.min_weight,
+                weights <= constraints.max_weight,
+            ],
+        )
+        try:
+            problem.solve()
+        except cp.error.SolverError as err:
+            logger.warning("Turnover-penalised risk parity failed: %s", err)
+            return target
+        if weights.value is None or problem.status not in {
+            cp.OPTIMAL,
+            cp.OPTIMAL_INACCURATE,
+        }:
+            logger.warning(
+                "Turnover-penalised risk parity returned status %s",
+                problem.status,
+            )
+            return target
+
+        # Only trims solver tolerance; the bounds are part of the problem.
+        solved = np.clip(
+            np.asarray(weights.value, dtype=float),
+            constraints.min_weight,
+            constraints.max_weight,
+        )
+        return pd.Series(solved, index=target.index, dtype=float)
+
+    @staticmethod
+    def _turnover_metadata(
+        weights_array: np.ndarray,
+        current: np.ndarray,
+        cost_model: TurnoverCostModel,
+    ) -> dict[str, float]:
+        return {
+            "turnover": float(np.abs(weights_array - current).sum()),
+            "transaction_cost": cost_model.cost(current, weights_array),
+        }
+
     def _regularize_covariance(
         self,
         cov_matrix: pd.DataFrame,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Sequence
 
@@ -70,6 +70,7 @@ class PortfolioConstructionResult:
     strategies_evaluated: tuple[str, ...]
     portfolio: Portfolio | None
     comparison: pd.DataFrame | None
+    timings: dict[str, float] = field(default_factory=dict)
 
     @property
     def is_comparison(self) -> bool:
@@ -129,20 +130,36 @@ class PortfolioConstructionService:
         constructor = self._constructor_factory(constraints)
         return constructor.construct(strategy, returns, constraints, asset_classes)
 
-    def compare_strategies(
+    def compare_strategies(  # noqa: PLR0913
         self,
         *,
         returns: pd.DataFrame,
         constraints: PortfolioConstraints,
         strategies: Sequence[str],
         asset_classes: pd.Series | None = None,
+        share_moments: bool = False,
+        max_workers: int = 1,
+        executor: str = "thread",
     ) -> pd.DataFrame:
-        """Construct and compare multiple strategies."""
+        """Construct and compare multiple strategies.
+
+        See :meth:`PortfolioConstructor.compare_strategies` for the meaning of
+        ``share_moments``, ``max_workers`` and ``executor``; per-strategy
+        timings are available in ``comparison.attrs["timings"]``.
+        """
 
         constructor = self._constructor_factory(constraints)
-        return constructor.compare_strategies(strategies, returns, constraints, asset_classes)
+        return constructor.compare_strategies(
+            strategies,
+            returns,
+            constraints,
+            asset_classes,
+            share_moments=share_moments,
+            max_workers=max_workers,
+            executor=executor,
+        )
 
-    def run_workflow(
+    def run_workflow(  # noqa: PLR0913
         self,
         *,
         returns: Path | pd.DataFrame,
@@ -151,6 +168,9 @@ class PortfolioConstructionService:
         compare: bool = False,
         comparison_strategies: Sequence[str] | None = None,
         asset_classes: Path | pd.Series | None = None,
+        share_moments: bool = False,
+        max_workers: int = 1,
+        executor: str = "thread",
     ) -> PortfolioConstructionResult:
         """Execute the full portfolio construction workflow."""
 
@@ -161,6 +181,7 @@ class PortfolioConstructionService:
         evaluated: tuple[str, ...]
         portfolio: Portfolio | None = None
         comparison: pd.DataFrame | None = None
+        timings: dict[str, float] = {}
 
         if compare:
             strategies = tuple(
@@ -174,8 +195,12 @@ class PortfolioConstructionService:
                 returns_df,
                 constraints,
                 classes,
+                share_moments=share_moments,
+                max_workers=max_workers,
+                executor=executor,
             )
             evaluated = tuple(comparison.columns)
+            timings = dict(comparison.attrs.get("timings", {}))
         else:
             if strategy is None:
                 msg = "A strategy name must be provided when compare=False"
@@ -197,4 +222,5 @@ class PortfolioConstructionService:
             strategies_evaluated=evaluated,
             portfolio=portfolio,
             comparison=comparison,
+            timings=timings,
         )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from dataclasses import replace
 from pathlib import Path
 
 import numpy as np
@@ -13,7 +15,15 @@ from portfolio_management.analytics.returns import (
     ReturnCalculator,
     ReturnConfig,
     ReturnSummary,
+    SharedPriceCache,
 )
+from portfolio_management.analytics.returns.loaders import (
+    assemble_price_frame,
+    build_price_panel,
+    update_price_panel,
+)
+from portfolio_management.core.exceptions import ReturnCalculationError
+from portfolio_management.data.io.fast_io import is_backend_available
 from src.portfolio_management.assets.selection.selection import SelectedAsset
 
 
@@ -78,6 +88,9 @@ def test_return_config_validation() -> None:
     with pytest.raises(ValueError):
         ReturnConfig(min_coverage=1.5).validate()
 
+    with pytest.raises(ValueError):
+        ReturnConfig(precision="float16").validate()
+
 
 @pytest.mark.integration
 class TestPriceLoader:
@@ -118,6 +131,83 @@ class TestPriceLoader:
         assert prices.index[0] == pd.Timestamp("2022-01-03")
         assert prices.iloc[-1] == 101
 
+    @pytest.mark.parametrize(
+        "backend",
+        [
+            "pandas",
+            pytest.param(
+                "pyarrow",
+                marks=pytest.mark.skipif(
+                    not is_backend_available("pyarrow"),
+                    reason="pyarrow not installed",
+                ),
+            ),
+            pytest.param(
+                "polars",
+                marks=pytest.mark.skipif(
+                    not is_backend_available("polars"),
+                    reason="polars not installed",
+                ),
+            ),
+        ],
+    )
+    def test_load_price_file_decodes_compact_dates(
+        self,
+        tmp_path: Path,
+        backend: str,
+    ) -> None:
+        """Export, raw Stooq and ISO layouts all load as calendar dates."""
+        rows = [("20240229", "10.5"), ("20231229", "9.5"), ("20240102", "")]
+        export = tmp_path / "t.us.csv"
+        export.write_text(
+            "ticker,per,date,time,open,high,low,close,volume,openint\n"
+            + "".join(
+                f"T.US,D,{date},000000,1,1,1,{close},5,0\n" for date, close in rows
+            ),
+        )
+        raw = tmp_path / "t.us.txt"
+        raw.write_text(
+            "<TICKER>,<PER>,<DATE>,<TIME>,<OPEN>,<HIGH>,<LOW>,<CLOSE>,<VOL>,<OPENINT>\r\n"
+            + "".join(
+                f"T.US,D,{date},000000,1,1,1,{close},5,0\r\n" for date, close in rows
+            ),
+        )
+        iso = tmp_path / "iso.csv"
+        iso.write_text(
+            "date,close\n"
+            + "".join(
+                f"{date[:4]}-{date[4:6]}-{date[6:]},{close}\n" for date, close in rows
+            ),
+        )
+        expected = pd.Series(
+            [9.5, np.nan, 10.5],
+            index=pd.DatetimeIndex(
+                ["2023-12-29", "2024-01-02", "2024-02-29"], name="date"
+            ),
+            name="close",
+        )
+
+        loader = PriceLoader(io_backend=backend)
+        for path in (export, raw, iso):
+            pd.testing.assert_series_equal(loader.load_price_file(path), expected)
+
+    def test_load_price_file_invalid_compact_date_falls_back(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """A file the fast decode rejects is read by the general path."""
+        path = tmp_path / "bad.csv"
+        path.write_text(
+            "ticker,per,date,time,open,high,low,close,volume,openint\n"
+            "T.US,D,20230229,000000,1,1,1,10,5,0\n"
+            "T.US,D,20230301,000000,1,1,1,11,5,0\n",
+        )
+        assert PriceLoader._read_price_columns(path, "pandas") is None
+
+        prices = PriceLoader().load_price_file(path)
+        assert prices.index.tolist() == [pd.Timestamp("2023-03-01")]
+        assert prices.tolist() == [11.0]
+
     def test_load_multiple_prices_missing_file(
         self,
         price_loader: PriceLoader,
@@ -307,6 +397,273 @@ class TestPriceLoader:
             # Earlier files should have been evicted
             assert paths[0] not in loader._cache
 
+    def test_process_executor_matches_threads(self, tmp_path: Path) -> None:
+        """Process-pool loading returns the same series and fills the cache."""
+        prices_dir = tmp_path / "prices"
+        prices_dir.mkdir()
+        paths = []
+        for i in range(6):
+            price_file = prices_dir / f"asset{i}.csv"
+            price_file.write_text(
+                f"date,close\n2022-01-04,{101 + i}\n2022-01-03,{100 + i}\n",
+            )
+            paths.append(price_file)
+        bad_file = prices_dir / "bad.txt"
+        bad_file.write_text("foo,bar\n1,2\n")
+
+        thread_results = dict(PriceLoader(max_workers=2)._submit_load_tasks(paths))
+        loader = PriceLoader(max_workers=2, executor="process")
+        process_results = dict(loader._submit_load_tasks([*paths, bad_file]))
+
+        assert process_results[bad_file] is None
+        for path in paths:
+            pd.testing.assert_series_equal(process_results[path], thread_results[path])
+        assert loader.cache_info()["size"] == len(paths)
+
+    def test_invalid_executor_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Invalid executor"):
+            PriceLoader(executor="fiber")
+
+    def test_cache_bytes_bounds_memory(self, tmp_path: Path) -> None:
+        """Eviction follows the memory footprint rather than the entry count."""
+        prices_dir = tmp_path / "prices"
+        prices_dir.mkdir()
+        paths = []
+        for i, rows in enumerate([10, 10, 10, 40]):
+            dates = pd.bdate_range("2022-01-03", periods=rows)
+            price_file = prices_dir / f"asset{i}.csv"
+            price_file.write_text(
+                "date,close\n"
+                + "".join(
+                    f"{date:%Y-%m-%d},{100 + j}\n" for j, date in enumerate(dates)
+                ),
+            )
+            paths.append(price_file)
+        series_bytes = 10 * 16  # datetime64 index + float64 values per row
+
+        loader = PriceLoader(cache_size=100, cache_bytes=3 * series_bytes)
+        for path in paths[:3]:
+            loader._load_price_with_cache(path)
+        loader._load_price_with_cache(paths[0])
+        assert loader.cache_info()["bytes"] == 3 * series_bytes
+
+        # The large series does not fit the budget at all and is not cached.
+        loader._load_price_with_cache(paths[3])
+        stats = loader.cache_info()
+        assert stats["size"] == 3
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 4, 0)
+
+        loader.cache_bytes = 5 * series_bytes
+        loader._load_price_with_cache(paths[3])
+        with loader._cache_lock:
+            assert list(loader._cache) == [paths[0], paths[3]]
+        stats = loader.cache_info()
+        assert stats["bytes"] == 5 * series_bytes
+        assert stats["evictions"] == 2
+        loader.clear_cache()
+        assert loader.cache_info()["bytes"] == 0
+
+        with pytest.raises(ValueError, match="cache_bytes"):
+            PriceLoader(cache_bytes=-1)
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_shared_cache_serves_other_loaders(
+        self,
+        tmp_path: Path,
+        executor: str,
+    ) -> None:
+        """Series parsed by one loader are mapped by others until files change."""
+        prices_dir = tmp_path / "prices"
+        prices_dir.mkdir()
+        paths = []
+        for i in range(4):
+            price_file = prices_dir / f"asset{i}.csv"
+            price_file.write_text(
+                f"date,close\n2022-01-03,{100 + i}\n2022-01-04,{101 + i}\n",
+            )
+            paths.append(price_file)
+        shared_dir = tmp_path / "shared"
+        expected = dict(PriceLoader()._submit_load_tasks(paths))
+
+        first = PriceLoader(max_workers=2, executor=executor, shared_cache=shared_dir)
+        first._submit_load_tasks(paths)
+        assert len(list(shared_dir.glob("*.npy"))) == len(paths)
+
+        second = PriceLoader(max_workers=2, executor=executor, shared_cache=shared_dir)
+        results = dict(second._submit_load_tasks(paths))
+        for path in paths:
+            pd.testing.assert_series_equal(results[path], expected[path])
+        stats = second.get_cache_stats()
+        assert (stats["shared_hits"], stats["shared_misses"]) == (len(paths), 0)
+        assert stats["shared_bytes_read"] == len(paths) * 2 * 16
+
+        # A rewritten file changes its key and is parsed again.
+        paths[0].write_text("date,close\n2022-01-03,50\n2022-01-04,51\n2022-01-05,52\n")
+        third = PriceLoader(shared_cache=shared_dir)
+        assert third._load_price_with_cache(paths[0]).tolist() == [50.0, 51.0, 52.0]
+        assert third.get_cache_stats()["shared_misses"] == 1
+
+    def test_shared_cache_prune_keeps_recent_entries(self, tmp_path: Path) -> None:
+        cache = SharedPriceCache(tmp_path / "shared", max_bytes=0)
+        series = pd.Series(
+            [1.0, 2.0],
+            index=pd.DatetimeIndex(["2022-01-03", "2022-01-04"], name="date"),
+            name="close",
+        )
+        for key in ("a", "b", "c"):
+            cache.put(key, series)
+        entry_bytes = cache.size_bytes() // 3
+        for mtime, key in enumerate(("b", "c", "a")):
+            os.utime(cache.path / f"{key}.npy", ns=(mtime, mtime))
+
+        cache.max_bytes = 2 * entry_bytes
+        assert cache.prune() == 1
+        assert cache.get("b") is None
+        pd.testing.assert_series_equal(cache.get("a"), series)
+        assert cache.stats()["hits"] == 1
+
+        cache.clear()
+        assert cache.size_bytes() == 0
+
+    def test_assemble_price_frame_matches_pandas_alignment(self) -> None:
+        """The scatter assembly equals aligning a dict of series in pandas."""
+        rng = np.random.default_rng(7)
+        calendar = pd.bdate_range("2020-01-01", periods=300, name="date")
+        prices = {}
+        for i in range(12):
+            start, stop = sorted(rng.integers(0, 300, size=2))
+            dates = calendar[start : stop + 1]
+            if i % 3 == 0:  # gaps inside the run
+                dates = dates[rng.random(len(dates)) > 0.2]
+            prices[f"A{i}"] = pd.Series(
+                rng.random(len(dates)),
+                index=pd.DatetimeIndex(list(dates), name="date"),
+                name="close",
+            )
+        prices["SHARED"] = prices["A1"]
+        prices["EMPTY"] = pd.Series(
+            dtype="float64",
+            index=pd.DatetimeIndex([], name="date"),
+        )
+
+        expected = pd.DataFrame(prices).sort_index()
+        pd.testing.assert_frame_equal(assemble_price_frame(prices), expected)
+
+        week = calendar[100:105]
+        aligned = assemble_price_frame(prices, calendar=week, dtype=np.float32)
+        assert aligned.index.equals(week)
+        assert (aligned.dtypes == np.float32).all()
+        pd.testing.assert_frame_equal(
+            aligned,
+            expected.reindex(week).astype(np.float32),
+            check_freq=False,
+        )
+        assert assemble_price_frame({}).empty
+
+    def test_panel_matches_price_files(
+        self,
+        tmp_path: Path,
+        sample_asset: SelectedAsset,
+    ) -> None:
+        """Assets in the panel load exactly as from their files; others fall back."""
+        prices_dir = tmp_path / "prices"
+        prices_dir.mkdir()
+        assets = []
+        for i, dates in enumerate(
+            [("2022-01-03", "2022-01-04"), ("2022-01-04", "2022-01-05")] * 2,
+        ):
+            (prices_dir / f"asset{i}.csv").write_text(
+                "date,close\n"
+                + "".join(f"{date},{100 + i + j}\n" for j, date in enumerate(dates)),
+            )
+            assets.append(
+                replace(sample_asset, symbol=f"A{i}", stooq_path=f"asset{i}.txt"),
+            )
+        expected = PriceLoader().load_multiple_prices(assets, prices_dir)
+
+        # Leave the last asset out of the panel so it is read from its file.
+        (prices_dir / "asset3.csv").rename(tmp_path / "asset3.csv")
+        store = build_price_panel(prices_dir, tmp_path / "panel")
+        (tmp_path / "asset3.csv").rename(prices_dir / "asset3.csv")
+        assert store.tickers == ["asset0", "asset1", "asset2"]
+
+        loader = PriceLoader(panel=tmp_path / "panel")
+        pd.testing.assert_frame_equal(
+            loader.load_multiple_prices(assets, prices_dir),
+            expected,
+            check_freq=False,
+        )
+        assert loader.cache_info()["size"] == 1
+        counts, loaded = loader.count_prices(assets, prices_dir)
+        assert loaded == 4
+        pd.testing.assert_series_equal(
+            counts,
+            expected.notna().sum(axis=1),
+            check_freq=False,
+        )
+
+        subset = store.load(["asset1", "unknown"], start="2022-01-05")
+        assert list(subset.columns) == ["asset1"]
+        assert subset["asset1"].tolist() == [102.0]
+
+    def test_update_price_panel_appends_new_rows(
+        self,
+        tmp_path: Path,
+        sample_asset: SelectedAsset,
+    ) -> None:
+        """New rows are appended as a segment; other changes rebuild the panel."""
+        prices_dir = tmp_path / "prices"
+        prices_dir.mkdir()
+        (prices_dir / "asset0.csv").write_text(
+            "ticker,per,date,time,open,high,low,close,volume,openint\n"
+            "A0,D,20220103,000000,1,1,1,100,1,0\n"
+            "A0,D,20220104,000000,1,1,1,101,1,0\n",
+        )
+        (prices_dir / "asset1.csv").write_text(
+            "date,close\n2022-01-03,100\n2022-01-04,101\n",
+        )
+        build_price_panel(prices_dir, tmp_path / "panel")
+
+        with (prices_dir / "asset0.csv").open("a") as handle:
+            handle.write(
+                "A0,D,20220106,000000,1,1,1,103,1,0\n"
+                "A0,D,20220105,000000,1,1,1,102,1,0\n"
+                "A0,D,20220107,000000,1,1,1,-1,1,0\n",
+            )
+        store = update_price_panel(prices_dir, tmp_path / "panel")
+        assert store.segments == 1
+        assert update_price_panel(prices_dir, tmp_path / "panel").segments == 1
+
+        assets = [
+            replace(sample_asset, symbol=f"A{i}", stooq_path=f"asset{i}.txt")
+            for i in range(2)
+        ]
+        expected = PriceLoader().load_multiple_prices(assets, prices_dir)
+        pd.testing.assert_frame_equal(
+            PriceLoader(panel=store).load_multiple_prices(assets, prices_dir),
+            expected,
+            check_freq=False,
+        )
+
+        # A restated history cannot be appended and forces a rebuild.
+        (prices_dir / "asset1.csv").write_text(
+            "date,close\n2022-01-03,50\n2022-01-04,51\n2022-01-05,52\n",
+        )
+        store = update_price_panel(prices_dir, tmp_path / "panel")
+        assert store.segments == 0
+        assert store.load(["asset1"])["asset1"].tolist() == [50.0, 51.0, 52.0]
+
+    def test_missing_panel_falls_back_to_files(
+        self,
+        tmp_path: Path,
+        prices_dir: Path,
+        sample_asset: SelectedAsset,
+    ) -> None:
+        loader = PriceLoader(panel=tmp_path / "missing")
+        prices = loader.load_multiple_prices([sample_asset], prices_dir)
+        assert list(prices.columns) == ["TEST.US"]
+        assert len(prices) == 5
+
 
 @pytest.mark.integration
 class TestReturnCalculator:
@@ -392,6 +749,60 @@ class TestReturnCalculator:
         assert not np.isnan(interpolated.iloc[1, 0])
         assert np.isnan(interpolated.iloc[2, 0])
 
+    @pytest.mark.parametrize("handle_missing", ["forward_fill", "interpolate"])
+    @pytest.mark.parametrize("max_days", [1, 3, 40])
+    def test_handle_missing_matches_pandas(
+        self,
+        return_calculator: ReturnCalculator,
+        handle_missing: str,
+        max_days: int,
+    ) -> None:
+        """The NumPy fill kernels reproduce pandas and count fills per asset."""
+        rng = np.random.default_rng(max_days)
+        values = 100 + rng.random((60, 6))
+        values[rng.random(values.shape) < 0.3] = np.nan
+        values[:20, 1] = np.nan  # late listing
+        values[45:, 2] = np.nan  # delisting
+        values[:, 3] = np.nan  # no data at all
+        prices = pd.DataFrame(
+            values,
+            index=pd.bdate_range("2022-01-03", periods=60),
+            columns=list("ABCDEF"),
+        )
+        if handle_missing == "forward_fill":
+            expected = prices.ffill(limit=max_days)
+        else:
+            expected = prices.interpolate(
+                method="linear",
+                limit=max_days,
+                limit_direction="both",
+            )
+
+        config = ReturnConfig(
+            handle_missing=handle_missing,
+            max_forward_fill_days=max_days,
+        )
+        handled = return_calculator.handle_missing_data(prices, config)
+        pd.testing.assert_frame_equal(handled, expected.dropna(how="all"))
+        pd.testing.assert_series_equal(
+            return_calculator.latest_fill_counts,
+            prices.isna().sum() - expected.isna().sum(),
+        )
+
+    def test_handle_missing_without_filling(
+        self,
+        return_calculator: ReturnCalculator,
+    ) -> None:
+        """A zero ``max_forward_fill_days`` leaves every gap open."""
+        prices = pd.DataFrame(
+            {"A": [100.0, np.nan, 102.0], "B": [np.nan, 49.0, 50.0]},
+            index=pd.bdate_range("2022-01-03", periods=3),
+        )
+        config = ReturnConfig(max_forward_fill_days=0)
+        handled = return_calculator.handle_missing_data(prices, config)
+        pd.testing.assert_frame_equal(handled, prices)
+        assert return_calculator.latest_fill_counts.tolist() == [0, 0]
+
     def test_align_dates_business_days(
         self,
         return_calculator: ReturnCalculator,
@@ -432,6 +843,135 @@ class TestReturnCalculator:
         filtered = return_calculator._apply_coverage_filter(returns, min_coverage=0.75)
         assert list(filtered.columns) == ["KEEP"]
 
+    @pytest.mark.parametrize(
+        "config",
+        [
+            ReturnConfig(min_coverage=0.5, max_forward_fill_days=2),
+            ReturnConfig(method="log", handle_missing="drop", min_coverage=0.5),
+            ReturnConfig(
+                align_method="inner",
+                reindex_to_business_days=True,
+                min_coverage=0.5,
+            ),
+        ],
+    )
+    def test_extend_returns_matches_full_recompute(
+        self,
+        tmp_path: Path,
+        config: ReturnConfig,
+    ) -> None:
+        """Extending returns with new days equals preparing the full history."""
+        rng = np.random.default_rng(7)
+        dates = pd.bdate_range("2022-01-03", periods=40)
+        prices = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, (40, 3)), axis=0)),
+            index=dates,
+            columns=["A", "B", "C"],
+        )
+        prices.iloc[[5, 6, 7, 8, 31, 33], 1] = np.nan
+        prices.iloc[[30, 34], 2] = np.nan
+
+        class _Loader:
+            frame = prices
+
+            def load_multiple_prices(self, *_args):
+                return self.frame
+
+        loader = _Loader()
+        calculator = ReturnCalculator(price_loader=loader)
+        assets = [object()] * 3
+        full = calculator.load_and_prepare(assets, tmp_path, config)
+
+        loader.frame = prices.iloc[:32]
+        partial = calculator.load_and_prepare(assets, tmp_path, config)
+        extended = calculator.extend_returns(partial, prices.iloc[20:], config)
+        pd.testing.assert_frame_equal(extended, full, check_freq=False)
+        assert calculator.extend_returns(extended, prices, config) is extended
+
+    def test_extend_returns_drop_matches_full_recompute_with_gaps(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Dropped rows follow the assets of the returns, not the whole panel."""
+        rng = np.random.default_rng(11)
+        dates = pd.bdate_range("2022-01-03", periods=60)
+        panel = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, (60, 4)), axis=0)),
+            index=dates,
+            columns=["A", "B", "C", "OTHER"],
+        )
+        panel.iloc[[3, 4, 40, 41, 42, 43, 44, 45, 46, 47], 1] = np.nan
+        panel.iloc[[12, 52, 55], 2] = np.nan
+        panel.iloc[[38, 49, 50, 57], 3] = np.nan
+        prices = panel[["A", "B", "C"]]
+        config = ReturnConfig(handle_missing="drop", max_forward_fill_days=2)
+
+        class _Loader:
+            frame = prices
+
+            def load_multiple_prices(self, *_args):
+                return self.frame
+
+        loader = _Loader()
+        calculator = ReturnCalculator(price_loader=loader)
+        assets = [object()] * 3
+        full = calculator.load_and_prepare(assets, tmp_path, config)
+
+        for cut in (40, 48, 53):
+            loader.frame = prices.iloc[:cut]
+            partial = calculator.load_and_prepare(assets, tmp_path, config)
+            extended = calculator.extend_returns(partial, panel, config)
+            pd.testing.assert_frame_equal(extended, full, check_freq=False)
+
+    def test_extend_returns_rejects_resampled_returns(
+        self,
+        return_calculator: ReturnCalculator,
+        prices_df: pd.DataFrame,
+    ) -> None:
+        config = ReturnConfig(frequency="monthly")
+        with pytest.raises(ReturnCalculationError, match="daily"):
+            return_calculator.extend_returns(prices_df.pct_change(), prices_df, config)
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            ReturnConfig(),
+            ReturnConfig(method="log", frequency="weekly"),
+            ReturnConfig(method="excess", risk_free_rate=0.03, frequency="monthly"),
+        ],
+    )
+    def test_float32_precision_tracks_float64(
+        self,
+        return_calculator: ReturnCalculator,
+        config: ReturnConfig,
+    ) -> None:
+        """float32 panels take half the memory and agree to about 1e-6."""
+        rng = np.random.default_rng(3)
+        dates = pd.bdate_range("2020-01-01", periods=500)
+        prices = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.02, (500, 4)), axis=0)),
+            index=dates,
+            columns=["A", "B", "C", "D"],
+        )
+        prices.iloc[10:13, 1] = np.nan
+
+        expected = return_calculator._prepare_returns(prices, 4, config)
+        returns = return_calculator._prepare_returns(
+            prices,
+            4,
+            replace(config, precision="float32"),
+        )
+
+        assert (returns.dtypes == np.float32).all()
+        assert returns.to_numpy().nbytes * 2 == expected.to_numpy().nbytes
+        pd.testing.assert_frame_equal(
+            returns.astype(np.float64),
+            expected,
+            check_exact=False,
+            rtol=0,
+            atol=1e-6,
+        )
+
     def test_load_and_prepare_populates_summary(
         self,
         return_calculator: ReturnCalculator,
@@ -446,3 +986,375 @@ class TestReturnCalculator:
         assert isinstance(summary, ReturnSummary)
         assert "TEST.US" in summary.mean_returns.index
         assert summary.correlation.shape == (1, 1)
+
+
+class TestReturnsCache:
+    @pytest.fixture
+    def universe(
+        self,
+        tmp_path: Path,
+        sample_asset: SelectedAsset,
+    ) -> tuple[Path, list[SelectedAsset]]:
+        rng = np.random.default_rng(11)
+        prices_dir = tmp_path / "prices"
+        prices_dir.mkdir()
+        assets = []
+        for index in range(4):
+            stem = f"a{index}.us"
+            dates = pd.bdate_range("2022-01-03", periods=60)
+            keep = rng.random(dates.size) > 0.1 * index
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, dates.size)))
+            pd.DataFrame({"date": dates[keep], "close": close[keep]}).to_csv(
+                prices_dir / f"{stem}.csv",
+                index=False,
+            )
+            assets.append(
+                replace(sample_asset, symbol=stem.upper(), stooq_path=f"{stem}.txt"),
+            )
+        return prices_dir, assets
+
+    @staticmethod
+    def _counting_loader(loaded: list[str]) -> PriceLoader:
+        loader = PriceLoader(cache_size=0)
+        original = loader.load_multiple_prices
+
+        def load_multiple_prices(assets, prices_dir):
+            loaded.extend(asset.symbol for asset in assets)
+            return original(assets, prices_dir)
+
+        loader.load_multiple_prices = load_multiple_prices
+        return loader
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            ReturnConfig(min_coverage=0.5),
+            ReturnConfig(method="log", frequency="monthly", min_coverage=0.5),
+            ReturnConfig(align_method="inner", reindex_to_business_days=True),
+            ReturnConfig(min_coverage=0.5, precision="float32"),
+        ],
+    )
+    def test_cached_returns_match_fresh_computation(
+        self,
+        tmp_path: Path,
+        universe: tuple[Path, list[SelectedAsset]],
+        config: ReturnConfig,
+    ) -> None:
+        prices_dir, assets = universe
+        fresh = ReturnCalculator()
+        expected = fresh.load_and_prepare(assets, prices_dir, config)
+
+        loaded: list[str] = []
+        first = ReturnCalculator(
+            price_loader=self._counting_loader(loaded),
+            returns_cache=tmp_path / "cache",
+        )
+        pd.testing.assert_frame_equal(
+            first.load_and_prepare(assets, prices_dir, config),
+            expected,
+        )
+        # A new calculator, as in a later CLI run, loads no prices at all.
+        second = ReturnCalculator(
+            price_loader=self._counting_loader(loaded),
+            returns_cache=tmp_path / "cache",
+        )
+        cached = second.load_and_prepare(assets[::-1], prices_dir, config)
+        pd.testing.assert_frame_equal(cached, expected[cached.columns])
+        assert list(cached.columns) == [
+            asset.symbol for asset in assets[::-1] if asset.symbol in expected
+        ]
+        assert sorted(loaded) == sorted(asset.symbol for asset in assets)
+        assert second.returns_cache.stats()["hits"] == 1
+        pd.testing.assert_series_equal(
+            second.latest_summary.volatility,
+            ReturnCalculator()._summarize_returns(cached, config).volatility,
+        )
+        pd.testing.assert_series_equal(
+            second.latest_fill_counts,
+            fresh.latest_fill_counts[[asset.symbol for asset in assets[::-1]]],
+        )
+
+    def test_only_changed_assets_are_reloaded(
+        self,
+        tmp_path: Path,
+        universe: tuple[Path, list[SelectedAsset]],
+    ) -> None:
+        universe_dir, assets = universe
+        config = ReturnConfig(min_coverage=0.5)
+        loaded: list[str] = []
+        calculator = ReturnCalculator(
+            price_loader=self._counting_loader(loaded),
+            returns_cache=tmp_path / "cache",
+        )
+        calculator.load_and_prepare(assets[:3], universe_dir, config)
+
+        changed = universe_dir / "a1.us.csv"
+        changed.write_text(changed.read_text() + "2022-03-28,120.0\n")
+        loaded.clear()
+        returns = calculator.load_and_prepare(assets, universe_dir, config)
+        assert sorted(loaded) == ["A1.US", "A3.US"]
+        pd.testing.assert_frame_equal(
+            returns,
+            ReturnCalculator().load_and_prepare(assets, universe_dir, config),
+        )
+
+        loaded.clear()
+        monthly = ReturnConfig(frequency="monthly", min_coverage=0.5)
+        returns = calculator.load_and_prepare(assets, universe_dir, monthly)
+        assert loaded == []
+        pd.testing.assert_frame_equal(
+            returns,
+            ReturnCalculator().load_and_prepare(assets, universe_dir, monthly),
+        )
+        assert calculator.returns_cache.stats() == {
+            "hits": 0,
+            "misses": 3,
+            "reloaded_assets": 5,
+            "reused_assets": 6,
+        }
+
+
+class TestBlockedReturns:
+    @pytest.fixture
+    def universe(
+        self,
+        tmp_path: Path,
+        sample_asset: SelectedAsset,
+    ) -> tuple[Path, list[SelectedAsset]]:
+        rng = np.random.default_rng(7)
+        prices_dir = tmp_path / "prices"
+        prices_dir.mkdir()
+        calendar = pd.bdate_range("2022-01-03", periods=120)
+        assets = []
+        for index in range(7):
+            stem = f"b{index}.us"
+            dates = calendar[index * 6 : 120 - index * 4]
+            keep = rng.random(dates.size) > 0.05 * index
+            if index == 3:
+                # A gap longer than the fill limit.
+                keep[40:50] = False
+            if index == 5:
+                # Too short for min_periods.
+                keep[10:] = False
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, dates.size)))
+            pd.DataFrame({"date": dates[keep], "close": close[keep]}).to_csv(
+                prices_dir / f"{stem}.csv",
+                index=False,
+            )
+            assets.append(
+                replace(sample_asset, symbol=stem.upper(), stooq_path=f"{stem}.txt"),
+            )
+        return prices_dir, assets
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            ReturnConfig(min_periods=20, min_coverage=0.5),
+            ReturnConfig(handle_missing="interpolate", min_periods=20),
+            ReturnConfig(
+                align_method="inner",
+                reindex_to_business_days=True,
+                min_periods=20,
+            ),
+            ReturnConfig(method="log", frequency="monthly", min_coverage=0.5),
+            ReturnConfig(
+                frequency="weekly",
+                reindex_to_business_days=True,
+                min_periods=20,
+                precision="float32",
+            ),
+        ],
+    )
+    def test_blocked_returns_match_full_computation(
+        self,
+        tmp_path: Path,
+        universe: tuple[Path, list[SelectedAsset]],
+        config: ReturnConfig,
+    ) -> None:
+        prices_dir, assets = universe
+        full = ReturnCalculator()
+        expected = full.load_and_prepare(assets, prices_dir, config)
+
+        calculator = ReturnCalculator()
+        store = calculator.load_and_prepare_blocks(
+            assets,
+            prices_dir,
+            config,
+            tmp_path / "returns",
+            block_size=3,
+        )
+        pd.testing.assert_frame_equal(store.load(), expected, check_freq=False)
+        pd.testing.assert_series_equal(
+            calculator.latest_summary.volatility,
+            full.latest_summary.volatility,
+        )
+
+        store.to_csv(tmp_path / "blocked.csv", chunk_rows=7)
+        expected.to_csv(tmp_path / "full.csv")
+        assert (tmp_path / "blocked.csv").read_text() == (
+            tmp_path / "full.csv"
+        ).read_text()
+
+    def test_blocked_drop_uses_dates_complete_across_blocks(
+        self,
+        tmp_path: Path,
+        universe: tuple[Path, list[SelectedAsset]],
+    ) -> None:
+        prices_dir, assets = universe
+        config = ReturnConfig(handle_missing="drop", min_periods=5)
+        expected = ReturnCalculator().load_and_prepare(assets[:3], prices_dir, config)
+        store = ReturnCalculator().load_and_prepare_blocks(
+            assets[:3],
+            prices_dir,
+            config,
+            tmp_path / "returns",
+            block_size=1,
+        )
+        assert store.blocks == 3
+        pd.testing.assert_frame_equal(store.load(), expected, check_freq=False)
+
+    def test_count_prices_matches_loaded_frame(
+        self,
+        universe: tuple[Path, list[SelectedAsset]],
+    ) -> None:
+        prices_dir, assets = universe
+        loader = PriceLoader()
+        prices = loader.load_multiple_prices(assets, prices_dir)
+        counts, loaded = loader.count_prices(assets, prices_dir)
+        assert loaded == prices.shape[1]
+        pd.testing.assert_series_equal(counts, prices.notna().sum(axis=1))
+
+    @pytest.mark.parametrize(("cache_size", "hits"), [(1000, 7), (3, 3)])
+    def test_blocked_second_pass_reuses_cached_prices(
+        self,
+        tmp_path: Path,
+        universe: tuple[Path, list[SelectedAsset]],
+        cache_size: int,
+        hits: int,
+    ) -> None:
+        prices_dir, assets = universe
+        loader = PriceLoader(max_workers=1, cache_size=cache_size)
+        ReturnCalculator(price_loader=loader).load_and_prepare_blocks(
+            assets,
+            prices_dir,
+            ReturnConfig(min_periods=20),
+            tmp_path / "returns",
+            block_size=3,
+        )
+        stats = loader.get_cache_stats()
+        assert stats["hits"] == hits
+        assert stats["misses"] == 2 * len(assets) - hits
+
+    def test_store_loads_column_subsets(
+        self,
+        tmp_path: Path,
+        universe: tuple[Path, list[SelectedAsset]],
+    ) -> None:
+        prices_dir, assets = universe
+        config = ReturnConfig(min_periods=20)
+        store = ReturnCalculator().load_and_prepare_blocks(
+            assets,
+            prices_dir,
+            config,
+            tmp_path / "returns",
+            block_size=2,
+        )
+        columns = ["B2.US", "B0.US", "MISSING"]
+        pd.testing.assert_frame_equal(
+            store.load(columns),
+            store.load()[["B2.US", "B0.US"]],
+        )
+        with pytest.raises(ValueError, match="already in returns store"):
+            store.append(store.load(["B0.US"]))
+
+    def test_invalid_block_size(
+        self,
+        tmp_path: Path,
+        universe: tuple[Path, list[SelectedAsset]],
+    ) -> None:
+        prices_dir, assets = universe
+        with pytest.raises(ReturnCalculationError, match="block_size"):
+            ReturnCalculator().load_and_prepare_blocks(
+                assets,
+                prices_dir,
+                ReturnConfig(),
+                tmp_path / "returns",
+                block_size=0,
+            )
+
+
+class TestResampleCache:
+    @pytest.fixture
+    def universe(
+        self,
+        tmp_path: Path,
+        sample_asset: SelectedAsset,
+    ) -> tuple[Path, list[SelectedAsset]]:
+        rng = np.random.default_rng(5)
+        prices_dir = tmp_path / "prices"
+        prices_dir.mkdir()
+        dates = pd.bdate_range("2022-01-03", periods=90)
+        assets = []
+        for index in range(4):
+            stem = f"r{index}.us"
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, dates.size)))
+            pd.DataFrame({"date": dates, "close": close}).to_csv(
+                prices_dir / f"{stem}.csv",
+                index=False,
+            )
+            assets.append(
+                replace(sample_asset, symbol=stem.upper(), stooq_path=f"{stem}.txt"),
+            )
+        return prices_dir, assets
+
+    @pytest.mark.parametrize("method", ["simple", "log"])
+    def test_overlapping_universes_reuse_resampled_columns(
+        self,
+        universe: tuple[Path, list[SelectedAsset]],
+        method: str,
+    ) -> None:
+        prices_dir, assets = universe
+        config = ReturnConfig(method=method, frequency="monthly")
+        uncached = ReturnCalculator(resample_cache_size=0)
+        calculator = ReturnCalculator()
+
+        calculator.load_and_prepare(assets[:3], prices_dir, config)
+        returns = calculator.load_and_prepare(assets[1:], prices_dir, config)
+
+        pd.testing.assert_frame_equal(
+            returns,
+            uncached.load_and_prepare(assets[1:], prices_dir, config),
+        )
+        assert calculator.resample_cache_stats() == {
+            "entries": 1,
+            "reused_columns": 2,
+            "resampled_columns": 4,
+        }
+        assert uncached.resample_cache_stats()["entries"] == 0
+
+    def test_changed_price_file_is_resampled_again(
+        self,
+        universe: tuple[Path, list[SelectedAsset]],
+    ) -> None:
+        prices_dir, assets = universe
+        config = ReturnConfig(frequency="weekly")
+        calculator = ReturnCalculator(PriceLoader(cache_size=0))
+        calculator.load_and_prepare(assets, prices_dir, config)
+
+        changed = prices_dir / "r0.us.csv"
+        frame = pd.read_csv(changed)
+        frame["close"] *= 1 + np.linspace(0, 0.1, len(frame))
+        frame.to_csv(changed, index=False)
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        returns = calculator.load_and_prepare(assets, prices_dir, config)
+        pd.testing.assert_frame_equal(
+            returns,
+            ReturnCalculator().load_and_prepare(assets, prices_dir, config),
+        )
+        assert calculator.resample_cache_stats()["reused_columns"] == 3
+
+    def test_invalid_resample_cache_size(self) -> None:
+        with pytest.raises(ValueError, match="resample_cache_size"):
+            ReturnCalculator(resample_cache_size=-1)
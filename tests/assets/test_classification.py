@@ -1,13 +1,16 @@
 """Tests for the asset classification module."""
 
+from dataclasses import replace
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from portfolio_management.assets.classification import (
     AssetClass,
     AssetClassification,
     AssetClassifier,
+    ClassificationCache,
     ClassificationOverrides,
     Geography,
     SubClass,
@@ -221,6 +224,69 @@ class TestAssetClassifier:
         assert "asset_class" in df.columns
         assert df["asset_class"].iloc[0] == "equity"
 
+    def test_overlapping_keywords(
+        self, classifier: AssetClassifier, sample_asset: SelectedAsset
+    ) -> None:
+        """Keywords nested in longer keywords or words are all found."""
+        sample_asset.region = ""
+        sample_asset.currency = ""
+        cases = {
+            "Europe Trust": Geography.NORTH_AMERICA,  # "us" inside "trust"
+            "Eurozone Index": Geography.EUROPE,  # "eur", "de" inside "index"
+            "Jpy Hedged": Geography.ASIA_PACIFIC,  # "jp" inside "jpy"
+            "British Holdings": Geography.UNITED_KINGDOM,
+            "Plain Name": Geography.UNKNOWN,
+        }
+        for name, geography in cases.items():
+            sample_asset.name = name
+            assert classifier._classify_geography(sample_asset) == geography, name
+
+        df = classifier.classify_universe(
+            [replace(sample_asset, name=name) for name in cases]
+        )
+        assert df["geography"].tolist() == [geo.value for geo in cases.values()]
+
+    def test_classify_universe_matches_classify_asset(
+        self, classifier: AssetClassifier, sample_asset: SelectedAsset
+    ) -> None:
+        """Bulk and per-asset classification agree; sub-class precedence differs."""
+        assets = [
+            replace(sample_asset, name=name, category=category, currency=currency)
+            for name, category, currency in [
+                ("Gold Bullion Trust", "", "GBP"),
+                ("Real Estate REIT", "stock", "EUR"),
+                ("UK Government Gilt", "bond", "GBP"),
+                ("High Yield Credit", "", ""),
+                ("Silver Oil Commodity", "etf", "JPY"),
+                ("Acme Holdings", "", "PLN"),
+                ("Acme Holdings", "bond", "PLN"),
+            ]
+        ]
+        assets.append(replace(sample_asset, name=None, category=None, region=None))
+        df = classifier.classify_universe(assets)
+        for asset, (_, row) in zip(assets, df.iterrows(), strict=True):
+            single = classifier.classify_asset(asset)
+            assert row["asset_class"] == single.asset_class
+            assert row["geography"] == single.geography.value
+            assert row["confidence"] == single.confidence
+            assert row["sub_class"] == single.sub_class
+
+        mixed = replace(sample_asset, name="Large Cap Value Equity Fund")
+        assert classifier.classify_asset(mixed).sub_class == "large_cap"
+        assert classifier.classify_universe([mixed])["sub_class"].iloc[0] == "value"
+
+    def test_classify_universe_separator_in_name(
+        self, classifier: AssetClassifier, sample_asset: SelectedAsset
+    ) -> None:
+        """Names containing the scan separator are classified one by one."""
+        assets = [
+            replace(sample_asset, name="Treasury\0Bond", category=""),
+            replace(sample_asset, name="Gold", category=""),
+        ]
+        df = classifier.classify_universe(assets)
+        assert df["asset_class"].tolist() == ["fixed_income", "commodity"]
+        assert df["sub_class"].tolist() == ["government", "gold"]
+
 
 @pytest.mark.integration
 class TestClassificationOverrides:
@@ -260,3 +326,95 @@ class TestClassificationOverrides:
         content = export_path.read_text()
         assert "TEST.US" in content
         assert "large_cap" in content
+
+
+class TestClassificationCache:
+    """Tests for the ClassificationCache class."""
+
+    @pytest.fixture
+    def assets(self, sample_asset: SelectedAsset) -> list[SelectedAsset]:
+        return [
+            replace(sample_asset, symbol="EQ.US", isin="US1", name="Value Equity"),
+            replace(sample_asset, symbol="GB.UK", isin="GB1", name="UK Gilt"),
+            replace(sample_asset, symbol="AU.US", isin="US2", name="Gold", category=""),
+        ]
+
+    def test_reuses_unchanged_assets(
+        self, tmp_path: Path, assets: list[SelectedAsset]
+    ) -> None:
+        """Only new or changed assets are classified again."""
+        expected = AssetClassifier().classify_universe(assets)
+        cache = ClassificationCache(tmp_path / "cache")
+
+        first = AssetClassifier(cache=cache).classify_universe(assets)
+        pd.testing.assert_frame_equal(first, expected)
+        assert cache.stats() == {"reused_assets": 0, "classified_assets": 3}
+
+        # A fresh instance reads the entries written by the first run.
+        reloaded = ClassificationCache(tmp_path / "cache")
+        second = AssetClassifier(cache=reloaded).classify_universe(assets)
+        pd.testing.assert_frame_equal(second, expected)
+        assert reloaded.stats() == {"reused_assets": 3, "classified_assets": 0}
+
+        changed = [
+            replace(assets[0], name="Government Bond"),
+            assets[1],
+            replace(assets[2], symbol="NEW.US", isin="US3"),
+        ]
+        third = AssetClassifier(cache=reloaded).classify_universe(changed)
+        pd.testing.assert_frame_equal(
+            third, AssetClassifier().classify_universe(changed)
+        )
+        assert reloaded.stats() == {"reused_assets": 4, "classified_assets": 2}
+
+    def test_override_rows_match_uncached_run(
+        self, tmp_path: Path, assets: list[SelectedAsset]
+    ) -> None:
+        """Override rows come back with the same values and types as uncached."""
+        overrides = ClassificationOverrides(
+            overrides={"GB1": {"asset_class": "equity", "geography": "global"}}
+        )
+        expected = AssetClassifier(overrides=overrides).classify_universe(assets)
+        assert expected.loc[1, "geography"] is Geography.GLOBAL
+
+        for _ in range(2):  # the miss that writes the entries, then a hit
+            cache = ClassificationCache(tmp_path / "cache")
+            result = AssetClassifier(
+                overrides=overrides, cache=cache
+            ).classify_universe(assets)
+            pd.testing.assert_frame_equal(result, expected)
+            assert [type(value) for value in result["geography"]] == [
+                type(value) for value in expected["geography"]
+            ]
+        assert cache.stats() == {"reused_assets": 3, "classified_assets": 0}
+
+    def test_overrides_and_rules_invalidate(
+        self, tmp_path: Path, assets: list[SelectedAsset]
+    ) -> None:
+        """Changing overrides or the rules version reclassifies every asset."""
+        cache = ClassificationCache(tmp_path / "cache")
+        AssetClassifier(cache=cache).classify_universe(assets)
+
+        overrides = ClassificationOverrides(
+            overrides={"GB1": {"asset_class": "equity", "geography": "global"}}
+        )
+        result = AssetClassifier(overrides=overrides, cache=cache).classify_universe(
+            assets
+        )
+        assert cache.stats()["classified_assets"] == 6
+        assert result.loc[1, "asset_class"] == "equity"
+        assert result.loc[1, "geography"] == "global"
+        assert result.loc[1, "confidence"] == 1.0
+
+        class RevisedClassifier(AssetClassifier):
+            RULES_VERSION = AssetClassifier.RULES_VERSION + 1
+
+        RevisedClassifier(overrides=overrides, cache=cache).classify_universe(assets)
+        assert cache.stats()["classified_assets"] == 9
+        assert cache.stats()["reused_assets"] == 0
+
+        # The default rules are classified again by a classifier given the
+        # cache directory, then reused by the original cache instance.
+        AssetClassifier(cache=str(tmp_path / "cache")).classify_universe(assets)
+        AssetClassifier(cache=cache).classify_universe(assets)
+        assert cache.stats() == {"reused_assets": 3, "classified_assets": 9}
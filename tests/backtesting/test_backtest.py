@@ -17,8 +17,10 @@ from portfolio_management.backtesting.engine import (
 )
 from portfolio_management.backtesting.models import PerformanceMetrics
 from portfolio_management.core.exceptions import InvalidBacktestConfigError
+from portfolio_management.portfolio import PortfolioResultCache
 from portfolio_management.portfolio.strategies import (
     EqualWeightStrategy,
+    MeanVarianceStrategy,
     PortfolioStrategy,
     RiskParityStrategy,
 )
@@ -88,6 +90,25 @@ class TestBacktestConfig:
                 end_date=date(2020, 1, 1),
             )
 
+    def test_negative_trade_aversion(self) -> None:
+        """Test that a negative trade aversion raises error."""
+        with pytest.raises(InvalidBacktestConfigError):
+            BacktestConfig(
+                start_date=date(2020, 1, 1),
+                end_date=date(2023, 12, 31),
+                cost_aware_rebalancing=True,
+                trade_aversion=-1.0,
+            )
+
+    def test_invalid_precision(self) -> None:
+        """Test that an unsupported precision raises error."""
+        with pytest.raises(InvalidBacktestConfigError):
+            BacktestConfig(
+                start_date=date(2020, 1, 1),
+                end_date=date(2023, 12, 31),
+                precision="float16",
+            )
+
     def test_negative_capital(self) -> None:
         """Test that negative capital raises error."""
         with pytest.raises(InvalidBacktestConfigError):
@@ -344,6 +365,111 @@ class TestBacktestEngine:
         assert metrics.max_drawdown <= 0  # Drawdown is negative
         assert metrics.num_rebalances > 0
 
+    def test_result_cache_reuses_portfolios(
+        self,
+        sample_data: tuple[pd.DataFrame, pd.DataFrame],
+    ) -> None:
+        """A second run with a shared result cache constructs nothing."""
+        prices, returns = sample_data
+        config = BacktestConfig(
+            start_date=date(2020, 1, 1),
+            end_date=date(2020, 12, 31),
+            rebalance_frequency=RebalanceFrequency.MONTHLY,
+        )
+        cache = PortfolioResultCache()
+
+        curves = []
+        for _ in range(2):
+            engine = BacktestEngine(
+                config=config,
+                strategy=EqualWeightStrategy(),
+                prices=prices,
+                returns=returns,
+                result_cache=cache,
+            )
+            equity_curve, metrics, _ = engine.run()
+            curves.append(equity_curve)
+
+        stats = cache.get_stats()
+        assert stats["misses"] == metrics.num_rebalances
+        assert stats["hits"] == metrics.num_rebalances
+        pd.testing.assert_frame_equal(curves[0], curves[1])
+
+    def test_cost_aware_rebalancing_reduces_costs(
+        self,
+        sample_data: tuple[pd.DataFrame, pd.DataFrame],
+    ) -> None:
+        """Penalising turnover lowers the transaction costs paid."""
+        prices, returns = sample_data
+        total_costs = {}
+        for cost_aware in (False, True):
+            config = BacktestConfig(
+                start_date=date(2020, 6, 1),
+                end_date=date(2021, 6, 30),
+                rebalance_frequency=RebalanceFrequency.MONTHLY,
+                commission_pct=0.002,
+                slippage_bps=20.0,
+                cost_aware_rebalancing=cost_aware,
+                trade_aversion=5.0,
+            )
+            engine = BacktestEngine(
+                config=config,
+                strategy=MeanVarianceStrategy(
+                    objective="min_volatility",
+                    min_periods=60,
+                ),
+                prices=prices,
+                returns=returns,
+            )
+            _, _, events = engine.run()
+            assert (engine.turnover_cost_model is not None) == cost_aware
+            total_costs[cost_aware] = sum(event.costs for event in events[1:])
+        assert total_costs[True] < total_costs[False]
+
+    def test_float32_precision_tracks_float64(
+        self,
+        sample_data: tuple[pd.DataFrame, pd.DataFrame],
+    ) -> None:
+        """float32 panels halve memory and barely move the equity curve."""
+        prices, returns = sample_data
+
+        class _RecordingStrategy(RiskParityStrategy):
+            def construct(self, returns, constraints, asset_classes=None):
+                self.dtypes.update(returns.dtypes.astype(str))
+                return super().construct(returns, constraints, asset_classes)
+
+        curves = {}
+        for precision in ("float64", "float32"):
+            config = BacktestConfig(
+                start_date=date(2020, 6, 1),
+                end_date=date(2021, 6, 30),
+                rebalance_frequency=RebalanceFrequency.MONTHLY,
+                precision=precision,
+            )
+            strategy = _RecordingStrategy(min_periods=60)
+            strategy.dtypes = set()
+            engine = BacktestEngine(
+                config=config,
+                strategy=strategy,
+                prices=prices,
+                returns=returns,
+            )
+            assert (engine.returns.dtypes == precision).all()
+            curves[precision], _, _ = engine.run()
+            # Optimisers always see float64 inputs.
+            assert strategy.dtypes == {"float64"}
+
+        assert (
+            engine.prices.memory_usage(index=False).sum() * 2
+            == prices.memory_usage(index=False).sum()
+        )
+        pd.testing.assert_frame_equal(
+            curves["float32"],
+            curves["float64"],
+            check_exact=False,
+            rtol=1e-4,
+        )
+
 
 @pytest.mark.integration
 class TestPITEligibility:
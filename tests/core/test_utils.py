@@ -1,13 +1,20 @@
-"""Tests for concurrency utilities in utils module."""
+"""Tests for concurrency and file utilities in utils module."""
 
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from portfolio_management.core.utils import _run_in_parallel
+from portfolio_management.core.utils import (
+    _run_in_parallel,
+    atomic_write,
+    resolve_executor,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def simple_task(x: int) -> int:
@@ -281,5 +288,108 @@ class TestRunInParallel:
         assert "failed" in caplog.text.lower() or "error" in caplog.text.lower()
 
 
+class TestProcessExecutor:
+    """Tests for the process-pool execution mode of _run_in_parallel."""
+
+    @pytest.mark.parametrize("chunksize", [None, 1, 3, 100])
+    def test_results_match_threads(self, chunksize: int | None) -> None:
+        """Chunked process execution returns results in task order."""
+        args = [(i,) for i in range(20)]
+        results = _run_in_parallel(
+            simple_task,
+            args,
+            max_workers=2,
+            executor="process",
+            chunksize=chunksize,
+        )
+        assert results == [i * 2 for i in range(20)]
+
+    def test_unordered_results(self) -> None:
+        """All results are returned when order is not preserved."""
+        args = [(i,) for i in range(10)]
+        results = _run_in_parallel(
+            simple_task,
+            args,
+            max_workers=2,
+            preserve_order=False,
+            executor="process",
+            chunksize=2,
+        )
+        assert sorted(results) == [i * 2 for i in range(10)]
+
+    def test_error_reports_task_index(self) -> None:
+        """A failure inside a chunk is reported with its task index."""
+        args = [(1,), (2,), (3,), (-4,), (5,)]
+        with pytest.raises(RuntimeError, match="Task 3 failed") as exc_info:
+            _run_in_parallel(
+                failing_task,
+                args,
+                max_workers=2,
+                executor="process",
+                chunksize=2,
+            )
+        assert isinstance(exc_info.value.__cause__, ValueError)
+
+    def test_error_logs_worker_traceback(
+        self,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """The log of a failed chunk keeps the traceback from the worker."""
+        args = [(1,), (-2,)]
+        with caplog.at_level(logging.ERROR), pytest.raises(RuntimeError):
+            _run_in_parallel(
+                failing_task,
+                args,
+                max_workers=2,
+                executor="process",
+                chunksize=1,
+            )
+        assert "Task 1 failed" in caplog.text
+        assert "in failing_task\n    raise ValueError" in caplog.text
+
+    def test_resolve_executor(self) -> None:
+        """Auto picks processes only for large multi-worker workloads."""
+        assert resolve_executor("thread", 10_000, 8) == "thread"
+        assert resolve_executor("auto", 10, 8) == "thread"
+        assert resolve_executor("auto", 10_000, 1) == "thread"
+        with pytest.raises(ValueError, match="Invalid executor"):
+            resolve_executor("fiber", 10, 2)
+
+    def test_invalid_executor_rejected(self) -> None:
+        """An unknown executor name is rejected before running anything."""
+        with pytest.raises(ValueError, match="Invalid executor"):
+            _run_in_parallel(simple_task, [(1,)], max_workers=2, executor="fiber")
+
+
+class TestAtomicWrite:
+    """Tests for the atomic_write context manager."""
+
+    def test_replaces_file(self, tmp_path: Path) -> None:
+        """The written temporary file replaces the target."""
+        target = tmp_path / "state.json"
+        target.write_text("old", encoding="utf-8")
+        with atomic_write(target) as tmp:
+            assert tmp.parent == target.parent
+            tmp.write_text("new", encoding="utf-8")
+            assert target.read_text(encoding="utf-8") == "old"
+        assert target.read_text(encoding="utf-8") == "new"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failure_keeps_file(self, tmp_path: Path) -> None:
+        """A failing block leaves the target untouched and no temporary file."""
+        target = tmp_path / "state.json"
+        target.write_text("old", encoding="utf-8")
+
+        def write_partially() -> None:
+            with atomic_write(target) as tmp:
+                tmp.write_text("partial", encoding="utf-8")
+                raise RuntimeError("interrupted")
+
+        with pytest.raises(RuntimeError):
+            write_partially()
+        assert target.read_text(encoding="utf-8") == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
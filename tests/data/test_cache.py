@@ -240,4 +240,89 @@ def test_create_cache_metadata(tmp_path: Path) -> None:
     assert "tradeable_hash" in metadata
     assert "stooq_index_hash" in metadata
     assert len(metadata["tradeable_hash"]) == 64
-    assert len(metadata["stooq_index_hash"]) == 64
\ No newline at end of file
+    assert len(metadata["stooq_index_hash"]) == 64
+
+
+@pytest.mark.integration
+def test_file_fingerprint_missing(tmp_path: Path) -> None:
+    """Test that missing files have no fingerprint."""
+    assert cache.file_fingerprint(tmp_path / "missing.txt") is None
+
+
+@pytest.mark.integration
+def test_diagnostics_manifest_lookup_and_roundtrip(tmp_path: Path) -> None:
+    """Test that unchanged files hit and changed files miss after reload."""
+    price_file = tmp_path / "a.txt"
+    price_file.write_text("1")
+    manifest = cache.DiagnosticsManifest()
+
+    entry, fingerprint = manifest.lookup("a.txt", price_file)
+    assert entry is None
+    manifest.record("a.txt", fingerprint, {"data_status": "ok"}, {"exported": True})
+    manifest_path = tmp_path / "manifest.json"
+    manifest.save(manifest_path)
+
+    reloaded = cache.DiagnosticsManifest.load(manifest_path)
+    entry, _ = reloaded.lookup("a.txt", price_file)
+    assert entry is not None
+    assert entry["diagnostics"] == {"data_status": "ok"}
+    assert entry["export"] == {"exported": True}
+
+    time.sleep(0.01)
+    price_file.write_text("22")
+    entry, _ = reloaded.lookup("a.txt", price_file)
+    assert entry is None
+
+
+@pytest.mark.integration
+def test_diagnostics_manifest_content_hash(tmp_path: Path) -> None:
+    """Test that content hashing ignores touches that do not change contents."""
+    price_file = tmp_path / "a.txt"
+    price_file.write_text("1")
+    manifest = cache.DiagnosticsManifest(content_hash=True)
+    _, fingerprint = manifest.lookup("a.txt", price_file)
+    assert "sha256" in fingerprint
+    manifest.record("a.txt", fingerprint, {"data_status": "ok"})
+
+    time.sleep(0.01)
+    price_file.write_text("1")
+    entry, _ = manifest.lookup("a.txt", price_file)
+    assert entry is not None
+
+    plain = cache.DiagnosticsManifest(manifest.entries)
+    assert plain.lookup("a.txt", price_file)[0] is None
+
+
+def test_diagnostics_manifest_invalidate(tmp_path: Path) -> None:
+    """Test invalidated files miss by stat but still match by content digest."""
+    price_file = tmp_path / "a.txt"
+    price_file.write_text("1")
+    manifest = cache.DiagnosticsManifest()
+    _, fingerprint = manifest.lookup("a.txt", price_file)
+    manifest.record("a.txt", fingerprint, {"data_status": "ok"}, {"exported": True})
+
+    manifest.invalidate(["a.txt", "missing.txt"])
+    assert manifest.lookup("a.txt", price_file)[0] is None
+    assert manifest.entries["a.txt"]["export"] == {"exported": True}
+
+    hashed = cache.DiagnosticsManifest(content_hash=True)
+    _, fingerprint = hashed.lookup("a.txt", price_file)
+    hashed.record("a.txt", fingerprint, {"data_status": "ok"})
+    hashed.invalidate(["a.txt"])
+    assert hashed.lookup("a.txt", price_file)[0] is not None
+
+
+@pytest.mark.integration
+def test_diagnostics_manifest_prune_and_invalid_file(tmp_path: Path) -> None:
+    """Test pruning and that unreadable manifests load empty."""
+    manifest = cache.DiagnosticsManifest(
+        {"a.txt": {}, "b.txt": {}},
+    )
+    assert manifest.prune(["a.txt"]) == 1
+    assert list(manifest.entries) == ["a.txt"]
+
+    bad_path = tmp_path / "manifest.json"
+    bad_path.write_text("{not json")
+    assert len(cache.DiagnosticsManifest.load(bad_path)) == 0
+    bad_path.write_text('{"version": 999, "entries": {"a.txt": {}}}')
+    assert len(cache.DiagnosticsManifest.load(bad_path)) == 0
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from portfolio_management.data.io.fast_io import (
     get_available_backends,
     is_backend_available,
+    read_csv_columns,
     read_csv_fast,
     select_backend,
 )
@@ -162,3 +164,43 @@ def test_backend_consistency(sample_csv: Path):
             df_other,
             check_dtype=False,  # Allow dtype differences between backends
         )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("backend", ["pandas", "pyarrow", "polars"])
+def test_read_csv_columns_explicit_types(sample_csv: Path, backend: str):
+    """Selected columns decode to typed arrays on every backend."""
+    if not is_backend_available(backend):
+        pytest.skip(f"{backend} not installed")
+    arrays = read_csv_columns(
+        sample_csv,
+        {"date": "date", "volume": "int64", "close": "float64"},
+        backend=backend,
+    )
+
+    assert list(arrays) == ["date", "volume", "close"]
+    assert arrays["date"].dtype == "datetime64[ns]"
+    assert arrays["date"][-1] == np.datetime64("2022-01-03")
+    assert arrays["volume"].tolist() == [1000, 1200, 1100]
+    assert arrays["close"].tolist() == [100.0, 101.5, 102.3]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("backend", ["pandas", "pyarrow", "polars"])
+def test_read_csv_columns_rejects_bad_values(tmp_path: Path, backend: str):
+    """Missing int or date fields and absent columns raise ValueError."""
+    if not is_backend_available(backend):
+        pytest.skip(f"{backend} not installed")
+    path = tmp_path / "gaps.csv"
+    path.write_text("date,close,volume\n2022-01-03,,\n,1.0,5\n")
+
+    for columns in (
+        {"volume": "int64"},
+        {"date": "date"},
+        {"missing": "float64"},
+    ):
+        with pytest.raises(ValueError):
+            read_csv_columns(path, columns, backend=backend)
+    assert np.isnan(
+        read_csv_columns(path, {"close": "float64"}, backend=backend)["close"][0]
+    )
@@ -0,0 +1,167 @@
+"""Tests for the persistent Stooq index store and incremental rescans."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from portfolio_management.core.exceptions import DataDirectoryNotFoundError
+from portfolio_management.data import ingestion
+from portfolio_management.data.ingestion import (
+    UNTRUSTED_MTIME,
+    build_stooq_index,
+    update_stooq_index,
+)
+from portfolio_management.data.io import StooqIndexStore
+from portfolio_management.data.models import StooqFile
+
+FIXTURES_ROOT = Path(__file__).resolve().parent.parent / "fixtures"
+STOOQ_FIXTURES = FIXTURES_ROOT / "stooq"
+
+OLD_MTIME_NS = 1_600_000_000 * 1_000_000_000
+
+
+def _make_tree(root: Path) -> Path:
+    data_dir = root / "stooq"
+    for rel_path in (
+        "daily/us/nasdaq stocks/1/aapl.us.txt",
+        "daily/us/nasdaq stocks/1/msft.us.txt",
+        "daily/us/nyse etfs/spy.us.txt",
+        "daily/pl/wse stocks/pkn.txt",
+        "daily/pl/wse stocks/.hidden.txt",
+        "daily/.cache/ignored.txt",
+        "top.txt",
+    ):
+        path = data_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("<TICKER>\n")
+    _age_directories(data_dir)
+    return data_dir
+
+
+def _age_directories(data_dir: Path, offset: int = 0) -> None:
+    """Move directory mtimes out of the racy window."""
+    for index, path in enumerate(
+        sorted([data_dir, *(p for p in data_dir.rglob("*") if p.is_dir())]),
+    ):
+        mtime_ns = OLD_MTIME_NS + offset + index * 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _count_listings(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    listed: list[Path] = []
+    original = ingestion._list_directory
+
+    def counting(path: Path, **kwargs):
+        listed.append(path)
+        return original(path, **kwargs)
+
+    monkeypatch.setattr(ingestion, "_list_directory", counting)
+    return listed
+
+
+class TestStooqIndexStore:
+    """Tests for the SQLite-backed index store."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Entries and directory mtimes are stored and loaded back."""
+        store = StooqIndexStore(tmp_path / "index.sqlite")
+        entries = [
+            StooqFile("AAPL.US", "AAPL.US", "daily/us/aapl.us.txt", "us", ""),
+            StooqFile("PKN", "PKN", "daily/pl/wse/pkn.txt", "pl", "wse"),
+        ]
+        store.save(tmp_path, entries, {"": 1, "daily": 2})
+
+        assert store.load_entries(tmp_path) == sorted(
+            entries,
+            key=lambda entry: entry.rel_path,
+        )
+        assert store.load_directories(tmp_path) == {"": 1, "daily": 2}
+
+    def test_unusable_store_reads_as_missing(self, tmp_path: Path) -> None:
+        """Missing, foreign-root and corrupt stores load as None."""
+        store = StooqIndexStore(tmp_path / "index.sqlite")
+        assert store.load_entries(tmp_path) is None
+
+        store.save(tmp_path, [], {"": 1})
+        other_root = tmp_path / "other"
+        other_root.mkdir()
+        assert store.load_entries(other_root) is None
+        assert store.load_directories(other_root) == {}
+
+        store.path.write_bytes(b"not a database")
+        assert store.load_entries(tmp_path) is None
+
+
+class TestUpdateStooqIndex:
+    """Tests for incremental rescans of the Stooq tree."""
+
+    def test_matches_full_scan_on_fixtures(self, tmp_path: Path) -> None:
+        """A first scan and a rescan both reproduce build_stooq_index."""
+        expected = build_stooq_index(STOOQ_FIXTURES, max_workers=4)
+        store = StooqIndexStore(tmp_path / "index.sqlite")
+
+        assert update_stooq_index(STOOQ_FIXTURES, store, max_workers=4) == expected
+        assert update_stooq_index(STOOQ_FIXTURES, store, max_workers=4) == expected
+        assert store.load_entries(STOOQ_FIXTURES) == expected
+
+    def test_rescan_lists_only_changed_directories(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Unchanged directories reuse their stored listing."""
+        data_dir = _make_tree(tmp_path)
+        store = tmp_path / "index.sqlite"
+        first = update_stooq_index(data_dir, store, max_workers=2)
+        assert first == build_stooq_index(data_dir, max_workers=2)
+
+        listed = _count_listings(monkeypatch)
+        assert update_stooq_index(data_dir, store, max_workers=2) == first
+        assert listed == []
+
+        added_to = data_dir / "daily" / "us" / "nyse etfs"
+        removed_from = data_dir / "daily" / "pl" / "wse stocks"
+        (added_to / "qqq.us.txt").write_text("<TICKER>\n")
+        (removed_from / "pkn.txt").unlink()
+        for path in (added_to, removed_from):
+            os.utime(path, ns=(OLD_MTIME_NS - 1, OLD_MTIME_NS - 1))
+
+        entries = update_stooq_index(data_dir, store, max_workers=2)
+        assert sorted(listed) == sorted([added_to, removed_from])
+        assert entries == build_stooq_index(data_dir, max_workers=2)
+        assert "daily/us/nyse etfs/qqq.us.txt" in {e.rel_path for e in entries}
+        assert "daily/pl/wse stocks/pkn.txt" not in {e.rel_path for e in entries}
+
+    def test_new_subdirectory_is_scanned(self, tmp_path: Path) -> None:
+        """Directories created since the last scan are picked up."""
+        data_dir = _make_tree(tmp_path)
+        store = StooqIndexStore(tmp_path / "index.sqlite")
+        update_stooq_index(data_dir, store)
+
+        new_dir = data_dir / "daily" / "uk" / "lse stocks"
+        new_dir.mkdir(parents=True)
+        (new_dir / "vod.uk.txt").write_text("<TICKER>\n")
+        _age_directories(data_dir, offset=500_000_000)
+
+        entries = update_stooq_index(data_dir, store)
+        assert entries == build_stooq_index(data_dir)
+        assert "daily/uk" in store.load_directories(data_dir)
+
+    def test_recent_directories_are_not_trusted(self, tmp_path: Path) -> None:
+        """Directories modified within the racy window are re-listed next time."""
+        data_dir = _make_tree(tmp_path)
+        (data_dir / "daily" / "us" / "nyse etfs" / "qqq.us.txt").write_text("x\n")
+        store = StooqIndexStore(tmp_path / "index.sqlite")
+        update_stooq_index(data_dir, store)
+
+        mtimes = store.load_directories(data_dir)
+        assert mtimes["daily/us/nyse etfs"] == UNTRUSTED_MTIME
+        assert mtimes["daily/us"] != UNTRUSTED_MTIME
+
+    def test_missing_directory_raises(self, tmp_path: Path) -> None:
+        """A missing Stooq root is reported like build_stooq_index does."""
+        with pytest.raises(DataDirectoryNotFoundError):
+            update_stooq_index(tmp_path / "missing", tmp_path / "index.sqlite")
@@ -0,0 +1,98 @@
+"""Tests for the batched tradeable matching engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from portfolio_management.data.matching import (
+    build_stooq_lookup,
+    candidate_tickers,
+    match_tradeables,
+    suffix_to_extensions,
+)
+from portfolio_management.data.models import StooqFile, TradeableInstrument
+
+
+def _entry(ticker: str, stem: str | None = None) -> StooqFile:
+    return StooqFile(ticker, stem or ticker, f"daily/{ticker.lower()}.txt")
+
+
+def _instrument(symbol: str, market: str = "") -> TradeableInstrument:
+    return TradeableInstrument(symbol, "", market, symbol, "", "broker.csv")
+
+
+@pytest.fixture
+def lookup():
+    return build_stooq_lookup(
+        [
+            _entry("AAPL.US"),
+            _entry("VOD.UK"),
+            _entry("META.US"),
+            _entry("QOLD.US"),
+            _entry("SAN.PA"),
+            _entry("SAN.FR"),
+            _entry("CDR.PL", stem="CDR"),
+            _entry("NOVN.CH"),
+            _entry("DUP.US"),
+            _entry("DUP.UK"),
+            _entry("IDX"),
+        ],
+    )
+
+
+def test_match_tradeables_strategies(lookup) -> None:
+    tradeables = [
+        _instrument("AAPL:US"),
+        _instrument("aapl", "NASDAQ"),
+        _instrument("VOD.L"),
+        _instrument("FB:US"),
+        _instrument("OLD", "NYSE"),
+        _instrument("SAN", "Euronext Paris"),
+        _instrument("CDR:XX", "Tokyo"),
+        _instrument("NOVN", "Unknown"),
+        _instrument("DUP", "Unknown"),
+        _instrument("IDX"),
+        _instrument("  "),
+    ]
+
+    matches, unmatched = match_tradeables(tradeables, *lookup)
+
+    assert [
+        (match.instrument.symbol, match.matched_ticker, match.strategy)
+        for match in matches
+    ] == [
+        ("AAPL:US", "AAPL.US", "ticker"),
+        ("aapl", "AAPL.US", "base_market"),
+        ("VOD.L", "VOD.UK", "ticker"),
+        ("FB:US", "META.US", "ticker"),
+        ("OLD", "QOLD.US", "base_market"),
+        ("SAN", "SAN.PA", "base_market"),
+        ("CDR:XX", "CDR.PL", "base_market"),
+        ("NOVN", "NOVN.CH", "base_market"),
+        ("IDX", "IDX", "ticker"),
+    ]
+    assert [(inst.symbol, inst.reason) for inst in unmatched] == [
+        ("DUP", "ambiguous_variants"),
+        ("  ", "missing_symbol"),
+    ]
+
+
+def test_match_tradeables_follows_candidate_order(lookup) -> None:
+    tradeables = [_instrument(symbol, "NASDAQ") for symbol in ("AAPL", "FB", "OLD")]
+
+    matches, _unmatched = match_tradeables(tradeables, *lookup)
+
+    by_ticker = lookup[0]
+    for match in matches:
+        first_hit = next(
+            candidate
+            for candidate in candidate_tickers(match.instrument.symbol, "NASDAQ")
+            if candidate in by_ticker
+        )
+        assert match.matched_ticker == first_hit
+
+
+def test_suffix_to_extensions_prefers_suffix_then_market() -> None:
+    assert tuple(suffix_to_extensions("ln", "NASDAQ")) == (".UK",)
+    assert tuple(suffix_to_extensions("", "Euronext Amsterdam")) == (".NL", ".AS")
+    assert tuple(suffix_to_extensions("XX", "")) == ("",)
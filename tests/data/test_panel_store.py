@@ -0,0 +1,117 @@
+"""Tests for the consolidated close-price panel store."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_management.data.io import PricePanelStore
+
+
+def _series(dates: list[str], values: list[float]) -> pd.Series:
+    return pd.Series(values, index=pd.to_datetime(dates), name="close")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> PricePanelStore:
+    store = PricePanelStore(tmp_path / "panel")
+    store.write(
+        {
+            "bbb.us": _series(["2024-01-03", "2024-01-05"], [20.0, 21.0]),
+            "aaa.us": _series(["2024-01-02", "2024-01-03"], [10.0, 11.0]),
+            "empty.us": pd.Series(dtype="float64"),
+        },
+    )
+    return store
+
+
+def test_layout(store: PricePanelStore) -> None:
+    """Tickers are sorted columns; each ticker's history is contiguous."""
+    assert store.tickers == ["aaa.us", "bbb.us"]
+    assert list(store.dates.strftime("%Y-%m-%d")) == [
+        "2024-01-02",
+        "2024-01-03",
+        "2024-01-05",
+    ]
+    matrix = np.load(store.path / "close.npy", mmap_mode="r")
+    assert matrix.flags.f_contiguous
+    assert "empty.us" not in store
+
+
+def test_load_subsets(store: PricePanelStore) -> None:
+    """Rows without a price for any requested ticker are dropped."""
+    frame = store.load(["bbb.us"])
+    pd.testing.assert_series_equal(
+        frame["bbb.us"],
+        _series(["2024-01-03", "2024-01-05"], [20.0, 21.0]).rename_axis("date"),
+        check_names=False,
+        check_freq=False,
+    )
+
+    both = store.load(["aaa.us", "bbb.us", "missing"], end="2024-01-03")
+    assert list(both.columns) == ["aaa.us", "bbb.us"]
+    assert both.loc["2024-01-02", "aaa.us"] == 10.0
+    assert np.isnan(both.loc["2024-01-02", "bbb.us"])
+    assert len(both) == 2
+
+
+def test_rewrite_replaces_panel(store: PricePanelStore) -> None:
+    """Writing again replaces the data seen by the same instance."""
+    store.load(["aaa.us"])
+    store.write({"ccc.us": _series(["2024-02-01"], [5.0])})
+    assert store.tickers == ["ccc.us"]
+    assert store.load(["aaa.us"]).empty
+
+
+def test_missing_or_inconsistent_panel(tmp_path: Path) -> None:
+    store = PricePanelStore(tmp_path / "panel")
+    assert not store.exists()
+    with pytest.raises(FileNotFoundError):
+        store.load(["aaa.us"])
+
+    store.write({"aaa.us": _series(["2024-01-02"], [1.0])})
+    index_path = store.path / "index.json"
+    index = json.loads(index_path.read_text())
+    index["tickers"].append("bbb.us")
+    index_path.write_text(json.dumps(index))
+    with pytest.raises(ValueError, match="Inconsistent"):
+        PricePanelStore(store.path).load(["aaa.us"])
+
+
+def test_append_adds_segment(store: PricePanelStore) -> None:
+    """Appended rows are served with the matrix until the next full write."""
+    store.write(
+        {
+            "aaa.us": _series(["2024-01-02", "2024-01-03"], [10.0, 11.0]),
+            "bbb.us": _series(["2024-01-03", "2024-01-05"], [20.0, 21.0]),
+        },
+        {"aaa.us": {"offset": 1}},
+    )
+    # aaa.us lagged: its 2024-01-05 price arrives with the next day.
+    store.append(
+        {
+            "aaa.us": _series(["2024-01-05", "2024-01-08"], [12.0, 13.0]),
+            "bbb.us": _series(["2024-01-08"], [22.0]),
+        },
+        {"aaa.us": {"offset": 2}, "bbb.us": {"offset": 3}},
+    )
+    assert store.segments == 1
+    assert store.sources == {"aaa.us": {"offset": 2}, "bbb.us": {"offset": 3}}
+    assert list(store.dates.strftime("%d")) == ["02", "03", "05", "08"]
+
+    frame = PricePanelStore(store.path).load(["aaa.us", "bbb.us"], start="2024-01-03")
+    assert frame.index.is_monotonic_increasing
+    assert frame["aaa.us"].tolist() == [11.0, 12.0, 13.0]
+    assert frame["bbb.us"].tolist() == [20.0, 21.0, 22.0]
+
+    with pytest.raises(ValueError, match="not in price panel"):
+        store.append({"ccc.us": _series(["2024-01-09"], [1.0])})
+
+    store.write({"aaa.us": _series(["2024-01-02"], [10.0])})
+    assert store.segments == 0
+    assert store.sources == {}
+    assert not list(store.path.glob("close.*.npy"))
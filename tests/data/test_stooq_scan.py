@@ -0,0 +1,108 @@
+"""Tests for the vectorized Stooq diagnostics scanner."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from portfolio_management.data.analysis.analysis import (
+    _scan_stooq_file_for_diagnostics,
+    _stream_stooq_file_for_diagnostics,
+)
+from portfolio_management.data.analysis.stooq_scan import scan_stooq_file
+
+FIXTURES_ROOT = Path(__file__).resolve().parent.parent / "fixtures"
+STOOQ_FIXTURES = FIXTURES_ROOT / "stooq"
+
+HEADER = "<TICKER>,<PER>,<DATE>,<TIME>,<OPEN>,<HIGH>,<LOW>,<CLOSE>,<VOL>,<OPENINT>"
+
+
+def _row(date: str, close: str = "10.5", volume: str = "100") -> str:
+    return f"AAA.US,D,{date},000000,10,11,9,{close},{volume},0"
+
+
+def _write(tmp_path: Path, lines: list[str], terminator: str = "\n") -> Path:
+    path = tmp_path / "aaa.us.txt"
+    path.write_bytes((terminator.join(lines) + terminator).encode())
+    return path
+
+
+@pytest.mark.slow
+def test_matches_pandas_diagnostics_on_fixtures() -> None:
+    """Every fixture the scanner accepts yields the pandas diagnostics."""
+    scanned = 0
+    for path in sorted(STOOQ_FIXTURES.rglob("*.txt")):
+        result = _scan_stooq_file_for_diagnostics(path)
+        if result is None:
+            continue
+        scanned += 1
+        assert result == _stream_stooq_file_for_diagnostics(path), path
+    assert scanned > 400
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        [HEADER, _row("20200102"), _row("20200103", "0.000", "0")],
+        [HEADER, _row("20200103"), _row("20200102", "-1"), _row("20200103")],
+        [_row("20200102"), "", _row("20200102", ".5", "0.0")],
+        [HEADER, _row("20200229")],
+    ],
+)
+@pytest.mark.parametrize("terminator", ["\n", "\r\n"])
+def test_matches_pandas_diagnostics(
+    tmp_path: Path,
+    lines: list[str],
+    terminator: str,
+) -> None:
+    """Flags, ordering and duplicate checks agree with the pandas reader."""
+    path = _write(tmp_path, lines, terminator)
+    result = _scan_stooq_file_for_diagnostics(path)
+    assert result is not None
+    assert result == _stream_stooq_file_for_diagnostics(path)
+
+
+def test_scan_statistics(tmp_path: Path) -> None:
+    """The scan reports first/last dates and per-row counts."""
+    path = _write(
+        tmp_path,
+        [
+            HEADER,
+            _row("20200103", "0", "0"),
+            _row("20200102", "-2.5", "10"),
+            _row("20200102", "3", "0.00"),
+        ],
+    )
+    scan = scan_stooq_file(path)
+    assert scan is not None
+    assert (scan.rows, scan.start_iso, scan.end_iso) == (3, "2020-01-03", "2020-01-02")
+    assert (scan.non_positive_close, scan.zero_volume) == (2, 2)
+    assert scan.duplicate_dates
+    assert scan.non_monotonic_dates
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        [HEADER],
+        [_row("2020010")],
+        [_row("20200230")],
+        [_row("20200102", "1e5")],
+        [_row("20200102", volume="")],
+        [_row("20200102", " 10")],
+        [_row("20200102") + ",extra"],
+        [_row("20200102", "10<")],
+        ["date,close,volume,ticker,per,time,open,high,low,openint"],
+    ],
+)
+def test_irregular_files_fall_back(tmp_path: Path, lines: list[str]) -> None:
+    """Anything the pandas reader handles specially is left to it."""
+    assert scan_stooq_file(_write(tmp_path, lines)) is None
+
+
+def test_empty_file_falls_back(tmp_path: Path) -> None:
+    """Empty files cannot be mapped and go through the pandas reader."""
+    path = tmp_path / "empty.txt"
+    path.touch()
+    assert scan_stooq_file(path) is None
@@ -0,0 +1,105 @@
+"""Tests for the input watchers behind ``prepare_tradeable_data.py --watch``."""
+
+from __future__ import annotations
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from portfolio_management.data.watch import (
+    ChangeSet,
+    InotifyWatcher,
+    PollingWatcher,
+    open_watcher,
+)
+
+
+def _inotify(data_dir: Path, tradeable_dir: Path) -> InotifyWatcher:
+    try:
+        return InotifyWatcher(data_dir, tradeable_dir)
+    except (OSError, AttributeError) as exc:
+        pytest.skip(f"inotify unavailable: {exc}")
+
+
+def _polling(data_dir: Path, tradeable_dir: Path) -> PollingWatcher:
+    return PollingWatcher(data_dir, tradeable_dir, interval=0.01)
+
+
+def _bump_mtime(path: Path) -> None:
+    # Coarse filesystem timestamps could hide a rewrite within one tick.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> tuple[Path, Path]:
+    data_dir = tmp_path / "stooq"
+    (data_dir / "daily" / "us" / "etfs").mkdir(parents=True)
+    (data_dir / "daily" / "us" / "etfs" / "aaa.us.txt").write_text("<TICKER>\n")
+    (data_dir / "daily" / "us" / "etfs" / "bbb.us.txt").write_text("<TICKER>\n")
+    tradeable_dir = tmp_path / "tradeable"
+    tradeable_dir.mkdir()
+    (tradeable_dir / "broker.csv").write_text("symbol\n")
+    return data_dir, tradeable_dir
+
+
+@pytest.mark.parametrize("factory", [_polling, _inotify], ids=["poll", "inotify"])
+def test_watcher_reports_input_changes(tree: tuple[Path, Path], factory) -> None:
+    data_dir, tradeable_dir = tree
+    with factory(data_dir, tradeable_dir) as watcher:
+        watcher.track(["daily/us/etfs/aaa.us.txt"])
+        assert not watcher.wait(0)
+
+        with (data_dir / "daily" / "us" / "etfs" / "aaa.us.txt").open("a") as handle:
+            handle.write("AAA.US,D,20240102,000000,1,1,1,1,1,0\n")
+        _bump_mtime(data_dir / "daily" / "us" / "etfs" / "aaa.us.txt")
+        with (data_dir / "daily" / "us" / "etfs" / "bbb.us.txt").open("a") as handle:
+            handle.write("BBB.US,D,20240102,000000,1,1,1,1,1,0\n")
+        assert watcher.wait(1) == ChangeSet(
+            files=frozenset({"daily/us/etfs/aaa.us.txt"}),
+        )
+
+        (data_dir / "daily" / "pl").mkdir()
+        (data_dir / "daily" / "pl" / "cdr.txt").write_text("<TICKER>\n")
+        changes = watcher.wait(1, settle=0.05)
+        assert changes.directories >= {"daily", "daily/pl"}
+        assert not changes.files
+        assert not changes.tradeables
+
+        (tradeable_dir / "broker.csv").write_text("symbol\nAAA\n")
+        _bump_mtime(tradeable_dir / "broker.csv")
+        (tradeable_dir / "notes.txt").write_text("ignored\n")
+        changes = watcher.wait(1)
+        assert changes.tradeables
+        assert not changes.directories
+
+        # Directories created after the watcher started are watched as well.
+        (data_dir / "daily" / "pl" / "11b.txt").write_text("<TICKER>\n")
+        assert watcher.wait(1).directories == {"daily/pl"}
+
+
+def test_inotify_watch_failure_requests_rescan(tree: tuple[Path, Path]) -> None:
+    data_dir, tradeable_dir = tree
+    with _inotify(data_dir, tradeable_dir) as watcher:
+
+        def exhausted(path: Path, _rel_dir: str | None) -> None:
+            raise OSError(errno.ENOSPC, f"Cannot watch {path}")
+
+        watcher._add_watch = exhausted
+        (data_dir / "daily" / "pl").mkdir()
+        changes = watcher.wait(1)
+        assert changes.rescan
+        assert "daily/pl" in changes.directories
+        assert not watcher.wait(0)
+
+
+def test_open_watcher_backends(tree: tuple[Path, Path]) -> None:
+    data_dir, tradeable_dir = tree
+    with open_watcher(data_dir, tradeable_dir, backend="poll") as watcher:
+        assert isinstance(watcher, PollingWatcher)
+    with open_watcher(data_dir, tradeable_dir) as watcher:
+        assert isinstance(watcher, (PollingWatcher, InotifyWatcher))
+    with pytest.raises(ValueError, match="Unknown watch backend"):
+        open_watcher(data_dir, tradeable_dir, backend="fsevents")
@@ -66,9 +66,7 @@ def synthetic_workflow(
 
     tradeables = load_tradeable_instruments(dataset.tradeable_dir)
     by_ticker, by_stem, by_base = build_stooq_lookup(entries)
-    matches, unmatched = match_tradeables(
-        tradeables, by_ticker, by_stem, by_base, max_workers=4
-    )
+    matches, unmatched = match_tradeables(tradeables, by_ticker, by_stem, by_base)
 
     (
         diagnostics,
@@ -1,12 +1,16 @@
-"""Tests for cardinality constraint interfaces and stubs.
+"""Tests for cardinality constraint interfaces and optimizers.
 
 These tests validate the design interfaces for cardinality-constrained
-optimization, ensuring that stub functions raise appropriate errors and
-validation logic works correctly.
+optimization, ensuring that stub functions raise appropriate errors, the MIQP
+branch-and-bound finds optimal sparse portfolios, and validation logic works
+correctly.
 """
 
 from __future__ import annotations
 
+import itertools
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -21,6 +25,7 @@ from portfolio_management.portfolio import (
     optimize_with_cardinality_relaxation,
     validate_cardinality_constraints,
 )
+from portfolio_management.portfolio import cardinality as cardinality_module
 
 
 class TestCardinalityConstraints:
@@ -169,10 +174,57 @@ class TestValidateCardinalityConstraints:
             num_assets=100,
         )
 
-    def test_non_preselection_method_raises(self) -> None:
-        """Test non-preselection methods raise NotImplementedError."""
+    def test_miqp_method_passes(self) -> None:
+        """Test MIQP method passes validation."""
+        constraints = CardinalityConstraints(
+            enabled=True,
+            method=CardinalityMethod.MIQP,
+            max_assets=30,
+        )
+        portfolio_constraints = PortfolioConstraints()
+
+        # Should not raise
+        validate_cardinality_constraints(
+            constraints,
+            portfolio_constraints,
+            num_assets=100,
+        )
+
+    def test_miqp_max_weight_infeasible(self) -> None:
+        """Test MIQP rejects max_assets that cannot hold full investment."""
+        constraints = CardinalityConstraints(
+            enabled=True,
+            method=CardinalityMethod.MIQP,
+            max_assets=3,
+        )
+        portfolio_constraints = PortfolioConstraints(max_weight=0.25)
+
+        with pytest.raises(ValueError, match="Infeasible.*max_weight"):
+            validate_cardinality_constraints(
+                constraints,
+                portfolio_constraints,
+                num_assets=100,
+            )
+
+    def test_miqp_requires_full_investment(self) -> None:
+        """Test MIQP rejects portfolios that need not be fully invested."""
+        constraints = CardinalityConstraints(
+            enabled=True,
+            method=CardinalityMethod.MIQP,
+            max_assets=3,
+        )
+        portfolio_constraints = PortfolioConstraints(require_full_investment=False)
+
+        with pytest.raises(ValueError, match="require_full_investment"):
+            validate_cardinality_constraints(
+                constraints,
+                portfolio_constraints,
+                num_assets=100,
+            )
+
+    def test_unimplemented_methods_raise(self) -> None:
+        """Test unimplemented methods raise NotImplementedError."""
         for method in [
-            CardinalityMethod.MIQP,
             CardinalityMethod.HEURISTIC,
             CardinalityMethod.RELAXATION,
         ]:
@@ -194,7 +246,7 @@ class TestValidateCardinalityConstraints:
         """String methods should normalize to enums before raising."""
         constraints = CardinalityConstraints(
             enabled=True,
-            method="miqp",
+            method="heuristic",
             max_assets=30,
         )
         portfolio_constraints = PortfolioConstraints()
@@ -318,22 +370,6 @@ class TestOptimizerStubs:
             max_assets=2,
         )
 
-    def test_miqp_stub_raises(
-        self,
-        sample_returns: pd.DataFrame,
-        constraints: PortfolioConstraints,
-        cardinality: CardinalityConstraints,
-    ) -> None:
-        """Test MIQP stub raises CardinalityNotImplementedError."""
-        with pytest.raises(CardinalityNotImplementedError) as excinfo:
-            optimize_with_cardinality_miqp(
-                sample_returns,
-                constraints,
-                cardinality,
-            )
-
-        assert "miqp" in str(excinfo.value).lower()
-
     def test_heuristic_stub_raises(
         self,
         sample_returns: pd.DataFrame,
@@ -367,6 +403,188 @@ class TestOptimizerStubs:
         assert "relaxation" in str(excinfo.value).lower()
 
 
+class TestMiqpBranchAndBound:
+    """Tests for the branch-and-bound MIQP optimizer."""
+
+    @pytest.fixture
+    def factor_returns(self) -> pd.DataFrame:
+        """Create correlated returns from a two-factor model."""
+        rng = np.random.default_rng(7)
+        n_assets = 8
+        factors = rng.normal(size=(260, 2))
+        loadings = rng.normal(size=(2, n_assets))
+        noise = rng.normal(size=(260, n_assets)) * rng.uniform(0.5, 2.0, n_assets)
+        return pd.DataFrame(
+            (factors @ loadings + noise) * 0.01,
+            index=pd.date_range("2020-01-01", periods=260, freq="B"),
+            columns=[f"ASSET{i}" for i in range(n_assets)],
+        )
+
+    @staticmethod
+    def _brute_force_variance(
+        returns: pd.DataFrame,
+        max_assets: int,
+        min_position: float,
+        max_weight: float,
+    ) -> float:
+        """Enumerate every support and solve each restricted QP exactly."""
+        cp = pytest.importorskip("cvxpy")
+        covariance = returns.cov().to_numpy() * 252
+        best = np.inf
+        for subset in itertools.combinations(range(returns.shape[1]), max_assets):
+            idx = list(subset)
+            weights = cp.Variable(len(idx))
+            problem = cp.Problem(
+                cp.Minimize(cp.quad_form(weights, covariance[np.ix_(idx, idx)])),
+                [cp.sum(weights) == 1, weights >= min_position, weights <= max_weight],
+            )
+            problem.solve()
+            if problem.value is not None:
+                best = min(best, problem.value)
+        return best
+
+    def test_matches_brute_force(self, factor_returns: pd.DataFrame) -> None:
+        """Test branch-and-bound proves the enumerated optimum."""
+        cardinality = CardinalityConstraints(
+            enabled=True,
+            method=CardinalityMethod.MIQP,
+            max_assets=3,
+            min_position_size=0.05,
+        )
+        constraints = PortfolioConstraints(max_weight=0.5)
+
+        portfolio = optimize_with_cardinality_miqp(
+            factor_returns,
+            constraints,
+            cardinality,
+        )
+
+        expected = self._brute_force_variance(factor_returns, 3, 0.05, 0.5)
+        assert portfolio.metadata["status"] == "optimal"
+        assert portfolio.metadata["objective_value"] == pytest.approx(
+            expected, rel=1e-5
+        )
+        assert portfolio.get_position_count() <= 3
+        assert (portfolio.weights >= 0.05 - 1e-6).all()
+        assert (portfolio.weights <= 0.5 + 1e-6).all()
+        assert portfolio.metadata["heuristic_objective"] >= (
+            portfolio.metadata["objective_value"] - 1e-9
+        )
+
+    def test_parallel_workers_match_serial(self, factor_returns: pd.DataFrame) -> None:
+        """Test the process-pool node evaluator reaches the same optimum."""
+        cardinality = CardinalityConstraints(
+            enabled=True,
+            method=CardinalityMethod.MIQP,
+            max_assets=2,
+        )
+        constraints = PortfolioConstraints(max_weight=0.6)
+
+        serial = optimize_with_cardinality_miqp(
+            factor_returns, constraints, cardinality
+        )
+        parallel = optimize_with_cardinality_miqp(
+            factor_returns,
+            constraints,
+            cardinality,
+            max_workers=2,
+        )
+
+        assert parallel.metadata["objective_value"] == pytest.approx(
+            serial.metadata["objective_value"],
+            rel=1e-6,
+        )
+
+    def test_node_limit_returns_incumbent(self, factor_returns: pd.DataFrame) -> None:
+        """Test an early stop still returns the heuristic incumbent."""
+        cardinality = CardinalityConstraints(
+            enabled=True,
+            method=CardinalityMethod.MIQP,
+            max_assets=3,
+        )
+        constraints = PortfolioConstraints(max_weight=0.5)
+
+        portfolio = optimize_with_cardinality_miqp(
+            factor_returns,
+            constraints,
+            cardinality,
+            max_nodes=1,
+            mip_gap=0.0,
+        )
+
+        assert portfolio.metadata["status"] in {"node_limit", "optimal"}
+        assert portfolio.metadata["lower_bound"] <= (
+            portfolio.metadata["objective_value"] + 1e-12
+        )
+        assert portfolio.get_position_count() <= 3
+
+    def test_unbranchable_node_is_not_optimal(
+        self,
+        factor_returns: pd.DataFrame,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a node dropped without branching leaves the search unproven."""
+        monkeypatch.setattr(
+            cardinality_module._BranchAndBound,
+            "_branch_candidate",
+            lambda _self, _node: -1,
+        )
+        cardinality = CardinalityConstraints(
+            enabled=True,
+            method=CardinalityMethod.MIQP,
+            max_assets=3,
+        )
+        constraints = PortfolioConstraints(max_weight=0.5)
+
+        portfolio = optimize_with_cardinality_miqp(
+            factor_returns,
+            constraints,
+            cardinality,
+            mip_gap=0.0,
+        )
+
+        assert portfolio.metadata["status"] == "unresolved"
+        assert portfolio.metadata["gap"] > 0
+        assert portfolio.metadata["incumbent_source"] == "heuristic"
+
+    def test_rescaling_keeps_max_weight(self) -> None:
+        """Test rescaling to full investment moves the excess off capped assets."""
+        weights = cardinality_module._fully_invested(
+            np.array([0.5, 0.3, 0.1999, 0.0, 1e-9]),
+            max_weight=0.5,
+        )
+
+        assert weights.sum() == pytest.approx(1.0)
+        assert weights.max() <= 0.5 + 1e-12
+        assert weights[0] == pytest.approx(0.5)
+        assert (weights[3:] == 0).all()
+
+    def test_group_limits_respected(self, factor_returns: pd.DataFrame) -> None:
+        """Test per-group position limits are enforced when classes are given."""
+        asset_classes = pd.Series(
+            ["equity"] * 4 + ["bond"] * 4,
+            index=factor_returns.columns,
+        )
+        cardinality = CardinalityConstraints(
+            enabled=True,
+            method=CardinalityMethod.MIQP,
+            max_assets=4,
+            group_limits={"equity": 1, "bond": 3},
+        )
+        constraints = PortfolioConstraints(max_weight=0.5)
+
+        portfolio = optimize_with_cardinality_miqp(
+            factor_returns,
+            constraints,
+            cardinality,
+            asset_classes,
+        )
+
+        held = asset_classes.loc[portfolio.weights.index]
+        assert (held == "equity").sum() <= 1
+        assert (held == "bond").sum() <= 3
+
+
 class TestGetCardinalityOptimizer:
     """Tests for get_cardinality_optimizer factory function."""
 
@@ -0,0 +1,190 @@
+"""Tests for the hierarchical risk parity strategy."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_management.core.exceptions import (
+    ConstraintViolationError,
+    InsufficientDataError,
+)
+from portfolio_management.portfolio import (
+    HierarchicalRiskParityStrategy,
+    PortfolioConstraints,
+    PortfolioConstructor,
+)
+
+
+def _block_returns(n_blocks: int, block_size: int, periods: int = 300) -> pd.DataFrame:
+    """Create returns with strongly correlated blocks of assets."""
+    rng = np.random.default_rng(11)
+    columns = []
+    blocks = []
+    for block in range(n_blocks):
+        factor = rng.normal(0, 0.01, size=(periods, 1))
+        noise = rng.normal(0, 0.004, size=(periods, block_size))
+        blocks.append(factor + noise)
+        columns.extend(f"B{block}_{i}" for i in range(block_size))
+    return pd.DataFrame(
+        np.hstack(blocks),
+        index=pd.date_range("2020-01-01", periods=periods, freq="B"),
+        columns=columns,
+    )
+
+
+class TestHierarchicalRiskParityStrategy:
+    """Tests for HierarchicalRiskParityStrategy."""
+
+    def test_weights_sum_to_one(self) -> None:
+        """Test a basic HRP allocation is fully invested and long-only."""
+        returns = _block_returns(3, 4)
+        strategy = HierarchicalRiskParityStrategy()
+
+        portfolio = strategy.construct(returns, PortfolioConstraints(max_weight=0.3))
+
+        assert list(portfolio.weights.index) == list(returns.columns)
+        assert np.isclose(portfolio.weights.sum(), 1.0)
+        assert (portfolio.weights > 0).all()
+        assert portfolio.metadata["linkage_reused"] is False
+
+    def test_two_uncorrelated_assets_match_inverse_variance(self) -> None:
+        """Test HRP reduces to inverse-variance weights for two assets."""
+        rng = np.random.default_rng(3)
+        returns = pd.DataFrame(
+            {
+                "LOW": rng.normal(0, 0.01, 400),
+                "HIGH": rng.normal(0, 0.03, 400),
+            },
+        )
+        strategy = HierarchicalRiskParityStrategy()
+
+        weights = strategy.construct(
+            returns,
+            PortfolioConstraints(max_weight=1.0),
+        ).weights
+
+        inv_var = 1.0 / returns.var()
+        expected = inv_var / inv_var.sum()
+        pd.testing.assert_series_equal(weights, expected, check_names=False)
+
+    def test_handles_large_universe(self) -> None:
+        """Test HRP does not fall back above the risk parity threshold."""
+        returns = _block_returns(35, 10)
+        strategy = HierarchicalRiskParityStrategy()
+
+        portfolio = strategy.construct(returns, PortfolioConstraints(max_weight=0.05))
+
+        assert len(portfolio.weights) == 350
+        assert portfolio.weights.max() <= 0.05 + 1e-9
+        assert "method" not in portfolio.metadata
+
+    def test_linkage_reused_for_marginal_changes(self) -> None:
+        """Test the cached linkage is reused when the window shifts slightly."""
+        returns = _block_returns(4, 5, periods=320)
+        strategy = HierarchicalRiskParityStrategy(correlation_tolerance=0.1)
+        constraints = PortfolioConstraints(max_weight=0.3)
+
+        first = strategy.construct(returns.iloc[:300], constraints)
+        second = strategy.construct(returns.iloc[5:305], constraints)
+
+        assert first.metadata["linkage_reused"] is False
+        assert second.metadata["linkage_reused"] is True
+
+    def test_linkage_incremental_asset_changes(self) -> None:
+        """Test a small asset turnover updates the cached order in place."""
+        returns = _block_returns(4, 5)
+        strategy = HierarchicalRiskParityStrategy(max_asset_turnover=0.2)
+        constraints = PortfolioConstraints(max_weight=0.3)
+
+        strategy.construct(returns.drop(columns=["B2_4"]), constraints)
+        portfolio = strategy.construct(returns.drop(columns=["B0_0"]), constraints)
+
+        assert portfolio.metadata["linkage_reused"] is True
+        assert "B2_4" in portfolio.weights.index
+        assert "B0_0" not in portfolio.weights.index
+        assert np.isclose(portfolio.weights.sum(), 1.0)
+
+    def test_linkage_rebuilt_for_structural_change(self) -> None:
+        """Test the linkage is rebuilt when correlations move materially."""
+        returns = _block_returns(3, 4)
+        shuffled = returns.copy()
+        shuffled["B0_0"] = np.random.default_rng(5).normal(0, 0.01, len(returns))
+        strategy = HierarchicalRiskParityStrategy(correlation_tolerance=0.05)
+        constraints = PortfolioConstraints(max_weight=0.3)
+
+        strategy.construct(returns, constraints)
+        portfolio = strategy.construct(shuffled, constraints)
+
+        assert portfolio.metadata["linkage_reused"] is False
+
+    def test_linkage_rebuilt_after_gradual_drift(self) -> None:
+        """Test small correlation moves add up against the linkage's correlation."""
+        returns = _block_returns(3, 4)
+        noise = np.random.default_rng(5).normal(0, 0.01, len(returns))
+        strategy = HierarchicalRiskParityStrategy(correlation_tolerance=0.05)
+        constraints = PortfolioConstraints(max_weight=0.3)
+
+        reused = []
+        previous = returns.corr()
+        for step in range(13):
+            drifted = returns.copy()
+            drifted["B0_0"] = returns["B0_0"] * (1 - step / 40) + noise * step / 40
+            correlation = drifted.corr()
+            assert (correlation - previous).abs().to_numpy().max() < 0.05
+            previous = correlation
+            portfolio = strategy.construct(drifted, constraints)
+            reused.append(portfolio.metadata["linkage_reused"])
+
+        assert reused[0] is False
+        assert not all(reused[1:])
+
+    def test_weight_cap_enforced(self) -> None:
+        """Test weights above max_weight are redistributed."""
+        rng = np.random.default_rng(9)
+        returns = pd.DataFrame(
+            rng.normal(0, 1, (300, 4)) * np.array([0.002, 0.02, 0.02, 0.02]),
+            columns=["SAFE", "A", "B", "C"],
+        )
+        strategy = HierarchicalRiskParityStrategy()
+
+        portfolio = strategy.construct(returns, PortfolioConstraints(max_weight=0.4))
+
+        assert portfolio.weights.max() <= 0.4 + 1e-9
+        assert np.isclose(portfolio.weights.sum(), 1.0)
+
+    def test_infeasible_weight_cap_raises(self) -> None:
+        """Test a cap below 1/N raises a constraint violation."""
+        returns = _block_returns(1, 3)
+        strategy = HierarchicalRiskParityStrategy()
+
+        with pytest.raises(ConstraintViolationError):
+            strategy.construct(returns, PortfolioConstraints(max_weight=0.2))
+
+    def test_insufficient_history(self) -> None:
+        """Test short histories raise InsufficientDataError."""
+        returns = _block_returns(2, 2, periods=50)
+        strategy = HierarchicalRiskParityStrategy()
+
+        with pytest.raises(InsufficientDataError):
+            strategy.construct(returns, PortfolioConstraints())
+
+    def test_invalid_linkage_method(self) -> None:
+        """Test an unknown linkage method is rejected."""
+        with pytest.raises(ValueError, match="Invalid linkage_method"):
+            HierarchicalRiskParityStrategy(linkage_method="centroid_typo")
+
+    def test_registered_in_constructor(self) -> None:
+        """Test the default constructor exposes the HRP strategy."""
+        constructor = PortfolioConstructor()
+        returns = _block_returns(2, 3)
+
+        portfolio = constructor.construct(
+            "hierarchical_risk_parity",
+            returns,
+            PortfolioConstraints(max_weight=0.4),
+        )
+
+        assert "hierarchical_risk_parity" in constructor.list_strategies()
+        assert portfolio.strategy == "hierarchical_risk_parity"
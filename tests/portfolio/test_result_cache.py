@@ -0,0 +1,246 @@
+"""Tests for the content-addressed portfolio result cache."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_management.portfolio import (
+    EqualWeightStrategy,
+    HierarchicalRiskParityStrategy,
+    Portfolio,
+    PortfolioConstraints,
+    PortfolioConstructor,
+    PortfolioResultCache,
+    PortfolioStrategy,
+    RiskParityStrategy,
+    window_fingerprint,
+)
+
+
+def _returns(n_assets: int = 6, periods: int = 120, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        rng.normal(0.0005, 0.01, size=(periods, n_assets)),
+        index=pd.date_range("2021-01-01", periods=periods, freq="B"),
+        columns=[f"T{i}" for i in range(n_assets)],
+    )
+
+
+class _CountingStrategy(PortfolioStrategy):
+    """Equal weights that count how often they are actually constructed."""
+
+    def __init__(self, params: dict[str, object] | None = None) -> None:
+        self.calls = 0
+        self._params = params
+
+    @property
+    def name(self) -> str:
+        return "counting"
+
+    @property
+    def min_history_periods(self) -> int:
+        return 1
+
+    @property
+    def cache_params(self) -> dict[str, object] | None:
+        return self._params
+
+    def construct(self, returns, constraints, asset_classes=None):  # noqa: ARG002
+        self.calls += 1
+        n_assets = returns.shape[1]
+        return Portfolio(
+            weights=pd.Series(1.0 / n_assets, index=returns.columns),
+            strategy=self.name,
+            metadata={"n_assets": n_assets},
+        )
+
+
+class TestWindowFingerprint:
+    """Tests for window_fingerprint."""
+
+    def test_equal_content_equal_fingerprint(self) -> None:
+        """Copies and equivalent slices share a fingerprint."""
+        returns = _returns()
+        assert window_fingerprint(returns) == window_fingerprint(returns.copy())
+        assert window_fingerprint(returns.iloc[10:50]) == window_fingerprint(
+            returns.iloc[10:50].copy(),
+        )
+
+    def test_changes_are_detected(self) -> None:
+        """Values, rows and columns all change the fingerprint."""
+        returns = _returns()
+        base = window_fingerprint(returns)
+        edited = returns.copy()
+        edited.iloc[5, 2] += 1e-12
+        assert window_fingerprint(edited) != base
+        assert window_fingerprint(returns.iloc[1:]) != base
+        assert window_fingerprint(returns.iloc[:, :-1]) != base
+        assert window_fingerprint(returns.rename(columns={"T0": "X"})) != base
+
+    def test_nan_payloads_normalised(self) -> None:
+        """NaNs from different sources hash identically."""
+        returns = _returns()
+        first = returns.copy()
+        second = returns.copy()
+        first.iloc[0, 0] = np.nan
+        second.iloc[0, 0] = -np.inf * 0.0
+        assert window_fingerprint(first) == window_fingerprint(second)
+
+
+class TestPortfolioResultCache:
+    """Tests for PortfolioResultCache."""
+
+    def test_hit_skips_construction(self) -> None:
+        """A repeated construction is served from the cache."""
+        cache = PortfolioResultCache()
+        strategy = _CountingStrategy(params={})
+        returns = _returns()
+        constraints = PortfolioConstraints()
+
+        first = cache.get_or_construct(strategy, returns, constraints)
+        second = cache.get_or_construct(strategy, returns.copy(), constraints)
+
+        assert strategy.calls == 1
+        pd.testing.assert_series_equal(first.weights, second.weights)
+        assert second.metadata == {"n_assets": 6}
+        assert cache.get_stats()["hits"] == 1
+
+    def test_returned_portfolios_are_independent(self) -> None:
+        """Mutating a returned portfolio does not corrupt the cache."""
+        cache = PortfolioResultCache()
+        strategy = _CountingStrategy(params={})
+        returns = _returns()
+        first = cache.get_or_construct(strategy, returns, PortfolioConstraints())
+        first.weights.iloc[0] = 99.0
+        second = cache.get_or_construct(strategy, returns, PortfolioConstraints())
+        assert second.weights.iloc[0] == pytest.approx(1 / 6)
+
+    def test_key_components(self) -> None:
+        """Constraints, params and asset classes are part of the key."""
+        cache = PortfolioResultCache()
+        returns = _returns()
+        strategy = _CountingStrategy(params={"alpha": 1})
+
+        cache.get_or_construct(strategy, returns, PortfolioConstraints())
+        cache.get_or_construct(strategy, returns, PortfolioConstraints(max_weight=0.5))
+        classes = pd.Series("equity", index=returns.columns)
+        cache.get_or_construct(strategy, returns, PortfolioConstraints(), classes)
+        strategy._params = {"alpha": 2}
+        cache.get_or_construct(strategy, returns, PortfolioConstraints())
+
+        assert strategy.calls == 4
+        assert cache.get_stats()["misses"] == 4
+
+    def test_uncacheable_strategy_bypasses_cache(self) -> None:
+        """Strategies without cache_params are always constructed."""
+        cache = PortfolioResultCache()
+        strategy = _CountingStrategy(params=None)
+        returns = _returns()
+        for _ in range(3):
+            cache.get_or_construct(strategy, returns, PortfolioConstraints())
+        assert strategy.calls == 3
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted beyond max_entries."""
+        cache = PortfolioResultCache(max_entries=2)
+        strategy = _CountingStrategy(params={})
+        returns = _returns()
+        windows = [returns.iloc[i : i + 50] for i in range(3)]
+        constraints = PortfolioConstraints()
+
+        cache.get_or_construct(strategy, windows[0], constraints)
+        cache.get_or_construct(strategy, windows[1], constraints)
+        cache.get_or_construct(strategy, windows[0], constraints)  # refresh 0
+        cache.get_or_construct(strategy, windows[2], constraints)  # evicts 1
+        assert len(cache) == 2
+        cache.get_or_construct(strategy, windows[0], constraints)
+        assert strategy.calls == 3
+        cache.get_or_construct(strategy, windows[1], constraints)
+        assert strategy.calls == 4
+
+    def test_invalid_max_entries(self) -> None:
+        """max_entries must be positive."""
+        with pytest.raises(ValueError, match="max_entries"):
+            PortfolioResultCache(max_entries=0)
+
+    def test_disk_persistence(self, tmp_path: Path) -> None:
+        """A new cache instance reuses portfolios persisted by an earlier one."""
+        returns = _returns()
+        constraints = PortfolioConstraints()
+        first = _CountingStrategy(params={})
+        PortfolioResultCache(cache_dir=tmp_path).get_or_construct(
+            first,
+            returns,
+            constraints,
+        )
+
+        second = _CountingStrategy(params={})
+        cache = PortfolioResultCache(cache_dir=tmp_path)
+        portfolio = cache.get_or_construct(second, returns, constraints)
+        assert second.calls == 0
+        assert cache.get_stats()["disk_hits"] == 1
+        assert portfolio.weights.sum() == pytest.approx(1.0)
+
+        cache.clear()
+        assert not list(tmp_path.glob("*.pkl"))
+
+    def test_corrupt_disk_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Unreadable files are ignored and rebuilt."""
+        cache = PortfolioResultCache(cache_dir=tmp_path)
+        strategy = _CountingStrategy(params={})
+        returns = _returns()
+        key = cache.make_key(strategy, returns, PortfolioConstraints())
+        (tmp_path / f"{key}.pkl").write_bytes(b"not a pickle")
+
+        cache.get_or_construct(strategy, returns, PortfolioConstraints())
+        assert strategy.calls == 1
+
+    def test_picklable(self) -> None:
+        """The cache survives a pickle round trip (process pools)."""
+        cache = PortfolioResultCache()
+        strategy = _CountingStrategy(params={})
+        cache.get_or_construct(strategy, _returns(), PortfolioConstraints())
+        restored = pickle.loads(pickle.dumps(cache))  # noqa: S301
+        restored.get_or_construct(strategy, _returns(), PortfolioConstraints())
+        assert strategy.calls == 1
+
+
+class TestStrategyCacheParams:
+    """Tests for the cache_params declared by built-in strategies."""
+
+    def test_builtin_params(self) -> None:
+        """Built-in strategies declare their output-determining parameters."""
+        assert EqualWeightStrategy().cache_params == {}
+        assert RiskParityStrategy(min_periods=60).cache_params == {"min_periods": 60}
+
+    def test_hrp_with_linkage_reuse_not_cacheable(self) -> None:
+        """HRP with linkage reuse depends on call history and opts out."""
+        assert HierarchicalRiskParityStrategy().cache_params is None
+        strict = HierarchicalRiskParityStrategy(
+            correlation_tolerance=0.0,
+            max_asset_turnover=0.0,
+        )
+        assert strict.cache_params is not None
+
+    def test_constructor_uses_shared_cache(self) -> None:
+        """PortfolioConstructor consults the cache for construct and compare."""
+        cache = PortfolioResultCache()
+        constructor = PortfolioConstructor(result_cache=cache)
+        constructor.register_strategy("risk_parity", RiskParityStrategy(min_periods=60))
+        returns = _returns()
+
+        constructor.construct("risk_parity", returns)
+        comparison = constructor.compare_strategies(
+            ["risk_parity", "equal_weight"],
+            returns,
+        )
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert set(comparison.columns) == {"risk_parity", "equal_weight"}
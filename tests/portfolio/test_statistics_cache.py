@@ -172,6 +172,24 @@ class TestStatisticsCache:
         assert stats._count == len(different_returns)
         assert cache_key1 == stats._cache_key
 
+    def test_float32_returns_accumulate_in_float64(self, sample_returns):
+        """float32 panels yield float64 statistics at full precision."""
+        stats = StatisticsCache()
+        mean_returns, cov_matrix = stats.get_statistics(
+            sample_returns.astype(np.float32),
+            annualize=False,
+        )
+
+        assert mean_returns.dtype == np.float64
+        assert (cov_matrix.dtypes == np.float64).all()
+        expected = sample_returns.astype(np.float32).astype(np.float64).cov()
+        np.testing.assert_allclose(cov_matrix.values, expected.values, rtol=1e-10)
+        np.testing.assert_allclose(
+            cov_matrix.values,
+            sample_returns.cov().values,
+            rtol=1e-5,
+        )
+
     def test_manual_invalidate_cache(self, sample_returns):
         """Test manual cache invalidation."""
         stats = StatisticsCache()
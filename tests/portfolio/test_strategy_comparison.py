@@ -0,0 +1,220 @@
+"""Tests for shared-moment and concurrent strategy comparison."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_management.core.exceptions import OptimizationError
+from portfolio_management.portfolio import (
+    HierarchicalRiskParityStrategy,
+    MeanVarianceStrategy,
+    Portfolio,
+    PortfolioConstraints,
+    PortfolioConstructor,
+    PortfolioMoments,
+    PortfolioStrategy,
+    RiskParityStrategy,
+)
+
+
+def _returns(n_assets: int = 8, periods: int = 300, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    vols = np.linspace(0.005, 0.02, n_assets)
+    return pd.DataFrame(
+        rng.normal(0.0004, vols, size=(periods, n_assets)),
+        index=pd.date_range("2020-01-01", periods=periods, freq="B"),
+        columns=[f"A{i:03d}" for i in range(n_assets)],
+    )
+
+
+class _FailingStrategy(PortfolioStrategy):
+    @property
+    def name(self) -> str:
+        return "failing"
+
+    @property
+    def min_history_periods(self) -> int:
+        return 1
+
+    def construct(self, returns, constraints, asset_classes=None):  # noqa: ARG002
+        raise OptimizationError(strategy_name=self.name, message="boom")
+
+
+class TestPortfolioMoments:
+    """Tests for the PortfolioMoments snapshot."""
+
+    def test_matches_pandas(self) -> None:
+        """Moments equal the pandas sample estimates."""
+        returns = _returns()
+        moments = PortfolioMoments.from_returns(returns)
+        pd.testing.assert_frame_equal(moments.covariance, returns.cov())
+        pd.testing.assert_series_equal(moments.mean, returns.mean())
+        assert moments.is_complete
+        assert moments.matches(returns)
+        assert not moments.matches(returns.iloc[1:])
+
+    def test_std_ddof(self) -> None:
+        """Standard deviations derived from the covariance honour ddof."""
+        returns = _returns()
+        returns.iloc[:10, 0] = np.nan
+        moments = PortfolioMoments.from_returns(returns)
+        assert not moments.is_complete
+        pd.testing.assert_series_equal(
+            moments.std(ddof=0),
+            returns.std(ddof=0),
+            check_names=False,
+        )
+        pd.testing.assert_series_equal(
+            moments.std(),
+            returns.std(),
+            check_names=False,
+        )
+
+
+class TestSharedMomentStrategies:
+    """Strategies produce identical weights with and without shared moments."""
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            RiskParityStrategy(min_periods=60),
+            HierarchicalRiskParityStrategy(min_periods=60),
+            MeanVarianceStrategy(objective="min_volatility", min_periods=60),
+        ],
+    )
+    def test_weights_unchanged(self, strategy: PortfolioStrategy) -> None:
+        """Reusing shared moments does not change the constructed weights."""
+        returns = _returns()
+        constraints = PortfolioConstraints(max_weight=0.5)
+        moments = PortfolioMoments.from_returns(returns)
+
+        direct = strategy.construct(returns, constraints)
+        shared = strategy.construct_with_moments(
+            returns,
+            constraints,
+            moments=moments,
+        )
+        pd.testing.assert_series_equal(direct.weights, shared.weights)
+
+    def test_large_universe_inverse_volatility(self) -> None:
+        """The inverse-volatility fallback reuses the shared covariance."""
+        returns = _returns(n_assets=310, periods=80)
+        constraints = PortfolioConstraints(max_weight=0.05)
+        strategy = RiskParityStrategy(min_periods=60)
+        moments = PortfolioMoments.from_returns(returns)
+
+        direct = strategy.construct(returns, constraints)
+        shared = strategy.construct_with_moments(returns, constraints, moments=moments)
+        assert shared.metadata["method"] == "inverse_volatility_fallback"
+        np.testing.assert_allclose(direct.weights, shared.weights, rtol=1e-10)
+
+    def test_mismatched_moments_ignored(self) -> None:
+        """Moments for a different window are not used."""
+        returns = _returns()
+        constraints = PortfolioConstraints(max_weight=0.5)
+        strategy = RiskParityStrategy(min_periods=60)
+        stale = PortfolioMoments.from_returns(returns.iloc[:-20])
+
+        direct = strategy.construct(returns, constraints)
+        shared = strategy.construct_with_moments(returns, constraints, moments=stale)
+        pd.testing.assert_series_equal(direct.weights, shared.weights)
+
+    def test_default_hook_delegates_to_construct(self) -> None:
+        """Custom strategies without an override ignore the moments."""
+        returns = _returns()
+        strategy = _FailingStrategy()
+        with pytest.raises(OptimizationError):
+            strategy.construct_with_moments(
+                returns,
+                PortfolioConstraints(),
+                moments=PortfolioMoments.from_returns(returns),
+            )
+
+
+class TestCompareStrategies:
+    """Tests for PortfolioConstructor.compare_strategies execution modes."""
+
+    @staticmethod
+    def _constructor() -> PortfolioConstructor:
+        constructor = PortfolioConstructor(PortfolioConstraints(max_weight=0.5))
+        constructor.register_strategy("risk_parity", RiskParityStrategy(min_periods=60))
+        constructor.register_strategy(
+            "hierarchical_risk_parity",
+            HierarchicalRiskParityStrategy(min_periods=60),
+        )
+        return constructor
+
+    def test_parallel_matches_sequential(self) -> None:
+        """Shared moments on a thread pool give the sequential result."""
+        returns = _returns()
+        names = ["equal_weight", "risk_parity", "hierarchical_risk_parity"]
+
+        sequential = self._constructor().compare_strategies(names, returns)
+        parallel = self._constructor().compare_strategies(
+            names,
+            returns,
+            share_moments=True,
+            max_workers=3,
+        )
+        pd.testing.assert_frame_equal(sequential, parallel)
+        assert set(parallel.attrs["timings"]) == set(names)
+        assert all(t >= 0 for t in parallel.attrs["timings"].values())
+        assert parallel.attrs["moments_time"] > 0
+        assert sequential.attrs["moments_time"] == 0.0
+
+    def test_process_executor(self) -> None:
+        """Strategies can be constructed on a process pool."""
+        returns = _returns()
+        names = ["equal_weight", "risk_parity"]
+
+        sequential = self._constructor().compare_strategies(names, returns)
+        parallel = self._constructor().compare_strategies(
+            names,
+            returns,
+            share_moments=True,
+            max_workers=2,
+            executor="process",
+        )
+        pd.testing.assert_frame_equal(sequential, parallel)
+
+    def test_failing_strategy_skipped(self) -> None:
+        """A failing strategy is dropped without aborting the others."""
+        constructor = self._constructor()
+        constructor.register_strategy("failing", _FailingStrategy())
+        comparison = constructor.compare_strategies(
+            ["equal_weight", "failing"],
+            _returns(),
+            max_workers=2,
+        )
+        assert list(comparison.columns) == ["equal_weight"]
+        assert "failing" not in comparison.attrs["timings"]
+
+    def test_all_failing_raises(self) -> None:
+        """A comparison where every strategy fails raises RuntimeError."""
+        constructor = self._constructor()
+        constructor.register_strategy("failing", _FailingStrategy())
+        with pytest.raises(RuntimeError, match="All requested strategies failed"):
+            constructor.compare_strategies(["failing"], _returns())
+
+    def test_invalid_executor(self) -> None:
+        """Unknown executor names are rejected."""
+        with pytest.raises(ValueError, match="Invalid executor"):
+            self._constructor().compare_strategies(
+                ["equal_weight"],
+                _returns(),
+                executor="cluster",
+            )
+
+    def test_returns_portfolio_weights(self) -> None:
+        """Comparison columns are the strategies' portfolio weights."""
+        returns = _returns()
+        constructor = self._constructor()
+        comparison = constructor.compare_strategies(["risk_parity"], returns)
+        expected = constructor.construct("risk_parity", returns)
+        assert isinstance(expected, Portfolio)
+        np.testing.assert_allclose(
+            comparison["risk_parity"].to_numpy(),
+            expected.weights.to_numpy(),
+        )
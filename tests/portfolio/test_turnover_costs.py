@@ -0,0 +1,225 @@
+"""Tests for turnover-penalised, cost-aware portfolio construction."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_management.portfolio import (
+    EqualWeightStrategy,
+    MeanVarianceStrategy,
+    PortfolioConstraints,
+    PortfolioResultCache,
+    RiskParityStrategy,
+    TurnoverCostModel,
+)
+from portfolio_management.portfolio.costs import align_weights
+
+
+def _returns(n_assets: int = 8, periods: int = 300, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    drifts = np.linspace(0.0002, 0.001, n_assets)
+    vols = np.linspace(0.005, 0.02, n_assets)
+    return pd.DataFrame(
+        rng.normal(drifts, vols, size=(periods, n_assets)),
+        index=pd.date_range("2020-01-01", periods=periods, freq="B"),
+        columns=[f"A{i:03d}" for i in range(n_assets)],
+    )
+
+
+def _current(columns: pd.Index) -> pd.Series:
+    weights = np.r_[0.3, 0.2, np.full(len(columns) - 2, 0.5 / (len(columns) - 2))]
+    return pd.Series(weights, index=columns)
+
+
+def _turnover(weights: pd.Series, current: pd.Series) -> float:
+    return float((weights.reindex(current.index, fill_value=0.0) - current).abs().sum())
+
+
+class TestTurnoverCostModel:
+    """Tests for the TurnoverCostModel value object."""
+
+    def test_from_transaction_costs(self) -> None:
+        """Commission and slippage combine into a linear cost."""
+        model = TurnoverCostModel.from_transaction_costs(0.001, 5.0, trade_aversion=2)
+        assert model.linear == pytest.approx(0.0015)
+        assert model.quadratic == 0.0
+        assert model.trade_aversion == 2
+
+    def test_cost(self) -> None:
+        """Linear and quadratic terms are charged on the weight changes."""
+        model = TurnoverCostModel(linear=0.01, quadratic=0.1)
+        assert model.cost([0.5, 0.5], [0.7, 0.3]) == pytest.approx(
+            0.01 * 0.4 + 0.1 * 0.08,
+        )
+
+    @pytest.mark.parametrize("field", ["linear", "quadratic", "trade_aversion"])
+    def test_rejects_negative(self, field: str) -> None:
+        """Negative or non-finite parameters are rejected."""
+        with pytest.raises(ValueError, match=field):
+            TurnoverCostModel(**{field: -1.0})
+        with pytest.raises(ValueError, match=field):
+            TurnoverCostModel(**{field: float("nan")})
+
+    def test_is_zero(self) -> None:
+        """A model without costs or without aversion never penalises."""
+        assert TurnoverCostModel().is_zero
+        assert TurnoverCostModel(linear=0.01, trade_aversion=0.0).is_zero
+        assert not TurnoverCostModel(quadratic=0.01).is_zero
+
+    def test_align_weights(self) -> None:
+        """Current weights are reindexed onto the optimisation universe."""
+        current = pd.Series({"A": 0.6, "Z": 0.4})
+        np.testing.assert_allclose(align_weights(current, ["A", "B"]), [0.6, 0.0])
+        assert align_weights(None, ["A"]) is None
+        assert align_weights(pd.Series(dtype=float), ["A"]) is None
+        assert align_weights(pd.Series({"Z": 1.0}), ["A"]) is None
+
+
+class TestCostAwareStrategies:
+    """Tests for strategies optimising net of turnover costs."""
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            MeanVarianceStrategy(objective="min_volatility", min_periods=60),
+            MeanVarianceStrategy(objective="max_sharpe", min_periods=60),
+            RiskParityStrategy(min_periods=60),
+        ],
+    )
+    def test_negligible_cost_reproduces_target(self, strategy) -> None:
+        """With a vanishing penalty the unpenalised weights are recovered."""
+        returns = _returns()
+        constraints = PortfolioConstraints(max_weight=0.5)
+        current = _current(returns.columns)
+
+        target = strategy.construct(returns, constraints).weights
+        penalised = strategy.construct_with_costs(
+            returns,
+            constraints,
+            current_weights=current,
+            cost_model=TurnoverCostModel(linear=0.0015, trade_aversion=1e-9),
+        )
+        np.testing.assert_allclose(
+            penalised.weights.reindex(returns.columns, fill_value=0.0),
+            target.reindex(returns.columns, fill_value=0.0),
+            atol=1e-3,
+        )
+        assert penalised.metadata["turnover"] == pytest.approx(
+            _turnover(penalised.weights, current),
+        )
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            MeanVarianceStrategy(objective="min_volatility", min_periods=60),
+            RiskParityStrategy(min_periods=60),
+        ],
+    )
+    def test_turnover_decreases_with_aversion(self, strategy) -> None:
+        """Higher trade aversion never increases turnover."""
+        returns = _returns()
+        constraints = PortfolioConstraints(max_weight=0.5)
+        current = _current(returns.columns)
+
+        turnovers = [
+            _turnover(
+                strategy.construct(
+                    returns,
+                    constraints,
+                    current_weights=current,
+                    cost_model=TurnoverCostModel(linear=0.0015, trade_aversion=ta),
+                ).weights,
+                current,
+            )
+            for ta in (0.01, 1.0, 100.0)
+        ]
+        assert turnovers[0] >= turnovers[1] - 1e-6
+        assert turnovers[1] >= turnovers[2] - 1e-6
+        assert turnovers[2] < 1e-4
+
+    def test_risk_parity_penalty_stays_long_only(self) -> None:
+        """Trading costs never push risk parity weights out of their bounds."""
+        returns = _returns()
+        constraints = PortfolioConstraints(max_weight=0.5)
+        current = pd.Series(0.0, index=returns.columns)
+        current.iloc[:2] = 0.5
+
+        weights = (
+            RiskParityStrategy(min_periods=60)
+            .construct(
+                returns,
+                constraints,
+                current_weights=current,
+                cost_model=TurnoverCostModel(quadratic=0.01, trade_aversion=10.0),
+            )
+            .weights
+        )
+        assert weights.min() >= 0
+        assert weights.max() <= constraints.max_weight + 1e-9
+        assert weights.sum() == pytest.approx(1.0)
+
+    def test_zero_cost_model_is_ignored(self) -> None:
+        """A zero cost model takes the unpenalised path."""
+        returns = _returns()
+        constraints = PortfolioConstraints(max_weight=0.5)
+        strategy = RiskParityStrategy(min_periods=60)
+        penalised = strategy.construct(
+            returns,
+            constraints,
+            current_weights=_current(returns.columns),
+            cost_model=TurnoverCostModel(),
+        )
+        pd.testing.assert_series_equal(
+            penalised.weights,
+            strategy.construct(returns, constraints).weights,
+        )
+        assert "turnover" not in penalised.metadata
+
+    def test_default_hook_ignores_costs(self) -> None:
+        """Strategies without a cost-aware objective fall back to construct."""
+        returns = _returns(n_assets=4)
+        portfolio = EqualWeightStrategy().construct_with_costs(
+            returns,
+            PortfolioConstraints(),
+            current_weights=_current(returns.columns),
+            cost_model=TurnoverCostModel(linear=0.01),
+        )
+        np.testing.assert_allclose(portfolio.weights, 0.25)
+
+    def test_result_cache_keys_on_costs(self) -> None:
+        """Current weights and the cost model are part of the cache key."""
+        returns = _returns()
+        constraints = PortfolioConstraints(max_weight=0.5)
+        strategy = RiskParityStrategy(min_periods=60)
+        cache = PortfolioResultCache()
+        current = _current(returns.columns)
+        model = TurnoverCostModel(linear=0.0015)
+
+        cache.get_or_construct(strategy, returns, constraints)
+        cache.get_or_construct(
+            strategy,
+            returns,
+            constraints,
+            current_weights=current,
+            cost_model=model,
+        )
+        cached = cache.get_or_construct(
+            strategy,
+            returns,
+            constraints,
+            current_weights=current.copy(),
+            cost_model=model,
+        )
+        cache.get_or_construct(
+            strategy,
+            returns,
+            constraints,
+            current_weights=pd.Series(0.125, index=returns.columns),
+            cost_model=model,
+        )
+        stats = cache.get_stats()
+        assert stats["misses"] == 3
+        assert stats["hits"] == 1
+        assert "turnover" in cached.metadata
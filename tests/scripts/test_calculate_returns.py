@@ -94,3 +94,32 @@ def test_cli_writes_output_file(
     assert output_path.exists()
     df = pd.read_csv(output_path)
     assert not df.empty
+
+
+def test_cli_block_size_writes_same_output(
+    tmp_path: Path,
+    assets_csv: Path,
+    prices_dir: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    base_args = ["--assets", str(assets_csv), "--prices-dir", str(prices_dir)]
+    full_path = tmp_path / "full.csv"
+    blocked_path = tmp_path / "blocked.csv"
+    assert run_cli(parse_args([*base_args, "--output", str(full_path)])) == 0
+    args = parse_args(
+        [
+            *base_args,
+            "--output",
+            str(blocked_path),
+            "--block-size",
+            "1",
+            "--returns-store",
+            str(tmp_path / "store"),
+            "--summary",
+        ],
+    )
+    assert run_cli(args) == 0
+
+    assert blocked_path.read_text() == full_path.read_text()
+    assert (tmp_path / "store" / "index.json").exists()
+    assert "Assets with returns: 1" in capsys.readouterr().out
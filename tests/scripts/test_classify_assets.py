@@ -90,3 +90,25 @@ def test_cli_writes_output_file(tmp_path: Path, assets_csv: Path) -> None:
     df = pd.read_csv(output_path)
     assert "asset_class" in df.columns
     assert not df.empty
+
+
+@pytest.mark.integration
+def test_cli_classification_cache(tmp_path: Path, assets_csv: Path) -> None:
+    cache_dir = tmp_path / "classification_cache"
+    outputs = []
+    for run in range(2):
+        output_path = tmp_path / f"classified_{run}.csv"
+        args = parse_args(
+            [
+                "--input",
+                str(assets_csv),
+                "--output",
+                str(output_path),
+                "--classification-cache",
+                str(cache_dir),
+            ],
+        )
+        assert run_cli(args) == 0
+        outputs.append(output_path.read_text())
+    assert (cache_dir / "classifications.json").exists()
+    assert outputs[0] == outputs[1]
@@ -9,6 +9,7 @@ refactor of ``prepare_tradeable_data.py``.
 
 from __future__ import annotations
 
+import logging
 import subprocess
 import sys
 from collections import Counter
@@ -106,11 +107,7 @@ def pipeline_result(
     report_dir.mkdir()
     report_path = report_dir / "tradeable_matches.csv"
 
-    matches, unmatched = ptd.match_tradeables(
-        tradeable_instruments,
-        *stooq_lookup,
-        max_workers=8,
-    )
+    matches, unmatched = ptd.match_tradeables(tradeable_instruments, *stooq_lookup)
     assert not unmatched, "Fixture subset should have complete matches"
 
     export_dir = session_tmp_path / "exports"
@@ -153,11 +150,7 @@ def pipeline_result(
         "export_dir": export_dir,
     }
 
-    matches, unmatched = ptd.match_tradeables(
-        tradeable_instruments,
-        *stooq_lookup,
-        max_workers=8,
-    )
+    matches, unmatched = ptd.match_tradeables(tradeable_instruments, *stooq_lookup)
     assert not unmatched, "Fixture subset should have complete matches"
 
     (
@@ -226,6 +219,41 @@ def test_match_report_summaries(
     assert data_status_counts == expected_data_status
 
 
+def test_write_match_report_process_executor_matches_threads(
+    tmp_path: Path,
+    pipeline_result: dict[str, object],
+) -> None:
+    export_dir = tmp_path / "exports"
+    report_path = tmp_path / "tradeable_matches.csv"
+    diagnostics, *_rest, exported_count, skipped_count = ptd.write_match_report(
+        pipeline_result["matches"],
+        report_path,
+        STOOQ_FIXTURES,
+        lse_currency_policy="broker",
+        max_workers=2,
+        export_config=ptd.ExportConfig(
+            data_dir=STOOQ_FIXTURES,
+            dest_dir=export_dir,
+            overwrite=True,
+            include_empty=True,
+            max_workers=2,
+        ),
+        executor="process",
+    )
+
+    assert diagnostics == pipeline_result["diagnostics"]
+    assert (exported_count, skipped_count) == (
+        pipeline_result["exported_count"],
+        pipeline_result["skipped_count"],
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_csv(report_path),
+        pipeline_result["report_df"],
+    )
+    expected_exports = sorted(p.name for p in pipeline_result["export_dir"].iterdir())
+    assert sorted(p.name for p in export_dir.iterdir()) == expected_exports
+
+
 @pytest.mark.parametrize(
     "ticker,expected_status,flag_substring",
     [
@@ -471,6 +499,25 @@ def test_resolve_currency_lse_policies(
     assert status == expected_status
 
 
+def test_resolve_currency_warns_on_every_unknown_policy(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    instrument = _make_instrument("IEMB:LN", market="LSE", currency="USD")
+    stooq_file = _make_stooq_file("IEMB.UK", "daily/uk/etfs/iemb.uk.txt", region="uk")
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(2):
+            _, _, resolved, status = ptd.resolve_currency(
+                instrument,
+                stooq_file,
+                inferred_currency="GBP",
+                lse_policy="bogus",
+            )
+
+    assert (resolved, status) == ("USD", "override")
+    assert caplog.text.count("Unknown LSE currency policy 'bogus'") == 2
+
+
 @pytest.mark.integration
 def test_resolve_currency_non_lse_mismatch() -> None:
     instrument = _make_instrument(
@@ -499,6 +546,44 @@ def test_resolve_currency_non_lse_mismatch() -> None:
     assert status == "mismatch"
 
 
+@pytest.mark.parametrize("policy", ["broker", "stooq", "strict", "bogus"])
+def test_resolve_match_currencies_matches_resolve_currency(policy: str) -> None:
+    stooq_files = [
+        _make_stooq_file("IEMB.UK", "daily/uk/etfs/iemb.uk.txt", region="uk"),
+        _make_stooq_file("SPY.US", "daily/us/etfs/spy.us.txt", region="us"),
+        _make_stooq_file("XYZ.ZZ", "daily/zz/xyz.zz.txt", region="zz"),
+    ]
+    instruments = [
+        _make_instrument(symbol, market=market, currency=currency)
+        for symbol in ("IEMB:LN", "IEMB", "iemb.l", "")
+        for market in ("LSE", "London Stock Exchange", "NYSE", "")
+        for currency in ("USD", "gbp", "")
+    ]
+    matches = [
+        ptd.TradeableMatch(
+            instrument=instrument,
+            stooq_file=stooq_file,
+            matched_ticker=stooq_file.ticker,
+            strategy="ticker",
+        )
+        for instrument in instruments
+        for stooq_file in stooq_files
+    ]
+
+    table = ptd.resolve_match_currencies(matches, lse_policy=policy)
+
+    expected = [
+        ptd.resolve_currency(
+            match.instrument,
+            match.stooq_file,
+            ptd.infer_currency(match.stooq_file),
+            lse_policy=policy,
+        )
+        for match in matches
+    ]
+    assert list(table.itertuples(index=False, name=None)) == expected
+
+
 @pytest.mark.integration
 def test_export_tradeable_prices_deduplicates_and_overwrites(tmp_path: Path) -> None:
     data_dir = tmp_path / "stooq"
@@ -589,20 +674,177 @@ def test_export_tradeable_prices_deduplicates_and_overwrites(tmp_path: Path) ->
     assert "20200102" in content
 
 
-def test_match_tradeables_parallel_consistency(
+def test_write_match_report_manifest_reprocesses_changed_files(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_dir = tmp_path / "stooq"
+    matches = []
+    for ticker in ("AAA.US", "BBB.US", "CCC.US"):
+        rel_path = Path(f"daily/us/etfs/{ticker.lower()}.txt")
+        source_path = data_dir / rel_path
+        source_path.parent.mkdir(parents=True, exist_ok=True)
+        source_path.write_text(
+            f"{ticker},D,20200102,000000,10,11,9,10,100,0\n"
+            f"{ticker},D,20200103,000000,11,12,10,11,150,0\n",
+        )
+        stooq_file = _make_stooq_file(ticker, rel_path.as_posix(), region="us")
+        matches.append(
+            ptd.TradeableMatch(
+                instrument=_make_instrument(ticker, market="NYSE", currency="USD"),
+                stooq_file=stooq_file,
+                matched_ticker=stooq_file.ticker,
+                strategy="ticker",
+            ),
+        )
+
+    io_module = sys.modules["portfolio_management.data.io.io"]
+    summarized: list[str] = []
+    original_summarize = io_module.summarize_price_file
+
+    def counting_summarize(base_dir, stooq_file):
+        summarized.append(stooq_file.ticker)
+        return original_summarize(base_dir, stooq_file)
+
+    monkeypatch.setattr(io_module, "summarize_price_file", counting_summarize)
+
+    export_dir = tmp_path / "exports"
+    manifest_path = tmp_path / "manifest.json"
+
+    def run(report_name: str) -> tuple:
+        manifest = ptd.cache.DiagnosticsManifest.load(manifest_path)
+        result = ptd.write_match_report(
+            matches,
+            tmp_path / report_name,
+            data_dir,
+            lse_currency_policy="broker",
+            export_config=ptd.ExportConfig(data_dir=data_dir, dest_dir=export_dir),
+            manifest=manifest,
+        )
+        manifest.save(manifest_path)
+        return result
+
+    first = run("first.csv")
+    assert sorted(summarized) == ["AAA.US", "BBB.US", "CCC.US"]
+    assert first[5] == 3
+
+    summarized.clear()
+    second = run("second.csv")
+    assert summarized == []
+    assert second[0] == first[0]
+    assert second[5] == 3
+    assert (tmp_path / "first.csv").read_text() == (tmp_path / "second.csv").read_text()
+
+    changed = data_dir / matches[1].stooq_file.rel_path
+    changed.write_text(
+        changed.read_text() + "BBB.US,D,20200106,000000,12,13,11,12,90,0\n",
+    )
+    (export_dir / "ccc.us.csv").unlink()
+    summarized.clear()
+    third = run("third.csv")
+    assert summarized == ["BBB.US"]
+    assert third[0]["BBB.US"]["price_rows"] == "3"
+    assert (export_dir / "ccc.us.csv").exists()
+    assert "20200106" in (export_dir / "bbb.us.csv").read_text()
+
+
+@pytest.mark.parametrize("terminator", ["\n", "\r\n"])
+def test_write_match_report_manifest_appends_new_rows(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    terminator: str,
+) -> None:
+    header = "<TICKER>,<PER>,<DATE>,<TIME>,<OPEN>,<HIGH>,<LOW>,<CLOSE>,<VOL>,<OPENINT>"
+    data_dir = tmp_path / "stooq"
+    matches = []
+    for ticker in ("AAA.US", "BBB.US", "CCC.US"):
+        rel_path = Path(f"daily/us/etfs/{ticker.lower()}.txt")
+        source_path = data_dir / rel_path
+        source_path.parent.mkdir(parents=True, exist_ok=True)
+        rows = [header] + [
+            f"{ticker},D,202001{day:02d},000000,10,11,9,10,100,0" for day in (2, 3)
+        ]
+        source_path.write_bytes((terminator.join(rows) + terminator).encode())
+        stooq_file = _make_stooq_file(ticker, rel_path.as_posix(), region="us")
+        matches.append(
+            ptd.TradeableMatch(
+                instrument=_make_instrument(ticker, market="NYSE", currency="USD"),
+                stooq_file=stooq_file,
+                matched_ticker=stooq_file.ticker,
+                strategy="ticker",
+            ),
+        )
+
+    export_dir = tmp_path / "exports"
+    manifest_path = tmp_path / "manifest.json"
+
+    def run() -> None:
+        manifest = ptd.cache.DiagnosticsManifest.load(manifest_path)
+        ptd.write_match_report(
+            matches,
+            tmp_path / "report.csv",
+            data_dir,
+            lse_currency_policy="broker",
+            export_config=ptd.ExportConfig(data_dir=data_dir, dest_dir=export_dir),
+            manifest=manifest,
+        )
+        manifest.save(manifest_path)
+
+    def append(ticker: str, row: str) -> None:
+        path = data_dir / f"daily/us/etfs/{ticker.lower()}.txt"
+        path.write_bytes(path.read_bytes() + (row + terminator).encode())
+
+    run()
+    io_module = sys.modules["portfolio_management.data.io.io"]
+    original_export = io_module._export_streaming_match
+    rewritten: list[str] = []
+
+    def tracking_export(match, config, diagnostics):
+        rewritten.append(match.stooq_file.ticker)
+        return original_export(match, config, diagnostics)
+
+    monkeypatch.setattr(io_module, "_export_streaming_match", tracking_export)
+
+    # AAA gains a day; BBB gains a row dated before its last one; CCC's last
+    # row is restated, as after a split adjustment.
+    append("AAA.US", "AAA.US,D,20200106,000000,12,13,11,12,90,0")
+    append("BBB.US", "BBB.US,D,20200101,000000,12,13,11,12,90,0")
+    ccc = data_dir / "daily/us/etfs/ccc.us.txt"
+    ccc.write_bytes(
+        ccc.read_bytes().replace(
+            b"10,100,0" + terminator.encode(), b"5,200,0" + terminator.encode()
+        )
+    )
+    run()
+    assert sorted(rewritten) == ["BBB.US", "CCC.US"]
+
+    append("AAA.US", "AAA.US,D,20200107,000000,12,13,11,12,90,0")
+    rewritten.clear()
+    run()
+    assert rewritten == []
+
+    for match in matches:
+        source_path = data_dir / match.stooq_file.rel_path
+        fresh_path = tmp_path / "fresh" / f"{match.stooq_file.ticker.lower()}.csv"
+        io_module._stream_price_file(source_path, fresh_path)
+        exported = (export_dir / fresh_path.name).read_bytes()
+        assert exported == fresh_path.read_bytes()
+
+
+def test_match_tradeables_max_workers_deprecated(
     stooq_lookup,
     tradeable_instruments: list[ptd.TradeableInstrument],
 ) -> None:
     matches_single, unmatched_single = ptd.match_tradeables(
         tradeable_instruments,
         *stooq_lookup,
-        max_workers=1,
-    )
-    matches_parallel, unmatched_parallel = ptd.match_tradeables(
-        tradeable_instruments,
-        *stooq_lookup,
-        max_workers=8,
     )
+    with pytest.warns(DeprecationWarning, match="max_workers"):
+        matches_parallel, unmatched_parallel = ptd.match_tradeables(
+            tradeable_instruments,
+            *stooq_lookup,
+            max_workers=8,
+        )
 
     def _signature(match: ptd.TradeableMatch) -> tuple[str, str, str]:
         return (
@@ -654,3 +896,272 @@ def test_write_unmatched_report_schema(tmp_path: Path) -> None:
         "reason",
     ]
     assert df["reason"].tolist() == ["alias_required", "manual_review"]
+
+
+def test_handle_stooq_index_uses_store(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    index_path = tmp_path / "metadata" / "stooq_index.csv"
+    args = ptd.parse_args(
+        [
+            "--data-dir",
+            str(STOOQ_FIXTURES),
+            "--metadata-output",
+            str(index_path),
+            "--force-reindex",
+        ],
+    )
+    built = ptd._handle_stooq_index(args, index_workers=2)
+    assert len(built) == 500
+    assert index_path.with_suffix(".sqlite").exists()
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("CSV index should not be parsed")
+
+    monkeypatch.setattr(ptd, "read_stooq_index", fail)
+    index_path.unlink()
+    args.force_reindex = False
+    assert ptd._handle_stooq_index(args, index_workers=2) == built
+    assert len(pd.read_csv(index_path)) == 500
+
+
+def test_copy_price_file_matches_streaming_export(
+    tmp_path: Path,
+    stooq_index: list[ptd.StooqFile],
+) -> None:
+    from portfolio_management.data.io.io import _copy_price_file, _stream_price_file
+
+    for stooq_file in stooq_index[:50]:
+        source_path = STOOQ_FIXTURES / stooq_file.rel_path
+        copied_path = tmp_path / "copied" / f"{stooq_file.ticker}.csv"
+        streamed_path = tmp_path / "streamed" / f"{stooq_file.ticker}.csv"
+        copied = _copy_price_file(source_path, copied_path)
+        rows = _stream_price_file(source_path, streamed_path)
+        assert copied is not None
+        assert (copied == 0) == (rows == 0)
+        assert copied_path.read_bytes() == streamed_path.read_bytes()
+
+
+@pytest.mark.parametrize("terminator", ["\r\n", "\n"])
+@pytest.mark.parametrize(
+    "middle_row",
+    [
+        "",
+        "<TICKER>,<PER>",
+        "Ticker,per",
+        "  AAA.US,D,20200102,000000,1,1,1,1,1,0 ",
+        None,
+    ],
+)
+def test_copy_and_streaming_exports_agree(
+    tmp_path: Path,
+    terminator: str,
+    middle_row: str | None,
+) -> None:
+    from portfolio_management.data.io.io import (
+        _copy_price_file,
+        _export_streaming_match,
+        _stream_price_file,
+    )
+
+    rows = [
+        f"AAA.US,D,{20000101 + row},000000,1.5,1.6,1.4,1.55,{row},0"
+        for row in range(2000)
+    ]
+    if middle_row is not None:
+        # Far from both ends of the file, beyond any head or tail sample.
+        rows.insert(1000, middle_row)
+    source_path = tmp_path / "stooq" / "aaa.us.txt"
+    source_path.parent.mkdir()
+    source_path.write_bytes(
+        terminator.join(["<TICKER>,<PER>,<DATE>", *rows, ""]).encode(),
+    )
+
+    streamed_path = tmp_path / "streamed.csv"
+    _stream_price_file(source_path, streamed_path)
+    copied = _copy_price_file(source_path, tmp_path / "copied.csv")
+    assert (copied is None) == (middle_row is not None)
+
+    config = ptd.ExportConfig(
+        data_dir=tmp_path / "stooq",
+        dest_dir=tmp_path / "exports",
+        overwrite=True,
+    )
+    match = ptd.TradeableMatch(
+        instrument=_make_instrument("AAA:US", market="NYSE"),
+        stooq_file=_make_stooq_file("AAA.US", "aaa.us.txt"),
+        matched_ticker="AAA.US",
+        strategy="ticker",
+    )
+    outcome = _export_streaming_match(match, config, {"data_status": "ok"})
+    assert outcome.exported
+    exported = (config.dest_dir / "aaa.us.csv").read_bytes()
+    assert exported == streamed_path.read_bytes()
+    assert exported.count(b"\n") == exported.count(terminator.encode())
+    assert len(pd.read_csv(config.dest_dir / "aaa.us.csv")) >= len(rows) - 1
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"AAA.US,D,20200102,000000,1,1,1,1,1,0\n",
+        b"<TICKER>\nAAA.US,D,20200102,000000,1,1,1,1,1,0",
+        b"<TICKER>\n\nAAA.US,D,20200102,000000,1,1,1,1,1,0\n",
+        b"<TICKER>\r\nAAA.US,D,20200102,000000,1,1,1,1,1,0 \r\n",
+        b"<TICKER>\nAAA.US,D,20200102,000000,1,1,1,1,1,0\r\n",
+    ],
+)
+def test_copy_price_file_rejects_irregular_files(
+    tmp_path: Path,
+    content: bytes,
+) -> None:
+    from portfolio_management.data.io.io import _copy_price_file
+
+    source_path = tmp_path / "aaa.us.txt"
+    source_path.write_bytes(content)
+    target_path = tmp_path / "aaa.us.csv"
+    assert _copy_price_file(source_path, target_path) is None
+    assert not target_path.exists()
+
+
+def test_price_panel_matches_exported_files(
+    tmp_path: Path,
+    pipeline_result: dict[str, object],
+) -> None:
+    from portfolio_management.analytics.returns.loaders import (
+        PriceLoader,
+        build_price_panel,
+    )
+
+    export_dir = pipeline_result["export_dir"]
+    store = build_price_panel(export_dir, tmp_path / "panel", max_workers=4)
+    loader = PriceLoader()
+    exported = {
+        path.stem: loader.load_price_file(path)
+        for path in sorted(export_dir.glob("*.csv"))
+    }
+    assert store.tickers == [key for key, prices in exported.items() if len(prices)]
+
+    for key in store.tickers[:10]:
+        expected = exported[key]
+        served = store.load([key])[key]
+        pd.testing.assert_series_equal(
+            served,
+            expected,
+            check_names=False,
+            check_freq=False,
+        )
+
+
+def test_watch_tradeable_data_reprocesses_changes(tmp_path: Path) -> None:
+    header = "<TICKER>,<PER>,<DATE>,<TIME>,<OPEN>,<HIGH>,<LOW>,<CLOSE>,<VOL>,<OPENINT>"
+    data_dir = tmp_path / "stooq"
+    etf_dir = data_dir / "daily" / "us" / "etfs"
+    etf_dir.mkdir(parents=True)
+
+    def write_prices(ticker: str, *days: int) -> None:
+        rows = [f"{ticker},D,202001{day:02d},000000,10,11,9,10,100,0" for day in days]
+        (etf_dir / f"{ticker.lower()}.txt").write_text(
+            "\n".join([header, *rows]) + "\n"
+        )
+
+    def write_tradeables(*symbols: str) -> None:
+        (tradeable_dir / "broker.csv").write_text(
+            "symbol,isin,market,name,currency\n"
+            + "".join(f"{symbol},US{symbol},NYSE,{symbol},USD\n" for symbol in symbols),
+        )
+
+    write_prices("AAA.US", 2, 3)
+    write_prices("BBB.US", 2, 3)
+    tradeable_dir = tmp_path / "tradeable"
+    tradeable_dir.mkdir()
+    write_tradeables("AAA.US", "BBB.US")
+
+    class ScriptedWatcher:
+        """Apply one scripted input change per wait and report it."""
+
+        def __init__(self) -> None:
+            self.tracked: set[str] = set()
+            self.steps = [self.append_day, self.add_listing]
+
+        def track(self, rel_paths) -> None:
+            self.tracked = set(rel_paths)
+
+        def wait(self, *_args, **_kwargs) -> ptd.ChangeSet:
+            return self.steps.pop(0)() if self.steps else ptd.ChangeSet()
+
+        def append_day(self) -> ptd.ChangeSet:
+            with (etf_dir / "aaa.us.txt").open("a") as handle:
+                handle.write("AAA.US,D,20200106,000000,12,13,11,12,90,0\n")
+            return ptd.ChangeSet(files=frozenset({"daily/us/etfs/aaa.us.txt"}))
+
+        def add_listing(self) -> ptd.ChangeSet:
+            write_prices("CCC.US", 2, 3, 6)
+            write_tradeables("AAA.US", "BBB.US", "CCC.US")
+            return ptd.ChangeSet(
+                tradeables=True,
+                directories=frozenset({"daily/us/etfs"}),
+            )
+
+    metadata_dir = tmp_path / "metadata"
+    args = ptd.parse_args(
+        [
+            "--data-dir",
+            str(data_dir),
+            "--tradeable-dir",
+            str(tradeable_dir),
+            "--metadata-output",
+            str(metadata_dir / "stooq_index.csv"),
+            "--match-report",
+            str(metadata_dir / "matches.csv"),
+            "--unmatched-report",
+            str(metadata_dir / "unmatched.csv"),
+            "--prices-output",
+            str(tmp_path / "prices"),
+            "--price-panel",
+            str(tmp_path / "panel"),
+            "--cache-metadata",
+            str(metadata_dir / "cache.json"),
+            "--diagnostics-manifest",
+            str(metadata_dir / "manifest.json"),
+            "--watch",
+        ],
+    )
+    watcher = ScriptedWatcher()
+    ptd.watch_tradeable_data(args, watcher=watcher, max_cycles=3)
+
+    assert watcher.tracked == {
+        f"daily/us/etfs/{ticker}.us.txt" for ticker in ("aaa", "bbb", "ccc")
+    }
+    report = pd.read_csv(metadata_dir / "matches.csv")
+    assert sorted(report["matched_ticker"]) == ["AAA.US", "BBB.US", "CCC.US"]
+    assert len(pd.read_csv(tmp_path / "prices" / "aaa.us.csv")) == 3
+    assert len(pd.read_csv(tmp_path / "prices" / "ccc.us.csv")) == 3
+    assert (metadata_dir / "manifest.json").exists()
+
+    from portfolio_management.data.io.panel_store import PricePanelStore
+
+    panel = PricePanelStore(tmp_path / "panel").load(["aaa.us", "bbb.us"])
+    assert panel.index[-1] == pd.Timestamp("2020-01-06")
+
+
+def test_run_cli_logs_stop_only_in_watch_mode(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ctrl+C ends watch mode cleanly but still interrupts a one-off run."""
+
+    def interrupt(_args) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(ptd, "prepare_tradeable_data", interrupt)
+    monkeypatch.setattr(ptd, "watch_tradeable_data", interrupt)
+    monkeypatch.setattr(ptd, "configure_logging", lambda _level: None)
+
+    with caplog.at_level(logging.INFO, logger=ptd.LOGGER.name):
+        with pytest.raises(KeyboardInterrupt):
+            ptd.run_cli(ptd.parse_args([]))
+        assert "Watch mode stopped" not in caplog.text
+        assert ptd.run_cli(ptd.parse_args(["--watch"])) == 0
+    assert "Watch mode stopped" in caplog.text
@@ -59,6 +59,8 @@ def test_incremental_resume_skips_when_unchanged(tmp_path: Path) -> None:
         "--incremental",
         "--cache-metadata",
         str(cache_file),
+        "--diagnostics-manifest",
+        str(tmp_path / "manifest.json"),
         "--log-level",
         "INFO",
     ]
@@ -159,6 +161,8 @@ def test_incremental_resume_reruns_when_tradeable_changed(tmp_path: Path) -> Non
         "--incremental",
         "--cache-metadata",
         str(cache_file),
+        "--diagnostics-manifest",
+        str(tmp_path / "manifest.json"),
         "--log-level",
         "DEBUG",
     ]
@@ -106,3 +106,26 @@ def test_missing_classification_columns_returns_none(tmp_path: Path) -> None:
 
     assert result.asset_classes is None
     assert result.portfolio is not None
+
+
+def test_compare_strategies_reports_timings(tmp_path: Path) -> None:
+    returns_path = _write_returns(tmp_path)
+
+    service = PortfolioConstructionService()
+    constraints = PortfolioConstraints(
+        max_weight=1.0,
+        min_bond_exposure=0.0,
+        max_equity_exposure=1.0,
+    )
+
+    result = service.run_workflow(
+        returns=returns_path,
+        constraints=constraints,
+        compare=True,
+        comparison_strategies=["equal_weight"],
+        share_moments=True,
+        max_workers=2,
+    )
+
+    assert result.strategies_evaluated == ("equal_weight",)
+    assert set(result.timings) == {"equal_weight"}